@@ -1,5 +1,6 @@
 import collections.abc
 from analitiq.base.agent_context import AgentContext
+from analitiq.databases.vector.utils.query_vector_memo import query_vector_scope
 
 
 class AgentPipeline:
@@ -8,22 +9,45 @@ class AgentPipeline:
         self.params = params
 
     def run(self, context: AgentContext):
-        for agent in self.agents:
-            agent.invoke(self.params)  # Agents initialize dependencies
-            context = agent.run(context)
+        # All agents answer the same query, so they can share its vector embeddings
+        with query_vector_scope():
+            for agent in self.agents:
+                agent.invoke(self.params)  # Agents initialize dependencies
+                context = agent.run(context)
         return context
 
     async def arun(self, context: AgentContext) -> collections.abc.AsyncGenerator:
         """Async method to run the pipeline with streaming capability and yield intermediate results."""
-        for agent in self.agents:
-            agent.invoke(self.params)  # Agents initialize dependencies
-            async for result in agent.arun(context):
-                # Yield each intermediate result directly to the caller
-                yield result
+        # The agents share the query vectors through one memo. Its scope is only open while an agent
+        # runs, never across a yield, so the caller's code does not see it and the generator can be
+        # closed from another context
+        query_vectors = {}
+        try:
+            for agent in self.agents:
+                agent.ainvoke(self.params)  # Agents initialize dependencies, including async ones
+                results = agent.arun(context)
+                try:
+                    while True:
+                        with query_vector_scope(query_vectors):
+                            try:
+                                result = await anext(results)
+                            except StopAsyncIteration:
+                                break
 
-                # Update the context if the yielded result is an updated context
-                if isinstance(result, AgentContext):
-                    context = result
+                        # Yield each intermediate result directly to the caller
+                        yield result
+
+                        # Update the context if the yielded result is an updated context
+                        if isinstance(result, AgentContext):
+                            context = result
+                finally:
+                    await results.aclose()
+        finally:
+            # Async clients belong to this event loop, so they are closed with the run.
+            # The connectors reconnect on their next call
+            for agent in self.agents:
+                if getattr(agent, "avdb", None) is not None:
+                    await agent.avdb.close()
 
         # Yield the final context after all agents have processed it
         # yield context
@@ -14,12 +14,12 @@ class BaseAgent(ABC):
         self.db = None
         self.llm = None
         self.vdb = None
+        self.avdb = None
 
-    def invoke(self, params: Dict[str, Any]):
-        """Initialize dependencies based on provided parameters."""
+    def _invoke_common(self, params: Dict[str, Any]):
+        """Initialize the dependencies shared by ``invoke`` and ``ainvoke``: the database and the LLM."""
         db_params = params.get("db_params")
         llm_params = params.get("llm_params")
-        vdb_params = params.get("vdb_params")
 
         if db_params and not self.db:
             self.db = RelationalDatabaseFactory.connect(db_params)
@@ -27,18 +27,49 @@ class BaseAgent(ABC):
         if llm_params and not self.llm:
             self.llm = LlmFactory.connect(llm_params)
             logger.debug(f"LLM initialized for agent {self.key}")
-        if vdb_params and not self.vdb:
-            self.vdb = VectorDatabaseFactory.connect(vdb_params)
-            logger.debug(f"Vector Database initialized for agent {self.key}")
 
         # Validate required dependencies
         if not self.llm:
             raise ValueError(f"Agent {self.key} requires access to LLM to function.")
 
-        if not self.vdb:
+    def _warn_if_no_vdb(self):
+        if not self.vdb and not self.avdb:
             logger.warning(f"Vector Database (vdb) is not provided for agent {self.key}. "
                            "Performance may be affected.")
 
+    def invoke(self, params: Dict[str, Any]):
+        """Initialize dependencies based on provided parameters."""
+        self._invoke_common(params)
+
+        vdb_params = params.get("vdb_params")
+        if vdb_params and not self.vdb:
+            self.vdb = VectorDatabaseFactory.connect(vdb_params)
+            logger.debug(f"Vector Database initialized for agent {self.key}")
+
+        self._warn_if_no_vdb()
+
+    def ainvoke(self, params: Dict[str, Any]):
+        """Initialize dependencies for ``arun``.
+
+        The agent gets the database and the LLM as with ``invoke``. When the vector database type has
+        an async connector, only that one is created, in ``self.avdb``, so that searches do not block
+        the event loop. Otherwise the sync connector is created in ``self.vdb`` and searched in a thread.
+        """
+        self._invoke_common(params)
+
+        vdb_params = params.get("vdb_params")
+        if vdb_params and not self.avdb:
+            try:
+                self.avdb = VectorDatabaseFactory.connect_async(vdb_params)
+                logger.debug(f"Async Vector Database initialized for agent {self.key}")
+            except ValueError as e:
+                logger.info(f"No async Vector Database for agent {self.key}, searches run in a thread: {e}")
+                if not self.vdb:
+                    self.vdb = VectorDatabaseFactory.connect(vdb_params)
+                    logger.debug(f"Vector Database initialized for agent {self.key}")
+
+        self._warn_if_no_vdb()
+
     @abstractmethod
     def run(self, context):
         """Run the agent synchronously."""
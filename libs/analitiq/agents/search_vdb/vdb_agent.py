@@ -1,3 +1,4 @@
+import asyncio
 from typing import Literal, AsyncGenerator, Union
 from analitiq.logger.logger import initialize_logging
 from analitiq.agents.base_agent import BaseAgent
@@ -98,15 +99,30 @@ class VDBAgent(BaseAgent):
 
         return context
 
-    async def arun(self, context) -> AsyncGenerator[Union[str, None], None]:
+    async def asearch(self, query: str):
+        """Search the vector database in the agent's search mode without blocking the event loop.
+
+        The async connector is used when there is one, otherwise the search runs in a worker thread.
+        """
+        if self.avdb is not None:
+            if self.search_mode == "kw":
+                return await self.avdb.akw_search(query)
+            elif self.search_mode == "hybrid":
+                return await self.avdb.ahybrid_search(query)
+            elif self.search_mode == "vector":
+                return await self.avdb.avector_search(query)
 
-        logger.info(f"[Search VDb Agent]. Query: {context.user_query}. Search mode: {self.search_mode}")
         if self.search_mode == "kw":
-            response = self.vdb.kw_search(context.user_query)
+            return await asyncio.to_thread(self.vdb.kw_search, query)
         elif self.search_mode == "hybrid":
-            response = self.vdb.hybrid_search(context.user_query)
+            return await asyncio.to_thread(self.vdb.hybrid_search, query)
         elif self.search_mode == "vector":
-            response = self.vdb.vector_search(context.user_query)
+            return await asyncio.to_thread(self.vdb.vector_search, query)
+
+    async def arun(self, context) -> AsyncGenerator[Union[str, None], None]:
+
+        logger.info(f"[Search VDb Agent]. Query: {context.user_query}. Search mode: {self.search_mode}")
+        response = await self.asearch(context.user_query)
 
         try:
             docs = response.objects
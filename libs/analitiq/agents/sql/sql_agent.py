@@ -1,16 +1,16 @@
-import pandas as pd
-from typing import Tuple, Optional
+import asyncio
+from typing import TYPE_CHECKING, AsyncIterator, Tuple, Optional, Union
 from analitiq.logger.logger import initialize_logging
 from analitiq.utils.code_extractor import CodeExtractor
 from analitiq.agents.sql.schema import SQL
 from analitiq.base.agent_context import AgentContext
 from analitiq.agents.base_agent import BaseAgent
-from langchain.prompts import PromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
-from sqlalchemy.exc import DatabaseError
-from sqlalchemy.sql import text
 from analitiq.agents.sql.prompt import TEXT_TO_SQL_PROMPT
-from langchain_core.exceptions import OutputParserException
+
+# pandas, langchain and sqlalchemy are imported where they are used, so that importing the agent stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
 logger, chat_logger = initialize_logging()
 class SQLAgent(BaseAgent):
@@ -39,9 +39,33 @@ class SQLAgent(BaseAgent):
         self.key = key  # Unique key for this agent instance
         self.user_query: str = None
 
-    def execute_sql(self, sql: str, params: Optional[dict] = None) -> Tuple[bool, Optional[pd.DataFrame]]:
+    def _stream_sql(self, sql: str, params: Optional[dict] = None):
+        """Start streaming the result of a query, capped by the 'result_max_rows' and 'result_max_bytes' params."""
+        from analitiq.databases.relational.result_stream import DEFAULT_MAX_ROWS, DEFAULT_MAX_BYTES
+
+        return self.db.stream_sql(
+            sql,
+            params,
+            max_rows=self.db.params.get("result_max_rows", DEFAULT_MAX_ROWS),
+            max_bytes=self.db.params.get("result_max_bytes", DEFAULT_MAX_BYTES),
+        )
+
+    @staticmethod
+    def _log_result(result: "pd.DataFrame", stream):
+        if stream.truncated:
+            chat_logger.warning(f"SQL result truncated to {stream.rows} rows ({stream.bytes} bytes).")
+        if result.empty:
+            chat_logger.info("SQL executed successfully, but result is empty.")
+        else:
+            chat_logger.info(f"SQL executed successfully. Converted to DataFrame of {len(result)} rows. {result.head()}")
+
+    def execute_sql(self, sql: str, params: Optional[dict] = None) -> Tuple[bool, Optional["pd.DataFrame"]]:
         """Executes the given SQL query and returns the result as a DataFrame.
 
+        The result is fetched in pages from a server-side cursor. It stops at 'result_max_rows'
+        rows (default 100000) or 'result_max_bytes' bytes (default 256 MiB) of the database
+        params, so that a query without a LIMIT cannot exhaust memory.
+
         Args:
         ----
             sql (str): The SQL query to be executed.
@@ -52,15 +76,16 @@ class SQLAgent(BaseAgent):
             Tuple[bool, Optional[pd.DataFrame]]: A tuple containing a boolean indicating success, and the result as a DataFrame or an error message.
 
         """
+        import pandas as pd
+        from sqlalchemy.exc import DatabaseError
+
         chat_logger.info(f"{sql}")  # Log the SQL query being executed
 
         try:
             # Execute the SQL query and store the result in a DataFrame
-            result = pd.read_sql(text(sql), self.db.engine, params=params)
-            if result.empty:
-                chat_logger.info("SQL executed successfully, but result is empty.")
-            else:
-                chat_logger.info(f"SQL executed successfully. Converted to DataFrame. {result}")
+            with self._stream_sql(sql, params) as stream:
+                result = pd.concat(list(stream), ignore_index=True)
+            self._log_result(result, stream)
 
             return True, result
         except DatabaseError as e:
@@ -68,6 +93,95 @@ class SQLAgent(BaseAgent):
             chat_logger.error(f"Error executing SQL. {e!s}")
             return False, str(e)
 
+    async def aexecute_sql_pages(self, sql: str, params: Optional[dict] = None) -> AsyncIterator["pd.DataFrame"]:
+        """Executes the given SQL query and yields its result in pages of DataFrames.
+
+        Pages are fetched in a worker thread, with the same caps as ``execute_sql``. Leaving the
+        iteration early closes the cursor. Database errors are raised by the first page.
+
+        Args:
+        ----
+            sql (str): The SQL query to be executed.
+            params (dict, optional): The parameters to be used in the SQL query.
+
+        Yields:
+        -------
+            pd.DataFrame: The next page of the result. The first page may be empty.
+
+        """
+        chat_logger.info(f"{sql}")  # Log the SQL query being executed
+
+        stream = self._stream_sql(sql, params)
+        end = object()
+        try:
+            while True:
+                page = await asyncio.to_thread(next, stream, end)
+                if page is end:
+                    break
+                yield page
+        finally:
+            await asyncio.to_thread(stream.close)
+
+        if stream.truncated:
+            chat_logger.warning(f"SQL result truncated to {stream.rows} rows ({stream.bytes} bytes).")
+        chat_logger.info(f"SQL executed successfully. Streamed {stream.rows} rows.")
+
+    def _arrow_results(self) -> bool:
+        return self.db.params.get("result_format") == "arrow"
+
+    def _fetch_arrow(self, sql: str, params: Optional[dict] = None):
+        from analitiq.databases.relational.result_stream import DEFAULT_MAX_ROWS, DEFAULT_MAX_BYTES
+
+        table, truncated = self.db.fetch_arrow(
+            sql,
+            params,
+            max_rows=self.db.params.get("result_max_rows", DEFAULT_MAX_ROWS),
+            max_bytes=self.db.params.get("result_max_bytes", DEFAULT_MAX_BYTES),
+        )
+        if truncated:
+            chat_logger.warning(f"SQL result truncated to {table.num_rows} rows ({table.nbytes} bytes).")
+        chat_logger.info(f"SQL executed successfully. Fetched {table.num_rows} rows as an Arrow table.")
+        return table
+
+    def execute_sql_arrow(self, sql: str, params: Optional[dict] = None) -> Tuple[bool, Union["pa.Table", str]]:
+        """Executes the given SQL query and returns the result as a pyarrow Table.
+
+        The result does not go through pandas: it is fetched with the ADBC driver of the database
+        when installed, or converted from the database rows to Arrow columns in pages. It is
+        capped like the result of ``execute_sql``. Needs pyarrow.
+
+        Args:
+        ----
+            sql (str): The SQL query to be executed.
+            params (dict, optional): The parameters to be used in the SQL query.
+
+        Returns:
+        -------
+            Tuple[bool, Union[pa.Table, str]]: A tuple containing a boolean indicating success, and the result as an Arrow table or an error message.
+
+        """
+        from sqlalchemy.exc import DatabaseError
+
+        chat_logger.info(f"{sql}")  # Log the SQL query being executed
+
+        try:
+            return True, self._fetch_arrow(sql, params)
+        except DatabaseError as e:
+            # Handle SQL execution errors
+            chat_logger.error(f"Error executing SQL. {e!s}")
+            return False, str(e)
+
+    def _execute(self, sql: str) -> Tuple[bool, Union["pd.DataFrame", "pa.Table", str]]:
+        # Arrow tables are returned if the 'result_format' database param is "arrow"
+        if self._arrow_results():
+            return self.execute_sql_arrow(sql)
+        return self.execute_sql(sql)
+
+    async def _aexecute_sql_arrow(self, sql: str) -> AsyncIterator["pa.Table"]:
+        # The whole result as one Arrow table, in the place of the pages of aexecute_sql_pages
+        chat_logger.info(f"{sql}")  # Log the SQL query being executed
+        yield await asyncio.to_thread(self._fetch_arrow, sql)
+
     def get_sql_from_llm(self, docs_ddl_formatted: Optional[str] = None, docs_schema_formatted: Optional[str] = None) -> str:
         """Generates SQL from the LLM (Language Model) based on provided DDL and schema documentation.
 
@@ -108,6 +222,9 @@ class SQLAgent(BaseAgent):
         else:
             docs_schema_text = ''
 
+        from langchain_core.output_parsers import JsonOutputParser
+        from langchain_core.prompts import PromptTemplate
+
         # Set up the parser and prompt for generating SQL
         parser = JsonOutputParser(pydantic_object=SQL)
 
@@ -174,6 +291,10 @@ class SQLAgent(BaseAgent):
         [DDL_END]
         """
 
+        from langchain_core.exceptions import OutputParserException
+        from langchain_core.output_parsers import JsonOutputParser
+        from langchain_core.prompts import PromptTemplate
+
         parser = JsonOutputParser(pydantic_object=SQL)
 
         prompt = PromptTemplate(
@@ -241,12 +362,8 @@ class SQLAgent(BaseAgent):
             output.append(f"Table name: {table_name}\nColumn names: {columns})\n")
         return ''.join(output)
 
-    def __get_ddl_from_vdb(self, user_prompt):
+    def __ddl_filter_expression(self) -> dict:
         # Set up filter to search for relevant DDL documents in vector database
-        if self.vdb is None:
-            logger.warning("Vector Database (vdb) is not available. Skipping the usage of vector database.")
-            return []
-
         filter_list = [
             {"property": "document_tags", "operator": "contains_any", "value": ["ddl"]}
         ]
@@ -255,12 +372,24 @@ class SQLAgent(BaseAgent):
         for schema in self.db.params.get("db_schemas", []):
             filter_list.append({"property": "document_name", "operator": "like", "value": f"*{schema}*"} )
 
-        filter_expression = {
+        return {
             "and": filter_list
         }
 
+    def __get_ddl_from_vdb(self, user_prompt):
+        if self.vdb is None:
+            logger.warning("Vector Database (vdb) is not available. Skipping the usage of vector database.")
+            return []
+
         # Search the vector database using the filter expression
-        return self.vdb.search_filter(user_prompt, filter_expression, ['document_name'])
+        return self.vdb.search_filter(user_prompt, self.__ddl_filter_expression(), ['document_name'])
+
+    async def __aget_ddl_from_vdb(self, user_prompt):
+        # Same as __get_ddl_from_vdb, without blocking the event loop
+        if self.avdb is not None:
+            return await self.avdb.asearch_filter(user_prompt, self.__ddl_filter_expression(), ['document_name'])
+
+        return await asyncio.to_thread(self.__get_ddl_from_vdb, user_prompt)
 
     def run(self, context: AgentContext) -> AgentContext:
         """Main method to run the SQL agent based on the user's prompt.
@@ -311,7 +440,7 @@ class SQLAgent(BaseAgent):
             logger.info(f"SQL: {sql}")
             try:
                 # Execute the generated SQL
-                success, result = self.execute_sql(sql)
+                success, result = self._execute(sql)
             except Exception as e:
                 # Handle SQL execution errors
                 context.add_result(self.key, str(e))
@@ -321,7 +450,7 @@ class SQLAgent(BaseAgent):
                 # Resubmit the SQL for correction if the execution fails
                 sql = self.resubmit_for_correction(docs_ddl_formatted, sql, result)
                 logger.info(f"Corrected SQL: {sql}")
-                success, result = self.execute_sql(sql)
+                success, result = self._execute(sql)
 
                 if not success:
                     # Parse SQL from the error message if the correction also fails
@@ -329,7 +458,7 @@ class SQLAgent(BaseAgent):
                     if extracted_code:
                         logger.info(f"Parsed SQL from error message: {extracted_code}")
                         sql = extracted_code
-                        success, result = self.execute_sql(sql)
+                        success, result = self._execute(sql)
 
             if success:
                 context.add_result(self.key, sql, 'sql')
@@ -357,7 +486,7 @@ class SQLAgent(BaseAgent):
         self.user_query = context.user_query
         logger.info(f"[SQL Agent] user query: {context.user_query}")
         # Get DDL documents from vector database
-        docs_ddl = self.__get_ddl_from_vdb(context.user_query)
+        docs_ddl = await self.__aget_ddl_from_vdb(context.user_query)
 
         if not docs_ddl or docs_ddl == "ANALYTQ___NO_ANSWER":
             logger.info("No relevant DDL documents in VDB located.")
@@ -395,19 +524,29 @@ class SQLAgent(BaseAgent):
 
         if sql:
             logger.info(f"SQL: {sql}")
+            from sqlalchemy.exc import DatabaseError
+
+            # Execute the generated SQL, streaming its result to the client in pages
+            pages = self._aexecute_sql_arrow(sql) if self._arrow_results() else self.aexecute_sql_pages(sql)
             try:
-                # Execute the generated SQL
-                success, result = self.execute_sql(sql)
-                if success:
-                    yield context.add_result(self.key, response.get("Explanation", ""), 'text')
-                    yield context.add_result(self.key, sql, 'sql')
-                    yield context.add_result(self.key, result, 'data')
-                    return
+                first_page = await anext(pages)
+                success = True
+            except DatabaseError as e:
+                chat_logger.error(f"Error executing SQL. {e!s}")
+                success, result = False, str(e)
             except Exception as e:
                 # Handle SQL execution errors
                 yield context.add_result(self.key, str(e))
                 return
 
+            if success:
+                yield context.add_result(self.key, response.get("Explanation", ""), 'text')
+                yield context.add_result(self.key, sql, 'sql')
+                yield context.add_result(self.key, first_page, 'data')
+                async for page in pages:
+                    yield context.append_data(self.key, page)
+                return
+
             retry_count = 0
             max_retries = 3
 
@@ -417,7 +556,7 @@ class SQLAgent(BaseAgent):
                 yield context.add_result(self.key, f"SQL execution failed, attempting to correct the SQL. Retry {retry_count + 1}/{max_retries}.", 'text')
 
                 logger.info(f"Corrected SQL: {corrected_sql}")
-                success, result = self.execute_sql(corrected_sql)
+                success, result = self._execute(corrected_sql)
                 retry_count += 1
 
                 if success:
@@ -430,7 +569,7 @@ class SQLAgent(BaseAgent):
                 extracted_code = extractor.extract_code(result, 'sql')
                 if extracted_code:
                     logger.info(f"Parsed SQL from error message: {extracted_code}")
-                    success, result = self.execute_sql(extracted_code)
+                    success, result = self._execute(extracted_code)
                     if success:
                         yield context.add_result(self.key, extracted_code, 'sql')
                         yield context.add_result(self.key, result, 'data')
@@ -1,6 +1,32 @@
+import sys
 from pydantic import BaseModel, Field
-from pandas import DataFrame
-from typing import Optional, Dict, Union
+from typing import TYPE_CHECKING, Optional, Dict, Union
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+    from pyarrow import Table
+
+
+def _is_dataframe(obj) -> bool:
+    # pandas is not imported here: a DataFrame can only exist if whoever created it imported pandas
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(obj, pandas.DataFrame)
+
+
+def _is_arrow_table(obj) -> bool:
+    pyarrow = sys.modules.get("pyarrow")
+    return pyarrow is not None and isinstance(obj, pyarrow.Table)
+
+
+def _arrow_to_split(table: "Table") -> Dict:
+    # the same layout as DataFrame.to_dict(orient='split')
+    columns = [column.to_pylist() for column in table.columns]
+    return {
+        "index": list(range(table.num_rows)),
+        "columns": table.column_names,
+        "data": [list(row) for row in zip(*columns)],
+    }
+
 
 # Define Pydantic Schema for AgentResultFormat
 class AgentResultFormat(BaseModel):
@@ -18,9 +44,11 @@ class AgentContext:
     def __init__(self, user_query: str):
         self.user_query = user_query
         self.results = AgentsResults(agents_results={})  # Store all results (SQL, data, text, etc.) under one key
+        # Arrow data results are kept as tables, and converted to the 'split' dict only when it is asked for
+        self.arrow_data: Dict[str, "Table"] = {}
 
     # Function to add result under a single key with result type validation
-    def add_result(self, key: str, result: Union[str, DataFrame], content_type: str = 'text'):
+    def add_result(self, key: str, result: Union[str, "DataFrame", "Table"], content_type: str = 'text'):
         # Ensure the key exists in the results dictionary
         if key not in self.results.agents_results:
             self.results.agents_results[key] = AgentResultFormat()
@@ -32,8 +60,12 @@ class AgentContext:
                 self.results.agents_results[key].text += "\n" + result
             else:
                 self.results.agents_results[key].text = result
-        elif content_type == 'data' and isinstance(result, DataFrame):
+        elif content_type == 'data' and _is_dataframe(result):
+            self.arrow_data.pop(key, None)
             self.results.agents_results[key].data = result.to_dict(orient='split')
+        elif content_type == 'data' and _is_arrow_table(result):
+            self.arrow_data[key] = result
+            self.results.agents_results[key].data = None
         elif content_type == 'sql':
             self.results.agents_results[key].sql = result
         else:
@@ -42,6 +74,21 @@ class AgentContext:
         # Stream the added result to the requestor as soon as it's added
         return {key: {content_type: result}}  # This can be used to stream results incrementally
 
+    # Function to append a page of rows to the data result, for results streamed in pages
+    def append_data(self, key: str, page: "DataFrame"):
+        data = self.get_result_data(key) if key in self.results.agents_results else None
+        if not data:
+            return self.add_result(key, page, 'data')
+
+        # the pages are appended to the 'split' dict, which replaces an Arrow table
+        self.arrow_data.pop(key, None)
+        split = page.to_dict(orient='split')
+        data['index'].extend(split['index'])
+        data['data'].extend(split['data'])
+
+        # Stream the page to the requestor
+        return {key: {'data': page}}
+
     # Function to retrieve the full result (SQL, data, text) by key
     def get_result(self, key: str) -> Optional[AgentResultFormat]:
         return self.results.agents_results.get(key)
@@ -51,10 +98,37 @@ class AgentContext:
         return self.results.agents_results.get(key, {}).sql
 
     def get_result_data(self, key: str) -> Optional[Dict]:
+        self._materialize_arrow_data(key)
         return self.results.agents_results.get(key, {}).data
 
+    def _materialize_arrow_data(self, key: str):
+        result = self.results.agents_results.get(key)
+        if key in self.arrow_data and result is not None and result.data is None:
+            result.data = _arrow_to_split(self.arrow_data[key])
+
+    # Arrow getters. The table is returned as stored, without copying it
+    def get_result_arrow(self, key: str) -> Optional["Table"]:
+        return self.arrow_data.get(key)
+
+    def get_result_dataframe(self, key: str) -> Optional["DataFrame"]:
+        if key in self.arrow_data:
+            from analitiq.databases.relational.arrow_fetch import to_pandas
+            return to_pandas(self.arrow_data[key])
+
+        data = self.get_result_data(key)
+        if data is None:
+            return None
+        import pandas as pd
+        return pd.DataFrame(data["data"], index=data["index"], columns=data["columns"])
+
+    def get_result_ipc(self, key: str) -> Optional[bytes]:
+        if key not in self.arrow_data:
+            return None
+        from analitiq.databases.relational.arrow_fetch import to_ipc_bytes
+        return to_ipc_bytes(self.arrow_data[key])
+
     def get_result_data_json(self, key: str) -> Optional[Dict]:
-        data = self.results.agents_results.get(key, {}).data
+        data = self.get_result_data(key)
         if data:
             return data
         return None
@@ -63,5 +137,7 @@ class AgentContext:
         return self.results.agents_results.get(key, {}).text
 
     def get_results(self) -> Dict[str, AgentResultFormat]:
+        for key in self.arrow_data:
+            self._materialize_arrow_data(key)
         dump = self.results.model_dump()
         return dump.get('agents_results')
@@ -1,18 +1,38 @@
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple, Optional
+from contextlib import contextmanager
+from typing import Any, List, Dict, Tuple, Optional
 from sqlalchemy import inspect
-from sqlalchemy.exc import DatabaseError, SQLAlchemyError
+from sqlalchemy.exc import DatabaseError
 from sqlalchemy.orm import sessionmaker, scoped_session
 from pandas import read_sql, DataFrame
 from langchain_community.utilities import SQLDatabase
+from analitiq.databases.relational.catalog import (
+    Catalog,
+    CatalogLoader,
+    DEFAULT_CATALOG_TTL,
+    format_table_columns,
+)
+from analitiq.databases.relational.pool import PoolMetrics
+from analitiq.databases.relational.result_stream import ResultStream, DEFAULT_PAGE_SIZE
+from analitiq.databases.relational import arrow_fetch
 
 
 class BaseRelationalDatabase(ABC):
-    """Abstract base class for relational databases."""
+    """Abstract base class for relational databases.
+
+    The engine keeps a pool of connections for the lifetime of the instance, configured by
+    ``pool_options``. Call ``close``, or use the instance as a context manager, to dispose of it.
+
+    The columns of the tables are read in one query per set of schemas and cached for
+    'catalog_ttl' seconds (default 300), see ``get_catalog``.
+    """
 
     def __init__(self, params: Dict):
         self.params = params
         self.engine = self.create_engine()
+        self.metrics = PoolMetrics(self.engine)
+        self.catalog_loader = CatalogLoader(self.engine, ttl=params.get("catalog_ttl", DEFAULT_CATALOG_TTL))
         self.session = self.create_session()
         self.db = self.create_db()
 
@@ -20,6 +40,29 @@ class BaseRelationalDatabase(ABC):
     def create_engine(self):
         """Create and return a SQLAlchemy engine."""
 
+    @contextmanager
+    def connection(self):
+        """Check out a connection from the pool, recording how long it took."""
+        start = time.perf_counter()
+        with self.engine.connect() as connection:
+            self.metrics.record_wait(time.perf_counter() - start)
+            yield connection
+
+    def pool_metrics(self) -> Dict[str, Any]:
+        """Return the checkout counters and wait times, and the state of the connection pool."""
+        return self.metrics.snapshot()
+
+    def close(self):
+        """Close the connections of the pool. The engine opens new ones if it is used again."""
+        self.session.remove()
+        self.engine.dispose()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def create_session(self):
         """Create a scoped session bound to the engine."""
         session_factory = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
@@ -32,36 +75,28 @@ class BaseRelationalDatabase(ABC):
 
     def get_schema_names(self) -> List[str]:
         """Retrieve the names of the database schemas."""
-        try:
-            inspector = inspect(self.engine)
-            return inspector.get_schema_names()
-        except SQLAlchemyError as e:
-            raise e
-        finally:
-            self.engine.dispose()
+        inspector = inspect(self.engine)
+        return inspector.get_schema_names()
 
     def get_tables_in_schema(self, db_schema: str) -> List[str]:
         """Get the names of all tables in a specific database schema."""
         inspector = inspect(self.engine)
-        table_names = inspector.get_table_names(schema=db_schema)
-        self.engine.dispose()
-        return table_names
+        return inspector.get_table_names(schema=db_schema)
+
+    def get_catalog(self, schemas: List[str], refresh: bool = False) -> Catalog:
+        """Return the columns of every table of the schemas, cached for 'catalog_ttl' seconds."""
+        return self.catalog_loader.load(schemas, refresh=refresh)
+
+    def refresh_catalog(self):
+        """Drop the cached catalogs, so that the next ``get_catalog`` reads the database."""
+        self.catalog_loader.refresh()
 
     def get_schemas_and_tables(self, target_schema_list: List[str]) -> List[str]:
-        """Retrieve the schemas and tables from the database engine."""
-        inspector = inspect(self.engine)
-        schemas = [schema for schema in inspector.get_schema_names() if schema in target_schema_list]
-        response = []
-        for schema in schemas:
-            tables = inspector.get_table_names(schema=schema)
-            for table in tables:
-                columns = self.get_table_columns(table_name=table, schema=schema)
-                column_details = ", ".join(
-                    f"{schema}.{table}.{column['name']} ({column['type']})" for column in columns
-                )
-                response.append(column_details)
-        self.engine.dispose()
-        return response
+        """Retrieve the columns of the tables of the schemas, one line per table."""
+        return [
+            format_table_columns(schema, table, columns)
+            for schema, table, columns in self.get_catalog(target_schema_list)
+        ]
 
     def get_table_columns(self, table_name: str, schema: str) -> List[Dict]:
         """Retrieve column metadata for a given table and schema."""
@@ -103,7 +138,7 @@ class BaseRelationalDatabase(ABC):
     def get_row_count(self, schema_name: str, table_name: str) -> int:
         """Get the row count for a specific table."""
         sql = f"SELECT COUNT(*) FROM {schema_name}.{table_name}"
-        with self.engine.connect() as connection:
+        with self.connection() as connection:
             result = connection.execute(sql)
             count = result.scalar()
         return count
@@ -119,7 +154,7 @@ class BaseRelationalDatabase(ABC):
                 AVG({column_name}) AS avg_val
             FROM {schema_name}.{table_name}
         """
-        with self.engine.connect() as connection:
+        with self.connection() as connection:
             result = connection.execute(sql)
             min_val, max_val, avg_val = result.fetchone()
         return min_val, max_val, avg_val
@@ -127,17 +162,42 @@ class BaseRelationalDatabase(ABC):
     def execute_sql(self, sql: str) -> Tuple[bool, Optional[DataFrame]]:
         """Execute the given SQL query and return the result as a DataFrame."""
         try:
-            result = read_sql(sql, self.engine)
+            with self.connection() as connection:
+                result = read_sql(sql, connection)
             return True, result
         except DatabaseError:
             return False, None
 
+    def stream_sql(self, sql: str, params: Optional[Dict] = None, page_size: Optional[int] = None,
+                   max_rows: Optional[int] = None, max_bytes: Optional[int] = None) -> ResultStream:
+        """Execute a query on a server-side cursor and return its result in pages of DataFrames.
+
+        The page size defaults to the 'result_page_size' param. See ResultStream.
+        """
+        page_size = page_size or self.params.get("result_page_size", DEFAULT_PAGE_SIZE)
+        return ResultStream(self.connection, sql, params, page_size, max_rows, max_bytes)
+
+    def adbc_uri(self) -> Optional[str]:
+        """Return the URI of the database for its ADBC driver, or None if it has none."""
+        return None
+
+    def fetch_arrow(self, sql: str, params: Optional[Dict] = None, max_rows: Optional[int] = None,
+                    max_bytes: Optional[int] = None) -> Tuple[Any, bool]:
+        """Execute a query and return its result as a pyarrow Table, and whether it was truncated.
+
+        The ADBC driver of the database is used when it is installed and the query has no
+        parameters; otherwise the rows of a server-side cursor are converted to Arrow in pages.
+        Needs pyarrow.
+        """
+        arrow_fetch.import_pyarrow()
+        uri = self.adbc_uri()
+        adbc_dbapi = arrow_fetch.import_adbc_driver(self.engine.dialect.name) if uri and not params else None
+        if adbc_dbapi is not None:
+            return arrow_fetch.fetch_arrow_adbc(adbc_dbapi, uri, sql, max_rows, max_bytes)
+
+        page_size = self.params.get("result_page_size", DEFAULT_PAGE_SIZE)
+        return arrow_fetch.fetch_arrow_from_rows(self.connection, sql, params, page_size, max_rows, max_bytes)
+
     def run(self, sql: str, include_columns: bool = True):
         """Execute a query using the SQLDatabase utility."""
-        try:
-            result = self.db.run(sql, include_columns=include_columns)
-            return result
-        except Exception as e:
-            raise e
-        finally:
-            self.engine.dispose()
+        return self.db.run(sql, include_columns=include_columns)
@@ -8,7 +8,7 @@ Persist a specific metadata info from parent to child groups.
 import json
 from typing import List, Iterable
 from analitiq.base.base_chunker import BaseChunker
-from analitiq.utils.keyword_extractions import extract_keywords
+from analitiq.utils.keyword_extractions import extract_keywords_many
 from analitiq.base.base_chunker import CHUNK_SIZE
 from analitiq.loaders.documents.schemas import  Chunk, DocumentSchema
 from langchain_text_splitters import RecursiveJsonSplitter
@@ -125,17 +125,19 @@ class CustomRecursiveJsonSplitter(RecursiveJsonSplitter):
                 continue
             logger.info(f"Splitting json into chunks of size {self.max_chunk_size}")
             chunks = self.split_json(document_content_json, self.max_chunk_size)
-            for chunk in chunks:
+            document_num_char = len(json.dumps(document_content_json, ensure_ascii=False))
+            chunks_as_text = [json.dumps(chunk, ensure_ascii=False) for chunk in chunks]
+            chunk_keywords = extract_keywords_many(chunks_as_text)
+            for chunk_as_text, content_kw in zip(chunks_as_text, chunk_keywords):
                 split_doc = doc.model_copy()
-                chunk_as_text = json.dumps(chunk, ensure_ascii=False)
 
                 chunk_obj = Chunk(
                     content=chunk_as_text,
                     document_name=doc.metadata.document_name,
-                    document_num_char=len(json.dumps(document_content_json, ensure_ascii=False)),
+                    document_num_char=document_num_char,
                     document_uuid = doc.uuid,
                     chunk_num_char=len(chunk_as_text),
-                    content_kw = extract_keywords(chunk_as_text)
+                    content_kw = content_kw
                 )
                 return_chunks.append(chunk_obj)
         return return_chunks
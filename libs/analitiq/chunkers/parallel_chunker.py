@@ -0,0 +1,124 @@
+"""
+Filename: analitiq/chunkers/parallel_chunker.py
+
+Chunk documents in a pool of worker processes.
+"""
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional
+from analitiq.factories.chunker_factory import ChunkerFactory
+from analitiq.loaders.documents.schemas import Chunk, DocumentSchema
+
+# Workers are spawned, not forked: the parent may hold gRPC channels (pooled Weaviate clients) and
+# torch thread pools, which a forked child inherits in an inconsistent state and can deadlock on
+START_METHOD = "spawn"
+
+
+def chunk_document(document: DocumentSchema) -> List[Chunk]:
+    """Chunk a document with the chunker of its type. Runs in the worker processes."""
+    chunker = ChunkerFactory.get_chunker(document.metadata.document_type.value)
+    return chunker.chunk(document) or []
+
+
+def _ready() -> bool:
+    return True
+
+
+class ParallelChunker:
+    """Fan documents out to a ``ProcessPoolExecutor`` to chunk them on several cores.
+
+    Chunking (text splitting, ``sqlparse`` and keyword extraction) is CPU-bound Python, so
+    threads do not speed it up. Each worker process keeps one chunker per document type for its
+    whole life. With ``workers`` set to 1 or less, documents are chunked in the calling thread.
+
+    Worker processes are started with ``start_method`` ("spawn" by default), so they start from a
+    fresh interpreter that only imports the chunkers, whatever connectors and models the parent
+    process has open.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Number of worker processes. Defaults to the number of CPUs.
+    chunk_function : Callable[[DocumentSchema], List[Chunk]], optional
+        The function run on every document. It must be picklable, i.e. defined at module level.
+    start_method : str, optional
+        The multiprocessing start method of the workers: "spawn" (default) or "forkserver".
+
+    Examples
+    --------
+    >>> with ParallelChunker(workers=4) as chunker:
+    ...     for chunks in chunker.map(loader.lazy_load()):
+    ...         vdb.load_chunks(chunks)
+
+    """
+
+    def __init__(self, workers: Optional[int] = None,
+                 chunk_function: Callable[[DocumentSchema], List[Chunk]] = chunk_document,
+                 start_method: str = START_METHOD):
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.chunk_function = chunk_function
+        self.start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def parallel(self) -> bool:
+        return self.workers > 1
+
+    def start(self):
+        """Start the worker processes now, instead of on the first document.
+
+        Spawning a worker starts a new interpreter, which takes a moment, so start them before
+        documents are queued.
+        """
+        if self.parallel and self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context(self.start_method)
+            )
+            # the pool starts all its workers on the first submit
+            self._executor.submit(_ready).result()
+
+    def submit(self, document: DocumentSchema) -> Future:
+        """Schedule a document and return the future of its chunks."""
+        if not self.parallel:
+            future = Future()
+            try:
+                future.set_result(self.chunk_function(document))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        self.start()
+        return self._executor.submit(self.chunk_function, document)
+
+    def chunk(self, document: DocumentSchema) -> List[Chunk]:
+        """Chunk one document in a worker process and wait for the result. Safe to call from several threads."""
+        return self.submit(document).result()
+
+    def map(self, documents: Iterable[DocumentSchema]) -> Iterator[List[Chunk]]:
+        """Chunk documents in parallel and yield their chunks in the order of the documents.
+
+        Unlike ``Executor.map``, the documents are consumed lazily: at most two documents per
+        worker are in flight at any time.
+        """
+        pending = deque()
+        for document in documents:
+            pending.append(self.submit(document))
+            if len(pending) >= self.workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
@@ -5,7 +5,7 @@ Filename: analitiq/chunkers/sql_chunker.py
 import sqlparse
 from typing import Any, List
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from analitiq.utils.keyword_extractions import extract_keywords
+from analitiq.utils.keyword_extractions import extract_keywords_many
 from analitiq.base.base_chunker import BaseChunker
 from analitiq.base.base_chunker import CHUNK_SIZE, CHUNK_OVERLAP
 from analitiq.loaders.documents.schemas import  Chunk, DocumentSchema
@@ -14,10 +14,10 @@ class SQLChunker(BaseChunker):
     def __init__(self, max_chunk_size: int = CHUNK_SIZE, chunk_overlap: int = CHUNK_OVERLAP):
         self.max_chunk_size = max_chunk_size
         self.chunk_overlap = chunk_overlap
+        self.splitter = SQLRecursiveCharacterTextSplitter(self.max_chunk_size, self.chunk_overlap)
 
     def chunk(self, document: DocumentSchema) -> List[Chunk]:
-        splitter = SQLRecursiveCharacterTextSplitter(self.max_chunk_size, self.chunk_overlap)
-        return splitter.split_documents(document)
+        return self.splitter.split_documents(document)
 
 
 class SQLRecursiveCharacterTextSplitter(RecursiveCharacterTextSplitter):
@@ -93,14 +93,15 @@ class SQLRecursiveCharacterTextSplitter(RecursiveCharacterTextSplitter):
         chunks = self.split_text(document.document_content)
 
         return_chunks = []
-        for chunk in chunks:
+        chunk_keywords = extract_keywords_many(chunks)
+        for chunk, content_kw in zip(chunks, chunk_keywords):
             chunk_obj = Chunk(
                 content=chunk,
                 document_num_char=len(document.document_content),
                 document_name=document.metadata.document_name,
                 document_uuid = document.uuid,
                 chunk_num_char=len(chunk),
-                content_kw = extract_keywords(chunk)
+                content_kw = content_kw
             )
             return_chunks.append(chunk_obj)
 
@@ -9,28 +9,28 @@ from analitiq.base.base_chunker import BaseChunker
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from analitiq.base.base_chunker import CHUNK_SIZE, CHUNK_OVERLAP
 from analitiq.loaders.documents.schemas import  Chunk, DocumentSchema
-from analitiq.utils.keyword_extractions import extract_keywords
+from analitiq.utils.keyword_extractions import extract_keywords_many
 
 
 class TextChunker(BaseChunker):
     def __init__(self, max_chunk_size: int = CHUNK_SIZE, chunk_overlap: int = CHUNK_OVERLAP):
         self.max_chunk_size = max_chunk_size
         self.chunk_overlap = chunk_overlap
-
-    def chunk(self, document: DocumentSchema) -> Union[List[Chunk], None]:
-        if document.document_content == '':
-            return None
-
-        splitter = RecursiveCharacterTextSplitter(
+        self.splitter = RecursiveCharacterTextSplitter(
             chunk_size=int(self.max_chunk_size),
             chunk_overlap=int(self.chunk_overlap),
             length_function=len,
         )
 
+    def chunk(self, document: DocumentSchema) -> Union[List[Chunk], None]:
+        if document.document_content == '':
+            return None
+
         #langchain_document = Document(page_content=document.document_content)
-        chunks = splitter.split_text(document.document_content)
+        chunks = self.splitter.split_text(document.document_content)
         return_chunks = []
-        for chunk in chunks:
+        chunk_keywords = extract_keywords_many(chunks)
+        for chunk, content_kw in zip(chunks, chunk_keywords):
             chunk_obj = Chunk(
                 content=chunk,
                 document_num_char=len(document.document_content),
@@ -38,7 +38,7 @@ class TextChunker(BaseChunker):
                 document_tags=document.metadata.document_tags,
                 document_uuid = document.uuid,
                 chunk_num_char=len(chunk),
-                content_kw = extract_keywords(chunk)
+                content_kw = content_kw
                 )
             return_chunks.append(chunk_obj)
 
@@ -0,0 +1,166 @@
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, List, Optional, Tuple, Union
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+from analitiq.databases.relational.result_stream import DEFAULT_PAGE_SIZE
+
+# pyarrow is optional: pip install pyarrow. ADBC drivers are used when installed, e.g.
+# pip install adbc-driver-postgresql
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def import_pyarrow():
+    """Return the pyarrow module.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Arrow results need pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+def import_adbc_driver(dialect: str):
+    """Return the ADBC DBAPI module of a dialect, or None if there is none or it is not installed."""
+    try:
+        if dialect == "postgresql":
+            import adbc_driver_postgresql.dbapi as adbc_dbapi
+            return adbc_dbapi
+    except ImportError:
+        pass
+    return None
+
+
+class _Batches:
+    """Collects record batches up to a number of rows and bytes."""
+
+    def __init__(self, max_rows: Optional[int], max_bytes: Optional[int]):
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.batches: List["pa.RecordBatch"] = []
+        self.rows = 0
+        self.bytes = 0
+        self.truncated = False
+
+    def add(self, batch: "pa.RecordBatch") -> bool:
+        """Keep the rows of the batch that fit. Return False once the caps are reached."""
+        if self.max_rows is not None and self.rows + batch.num_rows > self.max_rows:
+            batch = batch.slice(0, self.max_rows - self.rows)
+            self.truncated = True
+        if self.max_bytes is not None and self.bytes + batch.nbytes > self.max_bytes:
+            # keep the rows that fit, assuming rows of the batch have about the same size
+            fitting = int(batch.num_rows * (self.max_bytes - self.bytes) / batch.nbytes) if batch.nbytes else 0
+            batch = batch.slice(0, max(fitting, 0))
+            self.truncated = True
+
+        self.batches.append(batch)
+        self.rows += batch.num_rows
+        self.bytes += batch.nbytes
+        return not self.truncated
+
+    def table(self, schema: "pa.Schema") -> "pa.Table":
+        pa = import_pyarrow()
+        if not self.batches:
+            return schema.empty_table()
+        # a batch whose values of a column are all NULL has a null column, promoted to the type of the others
+        return pa.concat_tables([pa.Table.from_batches([batch]) for batch in self.batches],
+                                promote_options="permissive")
+
+
+def _rows_to_batch(rows: List[Tuple], names: List[str]) -> "pa.RecordBatch":
+    pa = import_pyarrow()
+    columns = list(zip(*rows)) if rows else [[] for _ in names]
+    return pa.RecordBatch.from_arrays([pa.array(column) for column in columns], names=names)
+
+
+def fetch_arrow_from_rows(connect: Callable[[], ContextManager], sql: Union[str, TextClause],
+                          params: Optional[Dict[str, Any]] = None, page_size: int = DEFAULT_PAGE_SIZE,
+                          max_rows: Optional[int] = None, max_bytes: Optional[int] = None) -> Tuple["pa.Table", bool]:
+    """Fetch a query result into an Arrow table through a SQLAlchemy server-side cursor.
+
+    Rows are converted to Arrow arrays ``page_size`` rows at a time, column by column, without a
+    pandas DataFrame in between. This works with every driver.
+
+    Returns
+    -------
+    (pyarrow.Table, bool)
+        The result, and whether it was truncated by ``max_rows`` or ``max_bytes``.
+
+    """
+    pa = import_pyarrow()
+    statement = text(sql) if isinstance(sql, str) else sql
+    collected = _Batches(max_rows, max_bytes)
+
+    with connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=page_size).execute(statement, params or {})
+        try:
+            if not result.returns_rows:
+                return pa.table({}), False
+
+            names = list(result.keys())
+            for rows in result.partitions(page_size):
+                if not collected.add(_rows_to_batch(rows, names)):
+                    break
+        finally:
+            result.close()
+
+    schema = pa.schema([(name, pa.null()) for name in names])
+    return collected.table(schema), collected.truncated
+
+
+def fetch_arrow_adbc(adbc_dbapi, uri: str, sql: str, max_rows: Optional[int] = None,
+                     max_bytes: Optional[int] = None) -> Tuple["pa.Table", bool]:
+    """Fetch a query result into an Arrow table with an ADBC driver.
+
+    The driver produces Arrow record batches directly, e.g. from the binary COPY protocol of
+    PostgreSQL, so no Python object is created per value.
+
+    Returns
+    -------
+    (pyarrow.Table, bool)
+        The result, and whether it was truncated by ``max_rows`` or ``max_bytes``.
+
+    """
+    collected = _Batches(max_rows, max_bytes)
+
+    with adbc_dbapi.connect(uri) as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            reader = cursor.fetch_record_batch()
+            for batch in reader:
+                if not collected.add(batch):
+                    break
+            schema = reader.schema
+
+    return collected.table(schema), collected.truncated
+
+
+def to_pandas(table: "pa.Table"):
+    """Convert an Arrow table to a DataFrame of Arrow-backed columns.
+
+    The columns keep the Arrow buffers, so the conversion does not copy the values or create
+    Python objects for strings.
+    """
+    import pandas as pd
+
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def to_ipc_bytes(table: "pa.Table") -> bytes:
+    """Serialize an Arrow table in the Arrow IPC stream format, e.g. to stream it to a client."""
+    pa = import_pyarrow()
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def from_ipc_bytes(data: bytes) -> "pa.Table":
+    """Read an Arrow table from the Arrow IPC stream format."""
+    pa = import_pyarrow()
+    return pa.ipc.open_stream(data).read_all()
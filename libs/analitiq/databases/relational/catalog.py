@@ -0,0 +1,199 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+from sqlalchemy import bindparam, text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_TTL = 300.0  # seconds
+
+# One query per dialect returns every column of the requested schemas, in column order.
+# Columns: table_schema, table_name, column_name, data_type, is_nullable, ordinal_position
+_PG_CATALOG_QUERY = """
+    SELECT n.nspname AS table_schema,
+           c.relname AS table_name,
+           a.attname AS column_name,
+           format_type(a.atttypid, a.atttypmod) AS data_type,
+           NOT a.attnotnull AS is_nullable,
+           a.attnum AS ordinal_position
+    FROM pg_catalog.pg_attribute a
+    JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE a.attnum > 0
+      AND NOT a.attisdropped
+      AND c.relkind IN ({relkinds})
+      AND n.nspname IN :schemas
+    ORDER BY n.nspname, c.relname, a.attnum
+"""
+
+_INFORMATION_SCHEMA_QUERY = """
+    SELECT table_schema, table_name, column_name, data_type, is_nullable, ordinal_position
+    FROM information_schema.columns
+    WHERE table_schema IN :schemas
+    ORDER BY table_schema, table_name, ordinal_position
+"""
+
+CATALOG_QUERIES = {
+    # tables, views, materialized views, partitioned and foreign tables
+    "postgresql": _PG_CATALOG_QUERY.format(relkinds="'r', 'v', 'm', 'p', 'f'"),
+    "redshift": _PG_CATALOG_QUERY.format(relkinds="'r', 'v'"),
+}
+
+
+def catalog_query(dialect: str):
+    """Return the catalog query of a dialect, or the ``information_schema`` query of other dialects."""
+    query = CATALOG_QUERIES.get(dialect, _INFORMATION_SCHEMA_QUERY)
+    return text(query).bindparams(bindparam("schemas", expanding=True))
+
+
+def format_table_columns(schema: str, table: str, columns: List[Dict[str, Any]]) -> str:
+    """Describe the columns of a table on one line: "schema.table.column (type), ..."."""
+    return ", ".join(f"{schema}.{table}.{column['name']} ({column['type']})" for column in columns)
+
+
+def _is_nullable(value: Any) -> bool:
+    # information_schema reports 'YES' or 'NO'
+    if isinstance(value, str):
+        return value.upper() == "YES"
+    return bool(value)
+
+
+class Catalog:
+    """An in-memory index of the columns of database tables: schema -> table -> columns.
+
+    Columns are dicts with the "name", "type" and "nullable" of the column, in column order, as
+    ``BaseRelationalDatabase.get_table_columns`` returns them. Types are the names the database
+    reports, e.g. "integer" or "character varying(256)".
+
+    Parameters
+    ----------
+    tables : dict
+        The columns of each table of each schema.
+    loaded_at : float, optional
+        When the catalog was read from the database, in seconds of the loader's clock.
+
+    """
+
+    def __init__(self, tables: Dict[str, Dict[str, List[Dict[str, Any]]]], loaded_at: float = 0.0):
+        self._tables = tables
+        self.loaded_at = loaded_at
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence], loaded_at: float = 0.0) -> "Catalog":
+        """Build a catalog from rows of (schema, table, column, type, nullable, position)."""
+        tables: Dict[str, Dict[str, List[Tuple[int, Dict[str, Any]]]]] = {}
+        for schema, table, column, data_type, nullable, position in rows:
+            column_info = {"name": column, "type": data_type, "nullable": _is_nullable(nullable)}
+            tables.setdefault(schema, {}).setdefault(table, []).append((int(position), column_info))
+
+        return cls(
+            {
+                schema: {table: [column for _, column in sorted(columns, key=lambda item: item[0])]
+                         for table, columns in schema_tables.items()}
+                for schema, schema_tables in tables.items()
+            },
+            loaded_at,
+        )
+
+    def schemas(self) -> List[str]:
+        """Return the names of the schemas that have tables."""
+        return list(self._tables)
+
+    def tables(self, schema: str) -> List[str]:
+        """Return the names of the tables of a schema, or an empty list if it has none."""
+        return list(self._tables.get(schema, {}))
+
+    def columns(self, schema: str, table: str) -> List[Dict[str, Any]]:
+        """Return the columns of a table.
+
+        Raises
+        ------
+        KeyError
+            If the table is not in the catalog.
+
+        """
+        try:
+            return self._tables[schema][table]
+        except KeyError:
+            raise KeyError(f"Table {schema}.{table} not found in catalog.") from None
+
+    def __contains__(self, schema_table: Tuple[str, str]) -> bool:
+        schema, table = schema_table
+        return table in self._tables.get(schema, {})
+
+    def __iter__(self) -> Iterator[Tuple[str, str, List[Dict[str, Any]]]]:
+        """Iterate over (schema, table, columns)."""
+        for schema, schema_tables in self._tables.items():
+            for table, columns in schema_tables.items():
+                yield schema, table, columns
+
+    def __len__(self) -> int:
+        return sum(len(schema_tables) for schema_tables in self._tables.values())
+
+
+class CatalogLoader:
+    """Loads the catalog of database schemas in one query, and caches it for ``ttl`` seconds.
+
+    A catalog is cached per set of schemas. ``refresh`` drops the cached catalogs, e.g. after
+    a migration, so that the next ``load`` reads the database again.
+
+    Parameters
+    ----------
+    engine : sqlalchemy.engine.Engine
+        The engine of the database.
+    ttl : float, optional
+        The number of seconds a catalog is reused (default is 300).
+    clock : Callable[[], float], optional
+        The time source, ``time.monotonic`` by default.
+
+    """
+
+    def __init__(self, engine, ttl: float = DEFAULT_CATALOG_TTL, clock: Callable[[], float] = time.monotonic):
+        self.engine = engine
+        self.ttl = ttl
+        self.clock = clock
+        self._catalogs: Dict[Tuple[str, ...], Catalog] = {}
+        self._lock = threading.Lock()
+
+    def _fetch_rows(self, schemas: Sequence[str]) -> List[Sequence]:
+        query = catalog_query(self.engine.dialect.name)
+        with self.engine.connect() as connection:
+            return list(connection.execute(query, {"schemas": list(schemas)}))
+
+    def load(self, schemas: Sequence[str], refresh: bool = False) -> Catalog:
+        """Return the catalog of the schemas, from the cache unless it expired or ``refresh`` is set.
+
+        Parameters
+        ----------
+        schemas : Sequence[str]
+            The schemas to load.
+        refresh : bool, optional
+            Read the database even if the catalog is cached.
+
+        Returns
+        -------
+        Catalog
+            The columns of every table and view of the schemas.
+
+        """
+        key = tuple(sorted(set(schemas)))
+        if not key:
+            return Catalog({}, self.clock())
+
+        with self._lock:
+            catalog = self._catalogs.get(key)
+            if catalog is not None and not refresh and self.clock() - catalog.loaded_at < self.ttl:
+                return catalog
+
+            start = time.perf_counter()
+            catalog = Catalog.from_rows(self._fetch_rows(key), self.clock())
+            logger.info(f"Loaded catalog of {len(catalog)} tables in {len(key)} schemas "
+                        f"in {time.perf_counter() - start:.2f}s")
+            self._catalogs[key] = catalog
+            return catalog
+
+    def refresh(self):
+        """Drop every cached catalog."""
+        with self._lock:
+            self._catalogs.clear()
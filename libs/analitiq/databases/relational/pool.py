@@ -0,0 +1,119 @@
+import threading
+from typing import Any, Dict, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_TIMEOUT = 30  # seconds to wait for a free connection before failing
+DEFAULT_POOL_RECYCLE = 1800  # seconds; connections are replaced before idle timeouts of the warehouse drop them
+
+
+def pool_options(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the connection pool options of ``create_engine`` for the connection params.
+
+    The pool keeps up to 'pool_size' connections open, by default the 'threads' param: the number
+    of queries run concurrently. 'max_overflow' more are opened when they are all checked out.
+    'pool_timeout', 'pool_recycle' and 'pool_pre_ping' are passed to SQLAlchemy.
+
+    Parameters
+    ----------
+    params : dict
+        The connection params.
+
+    Returns
+    -------
+    dict
+        Keyword arguments of ``sqlalchemy.create_engine``.
+
+    """
+    return {
+        "pool_size": int(params.get("pool_size", params.get("threads", DEFAULT_POOL_SIZE))),
+        "max_overflow": int(params.get("max_overflow", DEFAULT_MAX_OVERFLOW)),
+        "pool_timeout": params.get("pool_timeout", DEFAULT_POOL_TIMEOUT),
+        "pool_recycle": params.get("pool_recycle", DEFAULT_POOL_RECYCLE),
+        "pool_pre_ping": params.get("pool_pre_ping", True),
+    }
+
+
+def set_statement_timeout(engine: Engine, seconds: Optional[float]):
+    """Set the statement timeout of every connection the engine opens.
+
+    The timeout is set once per connection, when it is opened, and committed so that it outlives
+    the transaction.
+    """
+    if not seconds or not isinstance(engine, Engine):
+        return
+
+    milliseconds = int(seconds * 1000)
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET statement_timeout = {milliseconds}")
+        cursor.close()
+        dbapi_connection.commit()
+
+
+class PoolMetrics:
+    """Connection pool metrics of an engine.
+
+    The pool events count the connections opened, checked out, checked in and invalidated.
+    Callers that check out through ``BaseRelationalDatabase.connection`` also record how long they
+    waited for a connection, which includes opening one when the pool has none idle.
+
+    Parameters
+    ----------
+    engine : sqlalchemy.engine.Engine
+        The engine to watch. The metrics of other objects, e.g. test doubles, stay at zero.
+
+    """
+
+    COUNTERS = ("connects", "checkouts", "checkins", "invalidations")
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._lock = threading.Lock()
+        self.reset()
+
+        if isinstance(engine, Engine):
+            for event_name, counter in (("connect", "connects"), ("checkout", "checkouts"),
+                                        ("checkin", "checkins"), ("invalidate", "invalidations")):
+                event.listen(engine.pool, event_name, self._counter(counter))
+
+    def _counter(self, name: str):
+        def count(*args):
+            with self._lock:
+                setattr(self, name, getattr(self, name) + 1)
+
+        return count
+
+    def reset(self):
+        with self._lock:
+            for name in self.COUNTERS:
+                setattr(self, name, 0)
+            self.waits = 0
+            self.wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+
+    def record_wait(self, seconds: float):
+        """Record the time a caller waited to check out a connection."""
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the counters, the checkout wait times and the current state of the pool."""
+        with self._lock:
+            metrics = {name: getattr(self, name) for name in self.COUNTERS}
+            metrics["avg_wait_seconds"] = self.wait_seconds / self.waits if self.waits else 0.0
+            metrics["max_wait_seconds"] = self.max_wait_seconds
+
+        if isinstance(self.engine, Engine):
+            pool = self.engine.pool
+            # only a QueuePool has a size; other pools, e.g. of sqlite, report what they can
+            for name in ("size", "checkedin", "checkedout", "overflow"):
+                if hasattr(pool, name):
+                    metrics[f"pool_{name}"] = getattr(pool, name)()
+        return metrics
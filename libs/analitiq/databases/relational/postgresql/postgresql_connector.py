@@ -1,5 +1,7 @@
+from urllib.parse import quote, urlencode
 from sqlalchemy import create_engine
 from analitiq.base.base_relational_database import BaseRelationalDatabase
+from analitiq.databases.relational.pool import pool_options
 from analitiq.logger.logger import initialize_logging
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -8,12 +10,46 @@ logger, chat_logger = initialize_logging()
 class PostgresqlConnector(BaseRelationalDatabase):
     """Database wrapper for PostgreSQL databases."""
 
-    def create_engine(self):
+    def connect_args(self):
+        """Return the psycopg2 connection arguments: timeouts, keepalives and session options."""
+        connect_args = {}
+        if self.params.get("connect_timeout"):
+            connect_args["connect_timeout"] = self.params["connect_timeout"]
+        if self.params.get("keepalives_idle"):
+            connect_args["keepalives"] = 1
+            connect_args["keepalives_idle"] = self.params["keepalives_idle"]
 
-        engine_options = {}
+        options = []
         if self.params.get("db_schemas"):
             schemas_str = ",".join(self.params["db_schemas"])
-            engine_options["connect_args"] = {"options": f"-csearch_path={schemas_str}"}
+            options.append(f"-csearch_path={schemas_str}")
+        if self.params.get("statement_timeout"):
+            # seconds, like the other timeouts; postgres expects milliseconds
+            options.append(f"-cstatement_timeout={int(self.params['statement_timeout'] * 1000)}")
+        if options:
+            connect_args["options"] = " ".join(options)
+
+        return connect_args
+
+    def adbc_uri(self):
+        """Return the libpq URI of the database for the ADBC PostgreSQL driver."""
+        query = {"connect_timeout": self.params.get("connect_timeout")}
+        options = self.connect_args().get("options")
+        if options:
+            query["options"] = options
+        query_string = urlencode({key: value for key, value in query.items() if value})
+        return (
+            f"postgresql://{quote(self.params['username'], safe='')}:{quote(self.params['password'], safe='')}@"
+            f"{self.params['host']}:{self.params['port']}/{self.params['db_name']}"
+            + (f"?{query_string}" if query_string else "")
+        )
+
+    def create_engine(self):
+
+        engine_options = pool_options(self.params)
+        connect_args = self.connect_args()
+        if connect_args:
+            engine_options["connect_args"] = connect_args
         # Create a redacted version of the connection string for logging
         redacted_url = (
             f"postgresql+psycopg2://{self.params['username']}:*****@"
@@ -1,6 +1,7 @@
 from sqlalchemy import create_engine
 from sqlalchemy.engine.url import URL
 from analitiq.base.base_relational_database import BaseRelationalDatabase
+from analitiq.databases.relational.pool import pool_options, set_statement_timeout
 
 
 class RedshiftConnector(BaseRelationalDatabase):
@@ -15,5 +16,10 @@ class RedshiftConnector(BaseRelationalDatabase):
             username=self.params["username"],
             password=self.params["password"],
         )
-        engine = create_engine(url, connect_args={"sslmode": "allow"})
+        connect_args = {"sslmode": "allow", "tcp_keepalive": True}
+        if self.params.get("connect_timeout"):
+            connect_args["timeout"] = self.params["connect_timeout"]
+
+        engine = create_engine(url, connect_args=connect_args, **pool_options(self.params))
+        set_statement_timeout(engine, self.params.get("statement_timeout"))
         return engine
@@ -0,0 +1,125 @@
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, Iterator, Optional, Union
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+# pandas is imported when the first page is fetched
+if TYPE_CHECKING:
+    import pandas as pd
+
+DEFAULT_PAGE_SIZE = 10_000
+DEFAULT_MAX_ROWS = 100_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ResultStream:
+    """Fetch the result of a query in pages of DataFrames, up to a number of rows and bytes.
+
+    The query runs on a server-side cursor (``stream_results``) that is read ``page_size`` rows
+    at a time (``yield_per``), so only one page is in memory while it is fetched. Once
+    ``max_rows`` rows or ``max_bytes`` bytes of DataFrames are reached, the last page is cut,
+    ``truncated`` is set, and the cursor is closed without reading the rest of the result.
+
+    The query is executed when the first page is requested. At least one page is returned, which
+    is empty if the query returns no rows. Call ``close``, or read every page, to give the
+    connection back to the pool.
+
+    Parameters
+    ----------
+    connect : Callable[[], ContextManager]
+        Returns a connection context manager, e.g. ``BaseRelationalDatabase.connection``.
+    sql : str or TextClause
+        The query.
+    params : dict, optional
+        The parameters of the query.
+    page_size : int, optional
+        The number of rows of a page (default is 10000).
+    max_rows : int, optional
+        The maximum number of rows returned. Unlimited if None.
+    max_bytes : int, optional
+        The maximum memory use of the returned DataFrames. Unlimited if None.
+
+    Attributes
+    ----------
+    rows : int
+        The number of rows returned so far.
+    bytes : int
+        The memory use of the DataFrames returned so far.
+    truncated : bool
+        Whether rows of the result were left out because of ``max_rows`` or ``max_bytes``.
+
+    """
+
+    def __init__(self, connect: Callable[[], ContextManager], sql: Union[str, TextClause],
+                 params: Optional[Dict[str, Any]] = None, page_size: int = DEFAULT_PAGE_SIZE,
+                 max_rows: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.connect = connect
+        self.statement = text(sql) if isinstance(sql, str) else sql
+        self.params = params or {}
+        self.page_size = page_size
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.rows = 0
+        self.bytes = 0
+        self.truncated = False
+        self._pages = self._fetch()
+
+    def __iter__(self) -> Iterator["pd.DataFrame"]:
+        return self
+
+    def __next__(self) -> "pd.DataFrame":
+        return next(self._pages)
+
+    def close(self):
+        """Stop fetching, and close the cursor and the connection."""
+        self._pages.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _cap(self, page: "pd.DataFrame") -> "pd.DataFrame":
+        if self.max_rows is not None and self.rows + len(page) > self.max_rows:
+            page = page.iloc[:self.max_rows - self.rows].copy()
+            self.truncated = True
+
+        page_bytes = int(page.memory_usage(deep=True, index=False).sum())
+        if self.max_bytes is not None and self.bytes + page_bytes > self.max_bytes:
+            # keep the rows that fit, assuming rows of the page have about the same size
+            fitting = int(len(page) * (self.max_bytes - self.bytes) / page_bytes) if page_bytes else len(page)
+            page = page.iloc[:max(fitting, 0)].copy()
+            page_bytes = int(page.memory_usage(deep=True, index=False).sum())
+            self.truncated = True
+
+        # number the rows across pages
+        page.index = range(self.rows, self.rows + len(page))
+        self.rows += len(page)
+        self.bytes += page_bytes
+        return page
+
+    def _fetch(self) -> Iterator["pd.DataFrame"]:
+        import pandas as pd
+
+        with self.connect() as connection:
+            result = connection.execution_options(stream_results=True, yield_per=self.page_size) \
+                .execute(self.statement, self.params)
+            try:
+                if not result.returns_rows:
+                    yield pd.DataFrame()
+                    return
+
+                columns = list(result.keys())
+                returned = False
+                for rows in result.partitions(self.page_size):
+                    page = self._cap(pd.DataFrame.from_records(rows, columns=columns))
+                    if len(page) or not returned:
+                        returned = True
+                        yield page
+                    if self.truncated:
+                        break
+
+                if not returned:
+                    yield pd.DataFrame(columns=columns)
+            finally:
+                result.close()
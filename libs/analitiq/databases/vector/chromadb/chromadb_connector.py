@@ -0,0 +1,548 @@
+# File: databases/vector/chromadb/chromadb_connector.py
+
+import logging
+import re
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+import numpy as np
+from analitiq.base.base_vector_database import BaseVectorDatabase
+from analitiq.databases.vector.chromadb.client_pool import DEFAULT_PORT, get_client_pool
+from analitiq.databases.vector.chromadb.query_builder import ChromaQueryBuilder, _combine
+from analitiq.databases.vector.faiss.bm25 import BM25Index
+from analitiq.databases.vector.faiss.filters import LocalQueryBuilder
+from analitiq.databases.vector.schema import (
+    AggregateGroup,
+    AggregateGroupByResult,
+    AggregateResult,
+    DeleteResult,
+    GroupedBy,
+    SearchMetadata,
+    SearchObject,
+    SearchResult,
+)
+from analitiq.databases.vector.utils.analitiq_vectorizer import AnalitiqVectorizer, DEFAULT_MODEL_NAME
+from analitiq.databases.vector.utils.document_loading import DocumentLoaderMixin
+from analitiq.databases.vector.utils.embedding_cache import EmbeddingCache, DEFAULT_CACHE_SIZE
+from analitiq.databases.vector.utils.fusion import ResultFusion
+from analitiq.databases.vector.utils.incremental_sync import chunk_uuid, number_identical_chunks
+from analitiq.databases.vector.utils.inference_backends import DEFAULT_BACKEND
+from analitiq.databases.vector.utils.query_vector_memo import memoized_query_vector
+from analitiq.utils.document_processor import group_results_by_properties
+from analitiq.utils.keyword_extractions import get_keyword_extractor
+from analitiq.loaders.documents.schemas import Chunk
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = "~/.analitiq/chroma"
+DEFAULT_TENANT = "default"
+DEFAULT_BATCH_SIZE = 500
+COLLECTION_METADATA = {"hnsw:space": "cosine"}
+
+# metadata of the connector stored next to the chunk properties
+TERMS_KEY = "_terms"
+UPDATED_KEY = "_updated"
+INTERNAL_KEYS = (TERMS_KEY, UPDATED_KEY)
+CHUNK_PROPERTIES = tuple(Chunk.model_fields)
+
+
+def _collection_prefix(collection_name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9._-]+", "_", collection_name).lstrip("._-") + "__"
+
+
+def _collection_name(collection_name: str, tenant_name: Optional[str]) -> str:
+    """Return the Chroma collection of a collection tenant, a name of the characters Chroma allows."""
+    tenant = re.sub(r"[^a-zA-Z0-9._-]+", "_", tenant_name or DEFAULT_TENANT).rstrip("._-")
+    return _collection_prefix(collection_name) + tenant
+
+
+def _metadata(chunk: Chunk, terms: List[str], updated: float) -> Dict[str, Any]:
+    """Return the Chroma metadata of a chunk. Chroma rejects None values and empty lists."""
+    properties = chunk.model_dump(mode="json", exclude={"content"})
+    metadata = {key: value for key, value in properties.items() if value is not None and value != []}
+    if terms:
+        metadata[TERMS_KEY] = terms
+    metadata[UPDATED_KEY] = updated
+    return metadata
+
+
+def _properties(metadata: Optional[Dict[str, Any]], document: Optional[str]) -> Dict[str, Any]:
+    """Return the chunk properties of a stored object, with None for the properties it does not have."""
+    properties = dict.fromkeys(CHUNK_PROPERTIES)
+    properties.update((key, value) for key, value in (metadata or {}).items() if key not in INTERNAL_KEYS)
+    properties["content"] = document
+    return properties
+
+
+def _timestamp(value) -> Optional[datetime]:
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return None
+
+
+class ChromadbConnector(DocumentLoaderMixin, BaseVectorDatabase):
+    """The ChromadbConnector Class stores chunks in a self-hosted Chroma.
+
+    It runs Chroma in-process, persisted under ``path``, or connects to a Chroma server if ``host``
+    is given. Each collection tenant is a Chroma collection named ``<collection>__<tenant>``, using
+    the cosine distance. The connector opens the collection once and keeps its handle; the client
+    is shared with the other connectors of the process (see ``ChromaClientPool``).
+
+    The chunks are embedded with the connector's vectorizer, not by Chroma, and upserted in batches.
+    The chunk properties are the metadata of the Chroma records and the content is their document.
+    The searches, filters and deletes take the same arguments as the WeaviateConnector and return
+    results with the same attributes (see ``analitiq.databases.vector.schema``).
+    """
+
+    def __init__(self, params):
+        """Initialize a new instance of ChromadbConnector.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            Dictionary of parameters including 'collection_name' and 'tenant_name'.
+            'path' is the directory of the in-process Chroma (default is ``~/.analitiq/chroma``).
+            Set 'host', and optionally 'port', 'ssl' and 'headers', to use a Chroma server instead.
+            'batch_size' is the number of chunks upserted or deleted per request (default is 500,
+            at most the maximum batch size of the Chroma server).
+            'embedding_model', 'normalize_embeddings', 'embedding_cache_size',
+            'embedding_cache_path', 'embedding_backend' and 'embedding_backend_options' configure
+            the vectorizer, and 'fusion', 'fusion_weights', 'fusion_k' and 'fusion_overfetch' the
+            hybrid search, as for the WeaviateConnector.
+
+        """
+        super().__init__(params)
+        self.params = params
+        self.collection_name = self.params.get("collection_name", "default_collection")
+        self.tenant_name = self.params.get("tenant_name")
+        self.client_options = {
+            "path": self.params.get("path", DEFAULT_PATH),
+            "host": self.params.get("host"),
+            "port": self.params.get("port", DEFAULT_PORT),
+            "ssl": self.params.get("ssl", False),
+            "headers": self.params.get("headers"),
+        }
+        self.batch_size = self.params.get("batch_size", DEFAULT_BATCH_SIZE)
+        self.client = None
+        self.collection = None
+        self.connected = False
+        self.embedding_cache = EmbeddingCache(
+            max_items=self.params.get("embedding_cache_size", DEFAULT_CACHE_SIZE),
+            db_path=self.params.get("embedding_cache_path"),
+        )
+        self.vectorizer = AnalitiqVectorizer(
+            self.params.get("embedding_model", DEFAULT_MODEL_NAME),
+            normalize_embeddings=self.params.get("normalize_embeddings", False),
+            cache=self.embedding_cache,
+            backend=self.params.get("embedding_backend", DEFAULT_BACKEND),
+            backend_options=self.params.get("embedding_backend_options"),
+        )
+        self.fusion = ResultFusion.from_params(self.params)
+        self.connect()
+
+    def __enter__(self):
+        if not self.connected:
+            self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def _get_collection(self, collection_name: str, tenant_name: Optional[str]):
+        return self.client.get_or_create_collection(
+            _collection_name(collection_name, tenant_name),
+            metadata=COLLECTION_METADATA,
+            embedding_function=None,
+        )
+
+    def connect(self):
+        """Get the pooled client and open the collection of the connector's tenant, creating it if needed."""
+        self.client = get_client_pool().get_client(**self.client_options)
+        self.collection = self._get_collection(self.collection_name, self.tenant_name)
+        self.batch_size = min(self.batch_size, self.client.get_max_batch_size())
+        self.connected = True
+
+    def close(self):
+        """Release the collection handle. The client stays in the pool."""
+        self.collection = None
+        self.client = None
+        self.connected = False
+
+    def _get_query_vector(self, query: str) -> List[float]:
+        """Vectorize a query, reusing its vector within the current request scope."""
+        return memoized_query_vector(self.vectorizer, query)
+
+    def _batches(self, items: List):
+        for start in range(0, len(items), self.batch_size):
+            yield items[start:start + self.batch_size]
+
+    def _matching(self, filter_expression: Optional[Dict], include: List[str]) -> Dict[str, List]:
+        """Get the ids, and the ``include``d fields, of the objects matching a filter expression.
+
+        The filter is translated to a Chroma ``where`` filter. If it could only be translated in
+        part, the objects Chroma returns are checked against the expression.
+        """
+        builder = ChromaQueryBuilder()
+        where = builder.construct_query(filter_expression)
+        if builder.exact:
+            response = self.collection.get(where=where, include=include)
+            return {key: response[key] or [] for key in ["ids"] + include}
+
+        response = self.collection.get(where=where, include=sorted({"metadatas", "documents", *include}))
+        matches = LocalQueryBuilder().construct_query(filter_expression)
+        keep = [
+            i for i, (metadata, document) in enumerate(zip(response["metadatas"], response["documents"]))
+            if matches(_properties(metadata, document))
+        ]
+        return {key: [response[key][i] for i in keep] for key in ["ids"] + include}
+
+    def create_collection(self, collection_name: str) -> str:
+        """Create the collection for the connector's tenant, if it does not exist, and return its name."""
+        with self:
+            self._get_collection(collection_name, self.tenant_name)
+        logger.info(f"Collection exists: {collection_name}")
+        return collection_name
+
+    def collection_add_tenant(self, tenant_name: str) -> bool:
+        """
+        Add a tenant to the collection of the connector
+
+        :param tenant_name: The name of the tenant to be added to the collection.
+        :return: True
+        """
+        with self:
+            self._get_collection(self.collection_name, tenant_name)
+        return True
+
+    def load_chunks(self, chunks: List[Chunk]) -> int:
+        """Load chunks into Chroma.
+
+        The contents of all chunks are vectorized together in batches. Each chunk gets a UUID
+        derived from its document UUID and content, so loading the same chunk again overwrites it.
+
+        Parameters
+        ----------
+        chunks : List[Chunk]
+            The chunks to load.
+
+        Returns
+        -------
+        int
+            The number of chunks loaded.
+
+        """
+        number_identical_chunks(chunks)
+        hf_vectors = self.vectorizer.vectorize_batch([chunk.content for chunk in chunks])
+
+        return self._write_chunks(chunks, hf_vectors)
+
+    def _write_chunks(self, chunks: List[Chunk], hf_vectors) -> int:
+        """Upsert chunks with their precomputed vectors, ``batch_size`` per request, and return the number written.
+
+        If a chunk occurs more than once, the last one is written.
+        """
+        if not chunks:
+            return 0
+
+        extractor = get_keyword_extractor()
+        updated = time.time()
+        records = {}
+        for chunk, vector in zip(chunks, hf_vectors):
+            content = chunk.content or ""
+            records[chunk_uuid(chunk.document_uuid, chunk.content, chunk.occurrence)] = (
+                content, _metadata(chunk, extractor.terms(content), updated), vector
+            )
+
+        with self:
+            for ids in self._batches(list(records)):
+                documents, metadatas, vectors = zip(*(records[uuid] for uuid in ids))
+                self.collection.upsert(
+                    ids=ids,
+                    documents=list(documents),
+                    metadatas=list(metadatas),
+                    embeddings=np.asarray(vectors, dtype=np.float32),
+                )
+        return len(records)
+
+    def _objects(self, ids: List[str], metadatas: List, documents: List, metadata: List[SearchMetadata]) -> SearchResult:
+        return SearchResult(objects=[
+            SearchObject(uuid=uuid, properties=_properties(properties, document), metadata=hit)
+            for uuid, properties, document, hit in zip(ids, metadatas, documents, metadata)
+        ])
+
+    def kw_search(self, query: str, limit: int = 3) -> SearchResult:
+        """Perform a BM25 keyword search over the chunk contents.
+
+        The query is reduced to its stemmed keywords, as the chunks were when they were loaded.
+        Chroma selects the chunks containing one of the keywords and they are ranked with BM25. The
+        term statistics are those of the selected chunks, not of the whole collection.
+
+        Parameters
+        ----------
+        query : str
+            The search query.
+        limit : int, optional
+            The maximum number of search results to return, by default 3.
+
+        Returns
+        -------
+        SearchResult
+            The matching chunks, best first, with their BM25 score in ``metadata.score``.
+
+        """
+        terms = list(dict.fromkeys(get_keyword_extractor().terms(query)))
+        logger.info("Extracted keywords to search for: %s", " ".join(terms))
+        if not terms or limit <= 0:
+            return SearchResult()
+
+        with self:
+            where = _combine("$or", [{TERMS_KEY: {"$contains": term}} for term in terms])
+            response = self.collection.get(where=where, include=["metadatas", "documents"])
+
+        index = BM25Index()
+        rows = {}
+        for row, (uuid, metadata) in enumerate(zip(response["ids"], response["metadatas"])):
+            index.add(uuid, metadata.get(TERMS_KEY, []))
+            rows[uuid] = row
+
+        hits = index.search(terms, limit)
+        return SearchResult(objects=[
+            SearchObject(
+                uuid=uuid,
+                properties=_properties(response["metadatas"][rows[uuid]], response["documents"][rows[uuid]]),
+                metadata=SearchMetadata(score=score),
+            )
+            for uuid, score in hits
+        ])
+
+    def vector_search(self, query: str, limit: int = 3, query_vector: List[float] = None) -> SearchResult:
+        """Use Vector Search for document retrieval from Chroma.
+
+        Parameters
+        ----------
+        query : str
+            The query string for vector search.
+        limit : int, optional
+            Maximum number of results to return (default is 3).
+        query_vector : List[float], optional
+            A precomputed vector of the query. If not given, the query is vectorized.
+
+        Returns
+        -------
+        SearchResult
+            The nearest chunks, with their cosine distance in ``metadata.distance``.
+
+        """
+        near_vector = query_vector if query_vector is not None else self._get_query_vector(query)
+        if limit <= 0:
+            return SearchResult()
+
+        with self:
+            response = self.collection.query(
+                query_embeddings=[np.asarray(near_vector, dtype=np.float32)],
+                n_results=limit,
+                include=["metadatas", "documents", "distances"],
+            )
+        return self._objects(
+            response["ids"][0], response["metadatas"][0], response["documents"][0],
+            [SearchMetadata(distance=distance) for distance in response["distances"][0]],
+        )
+
+    def search(self, query: str, limit: int = 3) -> SearchResult:
+        return self.hybrid_search(query, limit)
+
+    def hybrid_search(self, query: str, limit: int = 3) -> SearchResult:
+        """Use Hybrid Search for document retrieval from Chroma.
+
+        Combines the keyword and the vector search. Each leg fetches ``limit * fusion.overfetch``
+        results, which are merged by the connector's fusion stage (see ``ResultFusion``).
+
+        Parameters
+        ----------
+        query : str
+            The search query.
+        limit : int, optional
+            The maximum number of results to return (default is 3).
+
+        Returns
+        -------
+        SearchResult
+            The hybrid search results, best first, with the fused score in ``metadata.score``.
+
+        """
+        query_vector = self._get_query_vector(query)
+        leg_limit = self.fusion.fetch_limit(limit)
+
+        kw_results = self.kw_search(query, leg_limit)
+        vector_results = self.vector_search(query, leg_limit, query_vector)
+
+        return self.fusion.fuse([kw_results, vector_results], limit)
+
+    def search_filter(self, query: str, filter_expression: dict = None, group_properties: list = None):
+        """Rank the objects matching a filter expression by their similarity to the query.
+
+        Parameters
+        ----------
+        query : str
+            The search query.
+        filter_expression : dict, optional
+            A filter expression, as for the WeaviateConnector (default is None, all objects).
+        group_properties : list, optional
+            A list of properties to group results by (default is None).
+
+        Returns
+        -------
+        list or None
+            Filtered and grouped search results, or None if the search failed.
+
+        """
+        try:
+            query_vector = self._get_query_vector(query)
+            with self:
+                ids = self._matching(filter_expression, include=[])["ids"]
+                if not ids:
+                    return []
+                response = self.collection.query(
+                    query_embeddings=[np.asarray(query_vector, dtype=np.float32)],
+                    ids=ids,
+                    n_results=len(ids),
+                    include=["metadatas", "documents", "distances"],
+                )
+            response = self._objects(
+                response["ids"][0], response["metadatas"][0], response["documents"][0],
+                [SearchMetadata(distance=distance) for distance in response["distances"][0]],
+            )
+
+        except Exception as e:
+            logger.error(f"Error retrieving documents: {e}")
+            return None
+
+        if not response.objects:
+            return []
+
+        if group_properties:
+            return group_results_by_properties(response, group_properties)
+        else:
+            return response
+
+    def filter(self, filter_expression: dict) -> SearchResult:
+        """Return the objects matching a filter expression, with their creation and last update time.
+
+        Parameters
+        ----------
+        filter_expression : dict
+            The filter, e.g. ``{"property": "name", "operator": "=", "value": "John"}``. Clauses can
+            be nested in "and" and "or".
+
+        Returns
+        -------
+        SearchResult
+            The matching objects.
+
+        """
+        with self:
+            response = self._matching(filter_expression, include=["metadatas", "documents"])
+        return self._objects(
+            response["ids"], response["metadatas"], response["documents"],
+            [SearchMetadata(creation_time=_timestamp(metadata.get("created_ts")),
+                            last_update_time=_timestamp(metadata.get(UPDATED_KEY)))
+             for metadata in response["metadatas"]],
+        )
+
+    def filter_count(self, filter_expression: dict) -> AggregateResult:
+        """Count the objects matching a filter expression."""
+        with self:
+            return AggregateResult(total_count=len(self._matching(filter_expression, include=[])["ids"]))
+
+    def filter_group_count(self, filter_expression: dict, group_by_prop: str) -> AggregateGroupByResult:
+        """Count the objects matching a filter expression per value of a property.
+
+        Chroma does not aggregate, so the metadata of the matching objects is fetched and counted.
+        An object with an array property counts once for each of its values. Groups are sorted by
+        count, largest first.
+        """
+        counts: Dict[Any, int] = {}
+        with self:
+            metadatas = self._matching(filter_expression, include=["metadatas"])["metadatas"]
+        for metadata in metadatas:
+            value = metadata.get(group_by_prop)
+            for item in value if isinstance(value, list) else [value]:
+                counts[item] = counts.get(item, 0) + 1
+
+        groups = [
+            AggregateGroup(grouped_by=GroupedBy(prop=group_by_prop, value=value), total_count=count)
+            for value, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)
+        ]
+        return AggregateGroupByResult(groups=groups)
+
+    def _delete_ids(self, ids: List[str]) -> DeleteResult:
+        """Delete objects by id, ``batch_size`` per request."""
+        deleted = 0
+        with self:
+            for batch in self._batches(ids):
+                try:
+                    self.collection.delete(ids=batch)
+                    deleted += len(batch)
+                except Exception as e:
+                    logger.error(f"Error deleting {len(batch)} objects: {e}")
+        return DeleteResult(matches=len(ids), successful=deleted, failed=len(ids) - deleted)
+
+    def _delete_matching(self, filter_expression: dict) -> DeleteResult:
+        with self:
+            ids = self._matching(filter_expression, include=[])["ids"]
+        return self._delete_ids(ids)
+
+    def filter_delete(self, property_name, property_value) -> DeleteResult:
+        return self._delete_matching({"property": property_name, "operator": "=", "value": property_value})
+
+    def delete_many_on_param(self, property_name: str, filter_list: List[str]) -> DeleteResult:
+        return self._delete_matching({"property": property_name, "operator": "contains_any", "value": filter_list})
+
+    def delete_many_on_uuids(self, uuids: List[str]) -> DeleteResult:
+        uuids = list(dict.fromkeys(uuids))
+        with self:
+            existing = [uuid for batch in self._batches(uuids)
+                        for uuid in self.collection.get(ids=batch, include=[])["ids"]]
+        return self._delete_ids(existing)
+
+    def delete_on_metadata_and(self, filter_list: List) -> DeleteResult:
+        """
+        Removes the objects matching all the given filters.
+
+        Args:
+            filter_list (List[Dict]): A list of dictionaries each containing the property name,
+                                      operator, and value to filter the documents by. An AND operation
+                                      is performed across filters.
+
+        Returns:
+            DeleteResult: The number of objects that matched and were deleted.
+
+        Raises:
+            ValueError: If the filter list is empty, which would delete every object.
+
+        """
+        if not filter_list:
+            raise ValueError("filter_list is empty")
+        return self._delete_matching({"and": filter_list})
+
+    def delete_collection(self, collection_name: str) -> bool:
+        """Delete a collection, with the Chroma collections of all its tenants.
+
+        Returns True if the collection was deleted and False if an error occurred.
+        """
+        prefix = _collection_prefix(collection_name)
+        try:
+            with self:
+                for collection in self.client.list_collections():
+                    name = collection if isinstance(collection, str) else collection.name
+                    if name.startswith(prefix):
+                        self.client.delete_collection(name)
+            if collection_name == self.collection_name:
+                self.close()
+            logger.info(f"Deleted collection '{collection_name}'")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting collection: {e}")
+            return False
@@ -0,0 +1,149 @@
+# File: databases/vector/chromadb/client_pool.py
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CHECK_INTERVAL = 30.0  # seconds between heartbeats of a pooled HTTP client
+DEFAULT_PORT = 8000
+
+ClientKey = Tuple
+
+
+class ChromaClientPool:
+    """A process-wide registry of Chroma clients.
+
+    Every connector pointing at the same persistent directory, or at the same Chroma server,
+    shares one client. Access is thread-safe: concurrent callers asking for the same key wait
+    for one client to be created instead of racing to open several.
+
+    A pooled HTTP client sends a heartbeat to its server at most once every
+    ``health_check_interval`` seconds when it is handed out, and is replaced if the heartbeat
+    fails. A persistent client runs in-process and is not checked.
+
+    chromadb is imported when the first client is created.
+
+    Parameters
+    ----------
+    health_check_interval : float, optional
+        Minimum number of seconds between two heartbeats of the same client.
+
+    """
+
+    def __init__(self, health_check_interval: float = HEALTH_CHECK_INTERVAL):
+        self.health_check_interval = health_check_interval
+        self._clients: Dict[ClientKey, Any] = {}
+        self._last_checked: Dict[ClientKey, float] = {}
+        self._key_locks: Dict[ClientKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def client_key(path: str = None, host: str = None, port: int = DEFAULT_PORT, ssl: bool = False,
+                   headers: Optional[Dict[str, str]] = None) -> ClientKey:
+        """Return the key of the client for a server if ``host`` is given, otherwise for a directory."""
+        if host:
+            return ("http", host, int(port), bool(ssl), tuple(sorted((headers or {}).items())))
+        return ("persistent", str(Path(path).expanduser().resolve()))
+
+    @staticmethod
+    def _create_client(key: ClientKey):
+        import chromadb
+
+        if key[0] == "http":
+            _, host, port, ssl, headers = key
+            return chromadb.HttpClient(host=host, port=port, ssl=ssl, headers=dict(headers) or None)
+
+        Path(key[1]).mkdir(parents=True, exist_ok=True)
+        return chromadb.PersistentClient(path=key[1])
+
+    def _get_key_lock(self, key: ClientKey) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _is_healthy(self, key: ClientKey, client) -> bool:
+        if key[0] != "http":
+            return True
+
+        now = time.monotonic()
+        if now - self._last_checked.get(key, 0.0) < self.health_check_interval:
+            return True
+
+        try:
+            client.heartbeat()
+        except Exception as e:
+            logger.warning(f"Heartbeat of pooled Chroma client failed: {e}")
+            return False
+
+        self._last_checked[key] = now
+        return True
+
+    def get_client(self, path: str = None, host: str = None, port: int = DEFAULT_PORT, ssl: bool = False,
+                   headers: Optional[Dict[str, str]] = None):
+        """Return a client for a Chroma server, or for a persistent directory if no host is given.
+
+        Parameters
+        ----------
+        path : str, optional
+            The directory of an in-process persistent Chroma. Used if ``host`` is not given.
+        host : str, optional
+            The host of a Chroma server.
+        port : int, optional
+            The port of the Chroma server (default is 8000).
+        ssl : bool, optional
+            Connect to the server over HTTPS.
+        headers : Dict[str, str], optional
+            HTTP headers sent with every request, e.g. for authentication.
+
+        Returns
+        -------
+        chromadb.api.ClientAPI
+            A client shared with every other caller using the same server or directory.
+
+        Raises
+        ------
+        Exception
+            If a new client has to be created and it fails.
+
+        """
+        key = self.client_key(path, host, port, ssl, headers)
+
+        with self._get_key_lock(key):
+            client = self._clients.get(key)
+            if client is not None:
+                if self._is_healthy(key, client):
+                    return client
+                logger.warning(f"Pooled Chroma client for {host} is unhealthy. Reconnecting.")
+
+            client = self._create_client(key)
+            self._clients[key] = client
+            self._last_checked[key] = time.monotonic()
+            logger.info(f"Opened pooled Chroma client: {host or key[1]}")
+
+            return client
+
+    def invalidate(self, key: ClientKey):
+        """Forget the pooled client of a key, so that the next ``get_client`` creates a new one."""
+        with self._get_key_lock(key):
+            self._clients.pop(key, None)
+            self._last_checked.pop(key, None)
+
+    def shutdown(self):
+        """Forget every pooled client."""
+        with self._lock:
+            self._clients.clear()
+            self._last_checked.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+_client_pool = ChromaClientPool()
+
+
+def get_client_pool() -> ChromaClientPool:
+    """Return the process-wide Chroma client pool."""
+    return _client_pool
@@ -0,0 +1,105 @@
+from typing import Any, Dict, List, Optional
+
+Where = Dict[str, Any]
+
+COMPARISONS = {">": "$gt", "<": "$lt", ">=": "$gte", "<=": "$lte"}
+OPERATORS = ("like", "=", "!=", "contains_any", "contains_all") + tuple(COMPARISONS)
+
+
+def _combine(operator: str, filters: List[Where]) -> Optional[Where]:
+    """Combine filters with "$and" or "$or". Chroma requires at least two operands."""
+    if not filters:
+        return None
+    if len(filters) == 1:
+        return filters[0]
+    return {operator: filters}
+
+
+def _equal(name: str, value: Any) -> Where:
+    # "$eq" matches a scalar property and "$contains" an item of an array property
+    return {"$or": [{name: {"$eq": value}}, {name: {"$contains": value}}]}
+
+
+def _not_equal(name: str, value: Any) -> Where:
+    return {"$and": [{name: {"$ne": value}}, {name: {"$not_contains": value}}]}
+
+
+class ChromaQueryBuilder:
+    """Translates filter expressions into Chroma ``where`` filters.
+
+    The expressions are those of the QueryBuilder of the Weaviate connector: a clause
+    ``{"property": ..., "operator": ..., "value": ...}``, or clauses nested in "and" and "or".
+    "=", "!=", "contains_any" and "contains_all" apply to scalar and array properties alike.
+
+    Chroma cannot filter every clause: it has no ``like`` operator, and the chunk content is
+    stored as the document, not as metadata. Such clauses are left out of the ``where`` filter,
+    which then matches a superset of the objects, and ``exact`` is set to False. The caller checks
+    the objects it gets against the expression with the LocalQueryBuilder.
+
+    Parameters
+    ----------
+    document_properties : tuple, optional
+        The properties stored as the Chroma document rather than in the metadata.
+
+    Attributes
+    ----------
+    exact : bool
+        Whether the last constructed filter matches exactly the objects of the expression.
+
+    Exceptions:
+        ValueError: Raised when an unsupported operator or logical operator is encountered.
+
+    """
+
+    def __init__(self, document_properties: tuple = ("content",)):
+        self.document_properties = document_properties
+        self.exact = True
+
+    def construct_query(self, expression: Optional[Dict[str, Any]]) -> Optional[Where]:
+        """Return the ``where`` filter of an expression, or None if it does not filter anything."""
+        self.exact = True
+        if not expression:
+            return None
+        return self.build_filters(expression)
+
+    def build_filters(self, expression: Dict[str, Any]) -> Optional[Where]:
+        if "property" in expression and "operator" in expression and "value" in expression:
+            return self._build_clause(expression["property"], expression["operator"].lower(), expression["value"])
+
+        logical_op, clauses = next(iter(expression.items()))
+        filters = [self.build_filters(clause) for clause in clauses]
+
+        if logical_op.lower() == "and":
+            return _combine("$and", [f for f in filters if f is not None])
+        elif logical_op.lower() == "or":
+            if not filters or None in filters:
+                self.exact = False
+                return None
+            return _combine("$or", filters)
+        else:
+            raise ValueError(f"Unsupported logical operator: {logical_op}")
+
+    def _build_clause(self, name: str, operator: str, value: Any) -> Optional[Where]:
+        if operator not in OPERATORS:
+            raise ValueError(f"Unsupported operator: {operator}")
+        if operator in ("contains_any", "contains_all") and not isinstance(value, list):
+            raise ValueError(f"Value must be list: {value}")
+
+        if operator == "like" or name in self.document_properties:
+            self.exact = False
+            return None
+
+        if operator == "=":
+            return _equal(name, value)
+        elif operator == "!=":
+            return _not_equal(name, value)
+        elif operator in COMPARISONS:
+            return {name: {COMPARISONS[operator]: value}}
+        elif operator == "contains_any":
+            if not value:
+                # matches nothing, which Chroma cannot express
+                self.exact = False
+                return None
+            return _combine("$or", [_equal(name, item) for item in value])
+        else:  # contains_all
+            return _combine("$and", [_equal(name, item) for item in value])
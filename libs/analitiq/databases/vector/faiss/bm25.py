@@ -0,0 +1,112 @@
+import heapq
+import math
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# the defaults of Weaviate's bm25 search
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+
+class BM25Index:
+    """An Okapi BM25 keyword index over the terms of stored chunks.
+
+    The index keeps the term frequencies of every document and an inverted index from term to
+    documents, so that a query only scores the documents containing one of its terms. Documents
+    are added, replaced and removed one by one, and the whole index serializes to a dict.
+
+    Parameters
+    ----------
+    k1 : float, optional
+        Term frequency saturation (default is 1.2).
+    b : float, optional
+        Document length normalization (default is 0.75).
+
+    Examples
+    --------
+    >>> index = BM25Index()
+    >>> index.add("a", ["revenu", "month"])
+    >>> index.add("b", ["custom", "month"])
+    >>> index.search(["revenu"], limit=1)
+    [('a', 0.693...)]
+
+    """
+
+    def __init__(self, k1: float = DEFAULT_K1, b: float = DEFAULT_B):
+        self.k1 = k1
+        self.b = b
+        self.documents: Dict[str, Dict[str, int]] = {}
+        self.lengths: Dict[str, int] = {}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.documents
+
+    def add(self, doc_id: str, terms: Iterable[str]):
+        """Index the terms of a document, replacing the document if it is already indexed."""
+        self._add_frequencies(doc_id, dict(Counter(terms)))
+
+    def _add_frequencies(self, doc_id: str, frequencies: Dict[str, int]):
+        self.remove(doc_id)
+        self.documents[doc_id] = frequencies
+        length = sum(frequencies.values())
+        self.lengths[doc_id] = length
+        self.total_length += length
+        for term, frequency in frequencies.items():
+            self.postings.setdefault(term, {})[doc_id] = frequency
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document from the index. Returns False if it was not indexed."""
+        frequencies = self.documents.pop(doc_id, None)
+        if frequencies is None:
+            return False
+
+        self.total_length -= self.lengths.pop(doc_id)
+        for term in frequencies:
+            postings = self.postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self.postings[term]
+        return True
+
+    def search(self, terms: Iterable[str], limit: int,
+               allowed: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, float]]:
+        """Return up to ``limit`` (document id, score) pairs, best first.
+
+        Repeated query terms count once. ``allowed`` restricts the search to the documents for
+        which it returns True.
+        """
+        if not self.documents or limit <= 0:
+            return []
+
+        count = len(self.documents)
+        average_length = self.total_length / count or 1.0
+        scores: Dict[str, float] = {}
+
+        for term in dict.fromkeys(terms):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                if allowed is not None and not allowed(doc_id):
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def to_dict(self) -> dict:
+        return {"k1": self.k1, "b": self.b, "documents": self.documents}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BM25Index":
+        index = cls(k1=data.get("k1", DEFAULT_K1), b=data.get("b", DEFAULT_B))
+        for doc_id, frequencies in data.get("documents", {}).items():
+            index._add_frequencies(doc_id, frequencies)
+        return index
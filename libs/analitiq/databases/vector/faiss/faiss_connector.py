@@ -1,27 +1,429 @@
-import faiss
-from langchain_community.docstore.in_memory import InMemoryDocstore
-from langchain_community.vectorstores import FAISS
-from uuid import uuid4
-from langchain_openai import OpenAIEmbeddings
-
-embeddings = OpenAIEmbeddings(model="text-embedding-3-large")
-documents = []
-
-index = faiss.IndexFlatL2(len(embeddings.embed_query("hello world")))
-
-vector_store = FAISS(
-    embedding_function=embeddings,
-    index=index,
-    docstore=InMemoryDocstore(),
-    index_to_docstore_id={},
+# File: databases/vector/faiss/faiss_connector.py
+
+import logging
+import re
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from analitiq.base.base_vector_database import BaseVectorDatabase
+from analitiq.databases.vector.faiss.filters import LocalQueryBuilder
+from analitiq.databases.vector.faiss.vector_store import LocalVectorStore, drop_stores, get_store
+from analitiq.databases.vector.schema import (
+    AggregateGroup,
+    AggregateGroupByResult,
+    AggregateResult,
+    DeleteResult,
+    GroupedBy,
+    SearchMetadata,
+    SearchObject,
+    SearchResult,
 )
+from analitiq.databases.vector.utils.analitiq_vectorizer import AnalitiqVectorizer, DEFAULT_MODEL_NAME
+from analitiq.databases.vector.utils.document_loading import DocumentLoaderMixin
+from analitiq.databases.vector.utils.embedding_cache import EmbeddingCache, DEFAULT_CACHE_SIZE
+from analitiq.databases.vector.utils.fusion import ResultFusion
+from analitiq.databases.vector.utils.incremental_sync import chunk_uuid, number_identical_chunks
+from analitiq.databases.vector.utils.inference_backends import DEFAULT_BACKEND
+from analitiq.databases.vector.utils.query_vector_memo import memoized_query_vector
+from analitiq.utils.document_processor import group_results_by_properties
+from analitiq.utils.keyword_extractions import get_keyword_extractor
+from analitiq.loaders.documents.schemas import Chunk
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = "~/.analitiq/faiss"
+DEFAULT_TENANT = "default"
+STORE_OPTIONS = ("index_type", "hnsw_m", "hnsw_ef_search", "ivf_nlist", "ivf_nprobe")
+
+
+def _dir_name(name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", name)
+
+
+def _timestamp(seconds: float) -> datetime:
+    return datetime.fromtimestamp(seconds, tz=timezone.utc)
+
+
+class FaissConnector(DocumentLoaderMixin, BaseVectorDatabase):
+    """The FaissConnector Class keeps a vector database in-process, in a local directory.
+
+    Each collection tenant is a LocalVectorStore: a FAISS index (flat, HNSW or IVF) of the chunk
+    vectors, a BM25 index of the chunk terms, and the chunk properties, saved under
+    ``<path>/<collection_name>/<tenant_name>`` and memory-mapped when opened. There is no server
+    round trip, which suits small tenants, tests and offline use. The searches, filters and deletes
+    take the same arguments as the WeaviateConnector and return results with the same attributes
+    (see ``analitiq.databases.vector.schema``).
+    """
+
+    def __init__(self, params):
+        """Initialize a new instance of FaissConnector.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            Dictionary of parameters including 'collection_name' and 'tenant_name'.
+            'path' is the directory of the collections (default is ``~/.analitiq/faiss``).
+            'index_type' selects the vector index: "flat" (exact, default), "hnsw", "ivf", or
+            "numpy" for an exact NumPy scan without faiss. 'hnsw_m', 'hnsw_ef_search', 'ivf_nlist'
+            and 'ivf_nprobe' tune the approximate indexes.
+            Set 'autosave' to False to write the store to disk only on ``close``.
+            'embedding_model', 'normalize_embeddings', 'embedding_cache_size',
+            'embedding_cache_path', 'embedding_backend' and 'embedding_backend_options' configure
+            the vectorizer, and 'fusion', 'fusion_weights', 'fusion_k' and 'fusion_overfetch' the
+            hybrid search, as for the WeaviateConnector.
+
+        """
+        super().__init__(params)
+        self.params = params
+        self.collection_name = self.params.get("collection_name", "default_collection")
+        self.tenant_name = self.params.get("tenant_name")
+        self.path = Path(self.params.get("path", DEFAULT_PATH)).expanduser()
+        self.autosave = self.params.get("autosave", True)
+        self.store_options = {key: self.params[key] for key in STORE_OPTIONS if key in self.params}
+        self.store: Optional[LocalVectorStore] = None
+        self.connected = False
+        self.embedding_cache = EmbeddingCache(
+            max_items=self.params.get("embedding_cache_size", DEFAULT_CACHE_SIZE),
+            db_path=self.params.get("embedding_cache_path"),
+        )
+        self.vectorizer = AnalitiqVectorizer(
+            self.params.get("embedding_model", DEFAULT_MODEL_NAME),
+            normalize_embeddings=self.params.get("normalize_embeddings", False),
+            cache=self.embedding_cache,
+            backend=self.params.get("embedding_backend", DEFAULT_BACKEND),
+            backend_options=self.params.get("embedding_backend_options"),
+        )
+        self.fusion = ResultFusion.from_params(self.params)
+        self.connect()
+
+    def __enter__(self):
+        if not self.connected:
+            self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    @property
+    def tenant_path(self) -> Path:
+        """The directory of the connector's collection tenant."""
+        return self.path / _dir_name(self.collection_name) / _dir_name(self.tenant_name or DEFAULT_TENANT)
+
+    def connect(self):
+        """Open the store of the collection tenant, reading it from disk if it exists.
+
+        Connectors of the same collection tenant in a process share the store.
+        """
+        self.store = get_store(self.tenant_path, **self.store_options)
+        self.connected = True
+
+    def close(self):
+        """Write unsaved changes to disk and release the store."""
+        if self.store is not None and self.store.dirty:
+            self.store.save()
+        self.store = None
+        self.connected = False
+
+    def _saved(self, written: int) -> int:
+        if self.autosave and written:
+            self.store.save()
+        return written
+
+    def _get_query_vector(self, query: str) -> List[float]:
+        """Vectorize a query, reusing its vector within the current request scope."""
+        return memoized_query_vector(self.vectorizer, query)
+
+    def _objects(self, hits: Sequence[Tuple[int, SearchMetadata]]) -> SearchResult:
+        store = self.store
+        return SearchResult(objects=[
+            SearchObject(uuid=store.uuids[row], properties=dict(store.properties[row]), metadata=metadata)
+            for row, metadata in hits
+        ])
+
+    def _matching_rows(self, filter_expression: Optional[Dict]):
+        return self.store.find_rows(LocalQueryBuilder().construct_query(filter_expression))
+
+    def create_collection(self, collection_name: str) -> str:
+        """Create the directory of a collection, if it does not exist, and return the collection name."""
+        (self.path / _dir_name(collection_name)).mkdir(parents=True, exist_ok=True)
+        logger.info(f"Collection exists: {collection_name}")
+        return collection_name
+
+    def collection_add_tenant(self, tenant_name: str) -> bool:
+        """
+        Add a tenant to the collection of the connector
+
+        :param tenant_name: The name of the tenant to be added to the collection.
+        :return: True
+        """
+        (self.path / _dir_name(self.collection_name) / _dir_name(tenant_name)).mkdir(parents=True, exist_ok=True)
+        return True
+
+    def load_chunks(self, chunks: List[Chunk]) -> int:
+        """Load chunks into the store.
+
+        The contents of all chunks are vectorized together in batches. Each chunk gets a UUID
+        derived from its document UUID and content, so loading the same chunk again overwrites it.
+
+        Parameters
+        ----------
+        chunks : List[Chunk]
+            The chunks to load.
+
+        Returns
+        -------
+        int
+            The number of chunks loaded.
+
+        """
+        number_identical_chunks(chunks)
+        hf_vectors = self.vectorizer.vectorize_batch([chunk.content for chunk in chunks])
+
+        return self._write_chunks(chunks, hf_vectors)
+
+    def _write_chunks(self, chunks: List[Chunk], hf_vectors) -> int:
+        """Write chunks with their precomputed vectors and return the number written."""
+        if not chunks:
+            return 0
+
+        extractor = get_keyword_extractor()
+        with self:
+            written = self.store.upsert(
+                [chunk_uuid(chunk.document_uuid, chunk.content, chunk.occurrence) for chunk in chunks],
+                [chunk.model_dump(mode="json") for chunk in chunks],
+                hf_vectors,
+                [extractor.terms(chunk.content or "") for chunk in chunks],
+            )
+            return self._saved(written)
+
+    def kw_search(self, query: str, limit: int = 3) -> SearchResult:
+        """Perform a BM25 keyword search over the chunk contents.
+
+        The query is reduced to its stemmed keywords, as the chunks were when they were loaded.
+
+        Parameters
+        ----------
+        query : str
+            The search query.
+        limit : int, optional
+            The maximum number of search results to return, by default 3.
+
+        Returns
+        -------
+        SearchResult
+            The matching chunks, best first, with their BM25 score in ``metadata.score``.
+
+        """
+        terms = get_keyword_extractor().terms(query)
+        logger.info("Extracted keywords to search for: %s", " ".join(terms))
+
+        with self:
+            store = self.store
+            with store.lock:
+                hits = store.bm25.search(terms, limit)
+                return self._objects([(store.rows[uuid], SearchMetadata(score=score)) for uuid, score in hits])
+
+    def vector_search(self, query: str, limit: int = 3, query_vector: List[float] = None) -> SearchResult:
+        """Use Vector Search for document retrieval from the store.
+
+        Parameters
+        ----------
+        query : str
+            The query string for vector search.
+        limit : int, optional
+            Maximum number of results to return (default is 3).
+        query_vector : List[float], optional
+            A precomputed vector of the query. If not given, the query is vectorized.
+
+        Returns
+        -------
+        SearchResult
+            The nearest chunks, with their cosine distance in ``metadata.distance``.
+
+        """
+        near_vector = query_vector if query_vector is not None else self._get_query_vector(query)
+
+        with self:
+            with self.store.lock:
+                hits = self.store.vector_search(near_vector, limit)
+                return self._objects([(row, SearchMetadata(distance=distance)) for row, distance in hits])
+
+    def search(self, query: str, limit: int = 3) -> SearchResult:
+        return self.hybrid_search(query, limit)
+
+    def hybrid_search(self, query: str, limit: int = 3) -> SearchResult:
+        """Use Hybrid Search for document retrieval from the store.
+
+        Combines the keyword and the vector search. Each leg fetches ``limit * fusion.overfetch``
+        results, which are merged by the connector's fusion stage (see ``ResultFusion``).
+
+        Parameters
+        ----------
+        query : str
+            The search query.
+        limit : int, optional
+            The maximum number of results to return (default is 3).
+
+        Returns
+        -------
+        SearchResult
+            The hybrid search results, best first, with the fused score in ``metadata.score``.
+
+        """
+        query_vector = self._get_query_vector(query)
+        leg_limit = self.fusion.fetch_limit(limit)
+
+        kw_results = self.kw_search(query, leg_limit)
+        vector_results = self.vector_search(query, leg_limit, query_vector)
+
+        return self.fusion.fuse([kw_results, vector_results], limit)
+
+    def search_filter(self, query: str, filter_expression: dict = None, group_properties: list = None):
+        """Rank the objects matching a filter expression by their similarity to the query.
+
+        Parameters
+        ----------
+        query : str
+            The search query.
+        filter_expression : dict, optional
+            A filter expression, as for the WeaviateConnector (default is None, all objects).
+        group_properties : list, optional
+            A list of properties to group results by (default is None).
+
+        Returns
+        -------
+        list or None
+            Filtered and grouped search results, or None if the search failed.
+
+        """
+        try:
+            query_vector = self._get_query_vector(query)
+            with self:
+                with self.store.lock:
+                    rows = self._matching_rows(filter_expression)
+                    hits = self.store.vector_search(query_vector, len(rows), rows=rows)
+                    response = self._objects([(row, SearchMetadata(distance=distance)) for row, distance in hits])
+
+        except Exception as e:
+            logger.error(f"Error retrieving documents: {e}")
+            return None
+
+        if not response.objects:
+            return []
+
+        if group_properties:
+            return group_results_by_properties(response, group_properties)
+        else:
+            return response
+
+    def filter(self, filter_expression: dict) -> SearchResult:
+        """Return the objects matching a filter expression, with their creation and last update time.
+
+        Parameters
+        ----------
+        filter_expression : dict
+            The filter, e.g. ``{"property": "name", "operator": "=", "value": "John"}``. Clauses can
+            be nested in "and" and "or".
+
+        Returns
+        -------
+        SearchResult
+            The matching objects, in load order.
+
+        """
+        with self:
+            store = self.store
+            with store.lock:
+                rows = self._matching_rows(filter_expression)
+                return self._objects([
+                    (row, SearchMetadata(creation_time=_timestamp(store.created[row]),
+                                         last_update_time=_timestamp(store.updated[row])))
+                    for row in rows.tolist()
+                ])
+
+    def filter_count(self, filter_expression: dict) -> AggregateResult:
+        """Count the objects matching a filter expression."""
+        with self:
+            return AggregateResult(total_count=len(self._matching_rows(filter_expression)))
+
+    def filter_group_count(self, filter_expression: dict, group_by_prop: str) -> AggregateGroupByResult:
+        """Count the objects matching a filter expression per value of a property.
+
+        An object with an array property counts once for each of its values. Groups are sorted by
+        count, largest first.
+        """
+        counts: Dict[Any, int] = {}
+        with self:
+            store = self.store
+            with store.lock:
+                for row in self._matching_rows(filter_expression).tolist():
+                    value = store.properties[row].get(group_by_prop)
+                    for item in value if isinstance(value, list) else [value]:
+                        counts[item] = counts.get(item, 0) + 1
+
+        groups = [
+            AggregateGroup(grouped_by=GroupedBy(prop=group_by_prop, value=value), total_count=count)
+            for value, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)
+        ]
+        return AggregateGroupByResult(groups=groups)
+
+    def _delete_matching(self, filter_expression: dict) -> DeleteResult:
+        with self:
+            store = self.store
+            with store.lock:
+                uuids = [store.uuids[row] for row in self._matching_rows(filter_expression).tolist()]
+                deleted = self._saved(store.delete(uuids))
+        return DeleteResult(matches=len(uuids), successful=deleted, failed=len(uuids) - deleted)
+
+    def filter_delete(self, property_name, property_value) -> DeleteResult:
+        return self._delete_matching({"property": property_name, "operator": "=", "value": property_value})
+
+    def delete_many_on_param(self, property_name: str, filter_list: List[str]) -> DeleteResult:
+        return self._delete_matching({"property": property_name, "operator": "contains_any", "value": filter_list})
+
+    def delete_many_on_uuids(self, uuids: List[str]) -> DeleteResult:
+        with self:
+            store = self.store
+            with store.lock:
+                matches = sum(1 for uuid in set(uuids) if uuid in store)
+                deleted = self._saved(store.delete(uuids))
+        return DeleteResult(matches=matches, successful=deleted, failed=matches - deleted)
+
+    def delete_on_metadata_and(self, filter_list: List) -> DeleteResult:
+        """
+        Removes the objects matching all the given filters.
+
+        Args:
+            filter_list (List[Dict]): A list of dictionaries each containing the property name,
+                                      operator, and value to filter the documents by. An AND operation
+                                      is performed across filters.
+
+        Returns:
+            DeleteResult: The number of objects that matched and were deleted.
+
+        Raises:
+            ValueError: If the filter list is empty, which would delete every object.
 
-uuids = [str(uuid4()) for _ in range(len(documents))]
+        """
+        if not filter_list:
+            raise ValueError("filter_list is empty")
+        return self._delete_matching({"and": filter_list})
 
-vector_store.add_documents(documents=documents, ids=uuids)
+    def delete_collection(self, collection_name: str) -> bool:
+        """Delete a collection, with all its tenants, from disk.
 
-results = vector_store.similarity_search(
-    "This is a test user query",
-    k=2,
-    filter={"source": "tweet"},
-)
\ No newline at end of file
+        Returns True if the collection was deleted and False if an error occurred.
+        """
+        collection_path = self.path / _dir_name(collection_name)
+        try:
+            drop_stores(collection_path)
+            if collection_name == self.collection_name:
+                self.store, self.connected = None, False
+            if collection_path.exists():
+                shutil.rmtree(collection_path)
+            logger.info(f"Deleted collection '{collection_name}'")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting collection: {e}")
+            return False
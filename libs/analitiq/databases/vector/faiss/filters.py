@@ -0,0 +1,109 @@
+import fnmatch
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def _values(value: Any) -> List[Any]:
+    """Return the values of a property: the items of an array property, otherwise the value itself."""
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+@lru_cache(maxsize=256)
+def _like_pattern(pattern: str) -> re.Pattern:
+    return re.compile(fnmatch.translate(pattern.lower()), re.DOTALL)
+
+
+def like(value: Any, pattern: str) -> bool:
+    """Match a value against a Weaviate ``like`` pattern: ``*`` is any text and ``?`` one character.
+
+    The match is case-insensitive and succeeds if the whole value or one of its words matches, as
+    with Weaviate's word tokenization.
+    """
+    regex = _like_pattern(str(pattern))
+    for item in _values(value):
+        text = str(item).lower()
+        if regex.match(text) or any(regex.match(token) for token in TOKEN_PATTERN.findall(text)):
+            return True
+    return False
+
+
+def _compare(compare: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    def matches(value, operand):
+        try:
+            return any(compare(item, operand) for item in _values(value))
+        except TypeError:
+            return False
+
+    return matches
+
+
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "like": like,
+    "=": lambda value, operand: operand in _values(value),
+    "!=": lambda value, operand: operand not in _values(value),
+    ">": _compare(lambda item, operand: item > operand),
+    "<": _compare(lambda item, operand: item < operand),
+    ">=": _compare(lambda item, operand: item >= operand),
+    "<=": _compare(lambda item, operand: item <= operand),
+    "contains_any": lambda value, operand: any(item in operand for item in _values(value)),
+    "contains_all": lambda value, operand: all(item in _values(value) for item in operand),
+}
+
+
+class LocalQueryBuilder:
+    """Builds a Python predicate over object properties from a filter expression.
+
+    This is the local counterpart of the Weaviate QueryBuilder and takes the same expressions: a
+    single clause ``{"property": ..., "operator": ..., "value": ...}`` or an ``and``/``or`` of
+    clauses, nested as needed. ``contains_any`` and ``contains_all`` take a list value.
+
+    Examples
+    --------
+    >>> matches = LocalQueryBuilder().construct_query(
+    ...     {"and": [{"property": "document_type", "operator": "=", "value": "sql"},
+    ...              {"property": "document_name", "operator": "like", "value": "sales*"}]})
+    >>> matches({"document_type": "sql", "document_name": "sales_by_month.sql"})
+    True
+
+    """
+
+    def construct_query(self, expression: Optional[Dict[str, Any]]) -> Predicate:
+        """Return a predicate for the expression. An empty expression matches every object."""
+        if not expression:
+            return lambda properties: True
+        return self.build_filters(expression)
+
+    def build_filters(self, expression: Dict[str, Any]) -> Predicate:
+        # Check if the expression is a single filter clause
+        if "property" in expression and "operator" in expression and "value" in expression:
+            prop_name = expression["property"]
+            operator = expression["operator"].lower()
+            value = expression["value"]
+
+            if operator not in OPERATORS:
+                raise ValueError(f"Unsupported operator: {operator}")
+            if operator in ("contains_any", "contains_all") and not isinstance(value, list):
+                raise ValueError(f"Value must be list: {value}")
+
+            compare = OPERATORS[operator]
+            return lambda properties: compare(properties.get(prop_name), value)
+
+        # Assume the root is an "or" or "and" logical operator
+        logical_op, clauses = next(iter(expression.items()))
+        filters = [self.build_filters(clause) for clause in clauses]
+
+        if logical_op.lower() == "and":
+            return lambda properties: all(f(properties) for f in filters)
+        elif logical_op.lower() == "or":
+            return lambda properties: any(f(properties) for f in filters)
+        else:
+            raise ValueError(f"Unsupported logical operator: {logical_op}")
@@ -0,0 +1,336 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from analitiq.databases.vector.faiss.bm25 import BM25Index
+from analitiq.databases.vector.utils.similarity_index import SimilarityIndex, normalize_rows
+from analitiq.logger.logger import initialize_logging
+
+logger, chat_logger = initialize_logging()
+
+INDEX_TYPES = ("flat", "hnsw", "ivf", "numpy")
+DEFAULT_INDEX_TYPE = "flat"
+IVF_MIN_POINTS_PER_LIST = 39  # FAISS warns when k-means gets fewer training points per centroid
+
+OBJECTS_FILE = "objects.json"
+VECTORS_FILE = "vectors.npy"
+BM25_FILE = "bm25.json"
+INDEX_FILE = "index.faiss"
+
+
+def import_faiss():
+    """Return the faiss module, or None if faiss is not installed."""
+    try:
+        import faiss
+    except ImportError:
+        return None
+    return faiss
+
+
+def _write_atomic(path: Path, write: Callable[[str], None]):
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    write(str(tmp_path))
+    os.replace(tmp_path, path)
+
+
+class LocalVectorStore:
+    """The chunks of one collection tenant, searchable by vector and by keywords, kept in a directory.
+
+    Every chunk has an id, its properties, a unit-length vector and its BM25 terms. Vectors are
+    searched by cosine similarity with a FAISS index when faiss is installed, otherwise with the
+    exact SimilarityIndex, which also holds the vectors. The directory holds:
+
+    - ``vectors.npy``: the float32 vector matrix, memory-mapped when the store is opened;
+    - ``objects.json``: the ids, properties and timestamps of the chunks;
+    - ``bm25.json``: the term frequencies of the keyword index;
+    - ``index.faiss``: the FAISS index, memory-mapped when the store is opened.
+
+    Added chunks are appended to the FAISS index. Replacing or deleting chunks updates the vector
+    matrix in place and the FAISS index is rebuilt on the next search.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        The directory of the store. Without one, the store lives in memory only.
+    index_type : str, optional
+        "flat" (exact, default), "hnsw" (graph, approximate), "ivf" (inverted lists, approximate)
+        or "numpy" (exact NumPy scan, no faiss needed). Without faiss, "numpy" is used.
+    hnsw_m : int, optional
+        Neighbors per node of the HNSW graph (default is 32).
+    hnsw_ef_search : int, optional
+        Candidate list size of an HNSW search (default is 64). Higher is more accurate and slower.
+    ivf_nlist : int, optional
+        The number of inverted lists of an IVF index (default is 100). Small stores use fewer lists
+        and stores too small to train them fall back to a flat index.
+    ivf_nprobe : int, optional
+        The number of inverted lists an IVF search visits (default is 8).
+
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        index_type: str = DEFAULT_INDEX_TYPE,
+        hnsw_m: int = 32,
+        hnsw_ef_search: int = 64,
+        ivf_nlist: int = 100,
+        ivf_nprobe: int = 8,
+    ):
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown index type '{index_type}'. Valid types: {', '.join(INDEX_TYPES)}")
+
+        self.path = Path(path).expanduser() if path is not None else None
+        self.index_type = index_type
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_search = hnsw_ef_search
+        self.ivf_nlist = ivf_nlist
+        self.ivf_nprobe = ivf_nprobe
+
+        self.uuids: List[str] = []
+        self.properties: List[Dict[str, Any]] = []
+        self.created: List[float] = []
+        self.updated: List[float] = []
+        self.rows: Dict[str, int] = {}
+        self.similarity = SimilarityIndex()
+        self.bm25 = BM25Index()
+        self.index = None
+        self.index_stale = True
+        self.dirty = False
+        self.lock = threading.RLock()
+
+        self._faiss = import_faiss() if index_type != "numpy" else None
+        if self._faiss is None and index_type != "numpy":
+            logger.warning(f"faiss is not installed, searching the '{index_type}' store with NumPy")
+
+        if self.path is not None and (self.path / OBJECTS_FILE).exists():
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self.rows
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """The unit-length vectors of the chunks, one row per chunk."""
+        return self.similarity.vectors
+
+    def load(self):
+        """Read the store from its directory. The vector matrix and the FAISS index are memory-mapped."""
+        with self.lock:
+            with open(self.path / OBJECTS_FILE, encoding="utf-8") as f:
+                objects = json.load(f)
+
+            self.uuids = objects["uuids"]
+            self.properties = objects["properties"]
+            self.created = objects["created"]
+            self.updated = objects["updated"]
+            self.rows = {uuid: row for row, uuid in enumerate(self.uuids)}
+            self.similarity = SimilarityIndex()
+            if self.uuids:
+                vectors = np.load(self.path / VECTORS_FILE, mmap_mode="r")
+                if len(vectors) != len(self.uuids):
+                    raise ValueError(f"{self.path} is corrupt: {len(vectors)} vectors for {len(self.uuids)} objects")
+                self.similarity = SimilarityIndex.from_vectors(vectors, normalized=True)
+
+            with open(self.path / BM25_FILE, encoding="utf-8") as f:
+                self.bm25 = BM25Index.from_dict(json.load(f))
+
+            self.index, self.index_stale = None, True
+            index_path = self.path / INDEX_FILE
+            if self._faiss is not None and index_path.exists() and objects.get("index_type") == self.index_type:
+                index = self._faiss.read_index(str(index_path), self._faiss.IO_FLAG_MMAP)
+                if index.ntotal == len(self.uuids):
+                    self._configure_index(index)
+                    self.index, self.index_stale = index, False
+
+            self.dirty = False
+            logger.info(f"Loaded {len(self.uuids)} chunks from {self.path}")
+
+    def save(self):
+        """Write the store to its directory. Each file is replaced atomically, the objects last."""
+        if self.path is None:
+            return
+
+        with self.lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            if len(self.similarity):
+                _write_atomic(self.path / VECTORS_FILE, self._write_vectors)
+
+            if self.index is not None and not self.index_stale:
+                _write_atomic(self.path / INDEX_FILE, lambda tmp: self._faiss.write_index(self.index, tmp))
+            elif (self.path / INDEX_FILE).exists():
+                (self.path / INDEX_FILE).unlink()
+
+            self._write_json(BM25_FILE, self.bm25.to_dict())
+            self._write_json(OBJECTS_FILE, {
+                "index_type": self.index_type,
+                "uuids": self.uuids,
+                "properties": self.properties,
+                "created": self.created,
+                "updated": self.updated,
+            })
+            self.dirty = False
+
+    def _write_vectors(self, tmp: str):
+        with open(tmp, "wb") as f:  # np.save would add a .npy suffix to the file name
+            np.save(f, self.vectors)
+
+    def _write_json(self, name: str, data: dict):
+        def write(tmp):
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+
+        _write_atomic(self.path / name, write)
+
+    def upsert(self, uuids: Sequence[str], properties: Sequence[Dict[str, Any]], vectors,
+               terms: Sequence[List[str]]) -> int:
+        """Add chunks, or replace the chunks that already have one of the ids. Returns the number written."""
+        if not uuids:
+            return 0
+
+        vectors = normalize_rows(vectors)
+        now = time.time()
+        # when an id appears several times in the batch, its last chunk wins
+        positions = {uuid: i for i, uuid in enumerate(uuids)}
+        with self.lock:
+            new_positions = []
+            for uuid, i in positions.items():
+                row = self.rows.get(uuid)
+                if row is None:
+                    new_positions.append(i)
+                else:
+                    # a replaced chunk keeps its row
+                    self.similarity.update([row], vectors[i])
+                    self.properties[row] = properties[i]
+                    self.updated[row] = now
+                    self.index_stale = True
+                self.bm25.add(uuid, terms[i])
+
+            if new_positions:
+                added = vectors[new_positions]
+                for i in new_positions:
+                    self.rows[uuids[i]] = len(self.uuids)
+                    self.uuids.append(uuids[i])
+                    self.properties.append(properties[i])
+                    self.created.append(now)
+                    self.updated.append(now)
+                self.similarity.add(added)
+                if self.index is not None and not self.index_stale:
+                    self.index.add(added)
+
+            self.dirty = True
+        return len(positions)
+
+    def delete(self, uuids) -> int:
+        """Delete chunks by id and return the number deleted."""
+        with self.lock:
+            rows = sorted({self.rows[uuid] for uuid in uuids if uuid in self.rows})
+            if not rows:
+                return 0
+
+            keep = np.ones(len(self.uuids), dtype=bool)
+            keep[rows] = False
+            for row in rows:
+                self.bm25.remove(self.uuids[row])
+
+            self.uuids = [uuid for uuid, kept in zip(self.uuids, keep) if kept]
+            self.properties = [props for props, kept in zip(self.properties, keep) if kept]
+            self.created = [ts for ts, kept in zip(self.created, keep) if kept]
+            self.updated = [ts for ts, kept in zip(self.updated, keep) if kept]
+            self.rows = {uuid: row for row, uuid in enumerate(self.uuids)}
+            self.similarity.delete(rows)
+            self.index, self.index_stale = None, True
+            self.dirty = True
+            return len(rows)
+
+    def clear(self):
+        """Delete every chunk."""
+        self.delete(list(self.uuids))
+
+    def find_rows(self, predicate: Callable[[Dict[str, Any]], bool]) -> np.ndarray:
+        """Return the rows whose properties match a predicate."""
+        with self.lock:
+            return np.array([row for row, props in enumerate(self.properties) if predicate(props)], dtype=np.int64)
+
+    def vector_search(self, vector, limit: int, rows: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        """Return up to ``limit`` (row, cosine distance) pairs, nearest first.
+
+        With ``rows``, only these rows are searched, exactly.
+        """
+        query = normalize_rows(vector)
+        with self.lock:
+            if not len(self.similarity) or limit <= 0:
+                return []
+
+            index = self._get_index() if rows is None else None
+            if index is None:
+                found, similarities = self.similarity.search(query, limit, rows)
+                return [(int(row), 1.0 - float(similarity)) for row, similarity in zip(found, similarities)]
+
+            similarities, found = index.search(query, min(limit, len(self.uuids)))
+            return [(int(row), 1.0 - float(similarity))
+                    for row, similarity in zip(found[0], similarities[0]) if row >= 0]
+
+    def _get_index(self):
+        if self.index_stale and self._faiss is not None:
+            self.index = self._build_index()
+            self.index_stale = False
+        return self.index
+
+    def _build_index(self):
+        faiss = self._faiss
+        vectors = np.ascontiguousarray(self.vectors, dtype=np.float32)
+        count, dimension = vectors.shape
+        started = time.perf_counter()
+
+        nlist = min(self.ivf_nlist, count // IVF_MIN_POINTS_PER_LIST)
+        if self.index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(dimension, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        elif self.index_type == "ivf" and nlist > 1:
+            index = faiss.IndexIVFFlat(faiss.IndexFlatIP(dimension), dimension, nlist, faiss.METRIC_INNER_PRODUCT)
+            index.train(vectors)
+        else:
+            # too few vectors to train an IVF index: an exact search is as fast
+            index = faiss.IndexFlatIP(dimension)
+
+        index.add(vectors)
+        self._configure_index(index)
+        logger.info(f"Built a {type(index).__name__} of {count} vectors in {time.perf_counter() - started:.2f}s")
+        return index
+
+    def _configure_index(self, index):
+        if hasattr(index, "hnsw"):
+            index.hnsw.efSearch = self.hnsw_ef_search
+        if hasattr(index, "nprobe"):
+            index.nprobe = self.ivf_nprobe
+
+
+_stores: Dict[Path, LocalVectorStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(path: Union[str, Path], **options) -> LocalVectorStore:
+    """Return the store of a directory, opening it on the first request.
+
+    Connectors of the same collection tenant share one store, so that they see each other's
+    writes and do not overwrite each other's files. ``options`` are used when the store is opened.
+    """
+    path = Path(path).expanduser().resolve()
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = LocalVectorStore(path, **options)
+        return store
+
+
+def drop_stores(path: Union[str, Path]):
+    """Forget the open stores in a directory and its subdirectories, e.g. before deleting it."""
+    path = Path(path).expanduser().resolve()
+    with _stores_lock:
+        for store_path in [p for p in _stores if p == path or path in p.parents]:
+            del _stores[store_path]
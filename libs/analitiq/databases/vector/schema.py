@@ -0,0 +1,71 @@
+"""Result types of the vector database connectors that do not return the objects of a client library.
+
+The attribute names follow the Weaviate client (``objects``, ``uuid``, ``properties``,
+``metadata.score``, ``metadata.distance``, ``total_count``, ...), so that code consuming search
+results works with every backend.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class SearchMetadata:
+    """Scores and timestamps of a search hit. ``score`` is higher-is-better, ``distance`` lower-is-better."""
+
+    score: Optional[float] = None
+    distance: Optional[float] = None
+    creation_time: Optional[datetime] = None
+    last_update_time: Optional[datetime] = None
+
+
+@dataclass
+class SearchObject:
+    """A stored chunk returned by a search: its id, its properties and the search metadata."""
+
+    uuid: str
+    properties: Dict[str, Any]
+    metadata: SearchMetadata = field(default_factory=SearchMetadata)
+
+
+@dataclass
+class SearchResult:
+    """The objects returned by a search, best match first."""
+
+    objects: List[SearchObject] = field(default_factory=list)
+
+
+@dataclass
+class AggregateResult:
+    """The number of objects matching a filter."""
+
+    total_count: int
+
+
+@dataclass
+class GroupedBy:
+    prop: str
+    value: Any
+
+
+@dataclass
+class AggregateGroup:
+    """The number of objects matching a filter with one value of the grouped-by property."""
+
+    grouped_by: GroupedBy
+    total_count: int
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class AggregateGroupByResult:
+    groups: List[AggregateGroup] = field(default_factory=list)
+
+
+@dataclass
+class DeleteResult:
+    """The outcome of a delete: how many objects matched and how many were deleted."""
+
+    matches: int
+    successful: int
+    failed: int = 0
@@ -1,6 +1,12 @@
-from typing import List, Union
-from transformers import AutoTokenizer, AutoModel
+from typing import Dict, List, Optional, Tuple, Union
 import numpy as np
+from analitiq.databases.vector.utils.embedding_cache import EmbeddingCache
+from analitiq.databases.vector.utils.model_registry import LoadedModel, ModelRegistry, get_model_registry
+from analitiq.databases.vector.utils.inference_backends import DEFAULT_BACKEND, INFERENCE_BACKENDS, InferenceBackend
+from analitiq.databases.vector.utils.similarity_index import SimilarityIndex
+
+DEFAULT_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_BATCH_SIZE = 32
 
 
 class AnalitiqVectorizer:
@@ -11,42 +17,114 @@ class AnalitiqVectorizer:
     model_name_or_path : str
         The name or path of the Hugging Face model.
     tokenizer : AutoTokenizer
-        The tokenizer for the model.
+        The tokenizer for the model, loaded on first access.
     model : AutoModel
-        The model for generating vectors.
+        The model for generating vectors, loaded on first access.
+    normalize_embeddings : bool
+        Whether vectors are L2-normalized, so that cosine similarity becomes a dot product.
+    cache : EmbeddingCache
+        Optional cache of previously generated vectors.
+    registry : ModelRegistry
+        The registry the tokenizer and model are taken from.
+    backend : str
+        The inference backend running the model: "torch", "torch_int8" or "onnx".
+    texts : List[str]
+        The texts searched by ``search``, see ``create_embeddings``.
+    index : SimilarityIndex
+        The normalized embeddings of ``texts``.
 
     Methods
     -------
-    __init__(model_name_or_path: str):
+    __init__(model_name_or_path: str, normalize_embeddings: bool = False, cache: EmbeddingCache = None,
+             registry: ModelRegistry = None, backend: str = "torch", backend_options: dict = None):
         Initializes the Vectorizer with the specified model.
     load_model():
-        Loads the tokenizer and model.
+        Loads the tokenizer and model now instead of on the first vectorization.
     vectorize(text: Union[str, List[str]]) -> torch.Tensor:
         Generates vectors for the given input text.
+    vectorize_batch(texts: List[str], batch_size: int) -> np.ndarray:
+        Generates a float32 matrix of vectors for many texts using length-sorted micro-batches.
+    create_embeddings(texts: List[str]), add_texts(texts: List[str]):
+        Embeds texts into an in-memory SimilarityIndex.
+    search(query: str, k: int), search_many(queries: List[str], k: int):
+        Returns the k texts most similar to each query.
 
     """
 
-    def __init__(self, model_name_or_path: str):
+    def __init__(
+        self,
+        model_name_or_path: str,
+        normalize_embeddings: bool = False,
+        cache: Optional[EmbeddingCache] = None,
+        registry: Optional[ModelRegistry] = None,
+        backend: str = DEFAULT_BACKEND,
+        backend_options: Optional[dict] = None,
+    ):
         """Initialize the Vectorizer with the specified model.
 
         Parameters
         ----------
         model_name_or_path : str
             The name or path of the Hugging Face model to be used.
+        normalize_embeddings : bool
+            If True, every generated vector is scaled to unit length.
+        cache : EmbeddingCache, optional
+            If given, vectors are looked up in and stored to this cache, so that each text
+            is run through the model only once.
+        registry : ModelRegistry, optional
+            Where the tokenizer and model are loaded from. Defaults to the process-wide registry,
+            so that all vectorizers of the same model share one copy of it.
+        backend : str
+            The inference backend, a key of ``INFERENCE_BACKENDS``. "torch" (default) runs the
+            model as loaded, "torch_int8" runs it with int8 dynamically quantized linear layers,
+            and "onnx" runs its ONNX export with ONNX Runtime. The last two are faster on CPUs,
+            at the cost of a small drift of the vectors.
+        backend_options : dict, optional
+            Passed to the backend when it is built, e.g. ``onnx_dir`` or ``intra_op_threads``
+            for the onnx backend.
 
         """
+        if backend not in INFERENCE_BACKENDS:
+            errmsg = f"Unknown inference backend '{backend}'. Valid backends: {', '.join(INFERENCE_BACKENDS)}"
+            raise ValueError(errmsg)
+
         self.model_name_or_path = model_name_or_path
-        self.tokenizer = None
-        self.model = None
-        self.load_model()
+        self.normalize_embeddings = normalize_embeddings
+        self.cache = cache
+        self.registry = registry if registry is not None else get_model_registry()
+        self.backend = backend
+        self.backend_options = backend_options or {}
+        self._loaded: Optional[LoadedModel] = None
+        self._inference_backend: Optional[InferenceBackend] = None
+        self.texts: Optional[List[str]] = None
+        self.index: Optional[SimilarityIndex] = None
 
-    def load_model(self):
-        """Load the tokenizer and model from Hugging Face.
+    def load_model(self) -> LoadedModel:
+        """Load the tokenizer and model, unless the registry already has them.
 
-        If the model is not present locally, it will be downloaded.
+        The model is otherwise loaded by the first vectorization. If it is not present locally,
+        it will be downloaded from Hugging Face.
         """
-        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name_or_path)
-        self.model = AutoModel.from_pretrained(self.model_name_or_path)
+        if self._loaded is None:
+            self._loaded = self.registry.get(self.model_name_or_path)
+        return self._loaded
+
+    @property
+    def tokenizer(self):
+        return self.load_model().tokenizer
+
+    @property
+    def model(self):
+        return self.load_model().model
+
+    @property
+    def inference_backend(self) -> InferenceBackend:
+        """The backend running the model, shared with the other vectorizers of the model."""
+        if self._inference_backend is None:
+            self._inference_backend = self.registry.get_backend(
+                self.model_name_or_path, self.backend, **self.backend_options
+            )
+        return self._inference_backend
 
     def vectorize(self, text: Union[str, List[str]], flatten: bool = True) -> np.ndarray:
         """Generate vectors for the given input text.
@@ -64,20 +142,108 @@ class AnalitiqVectorizer:
             The vectors generated from the input text.
 
         """
-        if self.tokenizer is None:
-            errmsg = "ERROR: Tokenizer is not set."
-            raise TypeError(errmsg)
-        if self.model is None:
-            errmsg = "ERROR: No Model is set."
-            raise TypeError(errmsg)
-        inputs = self.tokenizer(text, return_tensors="pt", padding=True, truncation=True)
-        outputs = self.model(**inputs)
-        vectors = outputs.last_hidden_state.mean(dim=1)
+        vectors = self.vectorize_batch([text] if isinstance(text, str) else list(text))
 
         if flatten:
-            return vectors.detach().cpu().numpy().flatten().tolist()
+            return vectors.flatten().tolist()
         else:
-            return vectors.detach().cpu().numpy()
+            return vectors
+
+    def vectorize_batch(self, texts: List[str], batch_size: int = DEFAULT_BATCH_SIZE) -> np.ndarray:
+        """Generate vectors for many texts at once.
+
+        Texts are sorted by token length and split into micro-batches, so that each forward
+        pass pads its texts to a similar length. Vectors are returned in the order
+        of the input texts. If a cache is set, only texts missing from the cache are embedded,
+        and duplicate texts are embedded once.
+
+        Parameters
+        ----------
+        texts : List[str]
+            The texts to be vectorized.
+        batch_size : int
+            The number of texts embedded in one forward pass.
+
+        Returns
+        -------
+        np.ndarray
+            A contiguous float32 matrix with one row per input text.
+
+        """
+        if batch_size < 1:
+            errmsg = f"batch_size must be a positive integer, got {batch_size}."
+            raise ValueError(errmsg)
+
+        if not texts:
+            return np.empty((0, self.model.config.hidden_size), dtype=np.float32)
+
+        if self.cache is not None:
+            cached = self.cache.get_many(self.cache_key, texts)
+        else:
+            cached = [None] * len(texts)
+
+        missing: Dict[str, List[int]] = {}
+        for idx, (text, vector) in enumerate(zip(texts, cached)):
+            if vector is None:
+                missing.setdefault(text, []).append(idx)
+
+        # the model is only loaded for the misses; when every text is cached, the cached vectors give the width
+        missing_texts = list(missing)
+        computed = self._compute(missing_texts, batch_size) if missing else None
+        dimension = computed.shape[1] if computed is not None else len(cached[0])
+
+        embeddings = np.empty((len(texts), dimension), dtype=np.float32)
+        for idx, vector in enumerate(cached):
+            if vector is not None:
+                embeddings[idx] = vector
+
+        if computed is not None:
+            for text, vector in zip(missing_texts, computed):
+                embeddings[missing[text]] = vector
+
+            if self.cache is not None:
+                self.cache.put_many(self.cache_key, missing_texts, computed)
+
+        return embeddings
+
+    @property
+    def cache_key(self) -> str:
+        """The model name under which this vectorizer's vectors are cached.
+
+        Backends other than the reference "torch" one produce slightly different vectors, so they
+        are cached separately.
+        """
+        key = f"{self.model_name_or_path}:{'normalized' if self.normalize_embeddings else 'raw'}"
+        return key if self.backend == DEFAULT_BACKEND else f"{key}:{self.backend}"
+
+    def _compute(self, texts: List[str], batch_size: int) -> np.ndarray:
+        """Run texts through the model in length-sorted micro-batches."""
+        loaded = self.load_model()
+        tensor_type = self.inference_backend.tensor_type
+        embeddings = np.empty((len(texts), loaded.model.config.hidden_size), dtype=np.float32)
+
+        # the tokenizer is shared with other threads, see LoadedModel
+        with loaded.tokenizer_lock:
+            token_counts = [len(ids) for ids in loaded.tokenizer(list(texts), truncation=True)["input_ids"]]
+        order = sorted(range(len(texts)), key=token_counts.__getitem__)
+
+        for start in range(0, len(order), batch_size):
+            batch_idx = order[start:start + batch_size]
+            with loaded.tokenizer_lock:
+                inputs = loaded.tokenizer(
+                    [texts[idx] for idx in batch_idx], return_tensors=tensor_type, padding=True, truncation=True
+                )
+            embeddings[batch_idx] = self._embed(inputs)
+
+        return embeddings
+
+    def _embed(self, inputs) -> np.ndarray:
+        """Run the model on tokenized inputs and pool the token states into one vector per text.
+
+        Token states are averaged with the attention mask as weights, so padding added to
+        shorter texts of a batch does not change their vectors.
+        """
+        return self.inference_backend.embed(inputs, self.normalize_embeddings)
 
     def normalize(self, vectors: np.ndarray) -> np.ndarray:
         """Normalizes the input vectors.
@@ -88,17 +254,34 @@ class AnalitiqVectorizer:
         norms = np.linalg.norm(vectors, axis=1, keepdims=True)
         return vectors / norms
 
+    @property
+    def embeddings(self) -> Optional[np.ndarray]:
+        """The normalized float32 embeddings of ``texts``, one row per text."""
+        return None if self.index is None else self.index.vectors
+
     def create_embeddings(self, texts: List[str]):
         """Create embeddings for the given texts.
 
+        The texts replace the ones searched by ``search``. Their embeddings are kept normalized in a
+        SimilarityIndex.
+
         :param texts: A list of strings representing the texts to create embeddings for.
         :type texts: list[str]
         :return: None
         :rtype: None
         """
-        self.texts = texts
-        embeddings = self.vectorize(texts, False)
-        self.embeddings = self.normalize(embeddings)
+        self.texts = list(texts)
+        self.index = SimilarityIndex.from_vectors(self.vectorize_batch(self.texts))
+
+    def add_texts(self, texts: List[str]):
+        """Add texts to the ones searched by ``search``, embedding only the new texts.
+
+        :param texts: The texts to add.
+        """
+        if self.index is None:
+            self.texts, self.index = [], SimilarityIndex()
+        self.index.add(self.vectorize_batch(list(texts)))
+        self.texts.extend(texts)
 
     def search(self, query: str, k: int = 3):
         """Search for similar texts based on the given query.
@@ -107,14 +290,23 @@ class AnalitiqVectorizer:
         :param k: The number of most similar texts to return. Default is 3.
         :return: A list of tuples containing the most similar texts and their similarity scores.
         """
-        if self.embeddings is None or self.texts is None:
+        return self.search_many([query], k)[0]
+
+    def search_many(self, queries: List[str], k: int = 3) -> List[List[Tuple[str, float]]]:
+        """Search the texts most similar to each of several queries.
+
+        The queries are embedded in one batch and compared to the texts with one matrix product.
+
+        :param queries: The texts to search for similarities.
+        :param k: The number of most similar texts to return per query. Default is 3.
+        :return: For every query, a list of (text, cosine similarity) tuples, most similar first.
+        """
+        if self.index is None or self.texts is None:
             errmsg = "Embeddings have not been created. Call create_embeddings() first."
             raise ValueError(errmsg)
 
-        query_vector = self.vectorize([query], False)
-        query_vector = self.normalize(query_vector)
-
-        similarities = np.dot(self.embeddings, query_vector.T).flatten()
-        top_k_indices = similarities.argsort()[-k:][::-1]
-        results = [(self.texts[idx], similarities[idx]) for idx in top_k_indices]
-        return results
+        rows, scores = self.index.search_batch(self.vectorize_batch(list(queries)), k)
+        return [
+            [(self.texts[row], float(score)) for row, score in zip(query_rows, query_scores)]
+            for query_rows, query_scores in zip(rows.tolist(), scores.tolist())
+        ]
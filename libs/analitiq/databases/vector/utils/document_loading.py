@@ -0,0 +1,231 @@
+import logging
+from pathlib import Path
+from typing import List
+from analitiq.databases.vector.utils.incremental_sync import (
+    IncrementalSync,
+    SyncManifest,
+    chunk_uuid,
+    default_manifest_path,
+    document_uuid_for_path,
+    number_identical_chunks,
+)
+
+# The loaders, chunkers and the ingestion pipeline are imported by the load_* methods. They pull in
+# langchain, which a connector that only searches does not need.
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentLoaderMixin:
+    """Loads files, directories and texts into a vector database connector.
+
+    The documents are read, chunked and embedded here; the connector writes the chunks. A connector
+    using the mixin provides ``params``, ``collection_name``, ``vectorizer``, ``load_chunks``,
+    ``_write_chunks(chunks, vectors)`` and ``delete_many_on_uuids(uuids)``.
+
+    Attributes
+    ----------
+    delete_batch_size : int
+        The number of ids passed to ``delete_many_on_uuids`` at once when stale chunks are deleted.
+
+    """
+
+    delete_batch_size: int = 1000
+
+    def load_file(self, path: str, incremental: bool = False, manifest_path: str = None) -> (List, int):
+        """Load a file into the vector database.
+
+        Reads the file at the given path, processes it into chunks, and loads the chunks.
+
+        Parameters
+        ----------
+        path : str
+            The file path to load.
+        incremental : bool, optional
+            Skip the file if it did not change since the last incremental load, and delete the
+            chunks it no longer produces if it did. See ``load_dir``.
+        manifest_path : str, optional
+            The sync manifest to use in incremental mode.
+
+        Returns
+        -------
+        int
+            The number of chunks loaded.
+
+        Raises
+        ------
+        Exception
+            If there is an error during file processing or loading.
+
+        """
+        sync = self._incremental_sync(manifest_path) if incremental else None
+        document_uuid = sync.check(path) if sync else None
+        if sync and document_uuid is None:
+            logger.info(f"File {path} is unchanged, skipping it.")
+            return [], 0
+
+        from analitiq.loaders.documents.file_loader import FileLoader
+        from analitiq.factories.chunker_factory import ChunkerFactory
+
+        loader = FileLoader(path)
+        documents = loader.load()
+        document=documents[0]
+        # a file keeps its id across loads, so the ids of its chunks are stable and a reload overwrites them
+        document.uuid = document_uuid or document_uuid_for_path(path)
+        chunker = ChunkerFactory.get_chunker(document.metadata.document_type.value)
+        chunks = chunker.chunk(document)
+        loaded = self.load_chunks(chunks)
+
+        if sync:
+            sync.add_chunks(document_uuid, self._chunk_uuids(chunks))
+            if loaded < len(chunks):
+                sync.discard(document_uuid)
+            resolved = str(Path(path).resolve())
+            self._delete_stale_chunks(sync.finish(lambda p: p == resolved))
+            sync.save()
+
+        return [document], loaded
+
+    def load_dir(self, path: str, extension: str, progress_callback=None, incremental: bool = False,
+                 manifest_path: str = None, workers: int = 1, **pipeline_options) -> (List, int):
+        """Load files from a directory into the vector database.
+
+        Processes all files with the given extension in the directory and loads them.
+        Files stream through an IngestionPipeline: they are read and chunked in worker threads,
+        embedded in batches and written while the next files are processed, so memory use does
+        not grow with the size of the directory.
+
+        Parameters
+        ----------
+        path : str
+            The directory path containing files to load.
+        extension : str
+            The file extension to filter by (e.g., 'txt').
+        progress_callback : Callable[[IngestionStats], None], optional
+            Called with the running ingestion stats after every written batch.
+        incremental : bool, optional
+            Only load what changed since the last incremental load of the directory. A manifest
+            records the mtime, content hash and chunk ids of every file: unchanged files are
+            skipped, the chunks that a changed file no longer produces are deleted, and so are
+            the chunks of files that disappeared. A file whose chunks were not all written is left
+            out of the manifest, so the next incremental load retries it.
+        manifest_path : str, optional
+            The sync manifest to use in incremental mode. Defaults to a file per collection and
+            tenant under ``~/.analitiq/manifests``.
+        workers : int, optional
+            Number of processes chunking documents in parallel (default is 1, chunking in threads
+            of this process). Chunking is CPU-bound, so use up to one worker per core.
+        **pipeline_options
+            Passed to IngestionPipeline, e.g. ``read_workers``, ``chunk_workers`` or ``batch_size``.
+
+        Returns
+        -------
+        (List[DocumentMetadata], int)
+            The metadata of the loaded documents and the number of chunks loaded.
+
+        Raises
+        ------
+        Exception
+            If there is an error during directory processing or loading.
+
+        """
+        from analitiq.loaders.documents.directory_loader import DirectoryLoader
+        from analitiq.chunkers.parallel_chunker import ParallelChunker
+        from analitiq.databases.vector.utils.ingestion_pipeline import IngestionPipeline
+
+        loader = DirectoryLoader(path, extension)
+        sync = self._incremental_sync(manifest_path) if incremental else None
+        documents = []
+
+        def load_document(file_path):
+            document_uuid = sync.check(file_path) if sync else None
+            if sync and document_uuid is None:
+                return None
+
+            document = loader.load_path(file_path)
+            if document is not None:
+                document.uuid = document_uuid or document_uuid_for_path(file_path)
+                documents.append(document.metadata)
+            return document
+
+        chunker = ParallelChunker(workers)
+
+        def chunk_document(document):
+            # numbered before the chunks of the document are split into batches
+            chunks = number_identical_chunks(chunker.chunk(document))
+            if sync:
+                sync.add_chunks(document.uuid, self._chunk_uuids(chunks))
+            return chunks
+
+        def write_batch(chunks, vectors):
+            written = self._write_chunks(chunks, vectors)
+            if sync and written < len(chunks):
+                # which chunks failed is not known, so every file of the batch is retried
+                for document_uuid in {chunk.document_uuid for chunk in chunks}:
+                    sync.discard(document_uuid)
+            return written
+
+        if chunker.parallel:
+            # keep every worker process busy
+            pipeline_options.setdefault("chunk_workers", workers)
+        pipeline = IngestionPipeline(
+            load_document,
+            chunk_document,
+            self.vectorizer.vectorize_batch,
+            write_batch,
+            progress_callback=progress_callback,
+            **pipeline_options,
+        )
+        # the worker processes are spawned before documents are queued
+        with chunker:
+            stats = pipeline.run(loader.iter_paths())
+
+        if sync:
+            self._delete_stale_chunks(sync.finish(loader.contains))
+            sync.save()
+            logger.info(f"Incremental load: {sync.skipped} unchanged files skipped.")
+
+        if not documents:
+            logger.info("No documents were loaded from the directory.")
+        return documents, stats.written
+
+    def load_text(self, content: str,
+                  document_name: str,
+                  document_type: str,
+                  document_uuid: str = None,
+                  document_tags: str = None) -> (List, int):
+        """
+        Load a text chunk into the Vector Database.
+        :param content: the content of the document
+        :param document_name: the name of the document
+        :param document_type: the type of the document
+        :param document_uuid: the uuid of the document if you want to maintain link to the source system from which the document came.
+        :param document_tags: the tags of the document
+        :return: The number of chunks that were loaded (always returns 1).
+        """
+        from analitiq.loaders.documents.text_loader import TextLoader
+        from analitiq.factories.chunker_factory import ChunkerFactory
+
+        loader = TextLoader(content, document_name, document_type, document_uuid, document_tags)
+        documents = loader.load()
+
+        document=documents[0]
+        chunker = ChunkerFactory.get_chunker(document.metadata.document_type.value)
+        chunks = chunker.chunk(document)
+
+        return [document], self.load_chunks(chunks)
+
+    @staticmethod
+    def _chunk_uuids(chunks) -> List[str]:
+        return [chunk_uuid(chunk.document_uuid, chunk.content, chunk.occurrence) for chunk in chunks]
+
+    def _incremental_sync(self, manifest_path: str = None) -> IncrementalSync:
+        path = manifest_path or default_manifest_path(self.collection_name, self.params.get("tenant_name"))
+        return IncrementalSync(SyncManifest(path))
+
+    def _delete_stale_chunks(self, uuids: List[str]):
+        """Delete chunks by id, in batches of ``delete_batch_size``."""
+        for start in range(0, len(uuids), self.delete_batch_size):
+            self.delete_many_on_uuids(uuids[start:start + self.delete_batch_size])
+        if uuids:
+            logger.info(f"Deleted {len(uuids)} stale chunks.")
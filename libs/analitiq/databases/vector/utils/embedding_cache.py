@@ -0,0 +1,201 @@
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+DEFAULT_CACHE_SIZE = 10000
+
+CacheKey = Tuple[str, str]
+
+
+def text_hash(text: str) -> str:
+    """Return the SHA-256 hex digest of a text, used as its content address."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """A content-addressed cache of text embeddings.
+
+    Embeddings are keyed by ``(model name, text hash)``, so the same text embedded by the same
+    model is only ever run through the model once. The cache has two tiers:
+
+    - a bounded in-memory LRU tier holding up to ``max_items`` vectors;
+    - an optional on-disk tier in an SQLite file, which survives restarts and is shared by
+      every process pointing at the same file.
+
+    Lookups check memory first, then disk. Vectors found on disk are promoted to memory.
+    The cache is thread-safe.
+
+    Parameters
+    ----------
+    max_items : int, optional
+        Maximum number of vectors kept in memory. 0 disables the memory tier.
+    db_path : str or Path, optional
+        Path of the SQLite file backing the disk tier. No disk tier is used if None.
+
+    Examples
+    --------
+    >>> cache = EmbeddingCache(max_items=1000, db_path="~/.analitiq/embeddings.sqlite")
+    >>> vectorizer = AnalitiqVectorizer(VECTOR_MODEL_NAME, cache=cache)
+    >>> cache.stats()
+    {'hits': 0, 'misses': 0, 'memory_hits': 0, 'disk_hits': 0, 'memory_items': 0}
+
+    """
+
+    def __init__(self, max_items: int = DEFAULT_CACHE_SIZE, db_path: Optional[Union[str, Path]] = None):
+        self.max_items = max_items
+        self.db_path = Path(db_path).expanduser() if db_path else None
+        self._memory: "OrderedDict[CacheKey, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+
+        if self.db_path:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, "
+                "PRIMARY KEY (model, text_hash))"
+            )
+            self._db.commit()
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Look up the embeddings of several texts.
+
+        Parameters
+        ----------
+        model : str
+            The name of the model that produced the embeddings.
+        texts : Sequence[str]
+            The texts to look up.
+
+        Returns
+        -------
+        List[Optional[np.ndarray]]
+            One read-only float32 vector per text, or None where the text is not cached.
+
+        """
+        keys = [(model, text_hash(text)) for text in texts]
+        found: List[Optional[np.ndarray]] = [None] * len(keys)
+        disk_lookups: Dict[str, List[int]] = {}
+
+        with self._lock:
+            for idx, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[idx] = vector
+                    self.memory_hits += 1
+                else:
+                    disk_lookups.setdefault(key[1], []).append(idx)
+
+            if disk_lookups and self._db is not None:
+                for digest, vector in self._read_disk(model, list(disk_lookups)):
+                    self._remember((model, digest), vector)
+                    for idx in disk_lookups[digest]:
+                        found[idx] = vector
+                        self.disk_hits += 1
+
+            hits = sum(vector is not None for vector in found)
+            self.hits += hits
+            self.misses += len(found) - hits
+
+        return found
+
+    def get(self, model: str, text: str) -> Optional[np.ndarray]:
+        """Look up the embedding of a single text. Returns None if it is not cached."""
+        return self.get_many(model, [text])[0]
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: np.ndarray):
+        """Store the embeddings of several texts.
+
+        Parameters
+        ----------
+        model : str
+            The name of the model that produced the embeddings.
+        texts : Sequence[str]
+            The embedded texts.
+        vectors : np.ndarray
+            A matrix with one vector per text.
+
+        """
+        rows = []
+        with self._lock:
+            for text, vector in zip(texts, vectors):
+                digest = text_hash(text)
+                vector = np.array(vector, dtype=np.float32)
+                vector.setflags(write=False)
+                self._remember((model, digest), vector)
+                rows.append((model, digest, vector.tobytes()))
+
+            if rows and self._db is not None:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)", rows
+                )
+                self._db.commit()
+
+    def put(self, model: str, text: str, vector: np.ndarray):
+        """Store the embedding of a single text."""
+        self.put_many(model, [text], [vector])
+
+    def _remember(self, key: CacheKey, vector: np.ndarray):
+        if self.max_items <= 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, model: str, digests: List[str]) -> List[Tuple[str, np.ndarray]]:
+        rows = []
+        # stay well below SQLite's limit on the number of bound parameters
+        for start in range(0, len(digests), 500):
+            batch = digests[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows.extend(
+                self._db.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *batch],
+                ).fetchall()
+            )
+
+        result = []
+        for digest, blob in rows:
+            vector = np.frombuffer(blob, dtype=np.float32)
+            result.append((digest, vector))
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit and miss counters and the number of vectors held in memory."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "memory_items": len(self._memory),
+            }
+
+    def clear(self):
+        """Drop all cached vectors from memory and disk and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM embeddings")
+                self._db.commit()
+            self.hits = self.misses = self.memory_hits = self.disk_hits = 0
+
+    def close(self):
+        """Close the disk tier."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,278 @@
+import dataclasses
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from analitiq.databases.vector.schema import SearchMetadata, SearchObject, SearchResult
+
+# The fusion functions work on the results of any connector: Weaviate QueryReturn objects as well as
+# SearchResult objects. They only use ``results.objects``, ``obj.uuid`` and ``obj.metadata``.
+
+DEFAULT_FUSION_METHOD = "rrf"
+DEFAULT_RRF_K = 60
+DEFAULT_WEIGHTS = (0.3, 0.7)  # keyword leg, vector leg
+DEFAULT_OVERFETCH = 3
+VECTORIZE_MIN_CANDIDATES = 256  # candidate count from which the NumPy implementation is used
+
+
+def _collect_candidates(result_lists: Sequence[SearchResult]) -> Tuple[List[SearchObject], List[np.ndarray]]:
+    """Deduplicate objects across result lists by uuid.
+
+    Returns the unique objects in first-seen order and, for every result list, the position of
+    each of its objects in the unique list.
+    """
+    positions: Dict = {}
+    candidates: List[SearchObject] = []
+    leg_positions = []
+
+    for results in result_lists:
+        objects = results.objects if results is not None else []
+        idx = np.empty(len(objects), dtype=np.int64)
+        for rank, obj in enumerate(objects):
+            pos = positions.get(obj.uuid)
+            if pos is None:
+                pos = positions[obj.uuid] = len(candidates)
+                candidates.append(obj)
+            idx[rank] = pos
+        leg_positions.append(idx)
+
+    return candidates, leg_positions
+
+
+def _leg_scores(objects: List[SearchObject]) -> np.ndarray:
+    """Return a "higher is better" score for each object of one leg.
+
+    The score is used when every object has one (bm25), otherwise the negated distance
+    (near_vector), otherwise the negated rank.
+    """
+    metadata = [obj.metadata for obj in objects]
+    if all(m is not None and m.score is not None for m in metadata):
+        return np.array([m.score for m in metadata], dtype=np.float64)
+    if all(m is not None and m.distance is not None for m in metadata):
+        return -np.array([m.distance for m in metadata], dtype=np.float64)
+    return -np.arange(len(objects), dtype=np.float64)
+
+
+def _normalize(scores: np.ndarray) -> np.ndarray:
+    """Min-max scale scores to [0, 1]. A leg whose scores are all equal gets 1.0 everywhere."""
+    if scores.size == 0:
+        return scores
+    low, high = scores.min(), scores.max()
+    if high == low:
+        return np.ones_like(scores)
+    return (scores - low) / (high - low)
+
+
+def _top_python(scores: List[float], limit: int) -> List[int]:
+    # sorted() is stable, so ties keep the first-seen order
+    return sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:limit]
+
+
+def _top_numpy(scores: np.ndarray, limit: int) -> np.ndarray:
+    if limit >= scores.size:
+        keep = np.arange(scores.size)
+    else:
+        threshold = np.partition(scores, scores.size - limit)[scores.size - limit]
+        keep = np.flatnonzero(scores >= threshold)
+    # order by score, then by first-seen position, like the pure Python path
+    order = np.lexsort((keep, -scores[keep]))
+    return keep[order][:limit]
+
+
+def reciprocal_rank_fusion(
+    result_lists: Sequence[SearchResult],
+    limit: int,
+    weights: Sequence[float],
+    k: int = DEFAULT_RRF_K,
+    vectorized: Optional[bool] = None,
+) -> Tuple[List[SearchObject], List[float]]:
+    """Fuse ranked result lists with weighted reciprocal rank fusion.
+
+    Every object gets ``sum(weight / (k + rank))`` over the lists it appears in.
+
+    Parameters
+    ----------
+    result_lists : Sequence[SearchResult]
+        One result list per search leg, best match first.
+    limit : int
+        The maximum number of fused results.
+    weights : Sequence[float]
+        One weight per result list.
+    k : int, optional
+        The RRF rank constant. Larger values flatten the difference between top ranks.
+    vectorized : bool, optional
+        Force the NumPy (True) or pure Python (False) implementation. By default NumPy is used
+        from ``VECTORIZE_MIN_CANDIDATES`` candidates on.
+
+    Returns
+    -------
+    Tuple[List[SearchObject], List[float]]
+        The fused objects and their scores, best first.
+
+    """
+    candidates, leg_positions = _collect_candidates(result_lists)
+    if vectorized is None:
+        vectorized = len(candidates) >= VECTORIZE_MIN_CANDIDATES
+
+    if vectorized:
+        scores = np.zeros(len(candidates), dtype=np.float64)
+        for weight, idx in zip(weights, leg_positions):
+            ranks = np.arange(1, idx.size + 1, dtype=np.float64)
+            np.add.at(scores, idx, weight / (k + ranks))
+        top = _top_numpy(scores, limit)
+        return [candidates[i] for i in top], scores[top].tolist()
+
+    scores = [0.0] * len(candidates)
+    for weight, idx in zip(weights, leg_positions):
+        for rank, pos in enumerate(idx.tolist(), start=1):
+            scores[pos] += weight / (k + rank)
+    top = _top_python(scores, limit)
+    return [candidates[i] for i in top], [scores[i] for i in top]
+
+
+def relative_score_fusion(
+    result_lists: Sequence[SearchResult],
+    limit: int,
+    weights: Sequence[float],
+    vectorized: Optional[bool] = None,
+    **kwargs,
+) -> Tuple[List[SearchObject], List[float]]:
+    """Fuse result lists by their min-max normalized scores.
+
+    Unlike RRF, the size of the gap between two hits is kept: a keyword hit that clearly beats
+    the others stays ahead of a vector hit that barely made the list. Each leg is scaled to
+    [0, 1], weighted, and summed per object.
+
+    Parameters
+    ----------
+    result_lists : Sequence[SearchResult]
+        One result list per search leg, best match first.
+    limit : int
+        The maximum number of fused results.
+    weights : Sequence[float]
+        One weight per result list.
+    vectorized : bool, optional
+        Force the NumPy (True) or pure Python (False) implementation.
+
+    Returns
+    -------
+    Tuple[List[SearchObject], List[float]]
+        The fused objects and their scores, best first.
+
+    """
+    candidates, leg_positions = _collect_candidates(result_lists)
+    if vectorized is None:
+        vectorized = len(candidates) >= VECTORIZE_MIN_CANDIDATES
+
+    leg_scores = [
+        _normalize(_leg_scores(results.objects)) if results is not None else np.empty(0)
+        for results in result_lists
+    ]
+
+    if vectorized:
+        scores = np.zeros(len(candidates), dtype=np.float64)
+        for weight, idx, normalized in zip(weights, leg_positions, leg_scores):
+            np.add.at(scores, idx, weight * normalized)
+        top = _top_numpy(scores, limit)
+        return [candidates[i] for i in top], scores[top].tolist()
+
+    scores = [0.0] * len(candidates)
+    for weight, idx, normalized in zip(weights, leg_positions, leg_scores):
+        for pos, score in zip(idx.tolist(), normalized.tolist()):
+            scores[pos] += weight * score
+    top = _top_python(scores, limit)
+    return [candidates[i] for i in top], [scores[i] for i in top]
+
+
+FusionFunction = Callable[..., Tuple[List[SearchObject], List[float]]]
+
+FUSION_METHODS: Dict[str, FusionFunction] = {
+    "rrf": reciprocal_rank_fusion,
+    "relative_score": relative_score_fusion,
+}
+
+
+class ResultFusion:
+    """The fusion stage of a hybrid search.
+
+    It decides how many results each search leg fetches and merges the legs into one ranked list.
+    The fused score of every returned object is set on ``object.metadata.score``; the original
+    ``distance`` is kept.
+
+    Parameters
+    ----------
+    method : str, optional
+        A key of ``FUSION_METHODS``: "rrf" (default) or "relative_score".
+    weights : Sequence[float], optional
+        The weights of the keyword and vector legs (default is (0.3, 0.7)).
+    k : int, optional
+        The RRF rank constant (default is 60). Ignored by relative score fusion.
+    overfetch : int, optional
+        Each leg fetches ``limit * overfetch`` results, so that objects ranked just below the
+        limit in one leg can still make the fused top ``limit`` (default is 3).
+    vectorized : bool, optional
+        Force or disable the NumPy implementation. By default it is picked by candidate count.
+
+    Examples
+    --------
+    >>> fusion = ResultFusion(method="relative_score", weights=(0.5, 0.5))
+    >>> vdb = WeaviateConnector({**params, "fusion": fusion})
+    >>> vdb.hybrid_search("revenue by month", limit=5)
+
+    """
+
+    def __init__(
+        self,
+        method: str = DEFAULT_FUSION_METHOD,
+        weights: Sequence[float] = DEFAULT_WEIGHTS,
+        k: int = DEFAULT_RRF_K,
+        overfetch: int = DEFAULT_OVERFETCH,
+        vectorized: Optional[bool] = None,
+    ):
+        if method not in FUSION_METHODS:
+            raise ValueError(f"Unknown fusion method '{method}'. Valid methods: {', '.join(FUSION_METHODS)}")
+        if overfetch < 1:
+            raise ValueError("overfetch must be at least 1")
+
+        self.method = method
+        self.weights = tuple(weights)
+        self.k = k
+        self.overfetch = overfetch
+        self.vectorized = vectorized
+
+    @classmethod
+    def from_params(cls, params: dict) -> "ResultFusion":
+        """Build the fusion stage from connector params.
+
+        ``params["fusion"]`` may be a ResultFusion instance or a method name. The other keys read
+        are 'fusion_weights', 'fusion_k' and 'fusion_overfetch'.
+        """
+        fusion: Union[str, "ResultFusion", None] = params.get("fusion")
+        if isinstance(fusion, ResultFusion):
+            return fusion
+
+        return cls(
+            method=fusion or DEFAULT_FUSION_METHOD,
+            weights=params.get("fusion_weights", DEFAULT_WEIGHTS),
+            k=params.get("fusion_k", DEFAULT_RRF_K),
+            overfetch=params.get("fusion_overfetch", DEFAULT_OVERFETCH),
+        )
+
+    def fetch_limit(self, limit: int) -> int:
+        """Return the number of results each leg should fetch for a fused result of ``limit``."""
+        return limit * self.overfetch
+
+    def fuse(self, result_lists: Sequence[SearchResult], limit: int) -> SearchResult:
+        """Merge the results of the search legs into one list of at most ``limit`` objects.
+
+        Empty legs are fine: if the keyword leg finds nothing, the vector hits are returned.
+        """
+        objects, scores = FUSION_METHODS[self.method](
+            result_lists, limit, weights=self.weights, k=self.k, vectorized=self.vectorized
+        )
+
+        fused = [
+            dataclasses.replace(obj, metadata=dataclasses.replace(obj.metadata or SearchMetadata(), score=score))
+            for obj, score in zip(objects, scores)
+        ]
+        # return the result type of the connector, e.g. a Weaviate QueryReturn
+        result_type = next((type(results) for results in result_lists if results is not None), SearchResult)
+        return result_type(objects=fused)
@@ -0,0 +1,228 @@
+import hashlib
+import json
+import os
+import threading
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Union
+from analitiq.logger.logger import initialize_logging
+
+logger, chat_logger = initialize_logging()
+
+DEFAULT_MANIFEST_DIR = Path("~/.analitiq/manifests")
+# namespace of the deterministic document and chunk ids
+ANALITIQ_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://analitiq.ai/documents")
+
+
+def document_uuid_for_path(path: Union[str, Path]) -> str:
+    """Return a stable document id for a file, derived from its absolute path."""
+    return str(uuid.uuid5(ANALITIQ_NAMESPACE, str(Path(path).resolve())))
+
+
+def chunk_uuid(document_uuid: Optional[str], content: str, occurrence: int = 0) -> str:
+    """Return a stable chunk id, derived from the document id, the chunk content and its occurrence.
+
+    Reloading an unchanged document therefore produces the same ids and overwrites the stored
+    chunks instead of duplicating them. ``occurrence`` tells identical chunks of a document apart,
+    see :func:`number_identical_chunks`; the first one gets the same id as without it.
+    """
+    name = f"{document_uuid or ''}\x00{content}"
+    if occurrence:
+        name = f"{name}\x00{occurrence}"
+    return str(uuid.uuid5(ANALITIQ_NAMESPACE, name))
+
+
+def number_identical_chunks(chunks: Sequence) -> Sequence:
+    """Set the ``occurrence`` of every chunk: how many identical chunks of its document come before it.
+
+    Call it with all the chunks of a document before they are split into batches, so that the ids
+    of identical chunks differ and none of them overwrites another. Returns ``chunks``.
+    """
+    seen = Counter()
+    for chunk in chunks:
+        key = (chunk.document_uuid, chunk.content)
+        chunk.occurrence = seen[key]
+        seen[key] += 1
+    return chunks
+
+
+def file_hash(path: Union[str, Path]) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def default_manifest_path(collection_name: str, tenant_name: Optional[str] = None) -> Path:
+    """Return the default manifest file of a collection and tenant, under ``~/.analitiq/manifests``."""
+    name = f"{collection_name}__{tenant_name}" if tenant_name else collection_name
+    return (DEFAULT_MANIFEST_DIR / f"{name}.json").expanduser()
+
+
+@dataclass
+class ManifestEntry:
+    """What was indexed for one file."""
+
+    path: str
+    mtime: float
+    content_hash: str
+    document_uuid: str
+    chunk_uuids: List[str] = field(default_factory=list)
+
+
+class SyncManifest:
+    """A JSON file recording, for every indexed file, its mtime, content hash and chunk ids.
+
+    Parameters
+    ----------
+    path : str or Path
+        The manifest file. It is created on the first save.
+
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        self.entries: Dict[str, ManifestEntry] = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.entries = {item["path"]: ManifestEntry(**item) for item in data.get("files", [])}
+
+    def get(self, path: str) -> Optional[ManifestEntry]:
+        return self.entries.get(path)
+
+    def set(self, entry: ManifestEntry):
+        self.entries[entry.path] = entry
+
+    def remove(self, path: str) -> Optional[ManifestEntry]:
+        return self.entries.pop(path, None)
+
+    def save(self):
+        """Write the manifest atomically, so that an interrupted save never corrupts it."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"files": [asdict(entry) for entry in self.entries.values()]}, f)
+        os.replace(tmp_path, self.path)
+
+
+@dataclass
+class _PendingFile:
+    path: str
+    mtime: float
+    content_hash: str
+    chunk_uuids: List[str] = field(default_factory=list)
+
+
+class IncrementalSync:
+    """Track which files changed since the last sync and which chunks became stale.
+
+    A sync goes through these steps, and is safe to call from several threads:
+
+    1. :meth:`check` each file. It returns None for unchanged files, which are then skipped, and
+       the document id to use for new or changed ones.
+    2. :meth:`add_chunks` with the chunk ids of every loaded document, and :meth:`discard` the
+       documents that failed to be written, so that the next sync loads them again.
+    3. :meth:`finish` once everything is written. It returns the ids of the chunks to delete: the
+       chunks of changed files that are not produced anymore, and all chunks of files that
+       disappeared. Delete them, then :meth:`save` the manifest.
+
+    A file whose mtime did not change is skipped without reading it. If only the mtime changed,
+    the content hash still matches and the file is skipped too.
+
+    Parameters
+    ----------
+    manifest : SyncManifest
+        The manifest of the previous sync.
+
+    """
+
+    def __init__(self, manifest: SyncManifest):
+        self.manifest = manifest
+        self._lock = threading.Lock()
+        self._seen: Set[str] = set()
+        self._pending: Dict[str, _PendingFile] = {}
+        self.skipped = 0
+
+    def check(self, path: Union[str, Path]) -> Optional[str]:
+        """Return the document id to load a file with, or None if the file is unchanged."""
+        key = str(Path(path).resolve())
+        mtime = os.stat(key).st_mtime
+
+        with self._lock:
+            self._seen.add(key)
+            entry = self.manifest.get(key)
+        if entry is not None and entry.mtime == mtime:
+            with self._lock:
+                self.skipped += 1
+            return None
+
+        content_hash = file_hash(key)
+        with self._lock:
+            if entry is not None and entry.content_hash == content_hash:
+                entry.mtime = mtime
+                self.skipped += 1
+                return None
+
+            document_uuid = document_uuid_for_path(key)
+            self._pending[document_uuid] = _PendingFile(key, mtime, content_hash)
+            return document_uuid
+
+    def add_chunks(self, document_uuid: str, chunk_uuids: Iterable[str]):
+        """Record the ids of chunks produced for a document returned by :meth:`check`."""
+        with self._lock:
+            self._pending[document_uuid].chunk_uuids.extend(chunk_uuids)
+
+    def discard(self, document_uuid: str):
+        """Leave a document returned by :meth:`check` out of the manifest update, e.g. because some
+        of its chunks failed to be written. Its file is then loaded again by the next sync."""
+        with self._lock:
+            pending = self._pending.pop(document_uuid, None)
+        if pending is not None:
+            logger.warning(f"File {pending.path} was not fully written, it is retried by the next sync")
+
+    def finish(self, in_scope: Callable[[str], bool] = lambda path: True) -> List[str]:
+        """Update the manifest with the loaded files and return the ids of the stale chunks.
+
+        Parameters
+        ----------
+        in_scope : Callable[[str], bool], optional
+            Tells whether a manifest path belongs to the synced set of files. Files in scope
+            that were not checked during this sync are treated as deleted.
+
+        Returns
+        -------
+        List[str]
+            The ids of the chunks to delete from the vector database.
+
+        """
+        stale: Set[str] = set()
+        with self._lock:
+            for document_uuid, pending in self._pending.items():
+                previous = self.manifest.get(pending.path)
+                if previous is not None:
+                    stale.update(set(previous.chunk_uuids) - set(pending.chunk_uuids))
+                self.manifest.set(ManifestEntry(
+                    path=pending.path,
+                    mtime=pending.mtime,
+                    content_hash=pending.content_hash,
+                    document_uuid=document_uuid,
+                    chunk_uuids=sorted(pending.chunk_uuids),
+                ))
+
+            for path in [p for p in self.manifest.entries if p not in self._seen and in_scope(p)]:
+                logger.info(f"File {path} disappeared, deleting its chunks")
+                stale.update(self.manifest.remove(path).chunk_uuids)
+
+            self._pending.clear()
+
+        return sorted(stale)
+
+    def save(self):
+        """Save the manifest. Call it after the stale chunks are deleted."""
+        with self._lock:
+            self.manifest.save()
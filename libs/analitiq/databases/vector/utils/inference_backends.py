@@ -0,0 +1,200 @@
+import copy
+import inspect
+import os
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Type, Union
+import numpy as np
+from analitiq.logger.logger import initialize_logging
+
+logger, chat_logger = initialize_logging()
+
+DEFAULT_BACKEND = "torch"
+DEFAULT_ONNX_DIR = Path("~/.analitiq/onnx")
+ONNX_OPSET = 17
+
+
+def mean_pool(token_states: np.ndarray, attention_mask: np.ndarray, normalize: bool) -> np.ndarray:
+    """Average token states with the attention mask as weights, as the PyTorch path does, in NumPy."""
+    mask = attention_mask[..., None].astype(np.float32)
+    vectors = (token_states * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+    if normalize:
+        vectors /= np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+
+    return vectors.astype(np.float32, copy=False)
+
+
+class InferenceBackend(ABC):
+    """Runs a Hugging Face model on tokenized texts and pools the result into one vector per text.
+
+    Backends are built once per model by the ModelRegistry and shared by all vectorizers of that
+    model, so they must be safe to call from several threads.
+
+    The backends support the torch range of the package, ``^2.3.1``. The int8 and ONNX backends use
+    ``torch.ao.quantization`` and the TorchScript ONNX exporter, which recent torch releases deprecate
+    in favour of torchao and the dynamo exporter. Those need extra dependencies (torchao, onnxscript)
+    and newer torch releases, so the backends keep the older APIs, which emit DeprecationWarnings on
+    torch 2.9 and later.
+
+    Attributes
+    ----------
+    name : str
+        The key of the backend in ``INFERENCE_BACKENDS``.
+    tensor_type : str
+        The ``return_tensors`` type of the tokenizer outputs the backend takes: "pt" or "np".
+
+    """
+
+    name: str = ""
+    tensor_type: str = "pt"
+
+    @abstractmethod
+    def embed(self, inputs: Mapping, normalize: bool) -> np.ndarray:
+        """Return a float32 matrix with one mean-pooled vector per tokenized text."""
+
+
+class TorchBackend(InferenceBackend):
+    """Eager PyTorch inference with the model as loaded. This is the reference implementation."""
+
+    name = "torch"
+
+    def __init__(self, loaded, **options):
+        self.model = loaded.model
+
+    def embed(self, inputs: Mapping, normalize: bool) -> np.ndarray:
+        import torch
+
+        with torch.inference_mode():
+            outputs = self.model(**inputs)
+            token_states = outputs.last_hidden_state
+            mask = inputs["attention_mask"].unsqueeze(-1).to(token_states.dtype)
+            vectors = (token_states * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+
+            if normalize:
+                vectors = torch.nn.functional.normalize(vectors, p=2, dim=1)
+
+        return vectors.cpu().numpy().astype(np.float32, copy=False)
+
+
+class QuantizedTorchBackend(TorchBackend):
+    """PyTorch inference with the linear layers dynamically quantized to int8.
+
+    Weights are stored as int8 and activations are quantized on the fly, which speeds up CPU
+    inference and shrinks the linear layers about four times. Vectors drift slightly from the
+    reference; run ``benchmarks/bench_inference_backends.py`` to measure it for a model.
+    The shared model is not modified: a quantized copy is made.
+    """
+
+    name = "torch_int8"
+
+    def __init__(self, loaded, **options):
+        import torch
+
+        self.model = torch.ao.quantization.quantize_dynamic(
+            copy.deepcopy(loaded.model), {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+
+class OnnxBackend(InferenceBackend):
+    """ONNX Runtime inference on the CPU.
+
+    The model is exported to ONNX on first use and the export is kept in ``onnx_dir``, by default
+    ``~/.analitiq/onnx/<model name>/model.onnx``. A model directory that already contains a
+    ``model.onnx`` is used as is. Needs ``pip install onnxruntime onnx``.
+
+    Parameters
+    ----------
+    loaded : LoadedModel
+        The model to export.
+    onnx_dir : str or Path, optional
+        Where the exported model is stored.
+    intra_op_threads : int, optional
+        Threads ONNX Runtime uses for one inference. By default it uses all cores.
+
+    """
+
+    name = "onnx"
+    tensor_type = "np"
+
+    def __init__(self, loaded, onnx_dir: Optional[Union[str, Path]] = None, intra_op_threads: Optional[int] = None,
+                 **options):
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ImportError("The onnx backend needs onnxruntime and onnx: pip install onnxruntime onnx") from e
+
+        model_path = self._export(loaded, onnx_dir)
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            session_options.intra_op_num_threads = intra_op_threads
+        self.session = onnxruntime.InferenceSession(
+            str(model_path), session_options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+        self.output_name = self.session.get_outputs()[0].name
+
+    @staticmethod
+    def onnx_path(model_name_or_path: str, onnx_dir: Optional[Union[str, Path]] = None) -> Path:
+        """Return where the ONNX export of a model is read from or written to."""
+        local = Path(model_name_or_path) / "model.onnx"
+        if onnx_dir is None and local.exists():
+            return local
+        safe_name = re.sub(r"[^\w.-]+", "__", model_name_or_path.strip("/"))
+        return (Path(onnx_dir or DEFAULT_ONNX_DIR) / safe_name / "model.onnx").expanduser()
+
+    @classmethod
+    def _export(cls, loaded, onnx_dir: Optional[Union[str, Path]]) -> Path:
+        path = cls.onnx_path(loaded.name, onnx_dir)
+        if path.exists():
+            return path
+
+        import torch
+
+        logger.info(f"Exporting {loaded.name} to ONNX in {path}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        sample = loaded.tokenizer(["an example sentence", "another one"], return_tensors="pt", padding=True)
+        # the exported graph takes its inputs in the order of the forward signature
+        input_names = [name for name in inspect.signature(loaded.model.forward).parameters if name in sample]
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names + ["last_hidden_state"]}
+
+        export_options = {}
+        if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+            export_options["dynamo"] = False  # the TorchScript exporter needs no extra dependencies
+
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+        with torch.no_grad():
+            torch.onnx.export(
+                loaded.model,
+                (dict(sample),),
+                str(tmp_path),
+                input_names=input_names,
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes,
+                opset_version=ONNX_OPSET,
+                **export_options,
+            )
+        tmp_path.replace(path)
+        return path
+
+    def embed(self, inputs: Mapping, normalize: bool) -> np.ndarray:
+        feed = {name: np.asarray(value, dtype=np.int64) for name, value in inputs.items() if name in self.input_names}
+        token_states = self.session.run([self.output_name], feed)[0]
+        return mean_pool(token_states, np.asarray(inputs["attention_mask"]), normalize)
+
+
+INFERENCE_BACKENDS: Dict[str, Type[InferenceBackend]] = {
+    "torch": TorchBackend,
+    "torch_int8": QuantizedTorchBackend,
+    "onnx": OnnxBackend,
+}
+
+
+def create_backend(name: str, loaded, **options) -> InferenceBackend:
+    """Build the inference backend ``name`` for a loaded model."""
+    if name not in INFERENCE_BACKENDS:
+        raise ValueError(f"Unknown inference backend '{name}'. Valid backends: {', '.join(INFERENCE_BACKENDS)}")
+    return INFERENCE_BACKENDS[name](loaded, **options)
@@ -0,0 +1,295 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from analitiq.loaders.documents.schemas import Chunk, DocumentSchema
+from analitiq.logger.logger import initialize_logging
+
+logger, chat_logger = initialize_logging()
+
+DEFAULT_READ_WORKERS = 4
+DEFAULT_CHUNK_WORKERS = 2
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_QUEUE_SIZE = 256  # chunks waiting to be embedded
+
+_DONE = object()  # end-of-stream marker passed through the queues
+_POLL_SECONDS = 0.1
+
+
+@dataclass
+class StageStats:
+    """Counters of one pipeline stage."""
+
+    name: str
+    items: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Items processed per second of work in this stage."""
+        return self.items / self.busy_seconds if self.busy_seconds else 0.0
+
+
+@dataclass
+class IngestionStats:
+    """Progress and throughput of an ingestion run.
+
+    ``stages`` holds one StageStats per stage: "read" counts documents, "chunk" and "embed" count
+    chunks, "write" counts chunks written successfully.
+    """
+
+    stages: Dict[str, StageStats] = field(
+        default_factory=lambda: {name: StageStats(name) for name in ("read", "chunk", "embed", "write")}
+    )
+    started: float = field(default_factory=time.perf_counter)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def documents(self) -> int:
+        return self.stages["read"].items
+
+    @property
+    def chunks(self) -> int:
+        return self.stages["chunk"].items
+
+    @property
+    def written(self) -> int:
+        return self.stages["write"].items
+
+    def summary(self) -> str:
+        stages = ", ".join(f"{s.name} {s.items} ({s.throughput:.1f}/s)" for s in self.stages.values())
+        return f"{self.documents} documents, {self.written}/{self.chunks} chunks written in " \
+               f"{self.elapsed_seconds:.1f}s. Stages: {stages}"
+
+
+class IngestionPipeline:
+    """Stream documents through read, chunk, embed and write stages running at the same time.
+
+    Each stage runs in its own threads and hands its output to the next one through a bounded
+    queue, so only a few documents and batches are in memory at any time, whatever the size of
+    the corpus. While one batch is written to the vector database, the next one is embedded and
+    more files are read and chunked.
+
+    - read: ``read_workers`` threads turn sources (e.g. file paths) into documents;
+    - chunk: ``chunk_workers`` threads split documents into chunks;
+    - embed: one thread groups chunks into batches of ``batch_size`` and embeds them;
+    - write: the calling thread writes the embedded batches.
+
+    The first error raised by any stage stops the pipeline and is re-raised by :meth:`run`.
+
+    Parameters
+    ----------
+    load_document : Callable[[Any], Optional[DocumentSchema]]
+        Reads one source. Returns None to skip it, e.g. for an empty file.
+    chunk_document : Callable[[DocumentSchema], List[Chunk]]
+        Splits a document into chunks.
+    embed_texts : Callable[[List[str]], Sequence]
+        Embeds a batch of chunk contents, returning one vector per text.
+    write_batch : Callable[[List[Chunk], Sequence], int]
+        Writes a batch of chunks with their vectors and returns the number written.
+    read_workers, chunk_workers : int, optional
+        Threads of the read and chunk stages.
+    batch_size : int, optional
+        Chunks per embedding and write batch.
+    queue_size : int, optional
+        Maximum number of chunks waiting to be embedded.
+    progress_callback : Callable[[IngestionStats], None], optional
+        Called with the running stats after every written batch.
+
+    Examples
+    --------
+    >>> pipeline = IngestionPipeline(loader.load_path, chunk, vectorizer.vectorize_batch, write)
+    >>> stats = pipeline.run(loader.iter_paths())
+    >>> stats.summary()
+    '120 documents, 2310/2310 chunks written in 41.2s. Stages: read 120 (95.3/s), ...'
+
+    """
+
+    def __init__(
+        self,
+        load_document: Callable[[Any], Optional[DocumentSchema]],
+        chunk_document: Callable[[DocumentSchema], List[Chunk]],
+        embed_texts: Callable[[List[str]], Sequence],
+        write_batch: Callable[[List[Chunk], Sequence], int],
+        read_workers: int = DEFAULT_READ_WORKERS,
+        chunk_workers: int = DEFAULT_CHUNK_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        progress_callback: Optional[Callable[[IngestionStats], None]] = None,
+    ):
+        self.load_document = load_document
+        self.chunk_document = chunk_document
+        self.embed_texts = embed_texts
+        self.write_batch = write_batch
+        self.read_workers = max(1, read_workers)
+        self.chunk_workers = max(1, chunk_workers)
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(self.batch_size, queue_size)
+        self.progress_callback = progress_callback
+
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self.stats = IngestionStats()
+
+    def run(self, sources: Iterable) -> IngestionStats:
+        """Ingest all sources and return the final stats.
+
+        ``sources`` is consumed lazily, so it can be a generator over a very large tree.
+        """
+        self._stop.clear()
+        self._error = None
+        self.stats = IngestionStats()
+
+        source_queue = queue.Queue(maxsize=self.read_workers * 2)
+        document_queue = queue.Queue(maxsize=self.chunk_workers * 2)
+        chunk_queue = queue.Queue(maxsize=self.queue_size)
+        batch_queue = queue.Queue(maxsize=2)
+
+        threads = [
+            self._start_thread("ingest-feed", self._feed, sources, source_queue),
+            self._start_thread("ingest-embed", self._embed, chunk_queue, batch_queue),
+        ]
+        threads += self._start_workers("ingest-read", self.read_workers, self._read,
+                                       source_queue, document_queue, self.chunk_workers)
+        threads += self._start_workers("ingest-chunk", self.chunk_workers, self._chunk,
+                                       document_queue, chunk_queue, 1)
+
+        try:
+            self._write(batch_queue)
+        except BaseException as e:  # also stop the workers on KeyboardInterrupt
+            self._fail(e)
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+
+        self.stats.elapsed_seconds = time.perf_counter() - self.stats.started
+        if self._error is not None:
+            raise self._error
+
+        logger.info(f"Ingestion finished: {self.stats.summary()}")
+        return self.stats
+
+    def _feed(self, sources: Iterable, out_queue: queue.Queue):
+        for source in sources:
+            if not self._put(out_queue, source):
+                return
+        for _ in range(self.read_workers):
+            self._put(out_queue, _DONE)
+
+    def _read(self, source, out_queue: queue.Queue):
+        started = time.perf_counter()
+        document = self.load_document(source)
+        self._record("read", 1 if document is not None else 0, started)
+        if document is not None:
+            self._put(out_queue, document)
+
+    def _chunk(self, document: DocumentSchema, out_queue: queue.Queue):
+        started = time.perf_counter()
+        chunks = self.chunk_document(document)
+        self._record("chunk", len(chunks), started)
+        for chunk in chunks:
+            if not self._put(out_queue, chunk):
+                return
+
+    def _embed(self, in_queue: queue.Queue, out_queue: queue.Queue):
+        batch: List[Chunk] = []
+        while True:
+            chunk = self._get(in_queue)
+            if chunk is None:
+                return
+            if chunk is not _DONE:
+                batch.append(chunk)
+            if batch and (chunk is _DONE or len(batch) >= self.batch_size):
+                started = time.perf_counter()
+                vectors = self.embed_texts([c.content for c in batch])
+                self._record("embed", len(batch), started)
+                if not self._put(out_queue, (batch, vectors)):
+                    return
+                batch = []
+            if chunk is _DONE:
+                self._put(out_queue, _DONE)
+                return
+
+    def _write(self, in_queue: queue.Queue):
+        while True:
+            item = self._get(in_queue)
+            if item is None or item is _DONE:
+                return
+            chunks, vectors = item
+            started = time.perf_counter()
+            written = self.write_batch(chunks, vectors)
+            self._record("write", written, started)
+            if self.progress_callback is not None:
+                self.stats.elapsed_seconds = time.perf_counter() - self.stats.started
+                self.progress_callback(self.stats)
+
+    def _start_workers(self, name, count, process, in_queue, out_queue, consumers) -> List[threading.Thread]:
+        """Start ``count`` threads applying ``process`` to the items of ``in_queue``.
+
+        When the last of them is done, one end marker per consumer of ``out_queue`` is sent.
+        """
+        remaining = [count]
+
+        def work():
+            while True:
+                item = self._get(in_queue)
+                if item is None or item is _DONE:
+                    break
+                process(item, out_queue)
+
+            with self._lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                for _ in range(consumers):
+                    self._put(out_queue, _DONE)
+
+        return [self._start_thread(f"{name}-{i}", work) for i in range(count)]
+
+    def _start_thread(self, name: str, target, *args) -> threading.Thread:
+        thread = threading.Thread(target=self._guard(target), args=args, name=name, daemon=True)
+        thread.start()
+        return thread
+
+    def _guard(self, target):
+        def run(*args):
+            try:
+                target(*args)
+            except BaseException as e:
+                self._fail(e)
+        return run
+
+    def _fail(self, error: BaseException):
+        with self._lock:
+            if self._error is None:
+                self._error = error
+                logger.error(f"Ingestion failed: {error}")
+        self._stop.set()
+
+    def _put(self, q: queue.Queue, item) -> bool:
+        """Put an item, waiting for room. Returns False if the pipeline stopped meanwhile."""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q: queue.Queue):
+        """Get an item, waiting for one. Returns None if the pipeline stopped meanwhile."""
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return None
+
+    def _record(self, stage: str, items: int, started: float):
+        with self._lock:
+            stats = self.stats.stages[stage]
+            stats.items += items
+            stats.busy_seconds += time.perf_counter() - started
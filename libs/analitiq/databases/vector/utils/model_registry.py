@@ -0,0 +1,145 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+from analitiq.logger.logger import initialize_logging
+
+logger, chat_logger = initialize_logging()
+
+
+@dataclass
+class LoadedModel:
+    """A tokenizer and model loaded once and shared by every vectorizer of the process.
+
+    The model is only used for inference and is never modified, so threads can run it at the
+    same time. Fast tokenizers are not safe to call concurrently, so calls to the tokenizer go
+    through ``tokenizer_lock``.
+    """
+
+    name: str
+    tokenizer: Any
+    model: Any
+    load_seconds: float
+    memory_bytes: int
+    tokenizer_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+def model_memory_bytes(model) -> int:
+    """Return the memory held by the parameters and buffers of a torch model, in bytes."""
+    tensors = list(model.parameters()) + list(model.buffers())
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+
+class ModelRegistry:
+    """A process-wide registry of embedding models, each loaded once on first use.
+
+    Every connector and agent used to load its own copy of the model. Vectorizers now get their
+    tokenizer and model from the registry, keyed by model name or path, so a pipeline whose agents
+    use the same model holds it in memory once. Loading is thread-safe: concurrent callers asking
+    for the same model wait for a single ``from_pretrained``.
+
+    The inference backends of each model (see ``inference_backends``) are built once as well.
+
+    Examples
+    --------
+    >>> registry = get_model_registry()
+    >>> loaded = registry.get("sentence-transformers/all-MiniLM-L6-v2")
+    >>> registry.memory_usage()
+    {'sentence-transformers/all-MiniLM-L6-v2': 90866688}
+
+    """
+
+    def __init__(self):
+        self._models: Dict[str, LoadedModel] = {}
+        self._backends: Dict[Tuple[str, str], Any] = {}
+        self._key_locks: Dict[Any, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _load(model_name_or_path: str) -> LoadedModel:
+        """Load a tokenizer and model with transformers, downloading them if not present locally."""
+        from transformers import AutoTokenizer, AutoModel
+
+        started = time.perf_counter()
+        tokenizer = AutoTokenizer.from_pretrained(model_name_or_path)
+        model = AutoModel.from_pretrained(model_name_or_path)
+        model.eval()
+
+        return LoadedModel(
+            name=model_name_or_path,
+            tokenizer=tokenizer,
+            model=model,
+            load_seconds=time.perf_counter() - started,
+            memory_bytes=model_memory_bytes(model),
+        )
+
+    def _get_key_lock(self, key) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get(self, model_name_or_path: str) -> LoadedModel:
+        """Return the loaded model, loading it if this is the first request for it."""
+        loaded = self._models.get(model_name_or_path)
+        if loaded is not None:
+            return loaded
+
+        with self._get_key_lock(model_name_or_path):
+            loaded = self._models.get(model_name_or_path)
+            if loaded is None:
+                loaded = self._load(model_name_or_path)
+                with self._lock:
+                    self._models[model_name_or_path] = loaded
+                logger.info(f"Loaded model {model_name_or_path} in {loaded.load_seconds:.1f}s "
+                            f"({loaded.memory_bytes / 2 ** 20:.1f} MiB)")
+        return loaded
+
+    def get_backend(self, model_name_or_path: str, backend: str, **options):
+        """Return the inference backend of a model, building it on the first request.
+
+        ``options`` are passed to the backend class when it is built. Later requests get the
+        same backend, whatever their options.
+        """
+        from analitiq.databases.vector.utils.inference_backends import create_backend
+
+        key = (model_name_or_path, backend)
+        inference_backend = self._backends.get(key)
+        if inference_backend is not None:
+            return inference_backend
+
+        with self._get_key_lock(key):
+            inference_backend = self._backends.get(key)
+            if inference_backend is None:
+                inference_backend = create_backend(backend, self.get(model_name_or_path), **options)
+                with self._lock:
+                    self._backends[key] = inference_backend
+                logger.info(f"Using the {backend} inference backend for {model_name_or_path}")
+        return inference_backend
+
+    def is_loaded(self, model_name_or_path: str) -> bool:
+        return model_name_or_path in self._models
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Return the bytes held by the parameters and buffers of each loaded model."""
+        with self._lock:
+            return {name: loaded.memory_bytes for name, loaded in self._models.items()}
+
+    def unload(self, model_name_or_path: str) -> Optional[LoadedModel]:
+        """Drop a model and its backends from the registry. Vectorizers that already hold them keep using them."""
+        with self._lock:
+            for key in [key for key in self._backends if key[0] == model_name_or_path]:
+                del self._backends[key]
+            return self._models.pop(model_name_or_path, None)
+
+    def clear(self):
+        """Drop all models from the registry."""
+        with self._lock:
+            self._models.clear()
+            self._backends.clear()
+
+
+_model_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide model registry."""
+    return _model_registry
@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+_query_vectors: ContextVar[Optional[Dict[Tuple[str, str], List[float]]]] = ContextVar(
+    "analitiq_query_vectors", default=None
+)
+
+
+@contextmanager
+def query_vector_scope(memo: Optional[Dict[Tuple[str, str], List[float]]] = None):
+    """Memoize query vectors for the duration of one request.
+
+    Inside the scope, every vector database call that embeds the same query with the same
+    model reuses the first vector instead of running the model again. This lets a docs agent
+    and a SQL agent answering the same question share one embedding. Nested scopes reuse the
+    outermost memo.
+
+    Pass the same ``memo`` dict to several scopes to share it across them, e.g. across the steps
+    of an async generator, which must not keep a scope open while it yields.
+
+    Example:
+    -------
+    >>> with query_vector_scope():
+    ...     vdb.hybrid_search(user_query)
+    ...     vdb.search_filter(user_query, filter_expression)  # query is not embedded again
+
+    """
+    if _query_vectors.get() is not None:
+        yield
+        return
+
+    token = _query_vectors.set({} if memo is None else memo)
+    try:
+        yield
+    finally:
+        _query_vectors.reset(token)
+
+
+def memoized_query_vector(vectorizer, query: str) -> List[float]:
+    """Return the vector of a query, reusing it within the current :func:`query_vector_scope`.
+
+    Outside a scope the query is simply vectorized.
+
+    :param vectorizer: The AnalitiqVectorizer used to embed the query.
+    :param query: The query text.
+    :return: The query vector as a list of floats.
+    """
+    memo = _query_vectors.get()
+    if memo is None:
+        return vectorizer.vectorize(query)
+
+    key = (vectorizer.cache_key, query)
+    if key not in memo:
+        memo[key] = vectorizer.vectorize(query)
+    return memo[key]
@@ -0,0 +1,235 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple, Union
+import numpy as np
+
+DEFAULT_RESULT_CACHE_SIZE = 1000
+DEFAULT_RESULT_CACHE_TTL = 300.0  # seconds
+
+Scope = Tuple[str, Optional[str]]  # (collection name, tenant name)
+
+# Write generations are process-wide, so that a write through any connector invalidates the results
+# cached by every connector of the same collection tenant.
+_generations: Dict[Hashable, int] = {}
+_generations_lock = threading.Lock()
+
+
+def invalidate(collection_name: str, tenant_name: Optional[str] = None):
+    """Invalidate the cached results of a collection tenant, or of all tenants of the collection."""
+    key = (collection_name, tenant_name) if tenant_name is not None else collection_name
+    with _generations_lock:
+        _generations[key] = _generations.get(key, 0) + 1
+
+
+def generation(scope: Scope) -> Tuple[int, int]:
+    """Return the write generation of a collection tenant. It changes on every invalidation."""
+    return _generations.get(scope[0], 0), _generations.get(scope, 0)
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase a query and collapse its whitespace. The keyword and embedding searches are case-insensitive."""
+    return " ".join(query.lower().split())
+
+
+@dataclass(frozen=True)
+class ResultKey:
+    """The identity of a search: where, how and what was searched."""
+
+    scope: Scope
+    mode: str
+    query: str
+    limit: Optional[int]
+    options: str = ""
+
+    @classmethod
+    def of(cls, scope: Scope, mode: str, query: str, limit: Optional[int] = None, **options) -> "ResultKey":
+        """Build a key. ``options`` such as a filter expression are part of the key, in a canonical form."""
+        canonical = json.dumps(options, sort_keys=True, default=str) if options else ""
+        return cls(scope, mode, normalize_query(query), limit, canonical)
+
+    @property
+    def bucket(self) -> tuple:
+        """The searches a semantic hit may answer: the same key, except for the query."""
+        return self.scope, self.mode, self.limit, self.options
+
+
+@dataclass
+class _Entry:
+    result: Any
+    generation: Tuple[int, int]
+    expires: float
+    vector: Optional[np.ndarray] = None
+
+
+class SearchResultCache:
+    """A TTL and LRU cache of vector database search results.
+
+    Results are keyed by ResultKey: collection tenant, search mode, normalized query, limit and
+    options such as the filter expression. An entry expires ``ttl`` seconds after it was stored,
+    and the least recently used entries are evicted beyond ``max_items``.
+
+    A write to a collection tenant calls :func:`invalidate`, which makes every result cached for the
+    tenant stale. Invalidation is process-wide; a write from another process is only seen when the
+    entries expire.
+
+    With a ``semantic_threshold``, a search missing the cache can be answered by the cached result
+    of another query of the same bucket (see ``ResultKey.bucket``) whose query vector has a cosine
+    similarity of at least the threshold.
+
+    Cached results are shared between callers and must not be modified. The cache is thread-safe.
+
+    Parameters
+    ----------
+    max_items : int, optional
+        The maximum number of cached results (default is 1000).
+    ttl : float, optional
+        The number of seconds a result stays valid (default is 300).
+    semantic_threshold : float, optional
+        The cosine similarity above which a similar query is a hit. Semantic hits are disabled if None.
+    clock : Callable[[], float], optional
+        The time source, ``time.monotonic`` by default.
+
+    Examples
+    --------
+    >>> cache = SearchResultCache(ttl=60, semantic_threshold=0.95)
+    >>> vdb = VectorDatabaseFactory.connect({**params, "result_cache": cache})
+    >>> cache.stats()
+    {'hits': 0, 'semantic_hits': 0, 'misses': 0, 'items': 0}
+
+    """
+
+    def __init__(self, max_items: int = DEFAULT_RESULT_CACHE_SIZE, ttl: float = DEFAULT_RESULT_CACHE_TTL,
+                 semantic_threshold: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.max_items = max_items
+        self.ttl = ttl
+        self.semantic_threshold = semantic_threshold
+        self.clock = clock
+        self._entries: "OrderedDict[ResultKey, _Entry]" = OrderedDict()
+        self._buckets: Dict[tuple, Dict[ResultKey, None]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> Optional["SearchResultCache"]:
+        """Return the result cache configured by connector params, or None if it is disabled.
+
+        'result_cache' is False (default), True or a SearchResultCache instance shared by several
+        connectors. 'result_cache_size', 'result_cache_ttl' and 'semantic_cache_threshold' configure
+        a new cache.
+        """
+        cache = params.get("result_cache", False)
+        if isinstance(cache, cls):
+            return cache
+        if not cache:
+            return None
+        return cls(
+            max_items=params.get("result_cache_size", DEFAULT_RESULT_CACHE_SIZE),
+            ttl=params.get("result_cache_ttl", DEFAULT_RESULT_CACHE_TTL),
+            semantic_threshold=params.get("semantic_cache_threshold"),
+        )
+
+    @property
+    def semantic(self) -> bool:
+        return self.semantic_threshold is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _is_valid(self, key: ResultKey, entry: _Entry, now: float) -> bool:
+        return entry.expires > now and entry.generation == generation(key.scope)
+
+    def _remove(self, key: ResultKey):
+        self._entries.pop(key, None)
+        bucket = self._buckets.get(key.bucket)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._buckets[key.bucket]
+
+    def get(self, key: ResultKey,
+            query_vector: Optional[Union[Sequence[float], Callable[[], Sequence[float]]]] = None) -> Optional[Any]:
+        """Return the cached result of a search, or None.
+
+        If the key is not cached and a ``query_vector`` is given, the most similar cached query of
+        the bucket is a hit if its similarity reaches the semantic threshold. ``query_vector`` may
+        be a function, called only when the key is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._is_valid(key, entry, self.clock()):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.result
+                self._remove(key)
+
+        if self.semantic and query_vector is not None:
+            # the query is embedded outside the lock
+            vector = _unit(query_vector() if callable(query_vector) else query_vector)
+            with self._lock:
+                hit = self._get_similar(key, vector, self.clock())
+                if hit is not None:
+                    self._entries.move_to_end(hit)
+                    self.semantic_hits += 1
+                    return self._entries[hit].result
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _get_similar(self, key: ResultKey, vector: np.ndarray, now: float) -> Optional[ResultKey]:
+        candidates = []
+        for other in list(self._buckets.get(key.bucket, ())):
+            entry = self._entries[other]
+            if not self._is_valid(other, entry, now):
+                self._remove(other)
+            elif entry.vector is not None:
+                candidates.append(other)
+        if not candidates:
+            return None
+
+        similarities = np.stack([self._entries[other].vector for other in candidates]) @ vector
+        best = int(np.argmax(similarities))
+        return candidates[best] if similarities[best] >= self.semantic_threshold else None
+
+    def put(self, key: ResultKey, result: Any, query_vector: Optional[Sequence[float]] = None,
+            write_generation: Optional[Tuple[int, int]] = None):
+        """Cache the result of a search.
+
+        Pass the ``write_generation`` read before the search was run, so that a result computed
+        while the tenant was written to is not served after the write.
+        """
+        if self.max_items <= 0:
+            return
+
+        entry = _Entry(
+            result=result,
+            generation=write_generation if write_generation is not None else generation(key.scope),
+            expires=self.clock() + self.ttl,
+            vector=_unit(query_vector) if self.semantic and query_vector is not None else None,
+        )
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._buckets.setdefault(key.bucket, {})[key] = None
+            while len(self._entries) > self.max_items:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def stats(self) -> dict:
+        """Return the hit, semantic hit and miss counters and the number of cached results."""
+        return {"hits": self.hits, "semantic_hits": self.semantic_hits, "misses": self.misses, "items": len(self)}
+
+
+def _unit(vector: Sequence[float]) -> np.ndarray:
+    vector = np.asarray(vector, dtype=np.float32).ravel()
+    return vector / max(float(np.linalg.norm(vector)), 1e-12)
@@ -0,0 +1,179 @@
+from typing import Optional, Tuple
+import numpy as np
+
+DEFAULT_CAPACITY = 1024
+
+
+def normalize_rows(vectors) -> np.ndarray:
+    """Return the vectors as a new float32 matrix of unit-length rows, so that a dot product is a cosine.
+
+    Zero vectors stay zero.
+    """
+    vectors = np.array(vectors, dtype=np.float32, ndmin=2)
+    vectors /= np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+    return vectors
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return the column indices of the ``k`` largest scores of every row, best first.
+
+    ``argpartition`` selects the top ``k`` in linear time and only those are sorted, instead of
+    sorting every score. Ties keep the lower index first.
+    """
+    count = scores.shape[1]
+    k = min(k, count)
+    if k <= 0:
+        return np.empty((scores.shape[0], 0), dtype=np.int64)
+
+    if k < count:
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        candidates.sort(axis=1)  # stable tie order
+    else:
+        candidates = np.broadcast_to(np.arange(count), scores.shape).copy()
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+class SimilarityIndex:
+    """An exact in-memory cosine similarity index.
+
+    Vectors are kept normalized in one contiguous float32 matrix, so a search is a single
+    matrix product followed by an ``argpartition`` top-k. Several queries are searched with one
+    matrix-matrix product. The matrix has spare capacity that doubles when it is full, so
+    appending vectors one batch at a time does not reallocate on every insert.
+
+    It serves small corpora, reranking and tests without a vector database. For large corpora use
+    an approximate index such as FAISS HNSW.
+
+    Parameters
+    ----------
+    dimension : int, optional
+        The vector dimension. By default it is taken from the first added vectors.
+    capacity : int, optional
+        The number of rows allocated by the first insert (default is 1024).
+
+    Examples
+    --------
+    >>> index = SimilarityIndex()
+    >>> index.add(vectors)
+    >>> rows, scores = index.search(query_vector, k=3)
+    >>> rows, scores = index.search_batch(query_vectors, k=3)  # one row of results per query
+
+    """
+
+    def __init__(self, dimension: Optional[int] = None, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.dimension = dimension
+        self.initial_capacity = capacity
+        self._matrix: Optional[np.ndarray] = None
+        self._size = 0
+
+    @classmethod
+    def from_vectors(cls, vectors: np.ndarray, normalized: bool = False) -> "SimilarityIndex":
+        """Build an index over a matrix.
+
+        If the matrix is already ``normalized``, float32 and contiguous, it is used without a copy,
+        e.g. a read-only memory map. It is copied on the first write.
+        """
+        vectors = np.asanyarray(vectors)  # keeps a memory map a memory map
+        index = cls(dimension=vectors.shape[1])
+        if normalized and vectors.dtype == np.float32 and vectors.flags.c_contiguous:
+            index._matrix = vectors
+        else:
+            index._matrix = normalize_rows(vectors)
+        index._size = len(vectors)
+        return index
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return 0 if self._matrix is None else len(self._matrix)
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """The normalized vectors, a view of the first ``len(index)`` rows of the matrix."""
+        if self._matrix is None:
+            return np.empty((0, self.dimension or 0), dtype=np.float32)
+        return self._matrix[:self._size]
+
+    def _reserve(self, size: int):
+        """Make the matrix writable with room for ``size`` rows, at least doubling it when it grows."""
+        if self._matrix is not None and size <= len(self._matrix) and self._matrix.flags.writeable:
+            return
+
+        capacity = self.capacity
+        if size > capacity:
+            capacity = max(size, 2 * capacity, self.initial_capacity)
+        matrix = np.empty((capacity, self.dimension), dtype=np.float32)
+        matrix[:self._size] = self.vectors
+        self._matrix = matrix
+
+    def add(self, vectors) -> np.ndarray:
+        """Append vectors and return their row numbers."""
+        vectors = normalize_rows(vectors)
+        if self.dimension is None:
+            self.dimension = vectors.shape[1]
+        elif vectors.shape[1] != self.dimension:
+            raise ValueError(f"Expected vectors of dimension {self.dimension}, got {vectors.shape[1]}")
+
+        start = self._size
+        self._reserve(start + len(vectors))
+        self._matrix[start:start + len(vectors)] = vectors
+        self._size += len(vectors)
+        return np.arange(start, self._size)
+
+    def update(self, rows, vectors):
+        """Replace the vectors of existing rows."""
+        self._reserve(self._size)
+        self._matrix[rows] = normalize_rows(vectors)
+
+    def delete(self, rows):
+        """Delete rows. The rows after them move up, keeping their order."""
+        if self._matrix is None:
+            return
+        keep = np.ones(self._size, dtype=bool)
+        keep[rows] = False
+        kept = self.vectors[keep]
+        self._size = len(kept)
+        self._reserve(self._size)
+        self._matrix[:self._size] = kept
+
+    def clear(self):
+        self._matrix, self._size = None, 0
+
+    def search_batch(self, queries, k: int, rows: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Search the ``k`` most similar vectors of every query.
+
+        Parameters
+        ----------
+        queries : array-like
+            A matrix with one query vector per row. They do not have to be normalized.
+        k : int
+            The number of results per query.
+        rows : np.ndarray, optional
+            Only search these rows, e.g. the rows matching a filter.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The rows and cosine similarities of the results, one row per query, best first.
+
+        """
+        candidates = self.vectors if rows is None else self.vectors[rows]
+        if candidates.shape[0] == 0:
+            empty = np.empty((len(np.atleast_2d(queries)), 0))
+            return empty.astype(np.int64), empty.astype(np.float32)
+
+        similarities = normalize_rows(queries) @ candidates.T
+        top = top_k(similarities, k)
+        scores = np.take_along_axis(similarities, top, axis=1)
+        return (top if rows is None else np.asarray(rows)[top]), scores
+
+    def search(self, query, k: int, rows: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Search the ``k`` vectors most similar to one query. Returns their rows and similarities."""
+        found, scores = self.search_batch(np.asarray(query).reshape(1, -1), k, rows)
+        return found[0], scores[0]
@@ -0,0 +1,422 @@
+"""An asyncio-native Weaviate connector for the async agent pipeline."""
+
+import asyncio
+import functools
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+import weaviate
+from weaviate.auth import AuthApiKey
+from weaviate.classes.data import DataObject
+from weaviate.classes.query import MetadataQuery
+from weaviate.collections.classes.internal import QueryReturn
+from analitiq.databases.vector.weaviate.query_builder import QueryBuilder
+from analitiq.databases.vector.utils.fusion import ResultFusion
+from analitiq.databases.vector.weaviate.weaviate_connector import (
+    VECTOR_MODEL_NAME,
+    QUERY_PROPERTIES,
+    CONNECTION_ERRORS,
+)
+from analitiq.databases.vector.utils.analitiq_vectorizer import AnalitiqVectorizer
+from analitiq.databases.vector.utils.embedding_cache import EmbeddingCache, DEFAULT_CACHE_SIZE
+from analitiq.databases.vector.utils.inference_backends import DEFAULT_BACKEND
+from analitiq.databases.vector.utils.query_vector_memo import memoized_query_vector, query_vector_scope
+from analitiq.databases.vector.utils.result_cache import ResultKey, SearchResultCache, generation, invalidate
+from analitiq.databases.vector.utils.incremental_sync import chunk_uuid, number_identical_chunks
+from analitiq.utils.keyword_extractions import extract_keywords
+from analitiq.utils.document_processor import group_results_by_properties
+from analitiq.loaders.documents.schemas import Chunk
+
+logger = logging.getLogger(__name__)
+
+INSERT_BATCH_SIZE = 200  # objects sent to Weaviate per insert_many request
+
+
+class AsyncWeaviateConnector:
+    """The AsyncWeaviateConnector runs Weaviate searches and writes without blocking the event loop.
+
+    It has the async counterparts of the WeaviateConnector methods used by the agents
+    (``asearch_filter``, ``ahybrid_search``, ``akw_search``, ``avector_search`` and ``aload_chunks``)
+    and takes the same params. Requests go through Weaviate's async client, and embedding runs in
+    a worker thread, so one event loop can serve many questions at the same time.
+
+    The connection is opened lazily by the first call, so the connector can be created outside
+    of a running event loop, e.g. by ``VectorDatabaseFactory.connect_async``. The client belongs to
+    the event loop it was opened on: a call from another loop closes it and opens a new one.
+    Close the connector when done; ``AgentPipeline.arun`` closes the connectors of its agents.
+
+    Searches go through the same result cache as those of WeaviateConnector, under the same keys,
+    so a connector of each kind sharing a SearchResultCache answer each other's searches.
+
+    Examples
+    --------
+    >>> vdb = VectorDatabaseFactory.connect_async(params)
+    >>> response = await vdb.ahybrid_search("revenue by month", limit=5)
+    >>> await vdb.close()
+
+    """
+
+    def __init__(self, params):
+        """Initialize a new instance of AsyncWeaviateConnector.
+
+        Parameters
+        ----------
+        params : dict
+            Dictionary of parameters including 'host', 'api_key', 'collection_name', and 'tenant_name'.
+            'normalize_embeddings', the 'embedding_cache_*', 'embedding_backend*', 'fusion*' and
+            'result_cache*' keys work as for WeaviateConnector.
+
+        """
+        self.params = params
+        self.collection_name = self.params.get("collection_name", "default_collection")
+        self.client = None
+        self._connect_lock = None
+        self._loop = None
+        self.embedding_cache = EmbeddingCache(
+            max_items=self.params.get("embedding_cache_size", DEFAULT_CACHE_SIZE),
+            db_path=self.params.get("embedding_cache_path"),
+        )
+        self.vectorizer = AnalitiqVectorizer(
+            VECTOR_MODEL_NAME,
+            normalize_embeddings=self.params.get("normalize_embeddings", False),
+            cache=self.embedding_cache,
+            backend=self.params.get("embedding_backend", DEFAULT_BACKEND),
+            backend_options=self.params.get("embedding_backend_options"),
+        )
+        self.fusion = ResultFusion.from_params(self.params)
+        self.result_cache = SearchResultCache.from_params(self.params)
+
+    async def connect(self):
+        """Connect to the Weaviate database, unless already connected on the running event loop.
+
+        Concurrent callers wait for a single connection attempt.
+
+        Raises
+        ------
+        Exception
+            If connection to Weaviate fails.
+
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # the lock and the client of another event loop cannot be used on this one
+            stale, self.client = self.client, None
+            self._connect_lock = asyncio.Lock()
+            self._loop = loop
+            if stale is not None:
+                await self._close_client(stale)
+
+        async with self._connect_lock:
+            if self.client is not None and self.client.is_connected():
+                return
+
+            stale, self.client = self.client, None
+            if stale is not None:
+                await self._close_client(stale)
+
+            client = weaviate.use_async_with_weaviate_cloud(
+                cluster_url=self.params["host"],
+                auth_credentials=AuthApiKey(self.params["api_key"]),
+            )
+            try:
+                await client.connect()
+            except Exception as e:
+                logger.error(f"Failed to connect to Weaviate: {e}")
+                raise
+            self.client = client
+
+    async def close(self):
+        """Close the connection to the Weaviate database. The next call reconnects."""
+        client, self.client = self.client, None
+        if client is not None:
+            await self._close_client(client)
+            logger.info("Closed async connection to Weaviate")
+
+    @staticmethod
+    async def _close_client(client):
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"Error closing async Weaviate client: {e}")
+
+    async def _drop_client(self, client):
+        """Close a client that failed, unless another call already replaced it."""
+        if self.client is client:
+            self.client = None
+        await self._close_client(client)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _get_client(self):
+        """Return the client, connecting first if needed."""
+        await self.connect()
+        return self.client
+
+    def _get_tenant_collection_object(self, client):
+        """Return the tenant-specific async collection of a client."""
+        tenant_name = self.params.get("tenant_name")
+        return client.collections.get(self.collection_name).with_tenant(tenant_name)
+
+    async def _run_query(self, query_func) -> QueryReturn:
+        """Await a query on the tenant collection, with the same error handling as ``search_and_handle_errors``.
+
+        A connection error closes the client, so that the next call reconnects.
+        """
+        client = await self._get_client()
+        try:
+            return await query_func(self._get_tenant_collection_object(client))
+        except weaviate.exceptions.WeaviateQueryError as e:
+            if 'tenant not found' in str(e) or 'no such prop' in str(e):
+                logger.warning(str(e))
+                return QueryReturn(objects=[])
+            raise
+        except CONNECTION_ERRORS as e:
+            logger.warning(f"Weaviate connection error, closing async client: {e}")
+            await self._drop_client(client)
+            raise
+        except Exception as e:
+            logger.error(f"Error during search: {e}")
+            raise
+
+    async def _get_query_vector(self, query: str) -> List[float]:
+        """Vectorize a query in a worker thread, reusing its vector within the current request scope."""
+        # to_thread copies the context, so the query vector memo of the caller is used
+        return await asyncio.to_thread(memoized_query_vector, self.vectorizer, query)
+
+    async def _cached_search(self, search: Callable[[], Awaitable[Any]], mode: str, query: str,
+                             limit: Optional[int] = None, query_vector: Optional[Callable[[], List[float]]] = None,
+                             **options):
+        """Await a search through the result cache, as ``WeaviateConnector._cached_search`` runs one.
+
+        ``query_vector`` is a blocking function returning the query vector used for semantic hits,
+        so it is called in a worker thread, and only when the cache misses.
+        """
+        cache = self.result_cache
+        if cache is None:
+            return await search()
+
+        scope = (self.collection_name, self.params.get("tenant_name"))
+        key = ResultKey.of(scope, mode, query, limit, **options)
+        semantic = cache.semantic and query_vector is not None
+        with query_vector_scope():
+            if semantic:
+                result = await asyncio.to_thread(cache.get, key, query_vector)
+            else:
+                result = cache.get(key)
+            if result is not None:
+                return result
+
+            write_generation = generation(scope)
+            result = await search()
+            if result is not None:
+                vector = await asyncio.to_thread(query_vector) if semantic else None
+                cache.put(key, result, vector, write_generation)
+            return result
+
+    def _query_vector_func(self, query: str, query_vector: List[float] = None) -> Callable[[], List[float]]:
+        """Return a blocking function returning the vector of a query, for ``_cached_search``."""
+        if query_vector is not None:
+            return lambda: query_vector
+        return functools.partial(memoized_query_vector, self.vectorizer, query)
+
+    async def akw_search(self, query: str, limit: int = 3) -> QueryReturn:
+        """Perform a keyword search in the Weaviate database.
+
+        Parameters
+        ----------
+        query : str
+            The search query. Keywords are extracted from it and matched with bm25.
+        limit : int, optional
+            The maximum number of search results to return, by default 3.
+
+        Returns
+        -------
+        QueryReturn
+            The result of the search query.
+
+        """
+        async def search():
+            # tokenizing and stemming are CPU-bound, so they do not run on the event loop
+            search_kw = await asyncio.to_thread(extract_keywords, query)
+            logger.info("Extracted keywords to search for: %s", search_kw)
+
+            async def ksearch(collection):
+                return await collection.query.bm25(
+                    query=search_kw,
+                    query_properties=QUERY_PROPERTIES,
+                    return_metadata=MetadataQuery(score=True, distance=True),
+                    limit=limit,
+                )
+
+            return await self._run_query(ksearch)
+
+        return await self._cached_search(search, "kw", query, limit)
+
+    async def avector_search(self, query: str, limit: int = 3, query_vector: List[float] = None) -> QueryReturn:
+        """Perform a vector search in the Weaviate database.
+
+        Parameters
+        ----------
+        query : str
+            The query string for vector search.
+        limit : int, optional
+            Maximum number of results to return (default is 3).
+        query_vector : List[float], optional
+            A precomputed vector of the query. If not given, the query is vectorized.
+
+        Returns
+        -------
+        QueryReturn
+            The search results.
+
+        """
+        async def search():
+            near_vector = query_vector if query_vector is not None else await self._get_query_vector(query)
+
+            async def vsearch(collection):
+                return await collection.query.near_vector(
+                    near_vector=near_vector,
+                    limit=limit,
+                    return_metadata=MetadataQuery(distance=True, score=True),
+                )
+
+            return await self._run_query(vsearch)
+
+        return await self._cached_search(
+            search, "vector", query, limit, query_vector=self._query_vector_func(query, query_vector)
+        )
+
+    async def asearch(self, query: str, limit: int = 3) -> QueryReturn:
+        return await self.ahybrid_search(query, limit)
+
+    async def ahybrid_search(self, query: str, limit: int = 3) -> QueryReturn:
+        """Perform a hybrid search, awaiting the keyword and vector legs concurrently.
+
+        The legs are merged by the connector's fusion stage, as in ``WeaviateConnector.hybrid_search``.
+
+        Parameters
+        ----------
+        query : str
+            The search query.
+        limit : int, optional
+            The maximum number of results to return (default is 3).
+
+        Returns
+        -------
+        QueryReturn
+            The hybrid search results, best first, with the fused score in ``metadata.score``.
+
+        """
+        async def search():
+            query_vector = await self._get_query_vector(query)
+            leg_limit = self.fusion.fetch_limit(limit)
+
+            kw_results, vector_results = await asyncio.gather(
+                self.akw_search(query, leg_limit),
+                self.avector_search(query, leg_limit, query_vector),
+            )
+
+            return self.fusion.fuse([kw_results, vector_results], limit)
+
+        return await self._cached_search(search, "hybrid", query, limit, query_vector=self._query_vector_func(query))
+
+    async def asearch_filter(self, query: str, filter_expression: dict = None, group_properties: list = None):
+        """Search objects matching a filter expression, ranked by similarity to the query.
+
+        Parameters
+        ----------
+        query : str
+            The search query.
+        filter_expression : dict, optional
+            A filter expression to apply to the query, see ``WeaviateConnector.search_filter``.
+        group_properties : list, optional
+            A list of properties to group results by (default is None).
+
+        Returns
+        -------
+        list or None
+            Filtered and grouped search results, or None if the search failed.
+
+        """
+        return await self._cached_search(
+            functools.partial(self._asearch_filter, query, filter_expression, group_properties), "filter", query,
+            query_vector=self._query_vector_func(query),
+            filter_expression=filter_expression, group_properties=group_properties,
+        )
+
+    async def _asearch_filter(self, query: str, filter_expression: dict = None, group_properties: list = None):
+        query_builder = QueryBuilder()
+        filters = query_builder.construct_query(filter_expression)
+
+        try:
+            query_vector = await self._get_query_vector(query)
+
+            async def fsearch(collection):
+                return await collection.query.near_vector(
+                    near_vector=query_vector,
+                    filters=filters,
+                    return_metadata=MetadataQuery(distance=True, score=True),
+                )
+
+            response: QueryReturn = await self._run_query(fsearch)
+
+        except Exception as e:
+            logger.error(f"Error retrieving documents: {e}")
+            return None
+
+        if not response.objects:
+            return []
+
+        if group_properties:
+            return group_results_by_properties(response, group_properties)
+        else:
+            return response
+
+    async def aload_chunks(self, chunks: List[Chunk]) -> int:
+        """Load chunks into Weaviate.
+
+        Chunk contents are vectorized in a worker thread and written with ``insert_many``
+        in batches of ``INSERT_BATCH_SIZE``. The cached search results of the collection tenant
+        are invalidated afterwards, even if a batch failed, as for the writes of WeaviateConnector.
+
+        Parameters
+        ----------
+        chunks : List[Chunk]
+            A list of chunks to load into the database.
+
+        Returns
+        -------
+        int
+            The number of chunks successfully loaded.
+
+        """
+        number_identical_chunks(chunks)
+        hf_vectors = await asyncio.to_thread(self.vectorizer.vectorize_batch, [chunk.content for chunk in chunks])
+
+        objects = []
+        for chunk, hf_vector in zip(chunks, hf_vectors):
+            objects.append(
+                DataObject(
+                    properties=chunk.model_dump(),
+                    uuid=chunk_uuid(chunk.document_uuid, chunk.content, chunk.occurrence),
+                    vector=hf_vector,
+                )
+            )
+
+        collection = self._get_tenant_collection_object(await self._get_client())
+        failed = 0
+        try:
+            for start in range(0, len(objects), INSERT_BATCH_SIZE):
+                response = await collection.data.insert_many(objects[start:start + INSERT_BATCH_SIZE])
+                if response.errors:
+                    failed += len(response.errors)
+                    logger.warning(f"Failed to import {len(response.errors)} objects. "
+                                   f"{next(iter(response.errors.values())).message}")
+        finally:
+            invalidate(self.collection_name, self.params.get("tenant_name"))
+
+        return len(chunks) - failed
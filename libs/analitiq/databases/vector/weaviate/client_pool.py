@@ -0,0 +1,175 @@
+# File: databases/vector/weaviate/client_pool.py
+
+import atexit
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+import weaviate
+from weaviate.auth import AuthApiKey
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CHECK_INTERVAL = 30.0  # seconds between readiness probes of a pooled client
+
+ClientKey = Tuple[str, str]
+
+
+class WeaviateClientPool:
+    """A process-wide registry of long-lived Weaviate clients.
+
+    Clients are keyed by ``(host, api_key)`` so that every connector pointing at the same
+    cluster with the same credentials shares a single client and pays the connection
+    handshake only once. Access is thread-safe: concurrent callers asking for the same key
+    wait for one connection attempt instead of racing to open several.
+
+    A pooled client is health-checked before it is handed out. The local connection flag is
+    checked on every call, and a readiness probe against the cluster is sent at most once
+    every ``health_check_interval`` seconds. Unhealthy clients are closed and replaced.
+
+    Parameters
+    ----------
+    health_check_interval : float, optional
+        Minimum number of seconds between two readiness probes of the same client.
+
+    """
+
+    def __init__(self, health_check_interval: float = HEALTH_CHECK_INTERVAL):
+        self.health_check_interval = health_check_interval
+        self._clients: Dict[ClientKey, weaviate.WeaviateClient] = {}
+        self._last_checked: Dict[ClientKey, float] = {}
+        self._key_locks: Dict[ClientKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _create_client(host: str, api_key: str) -> weaviate.WeaviateClient:
+        return weaviate.connect_to_weaviate_cloud(
+            cluster_url=host,
+            auth_credentials=AuthApiKey(api_key),
+        )
+
+    def _get_key_lock(self, key: ClientKey) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _is_healthy(self, key: ClientKey, client: weaviate.WeaviateClient) -> bool:
+        if not client.is_connected():
+            return False
+
+        now = time.monotonic()
+        if now - self._last_checked.get(key, 0.0) < self.health_check_interval:
+            return True
+
+        try:
+            ready = client.is_ready()
+        except Exception as e:
+            logger.warning(f"Health check of pooled Weaviate client failed: {e}")
+            return False
+
+        if ready:
+            self._last_checked[key] = now
+        return ready
+
+    @staticmethod
+    def _close_quietly(client: weaviate.WeaviateClient):
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Error closing Weaviate client: {e}")
+
+    def get_client(self, host: str, api_key: str) -> weaviate.WeaviateClient:
+        """Return a healthy client for the given cluster, connecting if necessary.
+
+        Parameters
+        ----------
+        host : str
+            The Weaviate cluster URL.
+        api_key : str
+            The API key used to authenticate against the cluster.
+
+        Returns
+        -------
+        weaviate.WeaviateClient
+            A connected client shared with every other caller using the same key.
+
+        Raises
+        ------
+        Exception
+            If a new connection has to be established and it fails.
+
+        """
+        key = (host, api_key)
+
+        with self._get_key_lock(key):
+            client = self._clients.get(key)
+            if client is not None:
+                if self._is_healthy(key, client):
+                    return client
+                logger.warning(f"Pooled Weaviate client for {host} is unhealthy. Reconnecting.")
+                self._close_quietly(client)
+
+            client = self._create_client(host, api_key)
+            self._clients[key] = client
+            self._last_checked[key] = time.monotonic()
+            logger.info(f"Opened pooled connection to Weaviate: {host}")
+
+            return client
+
+    def invalidate(self, host: str, api_key: str, client: Optional[weaviate.WeaviateClient] = None):
+        """Close and forget the pooled client for the given cluster.
+
+        The next call to :meth:`get_client` for the same key opens a fresh connection.
+        This is used after a request failed with a connection error. If ``client`` is given, it is
+        the client that failed: it is only dropped while it is still the pooled one, so that a
+        client another caller has already reconnected stays open.
+        """
+        key = (host, api_key)
+
+        with self._get_key_lock(key):
+            if client is not None and self._clients.get(key) is not client:
+                return
+            client = self._clients.pop(key, None)
+            self._last_checked.pop(key, None)
+
+        if client is not None:
+            self._close_quietly(client)
+
+    def shutdown(self):
+        """Close every pooled client. Safe to call more than once.
+
+        Each client is removed under the lock of its key, the one ``get_client`` holds while it
+        creates and hands out the client, so a concurrent ``get_client`` either gets its client
+        before it is closed or opens a new one after it is removed.
+        """
+        # every key being connected has a lock, even before its client is in the pool
+        with self._lock:
+            keys = list(self._key_locks)
+
+        clients = []
+        for key in keys:
+            with self._get_key_lock(key):
+                client = self._clients.pop(key, None)
+                self._last_checked.pop(key, None)
+            if client is not None:
+                clients.append(client)
+                self._close_quietly(client)
+
+        if clients:
+            logger.info(f"Closed {len(clients)} pooled Weaviate connection(s)")
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+_client_pool = WeaviateClientPool()
+atexit.register(_client_pool.shutdown)
+
+
+def get_client_pool() -> WeaviateClientPool:
+    """Return the process-wide Weaviate client pool."""
+    return _client_pool
+
+
+def shutdown():
+    """Close all pooled Weaviate clients of this process."""
+    _client_pool.shutdown()
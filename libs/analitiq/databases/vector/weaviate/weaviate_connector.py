@@ -1,10 +1,14 @@
 # File: databases/vector/weaviate/weaviate_connector.py
 
+import contextlib
+import functools
 import logging
-from typing import List, Dict, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Dict, Optional
+import numpy as np
 import weaviate
 from weaviate.auth import AuthApiKey
-from weaviate.util import generate_uuid5
 from weaviate.collections.classes.tenants import Tenant
 from weaviate.collections.classes.aggregate import AggregateGroupByReturn
 from weaviate.classes.config import Configure
@@ -13,19 +17,30 @@ from weaviate.classes.aggregate import GroupByAggregate
 from weaviate.collections.classes.internal import QueryReturn
 from analitiq.base.base_vector_database import BaseVectorDatabase
 from analitiq.databases.vector.weaviate.query_builder import QueryBuilder
-from analitiq.databases.vector.utils.analitiq_vectorizer import AnalitiqVectorizer
+from analitiq.databases.vector.weaviate.client_pool import get_client_pool
+from analitiq.databases.vector.utils.fusion import ResultFusion
+from analitiq.databases.vector.utils.analitiq_vectorizer import AnalitiqVectorizer, DEFAULT_MODEL_NAME
+from analitiq.databases.vector.utils.embedding_cache import EmbeddingCache, DEFAULT_CACHE_SIZE
+from analitiq.databases.vector.utils.inference_backends import DEFAULT_BACKEND
+from analitiq.databases.vector.utils.query_vector_memo import memoized_query_vector, query_vector_scope
+from analitiq.databases.vector.utils.result_cache import ResultKey, SearchResultCache, generation, invalidate
+from analitiq.databases.vector.utils.document_loading import DocumentLoaderMixin
+from analitiq.databases.vector.utils.incremental_sync import chunk_uuid, number_identical_chunks
 from analitiq.utils.keyword_extractions import extract_keywords
-from analitiq.loaders.documents.directory_loader import DirectoryLoader
-from analitiq.factories.chunker_factory import ChunkerFactory
 from analitiq.utils.document_processor import group_results_by_properties
-from analitiq.loaders.documents.file_loader import FileLoader
-from analitiq.loaders.documents.text_loader import TextLoader
 from analitiq.loaders.documents.schemas import Chunk
 
 logger = logging.getLogger(__name__)
 
-VECTOR_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+VECTOR_MODEL_NAME = DEFAULT_MODEL_NAME
 QUERY_PROPERTIES = ["content"]  # Adjust as needed
+SEARCH_WORKERS = 4  # threads used to run the legs of a hybrid search concurrently
+SEARCH_CONCURRENCY = 8  # searches in flight at once in vector_search_many and hybrid_search_many
+DELETE_BATCH_SIZE = 1000  # ids per delete_many request
+CONNECTION_ERRORS = (
+    weaviate.exceptions.WeaviateConnectionError,
+    weaviate.exceptions.WeaviateClosedClientError,
+)
 
 
 def search_only(func):
@@ -74,6 +89,22 @@ def search_only(func):
     return wrapper
 
 
+def invalidates_results(func):
+    """Invalidate the cached search results of the connector's collection tenant after a write.
+
+    The results are invalidated even if the write failed, as it may have been partly applied.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            invalidate(self.collection_name, self.params.get("tenant_name"))
+
+    return wrapper
+
+
 # Define a reusable search method that encapsulates the common logic
 def search_and_handle_errors(search_func, *args, logger, **kwargs):
     """
@@ -99,14 +130,16 @@ def search_and_handle_errors(search_func, *args, logger, **kwargs):
         raise e
 
 
-class WeaviateConnector(BaseVectorDatabase):
+class WeaviateConnector(DocumentLoaderMixin, BaseVectorDatabase):
     """The WeaviateConnector Class manages interactions with a Weaviate Vector Database.
 
     This class provides methods to connect to a Weaviate cluster, manage collections,
     load and chunk documents, and perform various types of searches and data manipulations,
-    including multi-tenancy support.
+    including multi-tenancy support. Files, directories and texts are loaded by DocumentLoaderMixin.
     """
 
+    delete_batch_size = DELETE_BATCH_SIZE
+
     def __init__(self, params):
         """Initialize a new instance of WeaviateConnector.
 
@@ -114,34 +147,114 @@ class WeaviateConnector(BaseVectorDatabase):
         ----------
         **kwargs : dict
             Dictionary of parameters including 'host', 'api_key', 'collection_name', and 'tenant_name'.
+            Set 'pooled_client' to False to open and close a dedicated connection around every call
+            instead of reusing the process-wide client pool.
+            Set 'normalize_embeddings' to True to store unit-length vectors.
+            'embedding_cache_size' bounds the in-memory embedding cache and 'embedding_cache_path'
+            points to an SQLite file that keeps embeddings across runs.
+            'embedding_backend' selects the inference backend of the embedding model: "torch"
+            (default), "torch_int8" or "onnx", and 'embedding_backend_options' configures it.
+            'search_workers' sets the number of threads running search legs concurrently, and
+            'search_concurrency' the number of searches in flight in the ``*_search_many`` methods.
+            'fusion' selects how hybrid search merges its legs: "rrf" (default), "relative_score"
+            or a ResultFusion instance. 'fusion_weights', 'fusion_k' and 'fusion_overfetch' tune it.
+            Set 'result_cache' to True, or to a shared SearchResultCache, to cache search results.
+            'result_cache_size', 'result_cache_ttl' and 'semantic_cache_threshold' configure it.
 
         """
         super().__init__(params)
         self.params = params
         self.collection_name = self.params.get("collection_name", "default_collection")
+        self.pooled = self.params.get("pooled_client", True)
         self.connected = False
         self.client = None
-        self.vectorizer = AnalitiqVectorizer(VECTOR_MODEL_NAME)
-        self.connect()
+        self.embedding_cache = EmbeddingCache(
+            max_items=self.params.get("embedding_cache_size", DEFAULT_CACHE_SIZE),
+            db_path=self.params.get("embedding_cache_path"),
+        )
+        self.vectorizer = AnalitiqVectorizer(
+            VECTOR_MODEL_NAME,
+            normalize_embeddings=self.params.get("normalize_embeddings", False),
+            cache=self.embedding_cache,
+            backend=self.params.get("embedding_backend", DEFAULT_BACKEND),
+            backend_options=self.params.get("embedding_backend_options"),
+        )
+        self._search_executor: Optional[ThreadPoolExecutor] = None
+        self._search_executor_lock = threading.Lock()
+        self.search_concurrency = self.params.get("search_concurrency", SEARCH_CONCURRENCY)
+        self.fusion = ResultFusion.from_params(self.params)
+        self.result_cache = SearchResultCache.from_params(self.params)
+        if self.pooled:
+            self.connect()  # without a pooled client, every call opens its own connection
 
     def __enter__(self):
         """Context manager entry: establish connection to Weaviate.
+
+        With a pooled client this hands out the shared client after a health check,
+        reconnecting if the pooled connection went away.
         """
-        if not self.connected:
+        if self.pooled or not self.connected:
             self.connect()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Context manager exit: ensure the connection is closed.
+
+        A pooled client stays open for the next call. It is only dropped from the pool
+        when the call failed with a connection error, so that the next call reconnects.
+        """
+        if not self.pooled:
+            self.close()
+        elif exc_type is not None and issubclass(exc_type, CONNECTION_ERRORS):
+            logger.warning(f"Weaviate connection error, dropping pooled client: {exc_value}")
+            get_client_pool().invalidate(self.params["host"], self.params["api_key"], self.client)
+            self.client = None
+            self.connected = False
+
+    def _open_client(self) -> weaviate.WeaviateClient:
+        """Return the pooled client, or open a dedicated one without a pooled client."""
+        try:
+            if self.pooled:
+                return get_client_pool().get_client(self.params["host"], self.params["api_key"])
+            return weaviate.connect_to_weaviate_cloud(
+                cluster_url=self.params["host"],
+                auth_credentials=AuthApiKey(self.params["api_key"]),
+            )
+        except Exception as e:
+            logger.error(f"Failed to connect to Weaviate: {e}")
+            raise
+
+    @contextlib.contextmanager
+    def _checkout(self) -> Iterator[weaviate.WeaviateClient]:
+        """Check out a client for one operation.
+
+        The client is only held by the operation, and the connector's ``client`` and ``connected``
+        are left alone, so operations running at the same time, like the legs of a hybrid search,
+        cannot drop or replace each other's client. When the operation fails with a connection
+        error, its pooled client, and only that one, is dropped from the pool. A dedicated client
+        is closed at the end of the operation.
         """
-        self.close()
+        client = self._open_client()
+        try:
+            yield client
+        except CONNECTION_ERRORS as e:
+            if self.pooled:
+                logger.warning(f"Weaviate connection error, dropping pooled client: {e}")
+                get_client_pool().invalidate(self.params["host"], self.params["api_key"], client)
+            raise
+        finally:
+            if not self.pooled:
+                client.close()
 
     def connect(self):
         """Connect to the Weaviate database.
 
         Establishes a connection to the Weaviate client using the provided host and API key.
-        If the specified collection does not exist, it creates one with multi-tenancy enabled.
-        It also ensures that the specified tenant exists within the collection.
+        In pooled mode the client is taken from the process-wide pool and shared with all other
+        connectors using the same host and API key.
+
+        The connector's methods check out their own client for every call; ``client`` is there
+        for code using the connector as a context manager.
 
         Raises
         ------
@@ -150,36 +263,81 @@ class WeaviateConnector(BaseVectorDatabase):
 
         """
         try:
-            self.client = weaviate.connect_to_weaviate_cloud(
-                cluster_url=self.params["host"],
-                auth_credentials=AuthApiKey(self.params["api_key"]),
-            )
+            self.client = self._open_client()
             self.connected = True
-
-        except Exception as e:
-            logger.error(f"Failed to connect to Weaviate: {e}")
+        except Exception:
             self.connected = False
             raise
 
     def close(self):
         """Close the connection to the Weaviate database.
 
-        Sets the client to None and updates the connection status.
+        Sets the client to None and updates the connection status. A pooled client is only
+        released by this connector and stays open for other users; call
+        :func:`analitiq.databases.vector.weaviate.client_pool.shutdown` to close pooled clients.
+        The threads running search legs are stopped once their searches finish.
         """
+        with self._search_executor_lock:
+            executor, self._search_executor = self._search_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
         if self.connected and self.client:
-            self.client.close()
+            if not self.pooled:
+                self.client.close()
+                logger.info("Closed connection to Weaviate")
+            self.client = None
             self.connected = False
-            logger.info("Closed connection to Weaviate")
 
-    def __get_tenant_collection_object(self) -> object:
+    @property
+    def search_executor(self) -> ThreadPoolExecutor:
+        """The threads running the legs of hybrid searches, started by the first one."""
+        with self._search_executor_lock:
+            if self._search_executor is None:
+                self._search_executor = ThreadPoolExecutor(
+                    max_workers=self.params.get("search_workers", SEARCH_WORKERS),
+                    thread_name_prefix="weaviate-search",
+                )
+            return self._search_executor
+
+    def _get_query_vector(self, query: str) -> List[float]:
+        """Vectorize a query, reusing its vector within the current request scope."""
+        return memoized_query_vector(self.vectorizer, query)
+
+    def _cached_search(self, search: Callable, mode: str, query: str, limit: Optional[int] = None,
+                       query_vector: Optional[Callable[[], List[float]]] = None, **options):
+        """Run a search through the result cache, if the connector has one.
+
+        The search is keyed by the collection tenant, ``mode``, the normalized query, ``limit`` and
+        ``options``. ``query_vector`` returns the query vector used for semantic hits; it is only
+        called when the cache misses, and inside a query vector scope, so the search reuses it.
+        Failed searches, which return None, are not cached.
+        """
+        cache = self.result_cache
+        if cache is None:
+            return search()
+
+        scope = (self.collection_name, self.params.get("tenant_name"))
+        key = ResultKey.of(scope, mode, query, limit, **options)
+        with query_vector_scope():
+            result = cache.get(key, query_vector)
+            if result is not None:
+                return result
+
+            write_generation = generation(scope)
+            result = search()
+            if result is not None:
+                vector = query_vector() if query_vector is not None and cache.semantic else None
+                cache.put(key, result, vector, write_generation)
+            return result
+
+    def __get_tenant_collection_object(self, client: weaviate.WeaviateClient) -> object:
         """Returns the tenant-specific collection object for multi-tenancy.
 
         Parameters
         ----------
-        collection_name : str
-            The name of the collection.
-        tenant_name : str
-            The tenant name within the collection.
+        client : weaviate.WeaviateClient
+            The client checked out for the operation.
 
         Returns
         -------
@@ -191,7 +349,7 @@ class WeaviateConnector(BaseVectorDatabase):
         collection_name = self.params.get("collection_name", "default_collection")
         logger.info(f"Existing VDB Collection name: {collection_name} with tenant: {tenant_name}")
 
-        return self.client.collections.get(collection_name).with_tenant(tenant_name)
+        return client.collections.get(collection_name).with_tenant(tenant_name)
 
     def create_collection(self, collection_name: str) -> str:
         """Create a collection in a Weaviate database.
@@ -225,14 +383,14 @@ class WeaviateConnector(BaseVectorDatabase):
         "MyCollection"
 
         """
-        with self:
-            check = self.client.collections.exists(collection_name)
+        with self._checkout() as client:
+            check = client.collections.exists(collection_name)
 
             if check:
                 logger.info(f"Collection exists: {collection_name}")
                 return collection_name
 
-            result = self.client.collections.create(
+            result = client.collections.create(
                 collection_name,
                 multi_tenancy_config=Configure.multi_tenancy(
                     enabled=True,
@@ -240,6 +398,7 @@ class WeaviateConnector(BaseVectorDatabase):
                 )
             )
 
+        invalidate(collection_name)
         logger.info(f"Collection created {collection_name}")
 
         return result
@@ -255,9 +414,10 @@ class WeaviateConnector(BaseVectorDatabase):
 
         collection_name = self.params.get("collection_name")
 
-        with self:
-            multi_collection = self.client.collections.get(collection_name)
+        with self._checkout() as client:
+            multi_collection = client.collections.get(collection_name)
             multi_collection.tenants.create(tenants=tenants)
+        invalidate(collection_name, tenant_name)
 
         return True
 
@@ -265,8 +425,9 @@ class WeaviateConnector(BaseVectorDatabase):
         """Load chunks into Weaviate.
 
         This method loads a list of chunks into the Weaviate Vector Database. Each chunk is expected
-        to be a dictionary containing at least a 'content' key. A UUID is generated for each chunk,
-        and the content is vectorized using the vectorizer.
+        to be a dictionary containing at least a 'content' key. Each chunk gets a UUID derived from its
+        document UUID, content and occurrence, so loading the same chunk again overwrites it while identical
+        chunks of a document are all kept. The contents of all chunks are vectorized together in batches before being written.
 
         Parameters
         ----------
@@ -284,15 +445,22 @@ class WeaviateConnector(BaseVectorDatabase):
             If there is an error during the loading process.
 
         """
-        with self:
-            collection = self.__get_tenant_collection_object()
+        number_identical_chunks(chunks)
+        hf_vectors = self.vectorizer.vectorize_batch([chunk.content for chunk in chunks])
+
+        return self._write_chunks(chunks, hf_vectors)
+
+    @invalidates_results
+    def _write_chunks(self, chunks: List[Chunk], hf_vectors) -> int:
+        """Write chunks with their precomputed vectors and return the number written."""
+        with self._checkout() as client:
+            collection = self.__get_tenant_collection_object(client)
 
             with collection.batch.dynamic() as batch:
-                for chunk in chunks:
+                for chunk, hf_vector in zip(chunks, hf_vectors):
                     chunk_model_json = chunk.model_dump()
 
-                    uuid = generate_uuid5(chunk_model_json)
-                    hf_vector = self.vectorizer.vectorize(chunk.content)
+                    uuid = chunk_uuid(chunk.document_uuid, chunk.content, chunk.occurrence)
                     try:
                         response = batch.add_object(
                             properties=chunk_model_json,
@@ -309,95 +477,6 @@ class WeaviateConnector(BaseVectorDatabase):
 
         return len(chunks) - len(collection.batch.failed_objects)
 
-    def load_file(self, path: str) -> (List, int):
-        """Load a file into Weaviate.
-
-        Reads the file at the given path, processes it into chunks, and loads the chunks into Weaviate.
-
-        Parameters
-        ----------
-        path : str
-            The file path to load.
-
-        Returns
-        -------
-        int
-            The number of chunks loaded.
-
-        Raises
-        ------
-        Exception
-            If there is an error during file processing or loading.
-
-        """
-
-        loader = FileLoader(path)
-        documents = loader.load()
-        document=documents[0]
-        chunker = ChunkerFactory.get_chunker(document.metadata.document_type.value)
-        chunks = chunker.chunk(document)
-
-        return [document], self.load_chunks(chunks)
-
-    def load_dir(self, path: str, extension: str) -> (List, int):
-        """Load files from a directory into Weaviate.
-
-        Processes all files with the given extension in the directory and loads them into Weaviate.
-
-        Parameters
-        ----------
-        path : str
-            The directory path containing files to load.
-        extension : str
-            The file extension to filter by (e.g., 'txt').
-
-        Returns
-        -------
-        int
-            The number of chunks loaded.
-
-        Raises
-        ------
-        Exception
-            If there is an error during directory processing or loading.
-
-        """
-
-        loader = DirectoryLoader(path, extension)
-        documents = loader.load()
-        if not documents:
-            logger.info("No documents were loaded from the directory.")
-        document_chunks=[]
-        for doc in documents:
-            chunker = ChunkerFactory.get_chunker(doc.metadata.document_type.value)
-            chunks = chunker.chunk(doc)
-            document_chunks.extend(chunks)
-        return documents, self.load_chunks(document_chunks)
-
-    def load_text(self, content: str,
-                  document_name: str,
-                  document_type: str,
-                  document_uuid: str = None,
-                  document_tags: str = None) -> (List, int):
-        """
-        Load a text chunk into the Vector Database.
-        :param content: the content of the document
-        :param document_name: the name of the document
-        :param document_type: the type of the document
-        :param document_uuid: the uuid of the document if you want to maintain link to the source system from which the document came.
-        :param document_tags: the tags of the document
-        :return: The number of chunks that were loaded (always returns 1).
-        """
-
-        loader = TextLoader(content, document_name, document_type, document_uuid, document_tags)
-        documents = loader.load()
-
-        document=documents[0]
-        chunker = ChunkerFactory.get_chunker(document.metadata.document_type.value)
-        chunks = chunker.chunk(document)
-
-        return [document], self.load_chunks(chunks)
-
     @search_only
     def kw_search(self, query: str, limit: int = 3) -> QueryReturn:
         """Perform a keyword search in the Weaviate database.
@@ -440,8 +519,8 @@ class WeaviateConnector(BaseVectorDatabase):
         response = QueryReturn(objects=[])
 
         def ksearch():
-            with self:
-                collection = self.__get_tenant_collection_object()
+            with self._checkout() as client:
+                collection = self.__get_tenant_collection_object(client)
                 return collection.query.bm25(
                     query=search_kw,
                     query_properties=QUERY_PROPERTIES,
@@ -449,10 +528,10 @@ class WeaviateConnector(BaseVectorDatabase):
                     limit=limit,
                 )
 
-        return search_and_handle_errors(ksearch, logger=logger)
+        return self._cached_search(lambda: search_and_handle_errors(ksearch, logger=logger), "kw", query, limit)
 
     @search_only
-    def vector_search(self, query: str, limit: int = 3) -> QueryReturn:
+    def vector_search(self, query: str, limit: int = 3, query_vector: List[float] = None) -> QueryReturn:
         """Use Vector Search for document retrieval from Weaviate Database.
 
         Parameters
@@ -461,6 +540,8 @@ class WeaviateConnector(BaseVectorDatabase):
             The query string for vector search.
         limit : int, optional
             Maximum number of results to return (default is 3).
+        query_vector : List[float], optional
+            A precomputed vector of the query. If not given, the query is vectorized.
 
         Returns
         -------
@@ -487,26 +568,32 @@ class WeaviateConnector(BaseVectorDatabase):
         response = QueryReturn(objects=[])
 
         def vsearch() -> QueryReturn:
-            query_vector = self.vectorizer.vectorize(query)
+            near_vector = query_vector if query_vector is not None else self._get_query_vector(query)
 
-            with self:
-                collection = self.__get_tenant_collection_object()
+            with self._checkout() as client:
+                collection = self.__get_tenant_collection_object(client)
                 return collection.query.near_vector(
-                    near_vector=query_vector,
+                    near_vector=near_vector,
                     limit=limit,
                     return_metadata=MetadataQuery(distance=True, score=True),
                 )
 
-        return search_and_handle_errors(vsearch, logger=logger)
+        return self._cached_search(
+            lambda: search_and_handle_errors(vsearch, logger=logger), "vector", query, limit,
+            query_vector=lambda: query_vector if query_vector is not None else self._get_query_vector(query),
+        )
 
     def search(self, query: str, limit: int = 3) -> QueryReturn:
         return self.hybrid_search(query, limit)
 
     @search_only
-    def hybrid_search(self, query: str, limit: int = 3) -> QueryReturn:
+    def hybrid_search(self, query: str, limit: int = 3, query_vector: List[float] = None) -> QueryReturn:
         """Use Hybrid Search for document retrieval from Weaviate Database.
 
         Perform a hybrid search by combining keyword-based search and vector-based search.
+        The query is embedded once, and with a pooled client both legs are sent to Weaviate
+        concurrently. Each leg over-fetches ``limit * fusion.overfetch`` results, which are merged
+        by the connector's fusion stage (see ``ResultFusion``).
 
         Parameters
         ----------
@@ -514,79 +601,133 @@ class WeaviateConnector(BaseVectorDatabase):
             The search query.
         limit : int, optional
             The maximum number of results to return (default is 3).
+        query_vector : List[float], optional
+            A precomputed vector of the query. If not given, the query is vectorized.
 
         Returns
         -------
         QueryReturn
-            The hybrid search results.
+            The hybrid search results, best first, with the fused score in ``metadata.score``.
+            If the keyword search finds nothing, the vector search results are returned.
 
         :raises Exception: If there is an error during the search.
 
         """
         response = QueryReturn(objects=[])
 
+        def get_query_vector():
+            return query_vector if query_vector is not None else self._get_query_vector(query)
+
         def search():
-            kw_results = self.kw_search(query, limit)
-            vector_results = self.vector_search(query, limit)
+            near_vector = get_query_vector()
+            leg_limit = self.fusion.fetch_limit(limit)
+
+            if self.pooled:
+                executor = self.search_executor
+                kw_future = executor.submit(self.kw_search, query, leg_limit)
+                vector_future = executor.submit(self.vector_search, query, leg_limit, near_vector)
+                kw_results = kw_future.result()
+                vector_results = vector_future.result()
+            else:
+                # each leg opens a dedicated client; run them one after the other to hold one connection at a time
+                kw_results = self.kw_search(query, leg_limit)
+                vector_results = self.vector_search(query, leg_limit, near_vector)
+
+            return self.fusion.fuse([kw_results, vector_results], limit)
 
-            return self.__combine_and_rerank_results(kw_results, vector_results)
+        return self._cached_search(
+            lambda: search_and_handle_errors(search, logger=logger), "hybrid", query, limit,
+            query_vector=get_query_vector,
+        )
 
-        return search_and_handle_errors(search, logger=logger)
+    def _get_query_vectors(self, queries: List[str]) -> List[List[float]]:
+        """Vectorize queries together, in batches."""
+        return np.asarray(self.vectorizer.vectorize_batch(list(queries)), dtype=np.float32).tolist()
 
-    @staticmethod
-    def __combine_and_rerank_results(
-        kw_results: QueryReturn,
-        vector_results: QueryReturn,
-        limit: int = 3,
-        kw_vector_weights: Tuple[float, float] = [0.3, 0.7],
-    ) -> List[dict]:
-        """Combine and rerank keyword search and vector search results.
+    def _run_concurrently(self, searches: List[Callable[[], Any]], max_concurrency: Optional[int] = None) -> List:
+        """Run searches with at most ``max_concurrency`` in flight and return their results in order.
+
+        Each search opens a dedicated client without a pooled client, so the searches then run
+        one after the other, holding one connection at a time.
+        """
+        workers = min(max_concurrency or self.search_concurrency, len(searches))
+        if not self.pooled or workers <= 1:
+            return [search() for search in searches]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="weaviate-search-many") as executor:
+            futures = [executor.submit(search) for search in searches]
+            return [future.result() for future in futures]
+
+    def vector_search_many(self, queries: List[str], limit: int = 3,
+                           max_concurrency: Optional[int] = None) -> List[QueryReturn]:
+        """Run a vector search for each of many queries.
+
+        The queries are embedded together in batches, and the searches are sent to Weaviate
+        concurrently. Use it to run an evaluation set or a batch of reports instead of calling
+        ``vector_search`` in a loop.
 
         Parameters
         ----------
-        kw_results : QueryReturn
-            Keyword search results.
-        vector_results : QueryReturn
-            Vector search results.
+        queries : List[str]
+            The queries.
         limit : int, optional
-            The maximum number of combined results to return (default is 3).
-        kw_vector_weights : Tuple[float, float], optional
-            Weights for keyword and vector results (default is (0.3, 0.7)).
+            Maximum number of results per query (default is 3).
+        max_concurrency : int, optional
+            The maximum number of searches in flight (default is the 'search_concurrency' param, 8).
 
         Returns
         -------
-        List[dict]
-            The combined and reranked search results.
+        List[QueryReturn]
+            The results of every query, in the order of the queries.
+
+        :raises Exception: If one of the searches fails.
 
         """
-        if not kw_results.objects:
-            return None
+        if not queries:
+            return []
+
+        vectors = self._get_query_vectors(queries)
+        return self._run_concurrently(
+            [functools.partial(self.vector_search, query, limit, vector) for query, vector in zip(queries, vectors)],
+            max_concurrency,
+        )
+
+    def hybrid_search_many(self, queries: List[str], limit: int = 3,
+                           max_concurrency: Optional[int] = None) -> List[QueryReturn]:
+        """Run a hybrid search for each of many queries.
 
-        combined = {}
+        The queries are embedded together in batches. The keyword and vector legs of all queries
+        are sent to Weaviate concurrently, and the legs of each query are fused as by ``hybrid_search``.
+
+        Parameters
+        ----------
+        queries : List[str]
+            The queries.
+        limit : int, optional
+            Maximum number of results per query (default is 3).
+        max_concurrency : int, optional
+            The maximum number of searches (legs) in flight (default is the 'search_concurrency' param, 8).
 
-        vector_weight = kw_vector_weights[1]
-        kw_weight = kw_vector_weights[0]
+        Returns
+        -------
+        List[QueryReturn]
+            The results of every query, in the order of the queries.
 
-        # Assign ranks to keyword search results
-        for rank, result in enumerate(kw_results.objects, start=1):
-            uuid = result.uuid
-            if uuid not in combined:
-                combined[uuid] = {"result": result, "score": 0}
-            combined[uuid]["score"] += kw_weight * (1 / (60 + rank))
-        # Assign ranks to vector search results
-        for rank, result in enumerate(vector_results.objects, start=1):
-            uuid = result.uuid
-            if uuid not in combined:
-                combined[uuid] = {"result": result, "score": 0}
-            combined[uuid]["score"] += vector_weight * (1 / (60 + rank))
+        :raises Exception: If one of the searches fails.
 
-        # Convert the combined dictionary to a list and sort by score
-        combined_list = sorted(combined.values(), key=lambda x: x["score"], reverse=True)
+        """
+        if not queries:
+            return []
 
-        # Extract only the results (up to the specified limit)
-        reranked_results = [item["result"] for item in combined_list[:limit]]
+        vectors = self._get_query_vectors(queries)
+        leg_limit = self.fusion.fetch_limit(limit)
+        legs = []
+        for query, vector in zip(queries, vectors):
+            legs.append(functools.partial(self.kw_search, query, leg_limit))
+            legs.append(functools.partial(self.vector_search, query, leg_limit, vector))
 
-        return QueryReturn(objects=reranked_results)
+        results = self._run_concurrently(legs, max_concurrency)
+        return [self.fusion.fuse(results[i:i + 2], limit) for i in range(0, len(results), 2)]
 
     def search_filter(self, query: str, filter_expression: dict = None, group_properties: list = None):
         """Retrieve objects from the collection that have a property whose value matches the given pattern.
@@ -626,14 +767,21 @@ class WeaviateConnector(BaseVectorDatabase):
                 }
 
         """
+        return self._cached_search(
+            lambda: self._search_filter(query, filter_expression, group_properties), "filter", query,
+            query_vector=lambda: self._get_query_vector(query),
+            filter_expression=filter_expression, group_properties=group_properties,
+        )
+
+    def _search_filter(self, query: str, filter_expression: dict = None, group_properties: list = None):
         query_builder = QueryBuilder()
         filters = query_builder.construct_query(filter_expression)
 
 
         try:
-            query_vector = self.vectorizer.vectorize(query)
-            with self:
-                collection = self.__get_tenant_collection_object()
+            query_vector = self._get_query_vector(query)
+            with self._checkout() as client:
+                collection = self.__get_tenant_collection_object(client)
                 response: QueryReturn = collection.query.near_vector(
                     near_vector=query_vector,
                     filters=filters,
@@ -689,8 +837,8 @@ class WeaviateConnector(BaseVectorDatabase):
 
         query_builder = QueryBuilder()
         filters = query_builder.construct_query(filter_expression)
-        with self:
-            collection = self.__get_tenant_collection_object()
+        with self._checkout() as client:
+            collection = self.__get_tenant_collection_object(client)
             response: QueryReturn = collection.query.fetch_objects(
                 filters=filters,
                 return_metadata=MetadataQuery(
@@ -763,8 +911,8 @@ class WeaviateConnector(BaseVectorDatabase):
         query_builder = QueryBuilder()
         filters = query_builder.construct_query(filter_expression)
 
-        with self:
-            collection = self.__get_tenant_collection_object()
+        with self._checkout() as client:
+            collection = self.__get_tenant_collection_object(client)
 
             def aggregation():
                 return collection.aggregate.over_all(total_count=True, filters=filters)
@@ -791,8 +939,8 @@ class WeaviateConnector(BaseVectorDatabase):
         query_builder = QueryBuilder()
         filters = query_builder.construct_query(filter_expression)
 
-        with self:
-            collection = self.__get_tenant_collection_object()
+        with self._checkout() as client:
+            collection = self.__get_tenant_collection_object(client)
             response = collection.aggregate.over_all(
                 total_count=True,
                 filters=filters,
@@ -801,36 +949,40 @@ class WeaviateConnector(BaseVectorDatabase):
 
         return response
 
+    @invalidates_results
     def filter_delete(self, property_name, property_value):
 
-        with self:
-            collection = self.__get_tenant_collection_object()
+        with self._checkout() as client:
+            collection = self.__get_tenant_collection_object(client)
             response = collection.data.delete_many(
                 where=weaviate.classes.query.Filter.by_property(property_name).equal(property_value)
             )
 
         return response
 
+    @invalidates_results
     def delete_many_on_param(self, property_name:str, filter_list: List[str]):
 
-        with self:
-            collection = self.__get_tenant_collection_object()
+        with self._checkout() as client:
+            collection = self.__get_tenant_collection_object(client)
             response = collection.data.delete_many(
                 where=weaviate.classes.query.Filter.by_property(property_name).contains_any(filter_list)
             )
 
         return response
 
+    @invalidates_results
     def delete_many_on_uuids(self, uuids: List[str]):
 
-        with self:
-            collection = self.__get_tenant_collection_object()
+        with self._checkout() as client:
+            collection = self.__get_tenant_collection_object(client)
             response = collection.data.delete_many(
                 where=weaviate.classes.query.Filter.by_id().contains_any(uuids)
             )
 
         return response
 
+    @invalidates_results
     def delete_on_metadata_and(self, filter_list: List):
         """
         Removes multiple documents from the collection based on provided filters.
@@ -884,8 +1036,8 @@ class WeaviateConnector(BaseVectorDatabase):
             else:
                 initial_filter = initial_filter & current_filter
 
-        with self:
-            collection = self.__get_tenant_collection_object()
+        with self._checkout() as client:
+            collection = self.__get_tenant_collection_object(client)
             result = collection.data.delete_many(
                 where=( initial_filter )
             )
@@ -928,8 +1080,9 @@ class WeaviateConnector(BaseVectorDatabase):
 
         """
         try:
-            with self:
-                self.client.collections.delete(collection_name)
+            with self._checkout() as client:
+                client.collections.delete(collection_name)
+            invalidate(collection_name)
             logger.info(f"Deleted collection '{collection_name}'")
             return True
         except Exception as e:
@@ -2,11 +2,33 @@
 Filename: chunker_factory.py
 
 """
+import threading
+from typing import Dict
 from analitiq.base.base_chunker import BaseChunker
 
+_chunkers: Dict[str, BaseChunker] = {}
+_lock = threading.Lock()
+
+
 class ChunkerFactory:
     @staticmethod
     def get_chunker(document_type: str) -> BaseChunker:
+        """Return the chunker of a document type.
+
+        Chunkers hold no per-document state, so one instance per document type is created and
+        reused by every caller of the process.
+        """
+        chunker = _chunkers.get(document_type)
+        if chunker is None:
+            with _lock:
+                chunker = _chunkers.get(document_type)
+                if chunker is None:
+                    chunker = _chunkers[document_type] = ChunkerFactory.create_chunker(document_type)
+        return chunker
+
+    @staticmethod
+    def create_chunker(document_type: str) -> BaseChunker:
+        """Create a new chunker of a document type."""
         if document_type == 'sql':
             from analitiq.chunkers.sql_chunker import SQLChunker
             return SQLChunker()
@@ -36,3 +36,26 @@ class VectorDatabaseFactory:
             return database_class(params)
         except (ImportError, AttributeError) as e:
             raise ValueError(f"Error loading Vector Database {db_type}: {e}") from e
+
+    @staticmethod
+    def connect_async(params: dict):
+        """Create the asyncio-native connector of a vector database type.
+
+        The connector class is ``Async{Type}Connector`` in ``analitiq.databases.vector.{type}.async_{type}_connector``.
+        It connects lazily, on its first awaited call.
+
+        :raises ValueError: If the database type has no async connector.
+        """
+        if "type" not in params:
+            raise KeyError("'type' not found in params. Please specify database type")
+
+        db_type = params["type"]
+        module_path = f"analitiq.databases.vector.{db_type}.async_{db_type}_connector"
+        class_name = f"Async{db_type.capitalize()}Connector"
+
+        try:
+            module = importlib.import_module(module_path)
+            database_class = getattr(module, class_name)
+            return database_class(params)
+        except (ImportError, AttributeError) as e:
+            raise ValueError(f"Error loading async Vector Database {db_type}: {e}") from e
@@ -3,7 +3,7 @@ Filename: analitiq/loaders/documents/directory_loader.py
 """
 
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict
 from analitiq.loaders.documents.schemas import DocumentSchema
 from langchain_core.document_loaders import BaseLoader
 from langchain_community.document_loaders import TextLoader
@@ -36,35 +36,56 @@ class DirectoryLoader:
         self.special_loaders = special_loaders or {}
         self.excluded_pattern = list(self.special_loaders.keys()) if special_loaders else []
 
-    def load(self) -> List[DocumentSchema]:
-        returned_documents = []
-        loader_factory = DocumentLoaderFactory()
+    def iter_paths(self) -> Iterator[Path]:
+        """Yield the paths of the files to load, without reading them."""
         for file_path in self.directory_path.glob(self.glob_pattern):
             # Only process files with allowed extensions if extension is not explicitly provided
             current_file_extension = file_path.suffix.lstrip('.')
             if not self.extension and current_file_extension not in ALLOWED_EXTENSIONS:
                 continue
+            yield file_path
 
-            # Select appropriate loader
-            loader = loader_factory.get_loader(file_path)
+    def contains(self, file_path: Path) -> bool:
+        """Tell whether a file path is one this loader would load, whether or not the file exists."""
+        file_path = Path(file_path)
+        if not file_path.is_relative_to(self.directory_path.resolve()):
+            return False
+        current_file_extension = file_path.suffix.lstrip('.')
+        if self.extension:
+            return current_file_extension == self.extension
+        return current_file_extension in ALLOWED_EXTENSIONS
 
-            logger.info(f"File suffix is '{current_file_extension}'. Using loader: {loader}")
-            docs = loader.load()
-            doc = docs[0]
+    def load_path(self, file_path: Path) -> Optional[DocumentSchema]:
+        """Load a single file. Returns None if the file is empty."""
+        loader_factory = DocumentLoaderFactory()
 
-            # for loading non
-            # if file is empty, pass
-            if len(doc.page_content) == 0:
-                continue
+        # Select appropriate loader
+        loader = loader_factory.get_loader(file_path)
 
-            file_name = file_path.name
-            file_name, file_extension = split_filename(file_name)
+        logger.info(f"File suffix is '{file_path.suffix.lstrip('.')}'. Using loader: {loader}")
+        docs = loader.load()
+        doc = docs[0]
 
-            doc.metadata['document_name'] = file_name
-            doc.metadata['document_type'] = get_document_type(file_extension)
+        # for loading non
+        # if file is empty, pass
+        if len(doc.page_content) == 0:
+            return None
 
-            # convert Documents to Analitiq DocumentsSchema
-            document_schemas = convert_to_document_schema([doc])
+        file_name = file_path.name
+        file_name, file_extension = split_filename(file_name)
 
-            returned_documents.extend(document_schemas)
-        return returned_documents
+        doc.metadata['document_name'] = file_name
+        doc.metadata['document_type'] = get_document_type(file_extension)
+
+        # convert Documents to Analitiq DocumentsSchema
+        return convert_to_document_schema([doc])[0]
+
+    def lazy_load(self) -> Iterator[DocumentSchema]:
+        """Yield the documents of the directory one at a time, so that the whole tree is never in memory."""
+        for file_path in self.iter_paths():
+            document = self.load_path(file_path)
+            if document is not None:
+                yield document
+
+    def load(self) -> List[DocumentSchema]:
+        return list(self.lazy_load())
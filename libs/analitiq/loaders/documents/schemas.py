@@ -74,6 +74,7 @@ class Chunk(DocumentMetadata):
         document_uuid: str = None
         chunk_num_char: int
         content_kw: str = None
+        occurrence: int = 0  # identical chunks of the document before this one, part of its id; not stored
 
     """
     content: str = None
@@ -82,3 +83,4 @@ class Chunk(DocumentMetadata):
     chunk_num_char: int
     content_kw: str = None
     created_ts: str = Field(default_factory=current_timestamp)
+    occurrence: int = Field(default=0, exclude=True)
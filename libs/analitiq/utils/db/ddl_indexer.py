@@ -0,0 +1,200 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from analitiq.databases.relational.catalog import format_table_columns
+from analitiq.databases.vector.utils.incremental_sync import (
+    ANALITIQ_NAMESPACE,
+    ManifestEntry,
+    SyncManifest,
+    chunk_uuid,
+    default_manifest_path,
+)
+from analitiq.loaders.documents.schemas import Chunk, DocumentSourceEnum, DocumentTypeEnum
+
+logger = logging.getLogger(__name__)
+
+DDL_TAG = "ddl"
+
+
+def table_fingerprint(columns: List[Dict[str, Any]]) -> str:
+    """Return the SHA-256 hex digest of the names, types and nullability of the columns of a table."""
+    described = [[column["name"], str(column["type"]), column.get("nullable")] for column in columns]
+    return hashlib.sha256(json.dumps(described).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class DDLIndexStats:
+    """What a DDL indexing run changed in the vector database."""
+
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    elapsed_seconds: float = 0.0
+
+    def summary(self) -> str:
+        return f"{len(self.added)} tables added, {len(self.changed)} changed, {len(self.deleted)} deleted, " \
+               f"{self.unchanged} unchanged in {self.elapsed_seconds:.1f}s"
+
+
+class DDLIndexer:
+    """Keep the DDL documents of a vector database in sync with the tables of a relational database.
+
+    Every table is one document named "schema.table" and tagged "ddl", as ``SQLAgent`` searches
+    them. Its content lists the columns and their types, one chunk per table.
+
+    A manifest stores a fingerprint of the columns of every indexed table. A run reads the catalog
+    of the schemas, then embeds and upserts only the tables that are new or whose columns changed,
+    and deletes the documents of the tables that were dropped. Unchanged tables cost nothing.
+
+    Run it on demand with ``run``, or every ``interval`` seconds in a background thread with
+    ``start`` and ``stop``.
+
+    Parameters
+    ----------
+    db : BaseRelationalDatabase
+        The database whose tables are indexed.
+    vdb : BaseVectorDatabase
+        The vector database the DDL documents are loaded into. It provides ``load_chunks`` and
+        ``delete_many_on_uuids``.
+    schemas : List[str], optional
+        The schemas to index. Defaults to the 'db_schemas' param of the database.
+    manifest_path : str or Path, optional
+        The manifest of the indexed tables. Defaults to a file per collection and tenant under
+        ``~/.analitiq/manifests``.
+
+    Examples
+    --------
+    >>> indexer = DDLIndexer(db, vdb)
+    >>> indexer.run().summary()
+    '12 tables added, 0 changed, 0 deleted, 0 unchanged in 3.2s'
+    >>> indexer.start(interval=3600)
+
+    """
+
+    delete_batch_size: int = 1000
+
+    def __init__(self, db, vdb, schemas: Optional[List[str]] = None,
+                 manifest_path: Optional[Union[str, Path]] = None):
+        self.db = db
+        self.vdb = vdb
+        self.schemas = list(schemas or db.params.get("db_schemas") or [])
+        if manifest_path is None:
+            manifest_path = default_manifest_path(vdb.collection_name, vdb.params.get("tenant_name")) \
+                .with_suffix(".ddl.json")
+        self.manifest = SyncManifest(manifest_path)
+        self._run_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _document_uuid(self, document_name: str) -> str:
+        params = self.db.params
+        database = f"{params.get('host')}:{params.get('port')}/{params.get('db_name')}"
+        return str(uuid.uuid5(ANALITIQ_NAMESPACE, f"ddl:{database}:{document_name}"))
+
+    def _chunk(self, schema: str, table: str, columns: List[Dict[str, Any]]) -> Chunk:
+        document_name = f"{schema}.{table}"
+        content = format_table_columns(schema, table, columns)
+        return Chunk(
+            content=content,
+            document_name=document_name,
+            document_type=DocumentTypeEnum.sql,
+            document_source=DocumentSourceEnum.sys,
+            document_tags=[DDL_TAG],
+            document_uuid=self._document_uuid(document_name),
+            document_num_char=len(content),
+            chunk_num_char=len(content),
+        )
+
+    def run(self) -> DDLIndexStats:
+        """Index the tables that changed since the last run.
+
+        The catalog is read from the database, bypassing its cache. The manifest is saved once the
+        vector database is updated; if a write fails, the next run retries the same tables.
+
+        Returns
+        -------
+        DDLIndexStats
+            The tables added, changed and deleted.
+
+        """
+        with self._run_lock:
+            start = time.perf_counter()
+            stats = DDLIndexStats()
+            catalog = self.db.get_catalog(self.schemas, refresh=True)
+
+            chunks = []
+            entries = []
+            stale = []
+            for schema, table, columns in catalog:
+                document_name = f"{schema}.{table}"
+                fingerprint = table_fingerprint(columns)
+                previous = self.manifest.get(document_name)
+                if previous is not None and previous.content_hash == fingerprint:
+                    stats.unchanged += 1
+                    continue
+
+                chunk = self._chunk(schema, table, columns)
+                chunk_id = chunk_uuid(chunk.document_uuid, chunk.content)
+                chunks.append(chunk)
+                entries.append(ManifestEntry(document_name, time.time(), fingerprint, chunk.document_uuid, [chunk_id]))
+                if previous is None:
+                    stats.added.append(document_name)
+                else:
+                    stats.changed.append(document_name)
+                    stale.extend(set(previous.chunk_uuids) - {chunk_id})
+
+            for document_name, entry in list(self.manifest.entries.items()):
+                schema, table = document_name.split(".", 1)
+                if schema in self.schemas and (schema, table) not in catalog:
+                    stats.deleted.append(document_name)
+                    stale.extend(entry.chunk_uuids)
+
+            if chunks:
+                self.vdb.load_chunks(chunks)
+            for batch_start in range(0, len(stale), self.delete_batch_size):
+                self.vdb.delete_many_on_uuids(stale[batch_start:batch_start + self.delete_batch_size])
+
+            for entry in entries:
+                self.manifest.set(entry)
+            for document_name in stats.deleted:
+                self.manifest.remove(document_name)
+            self.manifest.save()
+
+            stats.elapsed_seconds = time.perf_counter() - start
+            logger.info(f"DDL indexing: {stats.summary()}")
+            return stats
+
+    def start(self, interval: float):
+        """Run the indexer now and then every ``interval`` seconds, in a daemon thread.
+
+        A failed run is logged, and retried at the next interval.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError("The DDL indexer is already running.")
+
+        self._stopped.clear()
+
+        def loop():
+            while not self._stopped.is_set():
+                try:
+                    self.run()
+                except Exception as e:
+                    logger.error(f"DDL indexing failed: {e}")
+                self._stopped.wait(interval)
+
+        self._thread = threading.Thread(target=loop, name="ddl-indexer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the scheduled runs, waiting for a run in progress to finish."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
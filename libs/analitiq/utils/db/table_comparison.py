@@ -29,8 +29,8 @@ def compare_columns_between_tables(table_data, detailed: bool = False):
         column_data: dict = None
 
         try:
-            # Fetch column data for the table
-            column_data = db_wrapper.get_table_columns(table_name, schema_name)
+            # Fetch column data for the table from the cached catalog of its schema
+            column_data = db_wrapper.get_catalog([schema_name]).columns(schema_name, table_name)
         except Exception as e:
             print(f"Error fetching metadata for {db_name}: {e}. Table may not exist.")
             metadata[db_name] = None
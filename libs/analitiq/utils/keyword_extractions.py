@@ -1,16 +1,40 @@
 """Functions for handling keyword extractions."""
 
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.stem import PorterStemmer
-from nltk.data import find
+import os
+import re
+import threading
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Literal, Optional
+from analitiq.utils.stopwords_en import ENGLISH_STOP_WORDS
 
-DOWNLOAD_DIR = "/tmp"  # Specify your download directory here
+# Directory searched for NLTK data, and where missing resources are downloaded.
+# Set ANALITIQ_NLTK_DATA to use another one, e.g. a directory baked into a container image.
+DOWNLOAD_DIR = os.environ.get("ANALITIQ_NLTK_DATA", "/tmp")
+# Set ANALITIQ_NLTK_DOWNLOAD=0 to never download, e.g. in air-gapped environments.
+ALLOW_DOWNLOAD = os.environ.get("ANALITIQ_NLTK_DOWNLOAD", "1").lower() not in ("0", "false", "no")
+
+# (resource path, package name) of the NLTK data used by the "nltk" tokenizer
+PUNKT_RESOURCES = [("tokenizers/punkt", "punkt"), ("tokenizers/punkt_tab", "punkt_tab")]
+
+_nltk_lock = threading.Lock()
+_nltk_data_path_set = False
+
+
+def _nltk():
+    """Import NLTK on first use and add DOWNLOAD_DIR to its data path.
+
+    NLTK is not imported with this module, so importing analitiq does not pay for it.
+    """
+    global _nltk_data_path_set
+    import nltk
+
+    if not _nltk_data_path_set:
+        with _nltk_lock:
+            if DOWNLOAD_DIR not in nltk.data.path:
+                nltk.data.path.append(DOWNLOAD_DIR)
+            _nltk_data_path_set = True
+    return nltk
 
-# Set the default NLTK data path to include your custom directory.
-# This needs to happen before calling is_resource_downloaded to ensure that directory is checked.
-nltk.data.path.append(DOWNLOAD_DIR)
 
 def is_resource_downloaded(resource):
     """Checks if a resource has been downloaded.
@@ -19,24 +43,152 @@ def is_resource_downloaded(resource):
     :return: True if the resource has been downloaded, False otherwise.
     """
     try:
-        find(resource)
+        _nltk().data.find(resource)
         return True
     except LookupError:
         return False
 
 
-punkt_downloaded = is_resource_downloaded("tokenizers/punkt")
-stopwords_downloaded = is_resource_downloaded("corpora/stopwords")
-punkt_tab_downloaded = is_resource_downloaded("tokenizers/punkt_tab")
+def ensure_nltk_resource(resource: str, package: str) -> bool:
+    """Make sure an NLTK resource is available, downloading it into DOWNLOAD_DIR if allowed.
+
+    :param resource: The resource path, e.g. "tokenizers/punkt".
+    :param package: The NLTK package providing it, e.g. "punkt".
+    :return: True if the resource is available.
+    """
+    if is_resource_downloaded(resource):
+        return True
+    if not ALLOW_DOWNLOAD:
+        return False
+
+    with _nltk_lock:
+        if not is_resource_downloaded(resource):
+            _nltk().download(package, download_dir=DOWNLOAD_DIR, quiet=True)
+    return is_resource_downloaded(resource)
+
+
+def load_stop_words() -> FrozenSet[str]:
+    """Return the English stop words.
+
+    The NLTK stopwords corpus is used when it is installed, otherwise the bundled copy of the
+    same list. Nothing is downloaded.
+    """
+    if is_resource_downloaded("corpora/stopwords"):
+        from nltk.corpus import stopwords
+        return frozenset(stopwords.words("english"))
+    return ENGLISH_STOP_WORDS
+
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")  # runs of letters and digits, i.e. the tokens that pass str.isalnum()
+DEFAULT_STEM_CACHE_SIZE = 100000
+
+
+class KeywordExtractor:
+    """Extract stemmed keywords from text, loading the language resources once.
+
+    The stop words and the Porter stemmer are set up when the extractor is created, and stems are
+    memoized in a bounded LRU cache, which pays off because the vocabulary of a corpus is far
+    smaller than its word count.
+
+    Two tokenizers are available:
+
+    - "regex" (default): a precompiled regex that keeps runs of letters and digits. It matches
+      the NLTK tokenizer on plain prose and needs no NLTK data. It also splits hyphenated words and
+      contractions into their parts, which the NLTK path drops as non-alphanumeric tokens.
+    - "nltk": ``word_tokenize``, for output identical to earlier releases.
+
+    Parameters
+    ----------
+    stop_words : Iterable[str], optional
+        The words to ignore. Defaults to the English stop words of ``load_stop_words``.
+    stem_cache_size : int, optional
+        Maximum number of memoized stems.
+    tokenizer : {"regex", "nltk"}, optional
+        The tokenizer to use.
+
+    Examples
+    --------
+    >>> extractor = KeywordExtractor()
+    >>> extractor.extract("This is a test sentence for keyword extraction.")
+    'test sentenc keyword extract'
+    >>> extractor.extract_many(["Revenue by month", "Monthly revenue"])
+    ['revenu month', 'monthli revenu']
+
+    """
+
+    def __init__(
+        self,
+        stop_words: Optional[Iterable[str]] = None,
+        stem_cache_size: int = DEFAULT_STEM_CACHE_SIZE,
+        tokenizer: Literal["regex", "nltk"] = "regex",
+    ):
+        if tokenizer not in ("regex", "nltk"):
+            raise ValueError(f"Unknown tokenizer '{tokenizer}'. Valid tokenizers: regex, nltk")
+
+        from nltk.stem import PorterStemmer
+
+        self.stop_words = frozenset(stop_words) if stop_words is not None else load_stop_words()
+        self.tokenizer = tokenizer
+        if tokenizer == "nltk":
+            for resource, package in PUNKT_RESOURCES:
+                if not ensure_nltk_resource(resource, package):
+                    raise LookupError(f"NLTK resource '{package}' is not available in {DOWNLOAD_DIR} "
+                                      "and could not be downloaded. Use tokenizer='regex' to work without it.")
+        self.stemmer = PorterStemmer()
+        self._stem = lru_cache(maxsize=stem_cache_size)(self.stemmer.stem)
+
+    def tokenize(self, text: str) -> List[str]:
+        """Split a text into lower-case alphanumeric tokens. Underscores separate tokens."""
+        text = text.replace("_", " ").lower()
+        if self.tokenizer == "regex":
+            return TOKEN_PATTERN.findall(text)
+        from nltk.tokenize import word_tokenize
+
+        return [word for word in word_tokenize(text) if word.isalnum()]
+
+    def terms(self, text: str) -> List[str]:
+        """Return the stems of the non-stop-word tokens of a text, in order and with repeats.
+
+        These are the terms a keyword index counts, e.g. for BM25 term frequencies.
+        """
+        stop_words = self.stop_words
+        stem = self._stem
+        return [stem(word) for word in self.tokenize(text) if word not in stop_words]
+
+    def extract(self, text: str) -> str:
+        """Extract the keywords of a text.
+
+        Returns the distinct stems of the non-stop-word tokens, space-separated, in order of
+        first appearance. See ``extract_keywords``.
+        """
+        return " ".join(dict.fromkeys(self.terms(text)))
+
+    def extract_many(self, texts: Iterable[str]) -> List[str]:
+        """Extract the keywords of several texts, e.g. all chunks of a document."""
+        return [self.extract(text) for text in texts]
+
+    def cache_info(self):
+        """Return the hit and miss statistics of the stem cache."""
+        return self._stem.cache_info()
+
+
+_default_extractor: Optional[KeywordExtractor] = None
+_default_extractor_lock = threading.Lock()
+
 
-if not punkt_downloaded:
-    nltk.download("punkt", download_dir=DOWNLOAD_DIR)
+def get_keyword_extractor() -> KeywordExtractor:
+    """Return the process-wide KeywordExtractor, creating it on first use."""
+    global _default_extractor
+    if _default_extractor is None:
+        with _default_extractor_lock:
+            if _default_extractor is None:
+                _default_extractor = KeywordExtractor()
+    return _default_extractor
 
-if not punkt_tab_downloaded:
-    nltk.download("punkt_tab", download_dir=DOWNLOAD_DIR)
 
-if not stopwords_downloaded:
-    nltk.download("stopwords", download_dir=DOWNLOAD_DIR)
+def extract_keywords_many(texts: Iterable[str]) -> List[str]:
+    """Extract the keywords of several texts with the process-wide KeywordExtractor."""
+    return get_keyword_extractor().extract_many(texts)
 
 
 def extract_keywords(text: str) -> str:
@@ -68,21 +220,7 @@ def extract_keywords(text: str) -> str:
     - Internally, underscores in the input string are replaced with spaces prior to tokenization.
     - Only alphanumeric tokens that do not appear in the NLTK English stop words list are considered keywords.
     - The Porter Stemming algorithm is applied to all potential keywords prior to inclusion in the final output string.
+    - This uses the process-wide KeywordExtractor, which loads the stop words and stemmer once.
 
     """
-    tmp_text = text.replace("_", " ")
-    tmp_text = word_tokenize(tmp_text.lower())
-    stop_words = set(stopwords.words("english"))
-    tokens = [word for word in tmp_text if word.isalnum() and word not in stop_words]
-
-    # Stemming
-    stemmer = PorterStemmer()
-    seen = set()
-    result = []
-    for word in tokens:
-        stemmed_word = stemmer.stem(word)
-        if stemmed_word not in seen:
-            seen.add(stemmed_word)
-            result.append(stemmed_word)
-
-    return " ".join(result)
+    return get_keyword_extractor().extract(text)
@@ -0,0 +1,115 @@
+"""SQL results as Arrow tables against the pandas path, on wide and long result sets.
+
+The pandas path is the one of ``SQLAgent.execute_sql``: rows are fetched in pages into DataFrames,
+concatenated, and stored in the AgentContext as a 'split' dict of Python objects. The Arrow path
+converts the rows to Arrow columns page by page and stores the table as is; it is then converted
+to pandas (Arrow-backed, without copying) and to IPC bytes, as it would be for a client.
+
+The data is generated in a temporary SQLite database, so both paths read rows through the same
+DBAPI cursor. With a PostgreSQL ``--url``, ``--adbc-uri`` and adbc-driver-postgresql installed, the
+Arrow path reads record batches with ADBC instead. The tables bench_long and bench_wide are
+(re)created in the database.
+
+Usage (from the repository root):
+
+    python libs/benchmarks/bench_arrow_results.py --rows 500000 --wide-rows 20000 --wide-columns 200
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import pandas as pd
+from sqlalchemy import create_engine, text
+from analitiq.base.agent_context import AgentContext
+from analitiq.databases.relational.arrow_fetch import (
+    fetch_arrow_adbc,
+    fetch_arrow_from_rows,
+    import_adbc_driver,
+    to_ipc_bytes,
+    to_pandas,
+)
+from analitiq.databases.relational.result_stream import ResultStream
+
+
+def timed(func, repeat: int = 3):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def create_table(engine, name: str, rows: int, columns: int):
+    """Create a table of integer, float and text columns, in equal parts."""
+    kinds = ["INTEGER", "REAL", "TEXT"]
+    definitions = ", ".join(f"c{i} {kinds[i % 3]}" for i in range(columns))
+    frame = pd.DataFrame({
+        f"c{i}": (pd.Series(range(rows)) * (i + 1) if i % 3 == 0
+                  else pd.Series(range(rows)) / (i + 1) if i % 3 == 1
+                  else "value " + pd.Series(range(rows)).astype(str))
+        for i in range(columns)
+    })
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        connection.execute(text(f"CREATE TABLE {name} ({definitions})"))
+    frame.to_sql(name, engine, if_exists="append", index=False, chunksize=10_000)
+
+
+def pandas_path(engine, sql: str):
+    with ResultStream(engine.connect, sql) as stream:
+        frame = pd.concat(list(stream), ignore_index=True)
+    context = AgentContext("benchmark")
+    context.add_result("sql", frame, "data")
+    return context
+
+
+def arrow_path(engine, sql: str, adbc_uri: str = None):
+    adbc_dbapi = import_adbc_driver(engine.dialect.name) if adbc_uri else None
+    if adbc_dbapi is not None:
+        table, _ = fetch_arrow_adbc(adbc_dbapi, adbc_uri, sql)
+    else:
+        table, _ = fetch_arrow_from_rows(engine.connect, sql)
+    context = AgentContext("benchmark")
+    context.add_result("sql", table, "data")
+    return context
+
+
+def compare(engine, name: str, sql: str, adbc_uri: str = None):
+    pandas_seconds, pandas_context = timed(lambda: pandas_path(engine, sql))
+    arrow_seconds, arrow_context = timed(lambda: arrow_path(engine, sql, adbc_uri))
+    table = arrow_context.get_result_arrow("sql")
+    to_pandas_seconds, _ = timed(lambda: to_pandas(table))
+    ipc_seconds, ipc = timed(lambda: to_ipc_bytes(table))
+
+    rows = len(pandas_context.get_result_data("sql")["data"])
+    print(f"\n{name}: {rows} rows x {table.num_columns} columns")
+    print(f"{'pandas, DataFrame -> split dict':<36} {pandas_seconds * 1e3:10.1f} ms")
+    print(f"{'arrow, Table in context':<36} {arrow_seconds * 1e3:10.1f} ms  {pandas_seconds / arrow_seconds:5.1f}x")
+    print(f"{'  + to pandas (Arrow-backed)':<36} {to_pandas_seconds * 1e3:10.1f} ms")
+    print(f"{'  + to IPC bytes':<36} {ipc_seconds * 1e3:10.1f} ms  ({len(ipc) / 1e6:.1f} MB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500_000, help="rows of the long result set")
+    parser.add_argument("--columns", type=int, default=6, help="columns of the long result set")
+    parser.add_argument("--wide-rows", type=int, default=20_000, help="rows of the wide result set")
+    parser.add_argument("--wide-columns", type=int, default=200, help="columns of the wide result set")
+    parser.add_argument("--url", help="SQLAlchemy URL of the database, a temporary SQLite database by default")
+    parser.add_argument("--adbc-uri", help="URI for the ADBC driver of the --url database")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(args.url or f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        create_table(engine, "bench_long", args.rows, args.columns)
+        create_table(engine, "bench_wide", args.wide_rows, args.wide_columns)
+
+        compare(engine, "long", "SELECT * FROM bench_long", args.adbc_uri)
+        compare(engine, "wide", "SELECT * FROM bench_wide", args.adbc_uri)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Import time of the analitiq entry points, measured with ``python -X importtime``.
+
+Every module is imported in a fresh interpreter, so each figure is a cold start. The report shows
+the cumulative import time of the module and which heavy backends it pulled in. Heavy backends
+should only be imported when a factory instantiates them, not when analitiq is imported.
+
+Usage (from the repository root):
+
+    python libs/benchmarks/bench_import_time.py
+    python libs/benchmarks/bench_import_time.py --max-seconds 1.5 analitiq.main
+
+With ``--max-seconds``, the script exits with status 1 if a module takes longer to import, so it
+can guard against regressions in CI.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+LIBS_DIR = Path(__file__).resolve().parents[1]
+
+DEFAULT_MODULES = [
+    "analitiq.main",
+    "analitiq.agents.sql.sql_agent",
+    "analitiq.agents.search_vdb.vdb_agent",
+    "analitiq.databases.vector.weaviate.weaviate_connector",
+    "analitiq.databases.relational.postgresql.postgresql_connector",
+]
+HEAVY_MODULES = ["torch", "transformers", "pandas", "langchain", "langchain_community", "sqlalchemy", "nltk", "weaviate"]
+
+
+def import_time(module: str) -> tuple:
+    """Import a module in a new interpreter and return (seconds, heavy modules it imported)."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(LIBS_DIR), os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, cwd=LIBS_DIR,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        if total.strip().isdigit():
+            cumulative[name.strip()] = int(total)
+
+    return cumulative.get(module, 0) / 1e6, [name for name in HEAVY_MODULES if name in cumulative]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="modules to import")
+    parser.add_argument("--max-seconds", type=float, help="fail if a module takes longer to import")
+    args = parser.parse_args()
+
+    too_slow = []
+    for module in args.modules:
+        seconds, heavy = import_time(module)
+        print(f"{module:<65} {seconds:6.2f}s  {', '.join(heavy) or '-'}")
+        if args.max_seconds is not None and seconds > args.max_seconds:
+            too_slow.append(module)
+
+    if too_slow:
+        print(f"\nSlower than {args.max_seconds}s: {', '.join(too_slow)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
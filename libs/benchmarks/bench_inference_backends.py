@@ -0,0 +1,85 @@
+"""Throughput and embedding drift of the AnalitiqVectorizer inference backends.
+
+The corpus is the source and documentation of the analitiq package, split into chunks. Every
+backend embeds the same texts; the report shows texts per second, the speedup over the eager
+PyTorch backend, and how far its vectors drift from the PyTorch ones (cosine similarity and
+largest absolute difference). Backends whose dependencies are missing are skipped.
+
+Usage (from the repository root):
+
+    python libs/benchmarks/bench_inference_backends.py --texts 1024 --threads 4
+    python libs/benchmarks/bench_inference_backends.py --model /path/to/local/model --backends torch onnx
+"""
+
+import argparse
+import time
+from pathlib import Path
+import numpy as np
+from analitiq.databases.vector.utils.analitiq_vectorizer import AnalitiqVectorizer
+from analitiq.databases.vector.utils.inference_backends import INFERENCE_BACKENDS
+from analitiq.databases.vector.utils.model_registry import ModelRegistry
+from analitiq.databases.vector.weaviate.weaviate_connector import VECTOR_MODEL_NAME
+
+PACKAGE_DIR = Path(__file__).resolve().parents[1] / "analitiq"
+CHUNK_SIZE = 500
+
+
+def load_corpus(count: int) -> list:
+    chunks = []
+    for path in sorted(PACKAGE_DIR.rglob("*")):
+        if path.suffix in (".py", ".md") and path.is_file():
+            text = path.read_text(encoding="utf-8", errors="ignore")
+            chunks.extend(text[i:i + CHUNK_SIZE] for i in range(0, len(text), CHUNK_SIZE))
+    return (chunks * (count // max(len(chunks), 1) + 1))[:count]
+
+
+def drift(vectors: np.ndarray, reference: np.ndarray) -> str:
+    cosine = (vectors * reference).sum(axis=1) / (
+        np.linalg.norm(vectors, axis=1) * np.linalg.norm(reference, axis=1)
+    )
+    return f"cosine mean {cosine.mean():.5f} min {cosine.min():.5f}, max abs diff {np.abs(vectors - reference).max():.2e}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=VECTOR_MODEL_NAME, help="model name or local path")
+    parser.add_argument("--backends", nargs="+", default=list(INFERENCE_BACKENDS), choices=list(INFERENCE_BACKENDS))
+    parser.add_argument("--texts", type=int, default=512, help="number of texts embedded by each backend")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--threads", type=int, help="CPU threads used by PyTorch and ONNX Runtime")
+    args = parser.parse_args()
+
+    backend_options = {}
+    if args.threads:
+        import torch
+        torch.set_num_threads(args.threads)
+        backend_options["onnx"] = {"intra_op_threads": args.threads}
+
+    texts = load_corpus(args.texts)
+    print(f"{args.model}: {len(texts)} texts, {sum(map(len, texts)) / 1e3:.0f}k characters\n")
+
+    registry = ModelRegistry()  # the model is loaded once and shared by the backends
+    reference = None
+    baseline = None
+    for backend in ["torch"] + [name for name in args.backends if name != "torch"]:
+        vectorizer = AnalitiqVectorizer(args.model, registry=registry, backend=backend,
+                                        backend_options=backend_options.get(backend))
+        try:
+            vectorizer.vectorize_batch(texts[:args.batch_size])  # build the backend, e.g. export to ONNX
+        except ImportError as e:
+            print(f"{backend:<12} skipped: {e}")
+            continue
+
+        started = time.perf_counter()
+        vectors = vectorizer.vectorize_batch(texts, batch_size=args.batch_size)
+        elapsed = time.perf_counter() - started
+
+        if reference is None:
+            reference, baseline = vectors, elapsed
+        if backend in args.backends:
+            print(f"{backend:<12} {len(texts) / elapsed:8.1f} texts/s  {baseline / elapsed:5.2f}x  "
+                  f"{drift(vectors, reference)}")
+
+
+if __name__ == "__main__":
+    main()
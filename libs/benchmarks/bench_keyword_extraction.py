@@ -0,0 +1,75 @@
+"""Microbenchmark of keyword extraction on a realistic corpus.
+
+The corpus is the source and documentation of the analitiq package, split into chunks the way the
+text chunker splits documents. It compares the per-call setup of the previous implementation
+(new stop word set and stemmer, word_tokenize for every chunk) with KeywordExtractor.
+
+Usage (from the repository root):
+
+    python libs/benchmarks/bench_keyword_extraction.py --repeat 3
+"""
+
+import argparse
+import time
+from pathlib import Path
+from nltk.corpus import stopwords
+from nltk.stem import PorterStemmer
+from nltk.tokenize import word_tokenize
+from analitiq.utils.keyword_extractions import KeywordExtractor
+
+PACKAGE_DIR = Path(__file__).resolve().parents[1] / "analitiq"
+CHUNK_SIZE = 2000
+
+
+def load_corpus(repeat: int) -> list:
+    chunks = []
+    for path in sorted(PACKAGE_DIR.rglob("*")):
+        if path.suffix in (".py", ".md") and path.is_file():
+            text = path.read_text(encoding="utf-8", errors="ignore")
+            chunks.extend(text[i:i + CHUNK_SIZE] for i in range(0, len(text), CHUNK_SIZE))
+    return chunks * repeat
+
+
+def legacy_extract_keywords(text: str) -> str:
+    """The implementation before KeywordExtractor, kept here as the baseline."""
+    tmp_text = text.replace("_", " ")
+    tmp_text = word_tokenize(tmp_text.lower())
+    stop_words = set(stopwords.words("english"))
+    tokens = [word for word in tmp_text if word.isalnum() and word not in stop_words]
+
+    stemmer = PorterStemmer()
+    seen = set()
+    result = []
+    for word in tokens:
+        stemmed_word = stemmer.stem(word)
+        if stemmed_word not in seen:
+            seen.add(stemmed_word)
+            result.append(stemmed_word)
+
+    return " ".join(result)
+
+
+def timed(name: str, func, chunks: list, baseline: float = None) -> float:
+    started = time.perf_counter()
+    func(chunks)
+    elapsed = time.perf_counter() - started
+    speedup = f"  {baseline / elapsed:5.1f}x" if baseline else ""
+    print(f"{name:<40} {elapsed:8.3f}s  {len(chunks) / elapsed:10.0f} chunks/s{speedup}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="how many times the corpus is processed")
+    args = parser.parse_args()
+
+    chunks = load_corpus(args.repeat)
+    print(f"{len(chunks)} chunks, {sum(map(len, chunks)) / 1e6:.1f}M characters\n")
+
+    baseline = timed("legacy extract_keywords", lambda texts: [legacy_extract_keywords(t) for t in texts], chunks)
+    timed("KeywordExtractor(tokenizer='nltk')", KeywordExtractor(tokenizer="nltk").extract_many, chunks, baseline)
+    timed("KeywordExtractor() (regex)", KeywordExtractor().extract_many, chunks, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Top-k search of the SimilarityIndex against the previous full-sort search.
+
+Random unit vectors stand in for embeddings. The previous ``AnalitiqVectorizer.search``
+normalized the query, computed all similarities and sorted them with ``argsort``. The index selects
+the top k with ``argpartition`` and searches a batch of queries with one matrix product.
+
+Usage (from the repository root):
+
+    python libs/benchmarks/bench_similarity_index.py --vectors 100000 --queries 64 --k 10
+"""
+
+import argparse
+import time
+import numpy as np
+from analitiq.databases.vector.utils.similarity_index import SimilarityIndex
+
+
+def full_sort_search(embeddings: np.ndarray, query: np.ndarray, k: int) -> np.ndarray:
+    query = query / np.linalg.norm(query)
+    similarities = np.dot(embeddings, query.T).flatten()
+    return similarities.argsort()[-k:][::-1]
+
+
+def timed(func, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vectors", type=int, default=100_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=64)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(args.vectors, args.dimension))
+    queries = rng.normal(size=(args.queries, args.dimension))
+
+    embeddings = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)  # float64, as before
+    index = SimilarityIndex.from_vectors(vectors)
+
+    results = {
+        "full sort, one query at a time": timed(lambda: [full_sort_search(embeddings, q, args.k) for q in queries]),
+        "argpartition, one query at a time": timed(lambda: [index.search(q, args.k) for q in queries]),
+        "argpartition, batched queries": timed(lambda: index.search_batch(queries, args.k)),
+    }
+
+    print(f"{args.vectors} vectors of dimension {args.dimension}, {args.queries} queries, k={args.k}\n")
+    baseline = results["full sort, one query at a time"]
+    for name, seconds in results.items():
+        print(f"{name:<36} {seconds * 1e3 / args.queries:8.3f} ms/query  {baseline / seconds:5.1f}x")
+
+    appended = SimilarityIndex()
+    seconds = timed(lambda: [appended.add(vectors[i:i + 100]) for i in range(0, 10_000, 100)], repeat=1)
+    print(f"\nappending 100 batches of 100 vectors: {seconds * 1e3:.1f} ms, capacity {appended.capacity}")
+
+
+if __name__ == "__main__":
+    main()
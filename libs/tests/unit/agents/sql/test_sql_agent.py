@@ -0,0 +1,78 @@
+# pylint: disable=redefined-outer-name
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+from analitiq.agents.sql.sql_agent import SQLAgent
+from analitiq.base.agent_context import AgentContext
+from analitiq.databases.relational.result_stream import ResultStream
+
+
+@pytest.fixture
+def agent():
+    # pages are fetched in worker threads, which share the in-memory database
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE numbers (n INTEGER)"))
+        connection.execute(text("INSERT INTO numbers VALUES (:n)"), [{"n": n} for n in range(25)])
+
+    agent = SQLAgent("sql")
+    agent.db = MagicMock()
+    agent.db.engine = engine
+    agent.db.params = {"result_max_rows": 15}
+    agent.db.stream_sql = lambda sql, params, max_rows, max_bytes: ResultStream(
+        engine.connect, sql, params, page_size=10, max_rows=max_rows, max_bytes=max_bytes
+    )
+    return agent
+
+
+def test_execute_sql_caps_rows(agent):
+    success, result = agent.execute_sql("SELECT n FROM numbers ORDER BY n")
+
+    assert success is True
+    assert list(result["n"]) == list(range(15))
+
+
+def test_execute_sql_error(agent):
+    success, result = agent.execute_sql("SELECT missing FROM numbers")
+
+    assert success is False
+    assert "missing" in result
+
+
+def test_aexecute_sql_pages_streams_into_context(agent):
+    context = AgentContext("numbers")
+
+    async def stream():
+        streamed = []
+        async for page in agent.aexecute_sql_pages("SELECT n FROM numbers ORDER BY n"):
+            streamed.append(context.append_data("sql", page))
+        return streamed
+
+    streamed = asyncio.run(stream())
+
+    assert [len(item["sql"]["data"]) for item in streamed] == [10, 5]
+    data = context.get_result_data("sql")
+    assert data["columns"] == ["n"]
+    assert data["index"] == list(range(15))
+    assert [row[0] for row in data["data"]] == list(range(15))
+
+
+def test_execute_sql_arrow(agent):
+    pytest.importorskip("pyarrow")
+    from analitiq.databases.relational.arrow_fetch import fetch_arrow_from_rows
+
+    engine = agent.db.engine
+    agent.db.params["result_format"] = "arrow"
+    agent.db.fetch_arrow = lambda sql, params, max_rows, max_bytes: fetch_arrow_from_rows(
+        engine.connect, sql, params, max_rows=max_rows, max_bytes=max_bytes
+    )
+
+    success, table = agent._execute("SELECT n FROM numbers ORDER BY n")
+    assert success is True
+    assert table.column("n").to_pylist() == list(range(15))
+
+    success, error = agent._execute("SELECT missing FROM numbers")
+    assert success is False
@@ -0,0 +1,70 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from analitiq.agents.agent_pipeline import AgentPipeline
+from analitiq.base.agent_context import AgentContext
+from analitiq.databases.vector.utils.query_vector_memo import _query_vectors, memoized_query_vector
+
+
+class StreamingAgent:
+    """Searches the query before each of three results, like an agent streaming its answer."""
+
+    def __init__(self, vectorizer):
+        self.vectorizer = vectorizer
+        self.closed = False
+
+    def ainvoke(self, params):
+        pass
+
+    async def arun(self, context):
+        try:
+            for step in range(3):
+                memoized_query_vector(self.vectorizer, context.user_query)
+                yield f"step {step}"
+        finally:
+            self.closed = True
+
+
+def make_vectorizer():
+    vectorizer = MagicMock()
+    vectorizer.cache_key = "model:raw"
+    vectorizer.vectorize.side_effect = lambda query: [float(len(query))]
+    return vectorizer
+
+
+def test_agents_share_query_vectors():
+    vectorizer = make_vectorizer()
+    pipeline = AgentPipeline([StreamingAgent(vectorizer), StreamingAgent(vectorizer)], {})
+
+    async def run():
+        return [result async for result in pipeline.arun(AgentContext("revenue"))]
+
+    assert len(asyncio.run(run())) == 6
+    assert vectorizer.vectorize.call_count == 1
+
+
+def test_abandoned_run_is_closed_from_another_context():
+    agent = StreamingAgent(make_vectorizer())
+    results = AgentPipeline([agent], {}).arun(AgentContext("revenue"))
+
+    async def first():
+        result = await anext(results)
+        assert _query_vectors.get() is None  # the memo does not leak to the caller between yields
+        return result
+
+    assert asyncio.run(first()) == "step 0"
+    asyncio.run(results.aclose())  # another event loop, so another context
+
+    assert agent.closed
+
+
+def test_run_closes_async_vector_databases():
+    agent = StreamingAgent(make_vectorizer())
+    agent.avdb = MagicMock(close=AsyncMock())
+
+    async def run():
+        async for _ in AgentPipeline([agent], {}).arun(AgentContext("revenue")):
+            pass
+
+    asyncio.run(run())
+
+    agent.avdb.close.assert_awaited_once()
@@ -0,0 +1,49 @@
+# pylint: disable=redefined-outer-name
+import pytest
+from unittest.mock import patch
+from analitiq.agents.base_agent import BaseAgent
+
+PARAMS = {"llm_params": {"type": "bedrock"}, "vdb_params": {"type": "weaviate"}}
+
+
+class Agent(BaseAgent):
+    def run(self, context):
+        return context
+
+    async def arun(self, context):
+        yield context
+
+
+@pytest.fixture
+def factories():
+    module = "analitiq.agents.base_agent"
+    with patch(f"{module}.LlmFactory") as llm_factory, \
+            patch(f"{module}.VectorDatabaseFactory") as vdb_factory:
+        yield llm_factory, vdb_factory
+
+
+def test_ainvoke_creates_only_the_async_connector(factories):
+    _, vdb_factory = factories
+    agent = Agent("agent")
+
+    agent.ainvoke(PARAMS)
+
+    assert agent.avdb is vdb_factory.connect_async.return_value
+    assert agent.vdb is None
+    vdb_factory.connect.assert_not_called()
+
+
+def test_ainvoke_falls_back_to_the_sync_connector(factories):
+    _, vdb_factory = factories
+    vdb_factory.connect_async.side_effect = ValueError("no async connector")
+    agent = Agent("agent")
+
+    agent.ainvoke(PARAMS)
+
+    assert agent.avdb is None
+    assert agent.vdb is vdb_factory.connect.return_value
+
+
+def test_ainvoke_requires_an_llm(factories):
+    with pytest.raises(ValueError):
+        Agent("agent").ainvoke({"vdb_params": {"type": "weaviate"}})
@@ -45,20 +45,27 @@ def test_get_tables_in_schema(db_instance):
 
 
 def test_get_schemas_and_tables(db_instance):
-    with patch("analitiq.base.base_relational_database.inspect") as mock_inspect:
-        mock_inspector = MagicMock()
-        mock_inspector.get_schema_names.return_value = ["public", "schema1"]
-        mock_inspector.get_table_names.return_value = ["table1"]
-        mock_inspector.get_columns.return_value = [
-            {"name": "id", "type": "INTEGER"},
-            {"name": "name", "type": "VARCHAR"},
-        ]
-        mock_inspect.return_value = mock_inspector
-
+    rows = [
+        ("public", "table1", "name", "VARCHAR", "YES", 2),
+        ("public", "table1", "id", "INTEGER", "NO", 1),
+    ]
+    with patch.object(db_instance.catalog_loader, "_fetch_rows", return_value=rows) as mock_fetch_rows:
         result = db_instance.get_schemas_and_tables(["public"])
         expected = ["public.table1.id (INTEGER), public.table1.name (VARCHAR)"]
         assert result == expected
 
+        # the catalog is read in one query and cached
+        db_instance.get_schemas_and_tables(["public"])
+        mock_fetch_rows.assert_called_once_with(("public",))
+        # the pooled connections are kept for the next call
+        db_instance.engine.dispose.assert_not_called()
+
+
+def test_close_disposes_engine(db_instance):
+    with db_instance as db:
+        db.get_schema_names()
+    db_instance.engine.dispose.assert_called_once()
+
 
 def test_get_table_columns(db_instance):
     with patch("analitiq.base.base_relational_database.inspect") as mock_inspect:
@@ -0,0 +1,72 @@
+import os
+import pytest
+from analitiq.chunkers.parallel_chunker import ParallelChunker
+from analitiq.loaders.documents.schemas import Chunk, DocumentSchema, DocumentMetadata
+
+
+def split_words(document: DocumentSchema):
+    """Chunk function run in the worker processes. The chunk content records the worker pid."""
+    return [
+        Chunk(content=f"{os.getpid()}:{word}", document_name=document.metadata.document_name,
+              document_uuid=document.uuid, document_num_char=len(document.document_content),
+              chunk_num_char=len(word))
+        for word in document.document_content.split()
+    ]
+
+
+def fail_on_bad(document: DocumentSchema):
+    if document.metadata.document_name == "bad":
+        raise ValueError("cannot chunk bad")
+    return []
+
+
+def make_document(name: str, content: str) -> DocumentSchema:
+    return DocumentSchema(document_content=content, metadata=DocumentMetadata(document_name=name))
+
+
+def test_map_keeps_document_order():
+    documents = [make_document(f"doc{i}", " ".join(["word"] * (i % 7 + 1))) for i in range(40)]
+
+    with ParallelChunker(workers=2, chunk_function=split_words) as chunker:
+        results = list(chunker.map(iter(documents)))
+
+    assert [chunks[0].document_name for chunks in results] == [d.metadata.document_name for d in documents]
+    assert [len(chunks) for chunks in results] == [i % 7 + 1 for i in range(40)]
+    pids = {int(chunk.content.split(":")[0]) for chunks in results for chunk in chunks}
+    assert os.getpid() not in pids
+
+
+def test_single_worker_chunks_in_process():
+    chunker = ParallelChunker(workers=1, chunk_function=split_words)
+
+    chunks = chunker.chunk(make_document("doc", "a b"))
+
+    assert not chunker.parallel
+    assert [chunk.content for chunk in chunks] == [f"{os.getpid()}:a", f"{os.getpid()}:b"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_errors_are_raised(workers):
+    with ParallelChunker(workers=workers, chunk_function=fail_on_bad) as chunker:
+        with pytest.raises(ValueError, match="cannot chunk bad"):
+            list(chunker.map([make_document("good", "x"), make_document("bad", "y")]))
+
+
+# state of the parent process, like an open client, that a worker process must not inherit
+PARENT_STATE = []
+
+
+def chunk_parent_state(document: DocumentSchema):
+    return [Chunk(content=f"state={PARENT_STATE}", document_name=document.metadata.document_name,
+                  document_num_char=1, chunk_num_char=1)]
+
+
+def test_workers_do_not_inherit_parent_state():
+    PARENT_STATE.append("open client")
+    try:
+        with ParallelChunker(workers=2, chunk_function=chunk_parent_state) as chunker:
+            chunks = chunker.chunk(make_document("doc", "x"))
+    finally:
+        PARENT_STATE.clear()
+
+    assert chunks[0].content == "state=[]"
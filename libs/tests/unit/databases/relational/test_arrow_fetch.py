@@ -0,0 +1,59 @@
+# pylint: disable=redefined-outer-name
+
+import pytest
+from sqlalchemy import create_engine, text
+from analitiq.base.agent_context import AgentContext
+from analitiq.databases.relational.arrow_fetch import fetch_arrow_from_rows, from_ipc_bytes, to_pandas
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE events (id INTEGER, name TEXT, score REAL)"))
+        connection.execute(
+            text("INSERT INTO events VALUES (:id, :name, :score)"),
+            # the scores of the first page are all NULL
+            [{"id": i, "name": f"event {i}", "score": None if i < 10 else i / 2} for i in range(25)],
+        )
+    return engine
+
+
+def test_fetch_arrow_from_rows(engine):
+    table, truncated = fetch_arrow_from_rows(engine.connect, "SELECT * FROM events ORDER BY id", page_size=10)
+
+    assert not truncated
+    assert table.num_rows == 25
+    assert table.column_names == ["id", "name", "score"]
+    assert table.schema.field("id").type == pa.int64()
+    assert table.schema.field("score").type == pa.float64()
+    assert table.column("score").null_count == 10
+
+
+def test_fetch_arrow_caps(engine):
+    table, truncated = fetch_arrow_from_rows(engine.connect, "SELECT * FROM events", page_size=10, max_rows=12)
+    assert truncated
+    assert table.num_rows == 12
+
+    table, truncated = fetch_arrow_from_rows(engine.connect, "SELECT * FROM events WHERE id < :id", {"id": 0})
+    assert not truncated
+    assert table.num_rows == 0
+    assert table.column_names == ["id", "name", "score"]
+
+
+def test_agent_context_keeps_arrow_table(engine):
+    table, _ = fetch_arrow_from_rows(engine.connect, "SELECT id, name FROM events ORDER BY id LIMIT 3")
+    context = AgentContext("events")
+    context.add_result("sql", table, "data")
+
+    assert context.get_result_arrow("sql") is table
+    assert list(to_pandas(table)["id"]) == [0, 1, 2]
+    assert from_ipc_bytes(context.get_result_ipc("sql")).equals(table)
+    assert context.get_result_data("sql") == {
+        "index": [0, 1, 2],
+        "columns": ["id", "name"],
+        "data": [[0, "event 0"], [1, "event 1"], [2, "event 2"]],
+    }
+    assert context.get_results()["sql"]["data"]["columns"] == ["id", "name"]
@@ -0,0 +1,68 @@
+# pylint: disable=redefined-outer-name
+
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy.dialects import postgresql
+from analitiq.databases.relational.catalog import Catalog, CatalogLoader, catalog_query
+
+ROWS = [
+    ("sales", "orders", "amount", "numeric(10,2)", True, 2),
+    ("sales", "orders", "id", "integer", False, 1),
+    ("sales", "customers", "id", "integer", "NO", 1),
+    ("public", "events", "payload", "text", "YES", 1),
+]
+
+
+@pytest.fixture
+def clock():
+    clock = MagicMock(return_value=0.0)
+    return clock
+
+
+def test_catalog_index():
+    catalog = Catalog.from_rows(ROWS)
+
+    assert sorted(catalog.schemas()) == ["public", "sales"]
+    assert sorted(catalog.tables("sales")) == ["customers", "orders"]
+    assert catalog.columns("sales", "orders") == [
+        {"name": "id", "type": "integer", "nullable": False},
+        {"name": "amount", "type": "numeric(10,2)", "nullable": True},
+    ]
+    assert catalog.columns("public", "events")[0]["nullable"] is True
+    assert ("sales", "orders") in catalog
+    assert ("sales", "events") not in catalog
+    assert len(catalog) == 3
+    assert catalog.tables("missing") == []
+    with pytest.raises(KeyError):
+        catalog.columns("sales", "missing")
+
+
+def test_loader_caches_until_ttl(clock):
+    loader = CatalogLoader(MagicMock(), ttl=60, clock=clock)
+    loader._fetch_rows = MagicMock(return_value=ROWS)
+
+    first = loader.load(["sales", "public"])
+    assert loader.load(["public", "sales", "sales"]) is first
+    assert loader._fetch_rows.call_count == 1
+
+    clock.return_value = 61.0
+    assert loader.load(["sales", "public"]) is not first
+    assert loader._fetch_rows.call_count == 2
+
+
+def test_loader_refresh(clock):
+    loader = CatalogLoader(MagicMock(), clock=clock)
+    loader._fetch_rows = MagicMock(return_value=ROWS)
+
+    loader.load(["sales"])
+    loader.load(["sales"], refresh=True)
+    loader.refresh()
+    loader.load(["sales"])
+    assert loader._fetch_rows.call_count == 3
+    assert loader.load([]).schemas() == []
+
+
+def test_catalog_query_per_dialect():
+    pg_query = str(catalog_query("postgresql").compile(dialect=postgresql.dialect()))
+    assert "pg_catalog.pg_attribute" in pg_query
+    assert "information_schema.columns" in str(catalog_query("mysql"))
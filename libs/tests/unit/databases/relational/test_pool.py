@@ -0,0 +1,50 @@
+import threading
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+from analitiq.databases.relational.pool import PoolMetrics, pool_options
+
+
+def test_pool_options_default_to_threads():
+    options = pool_options({"threads": 4, "pool_recycle": 600})
+    assert options["pool_size"] == 4
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is True
+    assert pool_options({"threads": 4, "pool_size": 2})["pool_size"] == 2
+
+
+def test_pool_metrics_count_checkouts():
+    engine = create_engine("sqlite://", poolclass=QueuePool, **pool_options({"threads": 2}))
+    metrics = PoolMetrics(engine)
+
+    for _ in range(3):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    metrics.record_wait(0.5)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["checkouts"] == 3
+    assert snapshot["checkins"] == 3
+    # the connection is reused, not reopened
+    assert snapshot["connects"] == 1
+    assert snapshot["pool_size"] == 2
+    assert snapshot["pool_checkedout"] == 0
+    assert snapshot["max_wait_seconds"] == 0.5
+
+
+def test_pool_metrics_concurrent_checkouts():
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=2, max_overflow=0)
+    metrics = PoolMetrics(engine)
+    barrier = threading.Barrier(2)
+
+    def checkout():
+        with engine.connect():
+            barrier.wait()
+
+    workers = [threading.Thread(target=checkout) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert metrics.snapshot()["connects"] == 2
+    engine.dispose()
@@ -0,0 +1,62 @@
+# pylint: disable=redefined-outer-name
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import DatabaseError
+from analitiq.databases.relational.result_stream import ResultStream
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE numbers (n INTEGER, label TEXT)"))
+        connection.execute(text("INSERT INTO numbers VALUES (:n, :label)"),
+                           [{"n": n, "label": f"number {n}"} for n in range(25)])
+    return engine
+
+
+def test_pages(engine):
+    stream = ResultStream(engine.connect, "SELECT n, label FROM numbers ORDER BY n", page_size=10)
+    pages = list(stream)
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert list(pages[1].index) == list(range(10, 20))
+    assert list(pages[2]["n"]) == list(range(20, 25))
+    assert stream.rows == 25
+    assert not stream.truncated
+
+
+def test_row_cap_stops_early(engine):
+    stream = ResultStream(engine.connect, "SELECT n FROM numbers ORDER BY n", page_size=10, max_rows=15)
+    pages = list(stream)
+
+    assert [len(page) for page in pages] == [10, 5]
+    assert stream.rows == 15
+    assert stream.truncated
+
+
+def test_byte_cap(engine):
+    with ResultStream(engine.connect, "SELECT n, label FROM numbers", page_size=10) as stream:
+        page_bytes = int(next(stream).memory_usage(deep=True, index=False).sum())
+
+    stream = ResultStream(engine.connect, "SELECT n, label FROM numbers", page_size=10, max_bytes=page_bytes * 1.5)
+    pages = list(stream)
+
+    assert stream.truncated
+    assert 10 <= stream.rows < 20
+    assert stream.bytes <= page_bytes * 1.5
+
+
+def test_empty_result_has_columns(engine):
+    pages = list(ResultStream(engine.connect, "SELECT n FROM numbers WHERE n < :n", {"n": 0}))
+
+    assert len(pages) == 1
+    assert pages[0].empty
+    assert list(pages[0].columns) == ["n"]
+
+
+def test_error_is_raised_on_first_page(engine):
+    stream = ResultStream(engine.connect, "SELECT missing FROM numbers")
+    with pytest.raises(DatabaseError):
+        next(stream)
@@ -0,0 +1,30 @@
+"""Fixtures for unit tests of ChromadbConnector against an in-process persistent Chroma."""
+# pylint: disable=redefined-outer-name
+import numpy as np
+import pytest
+from unittest.mock import patch
+from tests.unit.databases.vector.faiss.conftest import bag_of_words
+
+pytest.importorskip("chromadb")
+
+from analitiq.databases.vector.chromadb.chromadb_connector import ChromadbConnector  # noqa: E402
+
+
+@pytest.fixture
+def make_vdb(tmp_path):
+    with patch("analitiq.databases.vector.chromadb.chromadb_connector.AnalitiqVectorizer") as vectorizer_cls:
+        vectorizer = vectorizer_cls.return_value
+        vectorizer.cache_key = "bag-of-words"
+        vectorizer.vectorize.side_effect = lambda text: bag_of_words(text).tolist()
+        vectorizer.vectorize_batch.side_effect = lambda texts: np.array([bag_of_words(t) for t in texts])
+
+        def make(**params):
+            return ChromadbConnector({"type": "chromadb", "path": str(tmp_path), "collection_name": "test",
+                                      "tenant_name": "tenant", **params})
+
+        yield make
+
+
+@pytest.fixture
+def vdb(make_vdb):
+    return make_vdb()
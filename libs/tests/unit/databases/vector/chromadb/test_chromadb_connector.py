@@ -0,0 +1,151 @@
+# pylint: disable=redefined-outer-name
+import pytest
+from unittest.mock import patch
+from analitiq.databases.vector.chromadb.chromadb_connector import ChromadbConnector
+from analitiq.databases.vector.chromadb.client_pool import get_client_pool
+from analitiq.databases.vector.chromadb.query_builder import ChromaQueryBuilder
+from analitiq.databases.vector.schema import SearchResult
+from analitiq.databases.vector.utils.incremental_sync import chunk_uuid
+from analitiq.factories.vector_database_factory import VectorDatabaseFactory
+from tests.unit.databases.vector.faiss.conftest import make_chunk
+
+
+def contents(result):
+    return [obj.properties["content"] for obj in result.objects]
+
+
+@pytest.fixture
+def loaded(vdb):
+    vdb.load_chunks([
+        make_chunk("monthly revenue by customer", "sales", document_type="sql", document_tags=["finance"]),
+        make_chunk("customers table schema", "schema", document_type="sql", document_tags=["crm", "finance"]),
+        make_chunk("hello world", "readme", document_type="text"),
+    ])
+    return vdb
+
+
+def test_searches(loaded):
+    result = loaded.vector_search("hello world", limit=2)
+    assert isinstance(result, SearchResult)
+    assert contents(result)[0] == "hello world"
+    assert result.objects[0].metadata.distance == pytest.approx(0.0, abs=1e-5)
+    assert result.objects[0].uuid == chunk_uuid("readme", "hello world")
+    assert result.objects[0].properties["document_tags"] is None
+    assert "_terms" not in result.objects[0].properties
+
+    result = loaded.kw_search("revenues of customers", limit=5)
+    assert contents(result)[0] == "monthly revenue by customer"
+    assert set(contents(result)) == {"monthly revenue by customer", "customers table schema"}
+    assert all(obj.metadata.score > 0 for obj in result.objects)
+
+    result = loaded.hybrid_search("monthly revenue", limit=2)
+    assert contents(result)[0] == "monthly revenue by customer"
+    assert len(result.objects) == 2
+
+
+def test_upserts_in_batches_and_overwrites(vdb):
+    vdb.batch_size = 2
+    chunks = [make_chunk(f"chunk number {i}", f"doc{i}") for i in range(5)]
+
+    with patch.object(vdb.collection, "upsert", wraps=vdb.collection.upsert) as upsert:
+        assert vdb.load_chunks(chunks) == 5
+
+    assert [len(call.kwargs["ids"]) for call in upsert.call_args_list] == [2, 2, 1]
+    assert vdb.load_chunks([make_chunk("chunk number 0", "doc0", document_type="markdown")]) == 1
+    assert vdb.collection.count() == 5
+    assert vdb.filter_count({"property": "document_type", "operator": "=", "value": "markdown"}).total_count == 1
+
+
+def test_filters(loaded):
+    sql = {"property": "document_type", "operator": "=", "value": "sql"}
+
+    assert sorted(contents(loaded.filter(sql))) == ["customers table schema", "monthly revenue by customer"]
+    assert loaded.filter(sql).objects[0].metadata.creation_time is not None
+    assert loaded.filter(sql).objects[0].metadata.last_update_time is not None
+    assert loaded.filter_count({"or": [sql, {"property": "content", "operator": "like", "value": "hel*"}]}).total_count == 3
+    assert loaded.filter_count({"property": "document_name", "operator": "like", "value": "s*"}).total_count == 2
+    assert loaded.filter_count({"property": "document_tags", "operator": "=", "value": "crm"}).total_count == 1
+    assert loaded.filter_count({"property": "document_tags", "operator": "contains_all",
+                                "value": ["crm", "finance"]}).total_count == 1
+    assert loaded.filter_count({"property": "document_tags", "operator": "!=", "value": "crm"}).total_count == 2
+    assert loaded.filter_count({"property": "chunk_num_char", "operator": ">", "value": 11}).total_count == 2
+
+    groups = loaded.filter_group_count(sql, "document_tags").groups
+    assert [(g.grouped_by.value, g.total_count) for g in groups] == [("finance", 2), ("crm", 1)]
+
+    ranked = loaded.search_filter("customers table", sql)
+    assert contents(ranked) == ["customers table schema", "monthly revenue by customer"]
+    grouped = loaded.search_filter("customers table", sql, group_properties=["document_name"])
+    assert [group["document_name"] for group in grouped] == ["schema", "sales"]
+    assert loaded.search_filter("hello", {"property": "document_type", "operator": "=", "value": "pdf"}) == []
+
+
+def test_deletes(loaded):
+    deleted = loaded.filter_delete("document_name", "readme")
+    assert (deleted.matches, deleted.successful) == (1, 1)
+    assert "hello world" not in contents(loaded.vector_search("hello world", limit=3))
+
+    deleted = loaded.delete_many_on_uuids([chunk_uuid("schema", "customers table schema"), "missing"])
+    assert (deleted.matches, deleted.successful) == (1, 1)
+
+    deleted = loaded.delete_on_metadata_and([{"property": "document_type", "operator": "=", "value": "sql"},
+                                             {"property": "document_name", "operator": "=", "value": "sales"}])
+    assert deleted.successful == 1
+    assert loaded.collection.count() == 0
+    assert loaded.hybrid_search("revenue").objects == []
+
+    with pytest.raises(ValueError):
+        loaded.delete_on_metadata_and([])
+
+
+def test_client_and_collection_are_reused(loaded, make_vdb):
+    with patch.object(loaded.client, "get_or_create_collection") as get_or_create:
+        loaded.vector_search("hello")
+        loaded.kw_search("hello")
+    get_or_create.assert_not_called()
+
+    other = make_vdb(tenant_name="other")
+    assert other.client is loaded.client
+    assert other.collection.name == "test__other"
+    assert other.vector_search("hello world").objects == []
+
+    loaded.close()
+    reopened = make_vdb()
+    assert contents(reopened.vector_search("hello world", limit=1)) == ["hello world"]
+
+    assert reopened.delete_collection("test")
+    assert not [c for c in get_client_pool().get_client(**reopened.client_options).list_collections()]
+    assert reopened.kw_search("hello").objects == []
+
+
+def test_query_builder():
+    builder = ChromaQueryBuilder()
+
+    assert builder.construct_query(None) is None and builder.exact
+    assert builder.construct_query({"property": "size", "operator": ">=", "value": 3}) == {"size": {"$gte": 3}}
+    assert builder.construct_query({"and": [
+        {"property": "name", "operator": "like", "value": "a*"},
+        {"property": "size", "operator": "<", "value": 3},
+    ]}) == {"size": {"$lt": 3}}
+    assert not builder.exact
+    assert builder.construct_query({"or": [
+        {"property": "content", "operator": "=", "value": "x"},
+        {"property": "size", "operator": "<", "value": 3},
+    ]}) is None
+    assert not builder.exact
+
+    with pytest.raises(ValueError):
+        builder.construct_query({"property": "size", "operator": "~", "value": 1})
+    with pytest.raises(ValueError):
+        builder.construct_query({"property": "tags", "operator": "contains_any", "value": "crm"})
+    with pytest.raises(ValueError):
+        builder.construct_query({"xor": []})
+
+
+def test_factory_creates_the_connector(tmp_path, tiny_model_path):
+    vdb = VectorDatabaseFactory.connect({"type": "chromadb", "path": str(tmp_path), "collection_name": "c",
+                                         "embedding_model": str(tiny_model_path)})
+    assert isinstance(vdb, ChromadbConnector)
+
+    assert vdb.load_chunks([make_chunk("revenue per customer", "sales"), make_chunk("monthly sales report", "sales")]) == 2
+    assert len(vdb.search("monthly sales report", limit=2).objects) == 2
@@ -0,0 +1,31 @@
+"""Fixtures shared by the vector database unit tests."""
+
+import pytest
+from transformers import BertConfig, BertModel, BertTokenizer
+
+TINY_VOCAB = [
+    "[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", ",", ".", "!", "?",
+    "hello", "world", "this", "is", "a", "test", "another", "document", "revenue",
+    "sales", "customer", "customers", "table", "schema", "report", "monthly", "by", "per",
+]
+
+
+@pytest.fixture(scope="session")
+def tiny_model_path(tmp_path_factory):
+    """Save a tiny randomly initialised BERT model, so that tests do not need to download one."""
+    path = tmp_path_factory.mktemp("tiny_bert")
+    vocab_file = path / "vocab.txt"
+    vocab_file.write_text("\n".join(TINY_VOCAB))
+
+    BertTokenizer(str(vocab_file)).save_pretrained(path)
+    config = BertConfig(
+        vocab_size=len(TINY_VOCAB),
+        hidden_size=16,
+        num_hidden_layers=1,
+        num_attention_heads=2,
+        intermediate_size=32,
+        max_position_embeddings=64,
+    )
+    BertModel(config).save_pretrained(path)
+
+    return str(path)
@@ -0,0 +1,45 @@
+"""Fixtures for unit tests of FaissConnector with a deterministic bag-of-words vectorizer."""
+# pylint: disable=redefined-outer-name
+import zlib
+import numpy as np
+import pytest
+from unittest.mock import patch
+from analitiq.databases.vector.faiss.faiss_connector import FaissConnector
+from analitiq.databases.vector.faiss.vector_store import import_faiss
+from analitiq.loaders.documents.schemas import Chunk
+
+DIMENSION = 32
+
+INDEX_TYPES = ["numpy"] + (["flat", "hnsw", "ivf"] if import_faiss() else [])
+
+
+def bag_of_words(text: str) -> np.ndarray:
+    vector = np.zeros(DIMENSION, dtype=np.float32)
+    for word in text.lower().split():
+        vector[zlib.crc32(word.encode()) % DIMENSION] += 1
+    return vector
+
+
+def make_chunk(content: str, document_name: str = "doc", **kwargs) -> Chunk:
+    return Chunk(content=content, document_name=document_name, document_uuid=document_name,
+                 document_num_char=len(content), chunk_num_char=len(content), **kwargs)
+
+
+@pytest.fixture
+def make_vdb(tmp_path):
+    with patch("analitiq.databases.vector.faiss.faiss_connector.AnalitiqVectorizer") as vectorizer_cls:
+        vectorizer = vectorizer_cls.return_value
+        vectorizer.cache_key = "bag-of-words"
+        vectorizer.vectorize.side_effect = lambda text: bag_of_words(text).tolist()
+        vectorizer.vectorize_batch.side_effect = lambda texts: np.array([bag_of_words(t) for t in texts])
+
+        def make(**params):
+            return FaissConnector({"type": "faiss", "path": str(tmp_path), "collection_name": "test",
+                                   "tenant_name": "tenant", **params})
+
+        yield make
+
+
+@pytest.fixture(params=INDEX_TYPES)
+def vdb(request, make_vdb):
+    return make_vdb(index_type=request.param)
@@ -0,0 +1,147 @@
+# pylint: disable=redefined-outer-name
+import numpy as np
+import pytest
+from unittest.mock import patch
+from analitiq.databases.vector.faiss.faiss_connector import FaissConnector
+from analitiq.databases.vector.faiss.vector_store import drop_stores
+from analitiq.databases.vector.schema import SearchResult
+from analitiq.databases.vector.utils.incremental_sync import chunk_uuid
+from analitiq.factories.vector_database_factory import VectorDatabaseFactory
+from tests.unit.databases.vector.faiss.conftest import make_chunk
+
+
+def contents(result):
+    return [obj.properties["content"] for obj in result.objects]
+
+
+@pytest.fixture
+def loaded(vdb):
+    vdb.load_chunks([
+        make_chunk("monthly revenue by customer", "sales", document_type="sql", document_tags=["finance"]),
+        make_chunk("customers table schema", "schema", document_type="sql", document_tags=["crm", "finance"]),
+        make_chunk("hello world", "readme", document_type="text"),
+    ])
+    return vdb
+
+
+def test_vector_search(loaded):
+    result = loaded.vector_search("hello world", limit=2)
+
+    assert isinstance(result, SearchResult)
+    assert contents(result)[0] == "hello world"
+    assert result.objects[0].metadata.distance == pytest.approx(0.0, abs=1e-5)
+    assert result.objects[0].uuid == chunk_uuid("readme", "hello world")
+
+
+def test_kw_search_matches_stems(loaded):
+    result = loaded.kw_search("revenues of customers", limit=5)
+
+    assert contents(result)[0] == "monthly revenue by customer"
+    assert set(contents(result)) == {"monthly revenue by customer", "customers table schema"}
+    assert all(obj.metadata.score > 0 for obj in result.objects)
+
+
+def test_hybrid_search(loaded):
+    result = loaded.hybrid_search("monthly revenue", limit=2)
+
+    assert isinstance(result, SearchResult)
+    assert contents(result)[0] == "monthly revenue by customer"
+    assert len(result.objects) == 2
+    assert all(obj.metadata.score is not None for obj in result.objects)
+
+
+def test_reloading_a_chunk_overwrites_it(loaded):
+    loaded.load_chunks([make_chunk("hello world", "readme", document_type="markdown")])
+
+    assert len(loaded.store) == 3
+    assert loaded.filter_count({"property": "document_type", "operator": "=", "value": "markdown"}).total_count == 1
+    assert contents(loaded.vector_search("hello world", limit=1)) == ["hello world"]
+
+
+def test_filters(loaded):
+    sql = {"property": "document_type", "operator": "=", "value": "sql"}
+
+    assert contents(loaded.filter(sql)) == ["monthly revenue by customer", "customers table schema"]
+    assert loaded.filter(sql).objects[0].metadata.creation_time is not None
+    assert loaded.filter_count({"or": [sql, {"property": "content", "operator": "like", "value": "hel*"}]}).total_count == 3
+
+    groups = loaded.filter_group_count(sql, "document_tags").groups
+    assert [(g.grouped_by.value, g.total_count) for g in groups] == [("finance", 2), ("crm", 1)]
+
+    ranked = loaded.search_filter("customers table", sql)
+    assert contents(ranked) == ["customers table schema", "monthly revenue by customer"]
+    grouped = loaded.search_filter("customers table", sql, group_properties=["document_name"])
+    assert [group["document_name"] for group in grouped] == ["schema", "sales"]
+    assert loaded.search_filter("hello", {"property": "document_type", "operator": "=", "value": "pdf"}) == []
+
+
+def test_deletes(loaded):
+    deleted = loaded.filter_delete("document_name", "readme")
+    assert (deleted.matches, deleted.successful) == (1, 1)
+    assert "hello world" not in contents(loaded.vector_search("hello world", limit=3))
+
+    deleted = loaded.delete_many_on_uuids([chunk_uuid("schema", "customers table schema"), "missing"])
+    assert (deleted.matches, deleted.successful) == (1, 1)
+
+    deleted = loaded.delete_on_metadata_and([{"property": "document_type", "operator": "=", "value": "sql"},
+                                             {"property": "document_name", "operator": "=", "value": "sales"}])
+    assert deleted.successful == 1
+    assert len(loaded.store) == 0
+    assert loaded.hybrid_search("revenue").objects == []
+
+    with pytest.raises(ValueError):
+        loaded.delete_on_metadata_and([])
+
+
+def test_store_is_persisted_and_memory_mapped(loaded, make_vdb, tmp_path):
+    index_type = loaded.store_options["index_type"]
+    loaded.vector_search("hello", limit=1)  # builds the index, which is saved with the next write
+    loaded.load_chunks([make_chunk("quarterly report", "report")])
+    loaded.close()
+    drop_stores(tmp_path)
+
+    reopened = make_vdb(index_type=index_type)
+
+    assert reopened.store is not loaded.store
+    assert len(reopened.store) == 4
+    assert isinstance(reopened.store.vectors, np.memmap)
+    assert not reopened.store.vectors.flags.writeable
+    assert (reopened.store.index is not None) == (index_type != "numpy")
+    assert contents(reopened.vector_search("hello world", limit=1)) == ["hello world"]
+    assert contents(reopened.vector_search("quarterly report", limit=1)) == ["quarterly report"]
+    assert contents(reopened.kw_search("revenue", limit=1)) == ["monthly revenue by customer"]
+
+    reopened.delete_many_on_param("document_name", ["schema", "report"])
+    assert sorted(contents(reopened.vector_search("customers table schema", limit=3))) == [
+        "hello world", "monthly revenue by customer"]
+
+
+def test_connectors_of_a_tenant_share_the_store(loaded, make_vdb):
+    other = make_vdb(index_type=loaded.store_options["index_type"], tenant_name="other")
+
+    assert make_vdb().store is loaded.store
+    assert other.store is not loaded.store
+    assert other.vector_search("hello world").objects == []
+
+
+def test_delete_collection(loaded, tmp_path):
+    assert loaded.delete_collection("test")
+    assert not (tmp_path / "test").exists()
+    assert loaded.kw_search("hello").objects == []
+
+
+def test_factory_creates_the_connector(tmp_path, tiny_model_path):
+    vdb = VectorDatabaseFactory.connect({"type": "faiss", "path": str(tmp_path), "collection_name": "c",
+                                         "embedding_model": str(tiny_model_path)})
+    assert isinstance(vdb, FaissConnector)
+
+    with patch("analitiq.chunkers.parallel_chunker.ChunkerFactory") as factory:
+        factory.get_chunker.return_value.chunk.side_effect = lambda document: [
+            make_chunk(line, document.metadata.document_name) for line in document.document_content.splitlines()
+        ]
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "sales.txt").write_text("revenue per customer\nmonthly sales report")
+        _, loaded = vdb.load_dir(str(tmp_path / "docs"), "txt")
+
+    assert loaded == 2
+    assert len(vdb.search("monthly sales report", limit=2).objects) == 2
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from analitiq.databases.vector.faiss.bm25 import BM25Index
+from analitiq.databases.vector.faiss.filters import LocalQueryBuilder, like
+from analitiq.databases.vector.faiss.vector_store import LocalVectorStore
+
+
+def random_store(count: int, index_type: str, **options) -> LocalVectorStore:
+    vectors = np.random.default_rng(0).normal(size=(count, 16)).astype(np.float32)
+    store = LocalVectorStore(index_type=index_type, **options)
+    uuids = [str(i) for i in range(count)]
+    store.upsert(uuids, [{"i": i} for i in range(count)], vectors, [[] for _ in range(count)])
+    return store
+
+
+def test_numpy_scan_is_exact():
+    store = random_store(500, "numpy")
+    query = store.vectors[42] + 0.01
+
+    hits = store.vector_search(query, limit=5)
+
+    expected = np.argsort(-(store.vectors @ (query / np.linalg.norm(query))))[:5]
+    assert [row for row, _ in hits] == expected.tolist()
+    assert hits[0][1] == pytest.approx(0.0, abs=1e-3)
+    assert [row for row, _ in store.vector_search(query, limit=3, rows=np.array([7, 42, 99]))][0] == 42
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw", "ivf"])
+def test_faiss_indexes_find_the_nearest_vector(index_type):
+    pytest.importorskip("faiss")
+    store = random_store(2000, index_type, ivf_nlist=16, ivf_nprobe=16)
+
+    for row in (0, 1000, 1999):
+        assert store.vector_search(store.vectors[row], limit=1)[0][0] == row
+    assert type(store.index).__name__ == {"flat": "IndexFlatIP", "hnsw": "IndexHNSWFlat", "ivf": "IndexIVFFlat"}[index_type]
+
+
+def test_small_ivf_store_uses_a_flat_index():
+    pytest.importorskip("faiss")
+    store = random_store(20, "ivf")
+
+    store.vector_search(store.vectors[0], limit=1)
+
+    assert type(store.index).__name__ == "IndexFlatIP"
+
+
+def test_upsert_replaces_and_delete_compacts():
+    store = random_store(10, "numpy")
+    new_vector = np.ones((1, 16), dtype=np.float32)
+
+    assert store.upsert(["3", "3"], [{"i": -1}, {"i": 33}], np.vstack([-new_vector, new_vector]), [[], []]) == 1
+    assert len(store) == 10
+    assert store.properties[store.rows["3"]] == {"i": 33}
+    assert store.vector_search(new_vector, limit=1)[0][0] == store.rows["3"]
+
+    assert store.delete(["0", "3", "missing"]) == 2
+    assert len(store) == 8 and store.vectors.shape == (8, 16)
+    assert store.uuids == [str(i) for i in range(10) if i not in (0, 3)]
+    assert all(store.uuids[row] == uuid for uuid, row in store.rows.items())
+
+
+def test_bm25_ranks_rare_and_frequent_terms():
+    index = BM25Index()
+    index.add("a", ["revenu", "revenu", "month"])
+    index.add("b", ["revenu", "custom", "tabl", "schema"])
+    index.add("c", ["month", "report"])
+
+    assert [doc for doc, _ in index.search(["revenu"], limit=3)] == ["a", "b"]
+    assert [doc for doc, _ in index.search(["report", "month"], limit=1)] == ["c"]
+    assert index.search(["revenu"], limit=3, allowed=lambda doc: doc != "a")[0][0] == "b"
+
+    index.add("a", ["report"])
+    assert index.search(["revenu"], limit=3)[0][0] == "b"
+    assert BM25Index.from_dict(index.to_dict()).search(["report"], 5) == index.search(["report"], 5)
+    assert index.remove("c") and not index.remove("c")
+    assert "month" not in index.postings
+
+
+def test_local_query_builder():
+    properties = {"document_name": "Sales_by_month.sql", "document_tags": ["finance", "crm"], "size": 10}
+    builder = LocalQueryBuilder()
+
+    def matches(expression):
+        return builder.construct_query(expression)(properties)
+
+    assert matches(None)
+    assert matches({"property": "document_name", "operator": "like", "value": "sales*"})
+    assert matches({"property": "document_name", "operator": "like", "value": "mont?"})
+    assert not matches({"property": "document_name", "operator": "like", "value": "*report*"})
+    assert matches({"property": "document_tags", "operator": "=", "value": "crm"})
+    assert matches({"property": "document_tags", "operator": "contains_all", "value": ["crm", "finance"]})
+    assert not matches({"property": "document_tags", "operator": "contains_any", "value": ["hr"]})
+    assert matches({"and": [{"property": "size", "operator": ">", "value": 5},
+                            {"or": [{"property": "size", "operator": "<", "value": 0},
+                                    {"property": "missing", "operator": "!=", "value": 1}]}]})
+    assert not matches({"property": "document_name", "operator": ">", "value": 5})
+
+    with pytest.raises(ValueError):
+        matches({"property": "size", "operator": "~", "value": 1})
+    with pytest.raises(ValueError):
+        matches({"property": "document_tags", "operator": "contains_any", "value": "crm"})
+    with pytest.raises(ValueError):
+        matches({"xor": []})
+    assert like("Hello", "HEL*")
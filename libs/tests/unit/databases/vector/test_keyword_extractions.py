@@ -1,4 +1,11 @@
-from analitiq.utils.keyword_extractions import extract_keywords
+import os
+import subprocess
+import sys
+import pytest
+import analitiq
+from analitiq.utils import keyword_extractions
+from analitiq.utils.keyword_extractions import extract_keywords, KeywordExtractor
+from analitiq.utils.stopwords_en import ENGLISH_STOP_WORDS
 
 
 def test_extract_keywords():
@@ -41,3 +48,55 @@ def test_extract_keywords_with_special_characters():
     text = "This is a test sentence with special characters @#$."
     expected_output = "test sentenc special charact"
     assert extract_keywords(text) == expected_output
+
+
+STOP_WORDS = {"this", "is", "a", "for", "with", "by", "and", "the"}
+
+
+def test_keyword_extractor_matches_extract_keywords_format():
+    """Test if KeywordExtractor stems, drops stop words and keeps the order of first appearance."""
+    extractor = KeywordExtractor(stop_words=STOP_WORDS)
+    assert extractor.extract("This is a test sentence for keyword extraction.") == "test sentenc keyword extract"
+    assert extractor.extract("Testing tests, tested_test!") == "test"
+    assert extractor.extract("") == ""
+
+
+def test_keyword_extractor_regex_tokenizer():
+    """Test if the regex tokenizer keeps alphanumeric runs and splits on underscores and punctuation."""
+    extractor = KeywordExtractor(stop_words=STOP_WORDS)
+    assert extractor.tokenize("Revenue_by month, 2024 (@#$) état-civil") == [
+        "revenue", "by", "month", "2024", "état", "civil"
+    ]
+
+
+def test_keyword_extractor_extract_many_and_stem_cache():
+    """Test if extract_many returns one result per text and memoizes stems."""
+    extractor = KeywordExtractor(stop_words=STOP_WORDS)
+    texts = ["Revenue by month", "Monthly revenue", "Revenue by month"]
+
+    assert extractor.extract_many(texts) == ["revenu month", "monthli revenu", "revenu month"]
+    assert extractor.cache_info().hits >= 3
+
+
+def test_keyword_extractor_invalid_tokenizer():
+    with pytest.raises(ValueError):
+        KeywordExtractor(stop_words=STOP_WORDS, tokenizer="whitespace")
+
+
+def test_import_does_not_load_nltk():
+    """Importing the module must not import NLTK or touch the network."""
+    code = "import sys, analitiq.utils.keyword_extractions; assert 'nltk' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(analitiq.__path__[0]))
+
+
+def test_load_stop_words_falls_back_to_bundled_list(monkeypatch):
+    monkeypatch.setattr(keyword_extractions, "is_resource_downloaded", lambda resource: False)
+    assert keyword_extractions.load_stop_words() is ENGLISH_STOP_WORDS
+    assert {"the", "is", "wouldn't"} <= ENGLISH_STOP_WORDS
+
+
+def test_nltk_tokenizer_without_data_and_downloads_disabled(monkeypatch):
+    monkeypatch.setattr(keyword_extractions, "is_resource_downloaded", lambda resource: False)
+    monkeypatch.setattr(keyword_extractions, "ALLOW_DOWNLOAD", False)
+    with pytest.raises(LookupError, match="tokenizer='regex'"):
+        KeywordExtractor(tokenizer="nltk")
@@ -0,0 +1,81 @@
+import numpy as np
+from unittest.mock import patch
+from analitiq.databases.vector.utils.embedding_cache import EmbeddingCache
+from analitiq.databases.vector.utils.analitiq_vectorizer import AnalitiqVectorizer
+from analitiq.databases.vector.utils.model_registry import ModelRegistry
+
+
+def test_memory_tier_hits_and_misses():
+    cache = EmbeddingCache(max_items=10)
+    cache.put_many("model", ["a", "b"], np.array([[1, 2], [3, 4]], dtype=np.float32))
+
+    found = cache.get_many("model", ["a", "b", "c"])
+
+    assert np.array_equal(found[0], [1, 2])
+    assert np.array_equal(found[1], [3, 4])
+    assert found[2] is None
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_keys_include_model_name():
+    cache = EmbeddingCache()
+    cache.put("model_a", "text", np.ones(2))
+
+    assert cache.get("model_b", "text") is None
+    assert cache.get("model_a", "text") is not None
+
+
+def test_memory_tier_is_bounded_lru():
+    cache = EmbeddingCache(max_items=2)
+    cache.put("model", "a", np.zeros(2))
+    cache.put("model", "b", np.zeros(2))
+    cache.get("model", "a")  # "b" is now least recently used
+    cache.put("model", "c", np.zeros(2))
+
+    assert cache.stats()["memory_items"] == 2
+    assert cache.get("model", "b") is None
+    assert cache.get("model", "a") is not None
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    db_path = tmp_path / "embeddings.sqlite"
+    cache = EmbeddingCache(max_items=10, db_path=db_path)
+    cache.put("model", "text", np.array([0.5, 0.25], dtype=np.float32))
+    cache.close()
+
+    reopened = EmbeddingCache(max_items=10, db_path=db_path)
+    vector = reopened.get("model", "text")
+
+    assert np.array_equal(vector, [0.5, 0.25])
+    assert reopened.stats()["disk_hits"] == 1
+
+
+def test_vectorizer_skips_cached_texts(tiny_model_path):
+    cache = EmbeddingCache()
+    vcz = AnalitiqVectorizer(tiny_model_path, cache=cache)
+    texts = ["hello world", "revenue report", "hello world"]
+
+    first = vcz.vectorize_batch(texts)
+    with patch.object(vcz, "_embed", wraps=vcz._embed) as embed:
+        second = vcz.vectorize_batch(texts)
+
+    embed.assert_not_called()
+    assert np.array_equal(first, second)
+    assert np.array_equal(first[0], first[2])
+    assert cache.stats()["memory_items"] == 2
+
+
+def test_full_cache_hit_does_not_load_the_model(tiny_model_path):
+    cache = EmbeddingCache()
+    AnalitiqVectorizer(tiny_model_path, cache=cache, registry=ModelRegistry()).vectorize_batch(["hello", "revenue"])
+
+    registry = ModelRegistry()  # a cold start: nothing loaded, the cache is warm
+    vcz = AnalitiqVectorizer(tiny_model_path, cache=cache, registry=registry)
+    with patch.object(registry, "_load", wraps=registry._load) as load:
+        vectors = vcz.vectorize_batch(["revenue", "hello", "revenue"])
+
+    load.assert_not_called()
+    assert not registry.is_loaded(tiny_model_path)
+    assert vectors.shape == (3, 16)
+    assert np.array_equal(vectors[0], vectors[2])
@@ -0,0 +1,106 @@
+import uuid
+import numpy as np
+import pytest
+from weaviate.collections.classes.internal import Object, MetadataReturn, QueryReturn
+from analitiq.databases.vector.schema import SearchMetadata, SearchObject, SearchResult
+from analitiq.databases.vector.utils.fusion import (
+    ResultFusion,
+    reciprocal_rank_fusion,
+    relative_score_fusion,
+)
+
+
+def make_object(name: str, score: float = None, distance: float = None) -> Object:
+    return Object(
+        uuid=uuid.uuid5(uuid.NAMESPACE_OID, name),
+        metadata=MetadataReturn(score=score, distance=distance),
+        properties={"content": name},
+        references=None,
+        vector={},
+        collection="Test",
+    )
+
+
+def names(objects):
+    return [o.properties["content"] for o in objects]
+
+
+def test_rrf_ranks_objects_found_by_both_legs_first():
+    kw = QueryReturn(objects=[make_object("a"), make_object("b")])
+    vector = QueryReturn(objects=[make_object("c"), make_object("b")])
+
+    objects, scores = reciprocal_rank_fusion([kw, vector], limit=3, weights=(0.5, 0.5), k=60)
+
+    assert names(objects) == ["b", "a", "c"]
+    assert scores[0] == pytest.approx(0.5 / 62 + 0.5 / 62)
+
+
+def test_rrf_weights_and_k_are_applied():
+    kw = QueryReturn(objects=[make_object("a")])
+    vector = QueryReturn(objects=[make_object("b")])
+
+    objects, _ = reciprocal_rank_fusion([kw, vector], limit=2, weights=(0.9, 0.1), k=1)
+
+    assert names(objects) == ["a", "b"]
+
+
+def test_relative_score_fusion_keeps_score_gaps():
+    kw = QueryReturn(objects=[make_object("a", score=10.0), make_object("b", score=1.0)])
+    vector = QueryReturn(objects=[make_object("c", distance=0.20), make_object("b", distance=0.21)])
+
+    objects, scores = relative_score_fusion([kw, vector], limit=3, weights=(0.5, 0.5))
+
+    # b is second in both legs but far behind a in the keyword leg
+    assert names(objects) == ["a", "c", "b"]
+    assert scores == pytest.approx([0.5, 0.5, 0.0])
+
+
+@pytest.mark.parametrize("fusion", [reciprocal_rank_fusion, relative_score_fusion])
+def test_numpy_and_python_implementations_agree(fusion):
+    rng = np.random.default_rng(0)
+    pool = [f"doc{i}" for i in range(500)]
+    kw = QueryReturn(objects=[make_object(n, score=float(s)) for n, s in
+                              zip(rng.choice(pool, 300, replace=False), np.sort(rng.random(300))[::-1])])
+    vector = QueryReturn(objects=[make_object(n, distance=float(d)) for n, d in
+                                  zip(rng.choice(pool, 300, replace=False), np.sort(rng.random(300)))])
+
+    python_objects, python_scores = fusion([kw, vector], limit=50, weights=(0.3, 0.7), vectorized=False)
+    numpy_objects, numpy_scores = fusion([kw, vector], limit=50, weights=(0.3, 0.7), vectorized=True)
+
+    assert names(numpy_objects) == names(python_objects)
+    assert numpy_scores == pytest.approx(python_scores)
+
+
+def test_fuse_sets_scores_and_handles_empty_keyword_leg():
+    vector = QueryReturn(objects=[make_object("a", distance=0.1), make_object("b", distance=0.2)])
+
+    result = ResultFusion().fuse([QueryReturn(objects=[]), vector], limit=5)
+
+    assert names(result.objects) == ["a", "b"]
+    assert all(o.metadata.score is not None for o in result.objects)
+    assert result.objects[0].metadata.distance == 0.1
+    assert vector.objects[0].metadata.score is None  # the leg results are not modified
+
+
+def test_from_params():
+    fusion = ResultFusion.from_params({"fusion": "relative_score", "fusion_weights": [0.5, 0.5], "fusion_overfetch": 4})
+
+    assert fusion.method == "relative_score"
+    assert fusion.weights == (0.5, 0.5)
+    assert fusion.fetch_limit(3) == 12
+    assert ResultFusion.from_params({"fusion": fusion}) is fusion
+
+    with pytest.raises(ValueError):
+        ResultFusion(method="unknown")
+
+
+def test_fuse_keeps_the_result_type_of_the_connector():
+    kw = SearchResult(objects=[SearchObject(uuid="a", properties={"content": "a"}, metadata=SearchMetadata(score=2.0))])
+    vector = SearchResult(objects=[SearchObject(uuid="b", properties={"content": "b"},
+                                                metadata=SearchMetadata(distance=0.1))])
+
+    result = ResultFusion().fuse([kw, vector], limit=5)
+
+    assert isinstance(result, SearchResult)
+    assert names(result.objects) == ["b", "a"]
+    assert result.objects[0].metadata.distance == 0.1
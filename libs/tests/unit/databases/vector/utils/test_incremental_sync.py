@@ -0,0 +1,94 @@
+import os
+from analitiq.databases.vector.utils.incremental_sync import (
+    IncrementalSync,
+    SyncManifest,
+    chunk_uuid,
+    document_uuid_for_path,
+    number_identical_chunks,
+)
+from analitiq.loaders.documents.schemas import Chunk
+
+
+def sync_files(manifest_path, files, chunks_per_file):
+    """Run one sync over files and return (loaded paths, stale chunk ids)."""
+    sync = IncrementalSync(SyncManifest(manifest_path))
+    loaded = []
+    for path in files:
+        document_uuid = sync.check(path)
+        if document_uuid is not None:
+            loaded.append(path.name)
+            sync.add_chunks(document_uuid, [chunk_uuid(document_uuid, c) for c in chunks_per_file(path)])
+    stale = sync.finish()
+    sync.save()
+    return loaded, stale
+
+
+def test_ids_are_deterministic(tmp_path):
+    path = tmp_path / "a.txt"
+
+    assert document_uuid_for_path(path) == document_uuid_for_path(str(path))
+    assert chunk_uuid("doc", "content") == chunk_uuid("doc", "content")
+    assert chunk_uuid("doc", "content") != chunk_uuid("other_doc", "content")
+    assert chunk_uuid("doc", "content", 0) == chunk_uuid("doc", "content")
+    assert chunk_uuid("doc", "content", 1) != chunk_uuid("doc", "content")
+
+
+def test_identical_chunks_of_a_document_are_numbered():
+    chunks = [
+        Chunk(content=content, document_uuid=document_uuid, document_name="doc",
+              document_num_char=9, chunk_num_char=len(content))
+        for document_uuid, content in [("a", "x"), ("a", "y"), ("a", "x"), ("b", "x"), ("a", "x")]
+    ]
+
+    number_identical_chunks(chunks)
+
+    assert [chunk.occurrence for chunk in chunks] == [0, 0, 1, 0, 2]
+    assert "occurrence" not in chunks[2].model_dump()
+
+
+def test_unchanged_files_are_skipped(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    a.write_text("one two")
+    b.write_text("three")
+    words = lambda path: path.read_text().split()
+
+    assert sync_files(manifest, [a, b], words) == (["a.txt", "b.txt"], [])
+    assert sync_files(manifest, [a, b], words) == ([], [])
+
+    # a new mtime with the same content is not a change
+    os.utime(a, (1, 1))
+    assert sync_files(manifest, [a, b], words) == ([], [])
+
+
+def test_changed_and_deleted_files_produce_stale_chunks(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    a.write_text("one two")
+    b.write_text("three")
+    words = lambda path: path.read_text().split()
+    sync_files(manifest, [a, b], words)
+
+    a.write_text("one four")
+    os.utime(a, (2, 2))
+    loaded, stale = sync_files(manifest, [a], words)
+
+    a_uuid, b_uuid = document_uuid_for_path(a), document_uuid_for_path(b)
+    assert loaded == ["a.txt"]
+    assert sorted(stale) == sorted([chunk_uuid(a_uuid, "two"), chunk_uuid(b_uuid, "three")])
+    assert str(b.resolve()) not in SyncManifest(manifest).entries
+
+
+def test_discarded_files_are_loaded_again(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    a = tmp_path / "a.txt"
+    a.write_text("one two")
+
+    sync = IncrementalSync(SyncManifest(manifest))
+    document_uuid = sync.check(a)
+    sync.add_chunks(document_uuid, [chunk_uuid(document_uuid, "one"), chunk_uuid(document_uuid, "two")])
+    sync.discard(document_uuid)  # e.g. a chunk failed to be written
+    assert sync.finish() == []
+    sync.save()
+
+    assert sync_files(manifest, [a], lambda path: path.read_text().split()) == (["a.txt"], [])
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from analitiq.databases.vector.utils.analitiq_vectorizer import AnalitiqVectorizer
+from analitiq.databases.vector.utils.inference_backends import InferenceBackend, mean_pool
+from analitiq.databases.vector.utils.model_registry import ModelRegistry
+
+TEXTS = ["hello world", "sales by customer per monthly report", "revenue", "this is another test document"]
+
+# The int8 and ONNX backends use APIs that torch 2.9+ deprecates, see InferenceBackend
+QUANTIZATION_IS_DEPRECATED = "ignore:torch.ao.quantization is deprecated:DeprecationWarning"
+QUANTIZED_TENSORS_ARE_DEPRECATED = "ignore:.*quantized tensor creation functions:UserWarning"
+TORCHSCRIPT_EXPORT_IS_DEPRECATED = "ignore:You are using the legacy TorchScript-based ONNX export:DeprecationWarning"
+TORCHSCRIPT_EXPORT_LOGGING_IS_DEPRECATED = "ignore:The feature will be removed:DeprecationWarning"
+
+
+def cosine(a, b):
+    a = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b = b / np.linalg.norm(b, axis=1, keepdims=True)
+    return (a * b).sum(axis=1)
+
+
+def reference_vectors(tiny_model_path, registry):
+    return AnalitiqVectorizer(tiny_model_path, registry=registry).vectorize_batch(TEXTS)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown inference backend"):
+        AnalitiqVectorizer("model", backend="tensorrt")
+
+
+def test_mean_pool_ignores_padding():
+    token_states = np.array([[[1.0, 2.0], [3.0, 4.0], [100.0, 100.0]]], dtype=np.float32)
+    mask = np.array([[1, 1, 0]])
+
+    assert np.allclose(mean_pool(token_states, mask, normalize=False), [[2.0, 3.0]])
+    assert np.allclose(np.linalg.norm(mean_pool(token_states, mask, normalize=True)), 1.0)
+
+
+def test_backends_must_implement_embed():
+    class IncompleteBackend(InferenceBackend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()
+
+
+@pytest.mark.filterwarnings(QUANTIZATION_IS_DEPRECATED)
+@pytest.mark.filterwarnings(QUANTIZED_TENSORS_ARE_DEPRECATED)
+def test_quantized_backend_is_close_to_reference(tiny_model_path):
+    registry = ModelRegistry()
+    reference = reference_vectors(tiny_model_path, registry)
+    vcz = AnalitiqVectorizer(tiny_model_path, registry=registry, backend="torch_int8")
+
+    vectors = vcz.vectorize_batch(TEXTS)
+
+    assert vectors.shape == reference.shape
+    assert cosine(vectors, reference).min() > 0.95
+    # the shared model is not quantized in place
+    assert type(registry.get(tiny_model_path).model.encoder.layer[0].output.dense).__name__ == "Linear"
+
+
+@pytest.mark.filterwarnings(TORCHSCRIPT_EXPORT_IS_DEPRECATED)
+@pytest.mark.filterwarnings(TORCHSCRIPT_EXPORT_LOGGING_IS_DEPRECATED)
+def test_onnx_backend_matches_reference(tiny_model_path, tmp_path):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("onnx")
+    registry = ModelRegistry()
+    reference = reference_vectors(tiny_model_path, registry)
+    vcz = AnalitiqVectorizer(tiny_model_path, registry=registry, backend="onnx",
+                             backend_options={"onnx_dir": tmp_path})
+
+    vectors = vcz.vectorize_batch(TEXTS)
+
+    assert np.allclose(vectors, reference, atol=1e-4)
+    assert list(tmp_path.glob("*/model.onnx"))
+
+
+def test_backends_are_cached_separately(tiny_model_path):
+    reference = AnalitiqVectorizer(tiny_model_path)
+    quantized = AnalitiqVectorizer(tiny_model_path, backend="torch_int8")
+
+    assert reference.cache_key == f"{tiny_model_path}:raw"
+    assert quantized.cache_key == f"{tiny_model_path}:raw:torch_int8"
@@ -0,0 +1,94 @@
+import threading
+import pytest
+from analitiq.databases.vector.utils.ingestion_pipeline import IngestionPipeline
+from analitiq.loaders.documents.schemas import Chunk, DocumentSchema, DocumentMetadata
+
+
+def load_document(name: str):
+    if name.startswith("empty"):
+        return None
+    return DocumentSchema(document_content=f"{name} a b c", metadata=DocumentMetadata(document_name=name))
+
+
+def chunk_document(document: DocumentSchema):
+    return [
+        Chunk(content=word, document_name=document.metadata.document_name, document_uuid=document.uuid,
+              document_num_char=len(document.document_content), chunk_num_char=len(word))
+        for word in document.document_content.split()
+    ]
+
+
+def embed_texts(texts):
+    return [[float(len(text))] for text in texts]
+
+
+class Writer:
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, chunks, vectors):
+        assert len(chunks) == len(vectors)
+        with self.lock:
+            self.batches.append(list(chunks))
+        return len(chunks)
+
+
+def test_all_chunks_are_written_in_batches():
+    writer = Writer()
+    progress = []
+    pipeline = IngestionPipeline(load_document, chunk_document, embed_texts, writer,
+                                 read_workers=3, chunk_workers=2, batch_size=10,
+                                 progress_callback=lambda stats: progress.append(stats.written))
+
+    stats = pipeline.run(f"doc{i}" if i % 5 else f"empty{i}" for i in range(100))
+
+    written = [chunk for batch in writer.batches for chunk in batch]
+    assert stats.documents == 80
+    assert stats.chunks == stats.written == len(written) == 320
+    assert sorted(c.document_name for c in written if c.content == "a") == sorted(
+        f"doc{i}" for i in range(100) if i % 5
+    )
+    assert all(len(batch) <= 10 for batch in writer.batches)
+    assert progress == sorted(progress) and progress[-1] == 320
+    assert stats.stages["embed"].items == 320
+
+
+def test_sources_are_consumed_lazily():
+    consumed = []
+    release = threading.Event()
+
+    def sources():
+        for i in range(1000):
+            consumed.append(i)
+            yield f"doc{i}"
+
+    def slow_writer(chunks, vectors):
+        release.wait(timeout=5)
+        return len(chunks)
+
+    pipeline = IngestionPipeline(load_document, chunk_document, embed_texts, slow_writer,
+                                 read_workers=1, chunk_workers=1, batch_size=4, queue_size=8)
+    thread = threading.Thread(target=pipeline.run, args=(sources(),))
+    thread.start()
+    threading.Event().wait(0.5)
+
+    # the writer is blocked, so the bounded queues stop the reader long before the end of the sources
+    assert len(consumed) < 50
+
+    release.set()
+    thread.join(timeout=30)
+    assert len(consumed) == 1000
+    assert pipeline.stats.written == 4000
+
+
+def test_stage_error_is_raised():
+    def failing_chunker(document):
+        if document.metadata.document_name == "doc7":
+            raise ValueError("cannot chunk doc7")
+        return chunk_document(document)
+
+    pipeline = IngestionPipeline(load_document, failing_chunker, embed_texts, Writer(), batch_size=4)
+
+    with pytest.raises(ValueError, match="doc7"):
+        pipeline.run(f"doc{i}" for i in range(50))
@@ -0,0 +1,51 @@
+import threading
+from unittest.mock import patch
+import numpy as np
+from analitiq.databases.vector.utils.model_registry import ModelRegistry
+from analitiq.databases.vector.utils.analitiq_vectorizer import AnalitiqVectorizer
+
+
+def test_model_is_loaded_once_and_shared(tiny_model_path):
+    registry = ModelRegistry()
+    first = AnalitiqVectorizer(tiny_model_path, registry=registry)
+    second = AnalitiqVectorizer(tiny_model_path, normalize_embeddings=True, registry=registry)
+
+    assert not registry.is_loaded(tiny_model_path)  # nothing is loaded before the first embedding
+
+    first.vectorize_batch(["hello world"])
+    second.vectorize_batch(["revenue report"])
+
+    assert first.model is second.model
+    assert first.tokenizer is second.tokenizer
+    assert registry.memory_usage()[tiny_model_path] > 0
+
+
+def test_concurrent_first_use_loads_once(tiny_model_path):
+    registry = ModelRegistry()
+    vectorizers = [AnalitiqVectorizer(tiny_model_path, registry=registry) for _ in range(4)]
+    results = [None] * len(vectorizers)
+
+    def embed(i):
+        results[i] = vectorizers[i].vectorize_batch(["sales by customer", "monthly report"])
+
+    with patch.object(ModelRegistry, "_load", wraps=ModelRegistry._load) as load:
+        threads = [threading.Thread(target=embed, args=(i,)) for i in range(len(vectorizers))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert load.call_count == 1
+    for result in results[1:]:
+        assert np.allclose(result, results[0])
+
+
+def test_unload_keeps_model_of_existing_vectorizers(tiny_model_path):
+    registry = ModelRegistry()
+    vcz = AnalitiqVectorizer(tiny_model_path, registry=registry)
+    vcz.load_model()
+
+    registry.unload(tiny_model_path)
+
+    assert registry.memory_usage() == {}
+    assert vcz.vectorize_batch(["hello"]).shape == (1, vcz.model.config.hidden_size)
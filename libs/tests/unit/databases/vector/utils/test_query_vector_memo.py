@@ -0,0 +1,42 @@
+from unittest.mock import MagicMock
+from analitiq.databases.vector.utils.query_vector_memo import query_vector_scope, memoized_query_vector
+
+
+def make_vectorizer():
+    vectorizer = MagicMock()
+    vectorizer.cache_key = "model:raw"
+    vectorizer.vectorize.side_effect = lambda query: [float(len(query))]
+    return vectorizer
+
+
+def test_query_is_embedded_once_within_scope():
+    vectorizer = make_vectorizer()
+
+    with query_vector_scope():
+        first = memoized_query_vector(vectorizer, "revenue by month")
+        second = memoized_query_vector(vectorizer, "revenue by month")
+
+    assert first == second
+    assert vectorizer.vectorize.call_count == 1
+
+
+def test_nested_scope_shares_the_memo():
+    vectorizer = make_vectorizer()
+
+    with query_vector_scope():
+        memoized_query_vector(vectorizer, "query")
+        with query_vector_scope():
+            memoized_query_vector(vectorizer, "query")
+
+    assert vectorizer.vectorize.call_count == 1
+
+
+def test_no_memo_outside_scope():
+    vectorizer = make_vectorizer()
+
+    with query_vector_scope():
+        memoized_query_vector(vectorizer, "query")
+    memoized_query_vector(vectorizer, "query")
+    memoized_query_vector(vectorizer, "query")
+
+    assert vectorizer.vectorize.call_count == 3
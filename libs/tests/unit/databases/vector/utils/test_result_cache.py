@@ -0,0 +1,85 @@
+import pytest
+from analitiq.databases.vector.utils.result_cache import ResultKey, SearchResultCache, generation, invalidate
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_keys_normalize_the_query_and_canonicalize_options():
+    scope = ("docs", "t")
+    key = ResultKey.of(scope, "filter", "  Revenue  BY month", filter_expression={"b": 1, "a": [2]})
+
+    assert key == ResultKey.of(scope, "filter", "revenue by month", filter_expression={"a": [2], "b": 1})
+    assert key != ResultKey.of(scope, "filter", "revenue by month", filter_expression={"a": [3], "b": 1})
+    assert key != ResultKey.of(("docs", "other"), "filter", "revenue by month", filter_expression={"a": [2], "b": 1})
+
+
+def test_ttl_and_lru_eviction():
+    clock = Clock()
+    cache = SearchResultCache(max_items=2, ttl=10, clock=clock)
+    keys = [ResultKey.of(("c", "ttl"), "kw", f"q{i}", 3) for i in range(3)]
+
+    cache.put(keys[0], "r0")
+    cache.put(keys[1], "r1")
+    assert cache.get(keys[0]) == "r0"  # keys[1] is now the least recently used
+    cache.put(keys[2], "r2")
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) == "r2"
+    clock.now = 11
+    assert cache.get(keys[0]) is None and len(cache) == 1
+    assert cache.stats() == {"hits": 2, "semantic_hits": 0, "misses": 2, "items": 1}
+
+
+def test_writes_invalidate_the_tenant():
+    cache = SearchResultCache()
+    key = ResultKey.of(("c", "invalidated"), "kw", "q", 3)
+    other = ResultKey.of(("c", "untouched"), "kw", "q", 3)
+    cache.put(key, "r")
+    cache.put(other, "r")
+
+    invalidate("c", "invalidated")
+    assert cache.get(key) is None
+    assert cache.get(other) == "r"
+
+    stale = generation(other.scope)
+    invalidate("c")  # every tenant of the collection
+    assert cache.get(other) is None
+    cache.put(other, "computed before the write", write_generation=stale)
+    assert cache.get(other) is None
+
+
+def test_semantic_hits_above_the_threshold():
+    cache = SearchResultCache(semantic_threshold=0.9)
+    scope = ("c", "semantic")
+    cache.put(ResultKey.of(scope, "vector", "monthly revenue", 3), "r", query_vector=[1.0, 0.0])
+    calls = []
+
+    def vector():
+        calls.append(1)
+        return [0.99, 0.1]
+
+    assert cache.get(ResultKey.of(scope, "vector", "revenue per month", 3), vector) == "r"
+    assert cache.get(ResultKey.of(scope, "vector", "revenue per month", 5), [1.0, 0.0]) is None  # other limit
+    assert cache.get(ResultKey.of(scope, "vector", "customers", 3), [0.0, 1.0]) is None
+    assert cache.get(ResultKey.of(scope, "vector", "monthly revenue", 3), vector) == "r"
+    assert len(calls) == 1  # the vector is only computed on a miss
+    assert cache.stats()["semantic_hits"] == 1
+
+
+@pytest.mark.parametrize("params, expected", [({}, None), ({"result_cache": False}, None)])
+def test_disabled_by_default(params, expected):
+    assert SearchResultCache.from_params(params) is expected
+
+
+def test_from_params():
+    shared = SearchResultCache()
+    assert SearchResultCache.from_params({"result_cache": shared}) is shared
+
+    cache = SearchResultCache.from_params({"result_cache": True, "result_cache_ttl": 5, "semantic_cache_threshold": 0.95})
+    assert (cache.ttl, cache.semantic_threshold) == (5, 0.95)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from analitiq.databases.vector.utils.similarity_index import SimilarityIndex, top_k
+
+
+def random_vectors(count: int, dimension: int = 8, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(count, dimension))
+
+
+def test_top_k_matches_a_full_sort():
+    scores = np.random.default_rng(1).normal(size=(4, 100))
+
+    top = top_k(scores, 5)
+
+    assert top.tolist() == np.argsort(-scores, axis=1)[:, :5].tolist()
+    assert top_k(scores, 500).shape == (4, 100)
+    assert top_k(np.array([[1.0, 2.0, 2.0, 0.0]]), 2).tolist() == [[1, 2]]  # ties keep index order
+
+
+def test_search_batch_is_one_search_per_query():
+    index = SimilarityIndex()
+    index.add(random_vectors(200))
+    queries = random_vectors(3, seed=2)
+
+    rows, scores = index.search_batch(queries, k=4)
+
+    assert rows.shape == scores.shape == (3, 4)
+    for query, query_rows, query_scores in zip(queries, rows, scores):
+        single_rows, single_scores = index.search(query, k=4)
+        assert query_rows.tolist() == single_rows.tolist()
+        assert query_scores == pytest.approx(single_scores)
+    assert index.vectors.dtype == np.float32 and index.vectors.flags.c_contiguous
+    assert np.linalg.norm(index.vectors, axis=1) == pytest.approx(np.ones(200), rel=1e-5)
+
+
+def test_append_grows_capacity_geometrically():
+    index = SimilarityIndex(capacity=4)
+    vectors = random_vectors(100)
+    capacities = set()
+
+    for start in range(0, 100, 10):
+        assert index.add(vectors[start:start + 10]).tolist() == list(range(start, start + 10))
+        capacities.add(index.capacity)
+
+    assert len(index) == 100
+    assert sorted(capacities) == [10, 20, 40, 80, 160]
+    assert index.search(vectors[57], k=1)[0].tolist() == [57]
+    with pytest.raises(ValueError):
+        index.add(np.ones((1, 3)))
+
+
+def test_update_delete_and_row_subsets():
+    vectors = random_vectors(10)
+    index = SimilarityIndex.from_vectors(vectors)
+
+    index.update([2], vectors[7])
+    assert index.search(vectors[7], k=2)[0].tolist() in ([2, 7], [7, 2])
+
+    index.delete([0, 7])
+    assert len(index) == 8
+    assert index.search(vectors[9], k=1)[0].tolist() == [7]
+
+    rows, _ = index.search(vectors[9], k=3, rows=np.array([1, 3]))
+    assert sorted(rows.tolist()) == [1, 3]
+    assert index.search(vectors[9], k=3, rows=np.array([], dtype=np.int64))[0].size == 0
+
+
+def test_read_only_matrix_is_copied_on_write():
+    vectors = np.ascontiguousarray(SimilarityIndex.from_vectors(random_vectors(5)).vectors)
+    vectors.flags.writeable = False
+    index = SimilarityIndex.from_vectors(vectors, normalized=True)
+    assert index.vectors.base is vectors or index.vectors is vectors or np.shares_memory(index.vectors, vectors)
+
+    index.add(random_vectors(1, seed=3))
+
+    assert len(index) == 6
+    assert not np.shares_memory(index.vectors, vectors)
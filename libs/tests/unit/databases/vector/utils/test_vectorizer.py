@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from analitiq.databases.vector.utils import analitiq_vectorizer as vectorizer
 
@@ -52,3 +53,66 @@ def test_search():
     results = vcz.search(query)
     assert len(results) == 3
     assert all(isinstance(result, tuple) and len(result) == 2 for result in results)
+
+
+def test_vectorize_batch(tiny_model_path):
+    """Test that batched vectors keep the input order and shape."""
+    vcz = vectorizer.AnalitiqVectorizer(tiny_model_path)
+    texts = ["hello world", "this is another test document", "revenue", "sales by customer"]
+
+    vectors = vcz.vectorize_batch(texts, batch_size=2)
+
+    assert vectors.dtype == np.float32
+    assert vectors.shape == (len(texts), vcz.model.config.hidden_size)
+    assert vectors.flags["C_CONTIGUOUS"]
+
+    # without padding every row must match the vector of the same text on its own
+    vectors = vcz.vectorize_batch(texts, batch_size=1)
+    for text, vector in zip(texts, vectors):
+        assert np.allclose(vector, vcz.vectorize(text, flatten=False)[0], atol=1e-5)
+
+
+def test_vectorize_batch_empty(tiny_model_path):
+    """Test that an empty input returns an empty matrix."""
+    vcz = vectorizer.AnalitiqVectorizer(tiny_model_path)
+
+    vectors = vcz.vectorize_batch([])
+
+    assert vectors.shape == (0, vcz.model.config.hidden_size)
+
+
+def test_vectorize_batch_ignores_padding(tiny_model_path):
+    """Test that padding added by batching does not change the vectors."""
+    vcz = vectorizer.AnalitiqVectorizer(tiny_model_path)
+    texts = ["hello world", "this is another test document", "revenue", "sales by customer"]
+
+    vectors = vcz.vectorize_batch(texts, batch_size=len(texts))
+
+    for text, vector in zip(texts, vectors):
+        assert np.allclose(vector, vcz.vectorize(text, flatten=False)[0], atol=1e-5)
+
+
+def test_normalized_embeddings(tiny_model_path):
+    """Test that normalized vectors have unit length."""
+    vcz = vectorizer.AnalitiqVectorizer(tiny_model_path, normalize_embeddings=True)
+
+    vectors = vcz.vectorize_batch(["hello world", "monthly revenue report per customer"])
+
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1, atol=1e-5)
+
+
+def test_search_many(tiny_model_path):
+    """Batched search returns the same results as one search per query, and added texts are searched."""
+    vcz = vectorizer.AnalitiqVectorizer(tiny_model_path)
+    vcz.create_embeddings(["hello world", "revenue", "sales by customer"])
+    vcz.add_texts(["monthly report"])
+
+    results = vcz.search_many(["revenue", "monthly report"], k=2)
+
+    for query, result in zip(["revenue", "monthly report"], results):
+        single = vcz.search(query, k=2)
+        assert [text for text, _ in result] == [text for text, _ in single]
+        assert [score for _, score in result] == pytest.approx([score for _, score in single], abs=1e-5)
+    assert results[0][0][0] == "revenue"
+    assert results[1][0] == ("monthly report", pytest.approx(1.0, abs=1e-5))
+    assert vcz.embeddings.shape == (4, vcz.model.config.hidden_size)
@@ -0,0 +1,33 @@
+"""Fixtures for unit tests of WeaviateConnector that mock the Weaviate client and the vectorizer."""
+# pylint: disable=redefined-outer-name
+import pytest
+from unittest.mock import patch, MagicMock
+from analitiq.databases.vector.weaviate.weaviate_connector import WeaviateConnector
+
+
+@pytest.fixture
+def collection():
+    return MagicMock()
+
+
+@pytest.fixture
+def vdb(collection):
+    params = {
+        "type": "weaviate",
+        "host": "https://host",
+        "api_key": "key",
+        "collection_name": "test",
+        "tenant_name": "tenant",
+    }
+    client = MagicMock()
+    client.collections.get.return_value.with_tenant.return_value = collection
+
+    with patch("analitiq.databases.vector.weaviate.weaviate_connector.AnalitiqVectorizer") as vectorizer_cls, \
+            patch("analitiq.databases.vector.weaviate.weaviate_connector.get_client_pool") as get_pool, \
+            patch("analitiq.databases.vector.weaviate.weaviate_connector.extract_keywords", lambda query: query):
+        get_pool.return_value.get_client.return_value = client
+        vectorizer = vectorizer_cls.return_value
+        vectorizer.cache_key = "model:raw"
+        vectorizer.vectorize.side_effect = lambda query: [0.1, 0.2]
+        vectorizer.vectorize_batch.side_effect = lambda texts: [[0.1, 0.2] for _ in texts]
+        yield WeaviateConnector(params)
@@ -0,0 +1,236 @@
+# pylint: disable=redefined-outer-name
+import asyncio
+import threading
+import uuid
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+from weaviate.collections.classes.internal import Object, MetadataReturn, QueryReturn
+from weaviate.exceptions import WeaviateConnectionError
+from analitiq.databases.vector.utils.result_cache import SearchResultCache
+from analitiq.databases.vector.weaviate.async_weaviate_connector import AsyncWeaviateConnector
+from analitiq.factories.vector_database_factory import VectorDatabaseFactory
+from analitiq.loaders.documents.schemas import Chunk
+
+PARAMS = {
+    "type": "weaviate",
+    "host": "https://host",
+    "api_key": "key",
+    "collection_name": "test",
+    "tenant_name": "tenant",
+}
+
+
+def make_object(content: str, distance: float = None) -> Object:
+    return Object(
+        uuid=uuid.uuid5(uuid.NAMESPACE_OID, content),
+        metadata=MetadataReturn(distance=distance),
+        properties={"content": content, "document_name": content},
+        references=None,
+        vector={},
+        collection="Test",
+    )
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.connect = AsyncMock()
+    client.close = AsyncMock()
+    collection = client.collections.get.return_value.with_tenant.return_value
+    collection.query.bm25 = AsyncMock(return_value=QueryReturn(objects=[]))
+    collection.query.near_vector = AsyncMock(return_value=QueryReturn(objects=[]))
+    collection.data.insert_many = AsyncMock(return_value=MagicMock(errors={}))
+    return client
+
+
+@pytest.fixture
+def avdb(client):
+    module = "analitiq.databases.vector.weaviate.async_weaviate_connector"
+    with patch(f"{module}.AnalitiqVectorizer") as vectorizer_cls, \
+            patch(f"{module}.weaviate.use_async_with_weaviate_cloud", return_value=client) as use_async, \
+            patch(f"{module}.extract_keywords", lambda query: query):
+        vectorizer = vectorizer_cls.return_value
+        vectorizer.cache_key = "model:raw"
+        vectorizer.vectorize.side_effect = lambda query: [0.1, 0.2]
+        vectorizer.vectorize_batch.side_effect = lambda texts: [[0.1, 0.2] for _ in texts]
+        connector = AsyncWeaviateConnector(PARAMS)
+        connector.use_async = use_async
+        yield connector
+
+
+def test_connects_lazily_once(avdb, client):
+    async def run():
+        await asyncio.gather(avdb.avector_search("revenue"), avdb.avector_search("sales"))
+
+    assert avdb.client is None
+    asyncio.run(run())
+
+    avdb.use_async.assert_called_once()
+    client.connect.assert_awaited_once()
+
+
+def test_connection_error_closes_the_client(avdb, client):
+    collection = client.collections.get.return_value.with_tenant.return_value
+    collection.query.near_vector.side_effect = WeaviateConnectionError("connection reset")
+
+    async def run():
+        with pytest.raises(WeaviateConnectionError):
+            await avdb.avector_search("revenue")
+        assert avdb.client is None
+        client.close.assert_awaited_once()
+
+        collection.query.near_vector.side_effect = None
+        await avdb.avector_search("revenue")  # reconnects
+
+    asyncio.run(run())
+    assert client.connect.await_count == 2
+
+
+def test_new_event_loop_gets_a_new_client(avdb):
+    clients = []
+
+    def use_async(**kwargs):
+        new_client = MagicMock(connect=AsyncMock(), close=AsyncMock())
+        collection = new_client.collections.get.return_value.with_tenant.return_value
+        collection.query.near_vector = AsyncMock(return_value=QueryReturn(objects=[]))
+        clients.append(new_client)
+        return new_client
+
+    avdb.use_async.side_effect = use_async
+
+    asyncio.run(avdb.avector_search("revenue"))
+    asyncio.run(avdb.avector_search("revenue"))  # e.g. the next request of a sync web worker
+    asyncio.run(avdb.close())
+
+    assert len(clients) == 2
+    clients[0].close.assert_awaited_once()
+    clients[1].close.assert_awaited_once()
+
+
+def test_hybrid_search_awaits_legs_concurrently(avdb, client):
+    collection = client.collections.get.return_value.with_tenant.return_value
+
+    async def run():
+        both_started = asyncio.Barrier(2)
+
+        async def bm25(**kwargs):
+            await asyncio.wait_for(both_started.wait(), timeout=5)
+            return QueryReturn(objects=[make_object("a")])
+
+        async def near_vector(**kwargs):
+            await asyncio.wait_for(both_started.wait(), timeout=5)
+            return QueryReturn(objects=[make_object("b", distance=0.1)])
+
+        collection.query.bm25.side_effect = bm25
+        collection.query.near_vector.side_effect = near_vector
+        return await avdb.ahybrid_search("revenue", limit=2)
+
+    result = asyncio.run(run())
+
+    assert {o.properties["content"] for o in result.objects} == {"a", "b"}
+    assert avdb.vectorizer.vectorize.call_count == 1
+
+
+def test_search_filter_groups_results(avdb, client):
+    collection = client.collections.get.return_value.with_tenant.return_value
+    collection.query.near_vector.return_value = QueryReturn(objects=[make_object("a"), make_object("b")])
+    filter_expression = {"property": "document_name", "operator": "like", "value": "*a*"}
+
+    result = asyncio.run(avdb.asearch_filter("revenue", filter_expression, ["document_name"]))
+
+    assert [group["document_name"] for group in result] == ["a", "b"]
+
+
+def test_search_filter_returns_none_on_error(avdb, client):
+    collection = client.collections.get.return_value.with_tenant.return_value
+    collection.query.near_vector.side_effect = RuntimeError("boom")
+    filter_expression = {"property": "document_name", "operator": "like", "value": "*a*"}
+
+    assert asyncio.run(avdb.asearch_filter("revenue", filter_expression)) is None
+
+
+def test_load_chunks_inserts_in_batches(avdb, client):
+    collection = client.collections.get.return_value.with_tenant.return_value
+    chunks = [
+        Chunk(content=f"chunk {i}", document_uuid="doc", document_name="doc.txt",
+              document_num_char=2000, chunk_num_char=8)
+        for i in range(250)
+    ]
+
+    loaded = asyncio.run(avdb.aload_chunks(chunks))
+
+    assert loaded == 250
+    assert [len(call.args[0]) for call in collection.data.insert_many.await_args_list] == [200, 50]
+
+
+def test_load_chunks_invalidates_cached_results(avdb, client, vdb, collection):
+    vdb.result_cache = SearchResultCache()
+    collection.query.near_vector.return_value = QueryReturn(objects=[make_object("a")])
+    chunks = [Chunk(content="new chunk", document_uuid="doc", document_name="doc.txt",
+                    document_num_char=9, chunk_num_char=9)]
+
+    vdb.vector_search("revenue")
+    vdb.vector_search("revenue")
+    assert collection.query.near_vector.call_count == 1
+
+    asyncio.run(avdb.aload_chunks(chunks))
+    vdb.vector_search("revenue")
+
+    assert collection.query.near_vector.call_count == 2
+
+
+def test_keywords_are_extracted_off_the_event_loop(avdb):
+    threads = []
+
+    def extract_keywords(query):
+        threads.append(threading.get_ident())
+        return query
+
+    async def run():
+        with patch("analitiq.databases.vector.weaviate.async_weaviate_connector.extract_keywords", extract_keywords):
+            await avdb.akw_search("revenue")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+
+    assert threads and threads[0] != loop_thread
+
+
+def test_searches_go_through_the_result_cache(avdb, client):
+    avdb.result_cache = SearchResultCache()
+    collection = client.collections.get.return_value.with_tenant.return_value
+    collection.query.bm25.return_value = QueryReturn(objects=[make_object("a")])
+    collection.query.near_vector.return_value = QueryReturn(objects=[make_object("b")])
+
+    async def run():
+        for _ in range(2):
+            await avdb.akw_search("revenue")
+            await avdb.avector_search("Revenue ")
+            await avdb.ahybrid_search("revenue")
+
+    asyncio.run(run())
+
+    # the hybrid search legs over-fetch, so they are other searches than the first two
+    assert collection.query.bm25.await_count == 2
+    assert collection.query.near_vector.await_count == 2
+
+
+def test_sync_and_async_searches_share_the_result_cache(avdb, client, vdb, collection):
+    cache = SearchResultCache()
+    vdb.result_cache = avdb.result_cache = cache
+    collection.query.near_vector.return_value = QueryReturn(objects=[make_object("a")])
+    async_collection = client.collections.get.return_value.with_tenant.return_value
+
+    vdb.vector_search("revenue")
+    result = asyncio.run(avdb.avector_search("revenue"))
+
+    assert [o.properties["content"] for o in result.objects] == ["a"]
+    async_collection.query.near_vector.assert_not_awaited()
+
+
+def test_factory_connect_async():
+    with patch("analitiq.databases.vector.weaviate.async_weaviate_connector.AnalitiqVectorizer"):
+        assert isinstance(VectorDatabaseFactory.connect_async(PARAMS), AsyncWeaviateConnector)
+
+    with pytest.raises(ValueError):
+        VectorDatabaseFactory.connect_async({"type": "unknown"})
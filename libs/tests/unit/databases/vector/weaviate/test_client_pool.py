@@ -0,0 +1,124 @@
+# pylint: disable=redefined-outer-name
+import threading
+import pytest
+from unittest.mock import patch, MagicMock
+from analitiq.databases.vector.weaviate.client_pool import WeaviateClientPool
+
+
+@pytest.fixture
+def connect_mock():
+    with patch("analitiq.databases.vector.weaviate.client_pool.weaviate.connect_to_weaviate_cloud") as mock_connect:
+        mock_connect.side_effect = lambda **kwargs: MagicMock()
+        yield mock_connect
+
+
+def test_client_is_reused(connect_mock):
+    pool = WeaviateClientPool()
+
+    first = pool.get_client("https://host", "key")
+    second = pool.get_client("https://host", "key")
+
+    assert first is second
+    assert connect_mock.call_count == 1
+
+
+def test_clients_are_keyed_by_host_and_key(connect_mock):
+    pool = WeaviateClientPool()
+
+    first = pool.get_client("https://host", "key")
+    second = pool.get_client("https://host", "other_key")
+
+    assert first is not second
+    assert len(pool) == 2
+
+
+def test_disconnected_client_is_replaced(connect_mock):
+    pool = WeaviateClientPool()
+
+    first = pool.get_client("https://host", "key")
+    first.is_connected.return_value = False
+    second = pool.get_client("https://host", "key")
+
+    assert first is not second
+    first.close.assert_called_once()
+
+
+def test_failed_health_check_reconnects(connect_mock):
+    pool = WeaviateClientPool(health_check_interval=0)
+
+    first = pool.get_client("https://host", "key")
+    first.is_ready.side_effect = RuntimeError("cluster unreachable")
+    second = pool.get_client("https://host", "key")
+
+    assert first is not second
+    assert connect_mock.call_count == 2
+
+
+def test_concurrent_callers_share_one_connection(connect_mock):
+    pool = WeaviateClientPool()
+    clients = []
+
+    def get():
+        clients.append(pool.get_client("https://host", "key"))
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert connect_mock.call_count == 1
+    assert all(client is clients[0] for client in clients)
+
+
+def test_invalidate_and_shutdown(connect_mock):
+    pool = WeaviateClientPool()
+
+    first = pool.get_client("https://host", "key")
+    pool.invalidate("https://host", "key")
+    first.close.assert_called_once()
+
+    second = pool.get_client("https://host", "key")
+    pool.shutdown()
+
+    second.close.assert_called_once()
+    assert len(pool) == 0
+
+
+def test_invalidate_keeps_a_client_that_replaced_the_failed_one(connect_mock):
+    pool = WeaviateClientPool()
+
+    failed = pool.get_client("https://host", "key")
+    pool.invalidate("https://host", "key", failed)
+    current = pool.get_client("https://host", "key")
+    pool.invalidate("https://host", "key", failed)  # a late caller that saw the same failure
+
+    current.close.assert_not_called()
+    assert pool.get_client("https://host", "key") is current
+
+
+def test_shutdown_waits_for_a_client_being_connected(connect_mock):
+    pool = WeaviateClientPool()
+    connecting = threading.Event()
+    release = threading.Event()
+    created = []
+
+    def slow_connect(**kwargs):
+        connecting.set()
+        assert release.wait(timeout=5)
+        created.append(MagicMock())
+        return created[-1]
+
+    connect_mock.side_effect = slow_connect
+    getter = threading.Thread(target=pool.get_client, args=("https://host", "key"))
+    getter.start()
+    assert connecting.wait(timeout=5)
+
+    stopper = threading.Thread(target=pool.shutdown)
+    stopper.start()
+    release.set()
+    getter.join()
+    stopper.join()
+
+    assert len(pool) == 0
+    created[0].close.assert_called_once()
@@ -0,0 +1,116 @@
+# pylint: disable=redefined-outer-name
+import os
+import pytest
+from unittest.mock import patch, MagicMock
+from analitiq.loaders.documents.schemas import Chunk
+
+
+def split_words(document):
+    return [
+        Chunk(content=word, document_name=document.metadata.document_name, document_uuid=document.uuid,
+              document_num_char=len(document.document_content), chunk_num_char=len(word))
+        for word in document.document_content.split()
+    ]
+
+
+@pytest.fixture
+def word_chunker():
+    with patch("analitiq.chunkers.parallel_chunker.ChunkerFactory") as factory:
+        factory.get_chunker.return_value.chunk.side_effect = split_words
+        yield factory
+
+
+def written_uuids(collection):
+    batch = collection.batch.dynamic.return_value.__enter__.return_value
+    return [call.kwargs["uuid"] for call in batch.add_object.call_args_list]
+
+
+def test_load_dir(vdb, collection, word_chunker, tmp_path):
+    (tmp_path / "a.txt").write_text("one two")
+    (tmp_path / "b.txt").write_text("three")
+    progress = []
+
+    documents, loaded = vdb.load_dir(str(tmp_path), "txt", progress_callback=progress.append, batch_size=2)
+
+    assert sorted(d.document_name for d in documents) == ["a", "b"]
+    assert loaded == 3
+    assert len(written_uuids(collection)) == 3
+    assert progress[-1].written == 3
+
+
+def test_incremental_load_dir(vdb, collection, word_chunker, tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.txt").write_text("one two")
+    (docs / "b.txt").write_text("three")
+    manifest = tmp_path / "manifest.json"
+
+    _, loaded = vdb.load_dir(str(docs), "txt", incremental=True, manifest_path=manifest)
+    first_uuids = written_uuids(collection)
+    assert loaded == 3
+
+    # nothing changed: nothing is read, written or deleted
+    collection.reset_mock()
+    _, loaded = vdb.load_dir(str(docs), "txt", incremental=True, manifest_path=manifest)
+    assert loaded == 0
+    collection.data.delete_many.assert_not_called()
+
+    # a changed file rewrites the same ids for unchanged chunks and deletes the stale ones
+    (docs / "a.txt").write_text("one four")
+    os.utime(docs / "a.txt", (2, 2))
+    (docs / "b.txt").unlink()
+    collection.reset_mock()
+    _, loaded = vdb.load_dir(str(docs), "txt", incremental=True, manifest_path=manifest)
+
+    assert loaded == 2
+    assert len(set(written_uuids(collection)) & set(first_uuids)) == 1  # the chunk "one"
+    collection.data.delete_many.assert_called_once()
+
+
+def test_reloading_writes_the_same_ids(vdb, collection, word_chunker, tmp_path):
+    (tmp_path / "a.txt").write_text("one two")
+
+    vdb.load_dir(str(tmp_path), "txt")
+    dir_uuids = written_uuids(collection)
+    collection.reset_mock()
+    vdb.load_dir(str(tmp_path), "txt")
+    assert sorted(written_uuids(collection)) == sorted(dir_uuids)
+
+    with patch("analitiq.factories.chunker_factory.ChunkerFactory", word_chunker):
+        collection.reset_mock()
+        vdb.load_file(str(tmp_path / "a.txt"))
+        file_uuids = written_uuids(collection)
+        collection.reset_mock()
+        vdb.load_file(str(tmp_path / "a.txt"))
+
+    assert written_uuids(collection) == file_uuids
+    assert sorted(file_uuids) == sorted(dir_uuids)
+
+
+def test_identical_chunks_of_a_document_get_their_own_ids(vdb, collection, word_chunker, tmp_path):
+    (tmp_path / "a.txt").write_text("total total total")
+
+    # the batches split the chunks of the document
+    _, loaded = vdb.load_dir(str(tmp_path), "txt", batch_size=2)
+
+    assert loaded == 3
+    assert len(set(written_uuids(collection))) == 3
+
+
+def test_files_with_failed_chunks_are_retried(vdb, collection, word_chunker, tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.txt").write_text("one two")
+    manifest = tmp_path / "manifest.json"
+
+    collection.batch.failed_objects = [MagicMock(message="timeout")]
+    _, loaded = vdb.load_dir(str(docs), "txt", incremental=True, manifest_path=manifest)
+    assert loaded == 1
+
+    collection.reset_mock()
+    collection.batch.failed_objects = []
+    _, loaded = vdb.load_dir(str(docs), "txt", incremental=True, manifest_path=manifest)
+
+    assert loaded == 2
+    collection.reset_mock()
+    assert vdb.load_dir(str(docs), "txt", incremental=True, manifest_path=manifest)[1] == 0
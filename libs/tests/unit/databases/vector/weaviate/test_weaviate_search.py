@@ -0,0 +1,171 @@
+# pylint: disable=redefined-outer-name
+import threading
+import time
+import uuid
+import pytest
+from weaviate.exceptions import WeaviateConnectionError
+from weaviate.collections.classes.internal import Object, MetadataReturn, QueryReturn
+from analitiq.databases.vector.utils.query_vector_memo import query_vector_scope
+from analitiq.databases.vector.weaviate import weaviate_connector
+from analitiq.databases.vector.utils.result_cache import SearchResultCache
+
+
+def make_object(content: str, score: float = None, distance: float = None) -> Object:
+    return Object(
+        uuid=uuid.uuid5(uuid.NAMESPACE_OID, content),
+        metadata=MetadataReturn(score=score, distance=distance),
+        properties={"content": content, "document_name": content},
+        references=None,
+        vector={},
+        collection="Test",
+    )
+
+
+def test_hybrid_search_embeds_query_once_and_runs_legs_concurrently(vdb, collection):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def bm25(**kwargs):
+        barrier.wait()  # fails with BrokenBarrierError unless the vector leg runs at the same time
+        return QueryReturn(objects=[make_object("a")])
+
+    def near_vector(**kwargs):
+        barrier.wait()
+        return QueryReturn(objects=[make_object("b")])
+
+    collection.query.bm25.side_effect = bm25
+    collection.query.near_vector.side_effect = near_vector
+
+    result = vdb.hybrid_search("revenue")
+
+    assert {o.properties["content"] for o in result.objects} == {"a", "b"}
+    assert vdb.vectorizer.vectorize.call_count == 1
+
+
+def test_search_filter_reuses_query_vector_within_scope(vdb, collection):
+    collection.query.bm25.return_value = QueryReturn(objects=[make_object("a")])
+    collection.query.near_vector.return_value = QueryReturn(objects=[make_object("a")])
+    filter_expression = {"property": "document_name", "operator": "like", "value": "*a*"}
+
+    with query_vector_scope():
+        vdb.hybrid_search("revenue")
+        vdb.search_filter("revenue", filter_expression)
+
+    assert vdb.vectorizer.vectorize.call_count == 1
+
+
+def test_hybrid_search_passes_limit_and_overfetches(vdb, collection):
+    collection.query.bm25.return_value = QueryReturn(objects=[make_object(f"kw{i}", score=10 - i) for i in range(3)])
+    collection.query.near_vector.return_value = QueryReturn(
+        objects=[make_object(f"v{i}", distance=0.1 * i) for i in range(15)]
+    )
+
+    result = vdb.hybrid_search("revenue", limit=5)
+
+    assert len(result.objects) == 5
+    assert collection.query.bm25.call_args.kwargs["limit"] == 15
+    assert collection.query.near_vector.call_args.kwargs["limit"] == 15
+
+
+def test_hybrid_search_returns_vector_hits_when_keyword_leg_is_empty(vdb, collection):
+    collection.query.bm25.return_value = QueryReturn(objects=[])
+    collection.query.near_vector.return_value = QueryReturn(objects=[make_object("a", distance=0.1)])
+
+    result = vdb.hybrid_search("revenue")
+
+    assert [o.properties["content"] for o in result.objects] == ["a"]
+    assert result.objects[0].metadata.score is not None
+
+
+def test_result_cache_serves_repeated_searches_until_a_write(vdb, collection):
+    vdb.result_cache = SearchResultCache()
+    collection.query.near_vector.return_value = QueryReturn(objects=[make_object("a")])
+    filter_expression = {"property": "document_name", "operator": "=", "value": "a"}
+
+    first = vdb.search_filter("Revenue by month", filter_expression)
+    assert vdb.search_filter("revenue  by month", filter_expression) is first
+    vdb.search_filter("revenue by month", {**filter_expression, "value": "b"})
+    assert collection.query.near_vector.call_count == 2
+
+    vdb.delete_many_on_uuids([str(make_object("a").uuid)])
+    vdb.search_filter("revenue by month", filter_expression)
+    assert collection.query.near_vector.call_count == 3
+
+
+def test_result_cache_semantic_hit(vdb, collection):
+    vdb.result_cache = SearchResultCache(semantic_threshold=0.99)
+    collection.query.near_vector.return_value = QueryReturn(objects=[make_object("a", distance=0.1)])
+
+    first = vdb.vector_search("monthly revenue")
+    assert vdb.vector_search("revenue per month") is first  # the fake vectorizer embeds both alike
+    assert collection.query.near_vector.call_count == 1
+    assert vdb.result_cache.stats()["semantic_hits"] == 1
+
+
+def test_search_many_embeds_once_and_bounds_concurrency(vdb, collection):
+    lock = threading.Lock()
+    in_flight = [0, 0]  # current, maximum
+
+    def near_vector(near_vector, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+        return QueryReturn(objects=[make_object(f"v{near_vector[0]:.0f}", distance=0.1)])
+
+    collection.query.near_vector.side_effect = near_vector
+    collection.query.bm25.side_effect = lambda query, **kwargs: QueryReturn(objects=[make_object(f"kw {query}", score=1)])
+    vdb.vectorizer.vectorize_batch.side_effect = lambda texts: [[float(len(text)), 0.0] for text in texts]
+    queries = ["a", "bb", "ccc", "dddd", "eeeee", "ffffff"]
+
+    results = vdb.vector_search_many(queries, limit=2, max_concurrency=3)
+
+    assert [r.objects[0].properties["content"] for r in results] == [f"v{len(q)}" for q in queries]
+    assert 1 < in_flight[1] <= 3
+    assert vdb.vectorizer.vectorize_batch.call_count == 1
+    assert vdb.vectorizer.vectorize.call_count == 0
+
+    hybrid = vdb.hybrid_search_many(queries[:2], limit=2)
+    assert [{o.properties["content"] for o in r.objects} for r in hybrid] == [{"kw a", "v1"}, {"kw bb", "v2"}]
+    assert vdb.vector_search_many([]) == [] and vdb.hybrid_search_many([]) == []
+
+
+def test_connection_error_in_one_leg_drops_only_its_client(vdb, collection):
+    pool = weaviate_connector.get_client_pool.return_value
+    client = pool.get_client.return_value
+    kw_failed = threading.Event()
+    vector_leg_finished = []
+
+    def bm25(**kwargs):
+        raise WeaviateConnectionError("connection reset")
+
+    def near_vector(**kwargs):
+        assert kw_failed.wait(timeout=5)  # the keyword leg failed while this leg held the client
+        vector_leg_finished.append(True)
+        return QueryReturn(objects=[make_object("b")])
+
+    collection.query.bm25.side_effect = bm25
+    collection.query.near_vector.side_effect = near_vector
+    pool.invalidate.side_effect = lambda *args: kw_failed.set()
+
+    with pytest.raises(WeaviateConnectionError):
+        vdb.hybrid_search("revenue")
+    vdb.search_executor.shutdown(wait=True)
+
+    pool.invalidate.assert_called_once_with("https://host", "key", client)
+    assert vector_leg_finished == [True]
+    assert vdb.client is client and vdb.connected
+
+
+def test_close_stops_the_search_threads(vdb, collection):
+    collection.query.bm25.return_value = QueryReturn(objects=[make_object("a")])
+    collection.query.near_vector.return_value = QueryReturn(objects=[make_object("b")])
+
+    vdb.hybrid_search("revenue")
+    executor = vdb.search_executor
+    vdb.close()
+
+    assert executor._shutdown
+    vdb.connect()
+    assert vdb.hybrid_search("sales").objects  # a closed connector can be used again
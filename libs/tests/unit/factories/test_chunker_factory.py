@@ -0,0 +1,15 @@
+from analitiq.factories.chunker_factory import ChunkerFactory
+from analitiq.chunkers.sql_chunker import SQLChunker
+from analitiq.chunkers.text_chunker import TextChunker
+
+
+def test_chunkers_are_reused_per_document_type():
+    sql_chunker = ChunkerFactory.get_chunker("sql")
+
+    assert isinstance(sql_chunker, SQLChunker)
+    assert ChunkerFactory.get_chunker("sql") is sql_chunker
+    assert isinstance(ChunkerFactory.get_chunker("text"), TextChunker)
+
+
+def test_create_chunker_returns_a_new_instance():
+    assert ChunkerFactory.create_chunker("sql") is not ChunkerFactory.get_chunker("sql")
@@ -78,3 +78,14 @@ def test_directory_loader_special_loader_invocation(mock_directory):
     assert len(documents) > 0
 
     assert any(doc.metadata.document_name == "test2" for doc in documents)
+
+def test_directory_loader_lazy_load_skips_empty_files(mock_directory):
+    """Test if DirectoryLoader.lazy_load yields documents one by one and skips empty files."""
+    (mock_directory / "empty.txt").write_text("")
+    loader = DirectoryLoader(directory_path=str(mock_directory), extension="txt")
+
+    documents = loader.lazy_load()
+
+    assert not isinstance(documents, list)
+    assert [doc.metadata.document_name for doc in documents] == ["test1"]
+    assert sorted(path.name for path in loader.iter_paths()) == ["empty.txt", "test1.txt"]
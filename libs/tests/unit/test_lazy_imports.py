@@ -0,0 +1,23 @@
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+LIBS_DIR = Path(__file__).resolve().parents[2]
+HEAVY_MODULES = ("torch", "transformers", "pandas", "langchain", "nltk")
+
+
+@pytest.mark.parametrize("module", [
+    "analitiq.main",
+    "analitiq.agents.sql.sql_agent",
+    "analitiq.agents.search_vdb.vdb_agent",
+    "analitiq.databases.vector.weaviate.weaviate_connector",
+    "analitiq.databases.vector.faiss.faiss_connector",
+    "analitiq.databases.vector.chromadb.chromadb_connector",
+])
+def test_import_does_not_load_heavy_backends(module):
+    """Heavy backends are imported when they are used, not when analitiq is imported."""
+    code = f"import sys, {module}; print('loaded:', *(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=LIBS_DIR, check=True)
+    # the logging setup may print configuration notices before
+    assert result.stdout.strip().splitlines()[-1] == "loaded:"
@@ -0,0 +1,104 @@
+# pylint: disable=redefined-outer-name
+
+import pytest
+from unittest.mock import MagicMock
+from analitiq.agents.sql.sql_agent import SQLAgent
+from analitiq.databases.relational.catalog import Catalog
+from analitiq.utils.db.ddl_indexer import DDLIndexer
+
+
+def catalog(*rows):
+    return Catalog.from_rows(rows)
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    db.params = {"host": "localhost", "port": 5432, "db_name": "test_db", "db_schemas": ["sales"]}
+    db.get_catalog.return_value = catalog(
+        ("sales", "orders", "id", "integer", False, 1),
+        ("sales", "customers", "id", "integer", False, 1),
+    )
+    return db
+
+
+@pytest.fixture
+def vdb():
+    vdb = MagicMock()
+    vdb.collection_name = "test_collection"
+    vdb.params = {"tenant_name": "test_tenant"}
+    return vdb
+
+
+@pytest.fixture
+def indexer(db, vdb, tmp_path):
+    return DDLIndexer(db, vdb, manifest_path=tmp_path / "ddl.json")
+
+
+def loaded_names(vdb):
+    return sorted(chunk.document_name for chunk in vdb.load_chunks.call_args.args[0])
+
+
+def test_first_run_indexes_every_table(indexer, db, vdb):
+    stats = indexer.run()
+
+    assert sorted(stats.added) == ["sales.customers", "sales.orders"]
+    db.get_catalog.assert_called_once_with(["sales"], refresh=True)
+    assert loaded_names(vdb) == ["sales.customers", "sales.orders"]
+    chunk = vdb.load_chunks.call_args.args[0][0]
+    assert chunk.document_tags == ["ddl"]
+    vdb.delete_many_on_uuids.assert_not_called()
+
+    # the documents are named as the SQL agent expects them
+    documents = [{"document_name": c.document_name, "document_chunks": [c.content]}
+                 for c in vdb.load_chunks.call_args.args[0]]
+    assert "Database Schema: sales" in SQLAgent.format_ddl_chunks(documents)
+
+
+def test_only_changes_are_written(indexer, db, vdb, tmp_path):
+    indexer.run()
+    first_ids = {name: entry.chunk_uuids for name, entry in indexer.manifest.entries.items()}
+
+    db.get_catalog.return_value = catalog(
+        ("sales", "orders", "id", "integer", False, 1),
+        ("sales", "orders", "amount", "numeric(10,2)", True, 2),
+        ("sales", "refunds", "id", "integer", False, 1),
+    )
+    vdb.reset_mock()
+    # a new indexer reads the manifest saved by the previous run
+    stats = DDLIndexer(db, vdb, manifest_path=tmp_path / "ddl.json").run()
+
+    assert stats.added == ["sales.refunds"]
+    assert stats.changed == ["sales.orders"]
+    assert stats.deleted == ["sales.customers"]
+    assert stats.unchanged == 0
+    assert loaded_names(vdb) == ["sales.orders", "sales.refunds"]
+    deleted = vdb.delete_many_on_uuids.call_args.args[0]
+    assert sorted(deleted) == sorted(first_ids["sales.orders"] + first_ids["sales.customers"])
+
+    vdb.reset_mock()
+    stats = DDLIndexer(db, vdb, manifest_path=tmp_path / "ddl.json").run()
+    assert stats.unchanged == 2
+    vdb.load_chunks.assert_not_called()
+    vdb.delete_many_on_uuids.assert_not_called()
+
+
+def test_failed_write_is_retried(indexer, vdb):
+    vdb.load_chunks.side_effect = RuntimeError("unavailable")
+    with pytest.raises(RuntimeError):
+        indexer.run()
+
+    vdb.load_chunks.side_effect = None
+    assert len(indexer.run().added) == 2
+
+
+def test_scheduled_runs(indexer, db):
+    indexer.start(interval=0.01)
+    try:
+        with pytest.raises(RuntimeError):
+            indexer.start(interval=0.01)
+    finally:
+        indexer.stop(timeout=5)
+
+    assert db.get_catalog.call_count >= 1
+    assert indexer._thread is None